@@ -0,0 +1,396 @@
+# BatchExport.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains the batch mode of the export functions in
+# 'TrimbleGeoDBToDatabase', for the many geodatabases of a season (one
+# per crew and sync). For a directory, glob pattern or list of
+# geodatabases it:
+# - Runs the transforms (see 'TableUtility.TransformTable') of each
+#   geodatabase, one geodatabase per worker process.
+# - Merges each '_Joined' feature class of all the geodatabases into
+#   one merged geodatabase, and removes the rows whose primary key
+#   (see 'TrimbleUtility.GetRowKey') was already read from another
+#   geodatabase.
+# - Runs the exports (see 'TrimbleGeoDBToDatabase.ExportAll') on the
+#   merged geodatabase, so there is one SQL script per target table.
+#
+# Each merged row keeps the path of the geodatabase it came from (see
+# 'TrimbleUtility.SOURCE_FIELD'), which is written in the SOURCE
+# column of the scripts.
+
+import arcpy
+import csv
+import os
+import glob
+import time
+import concurrent.futures
+import TrimbleGeoDBToDatabase
+import TrimbleUtility
+import TableUtility
+import RunMetrics
+
+# The '_Joined' feature classes that are merged by default.
+JOINED_FEATURE_CLASSES = ['Secchi_Joined', 'Depth_Joined', 'Loons_Joined', 'Water_Sample_Joined',
+                          'Monument_Joined', 'Deployment_Joined', 'Retrieval_Joined']
+
+# The name of the merged geodatabase. It is made again on each run, in
+# the same place, so the manifests of the incremental exports (see
+# 'TrimbleUtility.ReadExportManifest') carry over from one batch run to
+# the next.
+MERGED_GEO_DB_NAME = 'Batch_Merged.gdb'
+
+def GetGeoDBPaths(GeoDBs):
+    """
+    Returns the sorted list of the paths of the geodatabases of
+    'GeoDBs', which is one of:
+    - the path of a directory; its '*.gdb' geodatabases are used.
+    - a glob pattern, e.g. 'C:/Data/2026/*/*.gdb'.
+    - a list of geodatabase paths, which is used in the given order.
+    """
+    if isinstance(GeoDBs, str):
+        if os.path.isdir(GeoDBs) and not GeoDBs.lower().endswith('.gdb'):
+            GeoDBs = os.path.join(GeoDBs, '*.gdb')
+
+        # The merged geodatabase of an earlier run is not an input.
+        GeoDBPaths = sorted(GeoDBPath for GeoDBPath in glob.glob(GeoDBs)
+                            if os.path.basename(GeoDBPath) != MERGED_GEO_DB_NAME)
+    else:
+        GeoDBPaths = list(GeoDBs)
+
+    if len(GeoDBPaths) == 0:
+        raise Exception("No geodatabases were found for: " + str(GeoDBs))
+
+    return [os.path.abspath(GeoDBPath) for GeoDBPath in GeoDBPaths]
+
+def ExportBatch(GeoDBs, Exports = None, Transforms = None, JoinFeatures = None, KeepFieldsFunction = None, RenameFieldsFunction = None,
+                OutputFolder = None, Workers = None, UseCache = False, UseMonumentIndex = False, FeatureClasses = None, WriteMetrics = False,
+                MonumentIndexContentHash = False):
+    """
+    Transforms and exports many geodatabases as one. See the module
+    description.
+
+    Parameters:
+    - GeoDBs = the geodatabases (see 'GetGeoDBPaths'). When a primary
+      key is in several geodatabases, the row of the first
+      geodatabase in this order is kept.
+    - Exports = the exports run on the merged geodatabase (see
+      'TrimbleGeoDBToDatabase.ExportAll'). The default is
+      'TrimbleGeoDBToDatabase.EXPORT_ALL_DEFAULTS'.
+    - Transforms = an optional list of the (FeatureType,
+      TargetFeatures, OutputFeatureClass) tuples of the transforms
+      (see 'TableUtility.TransformAll'), or a module level function
+      that takes the path of a geodatabase and returns its list (the
+      Pathfinder feature class names differ from one geodatabase to
+      the next). The default (None) runs no transforms: the '_Joined'
+      feature classes already exist.
+    - JoinFeatures = the monuments feature class of the transforms, or
+      a module level function that takes the path of a geodatabase and
+      returns it.
+    - KeepFieldsFunction, RenameFieldsFunction, UseCache,
+      UseMonumentIndex, MonumentIndexContentHash = see
+      'TableUtility.TransformTable'.
+    - OutputFolder = the folder of the merged geodatabase
+      ('MERGED_GEO_DB_NAME'), and so of the SQL scripts. The default
+      (None) is the folder of the first geodatabase.
+    - Workers = the number of worker processes of the transforms and
+      of the exports. The default (None) is one worker per
+      geodatabase (export), up to the number of processors.
+    - FeatureClasses = the '_Joined' feature classes that are merged.
+      The default is 'JOINED_FEATURE_CLASSES'. A feature class that is
+      in none of the geodatabases is skipped.
+    - WriteMetrics = if True, the metrics of the batch (see
+      'RunMetrics') and of the transforms are written to a JSON file
+      next to the merged geodatabase.
+
+    NOTE: the calling script must guard its entry point with
+    "if __name__ == '__main__':" (see 'ExampleScript4.py').
+
+    If the transforms of every geodatabase fail, an error is raised
+    before the merged geodatabase is replaced.
+
+    Returns a dictionary with the keys:
+    - 'GeoDBPaths' = the paths of the geodatabases.
+    - 'MergedGeoDB' = the path of the merged geodatabase.
+    - 'Transforms' = a dictionary of the report of each geodatabase's
+      transforms (see 'RunBatchTransforms'). A geodatabase whose
+      transforms failed is not merged.
+    - 'Merged' = a dictionary of the number of 'Rows' merged and
+      'DuplicatesRemoved' of each feature class.
+    - 'DuplicatesReport' = the path of the CSV file that lists the
+      removed rows (see 'WriteDuplicatesReport'), or None.
+    - 'Exports' = the results of the exports (see
+      'TrimbleGeoDBToDatabase.ExportAll').
+    """
+    GeoDBPaths = GetGeoDBPaths(GeoDBs)
+
+    if OutputFolder is None:
+        OutputFolder = os.path.dirname(GeoDBPaths[0])
+
+    if FeatureClasses is None:
+        FeatureClasses = JOINED_FEATURE_CLASSES
+
+    MergedGeoDB = os.path.join(OutputFolder, MERGED_GEO_DB_NAME)
+
+    Report = {'GeoDBPaths': GeoDBPaths,
+              'MergedGeoDB': MergedGeoDB,
+              'Transforms': {},
+              'Merged': {},
+              'DuplicatesReport': None,
+              'Exports': []}
+
+    Metrics = RunMetrics.RunMetrics('ExportBatch')
+
+    # Transform each geodatabase in its own worker. The geodatabases
+    # are independent, so the workers do not contend for locks.
+    if Transforms is not None:
+        Metrics.StartStage('Transform')
+
+        TransformWorkers = (Workers if Workers is not None else min(len(GeoDBPaths), os.cpu_count() or 1))
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=TransformWorkers) as Executor:
+            Futures = {GeoDBPath: Executor.submit(RunBatchTransforms, GeoDBPath, Transforms, JoinFeatures, KeepFieldsFunction,
+                                                  RenameFieldsFunction, UseCache, UseMonumentIndex, MonumentIndexContentHash)
+                       for GeoDBPath in GeoDBPaths}
+
+            for GeoDBPath, Future in Futures.items():
+                Report['Transforms'][GeoDBPath] = Future.result()
+
+        for GeoDBPath, TransformReport in Report['Transforms'].items():
+            if TransformReport['Succeeded']:
+                arcpy.AddMessage("Transformed " + GeoDBPath + " in " + format(TransformReport['Seconds'], '.2f') + " seconds.")
+            else:
+                arcpy.AddMessage("Transforming " + GeoDBPath + " FAILED; it is not merged: " + TransformReport['Error'])
+
+        GeoDBPaths = [GeoDBPath for GeoDBPath in GeoDBPaths if Report['Transforms'][GeoDBPath]['Succeeded']]
+
+        # The merged geodatabase of an earlier run is kept, rather than
+        # replaced by an empty one.
+        if len(GeoDBPaths) == 0:
+            raise Exception("The transforms of every geodatabase failed; there is no geodatabase to merge.")
+
+    # Merge the feature classes in this process, one at a time, so that
+    # only one process writes to the merged geodatabase.
+    Metrics.StartStage('Merge')
+
+    if arcpy.Exists(MergedGeoDB):
+        arcpy.management.Delete(MergedGeoDB)
+
+    arcpy.management.CreateFileGDB(OutputFolder, MERGED_GEO_DB_NAME)
+
+    Duplicates = []
+
+    for FeatureClass in FeatureClasses:
+        MergedFeatureClass = MergeFeatureClass(GeoDBPaths, FeatureClass, MergedGeoDB)
+
+        if MergedFeatureClass is None:
+            continue
+
+        Removed = RemoveCrossFileDuplicates(MergedFeatureClass, FeatureClass, GeoDBPaths)
+        Duplicates.extend((FeatureClass,) + Row for Row in Removed)
+
+        Rows = int(arcpy.management.GetCount(MergedFeatureClass)[0])
+        Metrics.AddRowsEmitted(Rows)
+
+        Report['Merged'][FeatureClass] = {'Rows': Rows, 'DuplicatesRemoved': len(Removed)}
+
+        arcpy.AddMessage("Merged " + str(Rows) + " " + FeatureClass + " rows; " + str(len(Removed)) +
+                         " rows with the key of a row of another geodatabase were removed.")
+
+    if len(Duplicates) > 0:
+        Report['DuplicatesReport'] = WriteDuplicatesReport(MergedGeoDB, Duplicates)
+
+    # Export the merged geodatabase: one script per target table.
+    Metrics.StartStage('Export')
+
+    arcpy.env.workspace = MergedGeoDB
+
+    Report['Exports'] = TrimbleGeoDBToDatabase.ExportAll(Exports, Workers)
+
+    Metrics.Finish()
+
+    if WriteMetrics:
+        RunMetrics.WriteMetrics(RunMetrics.GetMetricsPath(MergedGeoDB),
+                                {'ExportBatch': Metrics.GetReport(),
+                                 'Transforms': {GeoDBPath: TransformReport['Metrics']
+                                                for GeoDBPath, TransformReport in Report['Transforms'].items()}})
+
+    return Report
+
+def RunBatchTransforms(GeoDBPath, Transforms, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, UseCache = False, UseMonumentIndex = False,
+                       MonumentIndexContentHash = False):
+    """
+    Runs the transforms of one geodatabase of function 'ExportBatch' in
+    a worker process, in that geodatabase, and returns its report. The
+    key of each monument index is worked out once for all the
+    transforms of the geodatabase (see
+    'TableUtility.CreateIndexedTableJoin'). Two transforms of the same
+    output feature class are an error. The report is a dictionary with
+    the keys:
+    - 'Succeeded' = True or False.
+    - 'Error' = the error message, or None.
+    - 'Seconds' = the time the transforms took.
+    - 'Metrics' = a dictionary of the metrics of each transform, by
+      output feature class (see 'TableUtility.TransformTable').
+    Errors are returned, not raised.
+    """
+    StartTime = time.perf_counter()
+
+    Report = {'Succeeded': False,
+              'Error': None,
+              'Metrics': {}}
+
+    try:
+        arcpy.env.workspace = GeoDBPath
+
+        if callable(Transforms):
+            Transforms = Transforms(GeoDBPath)
+
+        if callable(JoinFeatures):
+            JoinFeatures = JoinFeatures(GeoDBPath)
+
+        # A transform replaces the output of an earlier transform of the
+        # same output feature class.
+        OutputFeatureClasses = [OutputFeatureClass for FeatureType, TargetFeatures, OutputFeatureClass in Transforms]
+
+        for OutputFeatureClass in set(OutputFeatureClasses):
+            if OutputFeatureClasses.count(OutputFeatureClass) > 1:
+                raise Exception("More than one transform of " + GeoDBPath + " makes " + OutputFeatureClass + ".")
+
+        # The keys of the monument indexes of this geodatabase.
+        MonumentIndexKeys = {}
+
+        for FeatureType, TargetFeatures, OutputFeatureClass in Transforms:
+            Report['Metrics'][OutputFeatureClass] = TableUtility.TransformTable(FeatureType, TargetFeatures, JoinFeatures,
+                                                                                KeepFieldsFunction, RenameFieldsFunction,
+                                                                                OutputFeatureClass, UseCache = UseCache,
+                                                                                UseMonumentIndex = UseMonumentIndex,
+                                                                                MonumentIndexContentHash = MonumentIndexContentHash,
+                                                                                MonumentIndexKeys = MonumentIndexKeys)
+
+        Report['Succeeded'] = True
+    except Exception as e:
+        Report['Error'] = str(e)
+
+    Report['Seconds'] = time.perf_counter() - StartTime
+
+    return Report
+
+def MergeFeatureClass(GeoDBPaths, FeatureClass, MergedGeoDB):
+    """
+    Merges the 'FeatureClass' of the geodatabases, in their order, into
+    a feature class of the same name in 'MergedGeoDB', with the source
+    of each row in the 'TrimbleUtility.SOURCE_FIELD' field. Returns the
+    path of the merged feature class, or None if the feature class is
+    in none of the geodatabases.
+    """
+    Inputs = [os.path.join(GeoDBPath, FeatureClass) for GeoDBPath in GeoDBPaths
+              if arcpy.Exists(os.path.join(GeoDBPath, FeatureClass))]
+
+    if len(Inputs) == 0:
+        return None
+
+    MergedFeatureClass = os.path.join(MergedGeoDB, FeatureClass)
+
+    arcpy.management.Merge(Inputs, MergedFeatureClass, add_source='ADD_SOURCE_INFO')
+
+    return MergedFeatureClass
+
+def GetSourceRank(GeoDBPaths, SourcePath):
+    """
+    The position in 'GeoDBPaths' of the geodatabase of a merged row's
+    'TrimbleUtility.SOURCE_FIELD' value. A source that is not found is
+    ranked last.
+    """
+    GeoDBName = os.path.normcase(TrimbleUtility.GetSourceFileName(SourcePath))
+    SourceKey = os.path.normcase(os.path.normpath(SourcePath))
+
+    for Rank, GeoDBPath in enumerate(GeoDBPaths):
+        if SourceKey.startswith(os.path.normcase(os.path.normpath(GeoDBPath)) + os.sep):
+            return Rank
+
+    # The source is not a path under one of the geodatabases; match
+    # its geodatabase name.
+    for Rank, GeoDBPath in enumerate(GeoDBPaths):
+        if os.path.normcase(os.path.basename(GeoDBPath)) == GeoDBName:
+            return Rank
+
+    return len(GeoDBPaths)
+
+def RemoveCrossFileDuplicates(MergedFeatureClass, FeatureClass, GeoDBPaths):
+    """
+    Deletes the rows of a merged feature class (see
+    'MergeFeatureClass') whose primary key (see
+    'TrimbleUtility.GetRowKey', the key of
+    'TestTrimbleGeoDB.GetPrimaryKeys') is also the key of a row of an
+    earlier geodatabase in 'GeoDBPaths'. The rows with the same key in
+    the same geodatabase are kept; they are reported by the exports'
+    duplicate checks (see 'TrimbleGeoDBToDatabase.DuplicateCheck').
+
+    Returns a list of the (Key, KeptGeoDB, RemovedGeoDB) of each
+    deleted row, with the geodatabase file names.
+    """
+    FieldNames = TrimbleUtility.GetRowKeyFieldNames(FeatureClass) + [TrimbleUtility.SOURCE_FIELD]
+
+    # The ranks of the sources, by source path; a merged feature class
+    # has one source per geodatabase.
+    SourceRanks = {}
+
+    # The first geodatabase of each key, and its source.
+    FirstSources = {}
+
+    for Row in TrimbleUtility.IterFeatureClassRows(MergedFeatureClass, FieldNames):
+        # A record without a creation datetime is not a valid record,
+        # and has no key.
+        if Row['CreationDateTimeLocal'] is None:
+            continue
+
+        Source = Row[TrimbleUtility.SOURCE_FIELD]
+
+        if Source not in SourceRanks:
+            SourceRanks[Source] = GetSourceRank(GeoDBPaths, Source)
+
+        RowKey = TrimbleUtility.GetRowKey(FeatureClass, Row)
+
+        if RowKey not in FirstSources or SourceRanks[Source] < SourceRanks[FirstSources[RowKey]]:
+            FirstSources[RowKey] = Source
+
+    Removed = []
+
+    with arcpy.da.UpdateCursor(MergedFeatureClass, FieldNames) as Cursor:
+        for Values in Cursor:
+            Row = dict(zip(FieldNames, Values))
+
+            if Row['CreationDateTimeLocal'] is None:
+                continue
+
+            Source = Row[TrimbleUtility.SOURCE_FIELD]
+            RowKey = TrimbleUtility.GetRowKey(FeatureClass, Row)
+            FirstSource = FirstSources[RowKey]
+
+            if SourceRanks[Source] != SourceRanks[FirstSource]:
+                Cursor.deleteRow()
+                Removed.append((RowKey, TrimbleUtility.GetSourceFileName(FirstSource), TrimbleUtility.GetSourceFileName(Source)))
+
+    return Removed
+
+def WriteDuplicatesReport(MergedGeoDB, Duplicates):
+    """
+    Writes the rows removed by 'RemoveCrossFileDuplicates', a list of
+    (FeatureClass, Key, KeptGeoDB, RemovedGeoDB) tuples, to a CSV file
+    next to the merged geodatabase, and returns its path.
+    """
+    ReportPath = os.path.splitext(MergedGeoDB)[0] + '_Duplicates_' + TrimbleUtility.GetCurrentDatetimeStr() + '.csv'
+
+    with open(ReportPath, 'w', newline='') as ReportFile:
+        Writer = csv.writer(ReportFile)
+        Writer.writerow(['FeatureClass', 'Key', 'KeptGeoDB', 'RemovedGeoDB'])
+        Writer.writerows(Duplicates)
+
+    arcpy.AddMessage("The removed duplicate rows are listed in: " + ReportPath)
+
+    return ReportPath
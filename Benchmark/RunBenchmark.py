@@ -0,0 +1,221 @@
+# RunBenchmark.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script benchmarks the 'Export*Joined' functions of
+# 'TrimbleGeoDBToDatabase' on synthetic feature classes (see
+# 'SyntheticGeoDB.py'), with the 'arcpy' stand-in in this folder
+# instead of ArcGIS, so it runs on any system with Python and NumPy.
+# For each export and row count it reports the rows read per second,
+# the peak memory of the export (measured with 'tracemalloc', in a
+# second run, so that the timing is not slowed by it) and the size of
+# the SQL script.
+#
+# The results can be saved to a JSON file and compared with an earlier
+# results file; the script exits with status 1 if any export is
+# slower, or uses more memory, by more than the tolerance.
+#
+# Usage (from the repository folder):
+#
+# python Benchmark/RunBenchmark.py
+# python Benchmark/RunBenchmark.py --rows 1000 10000 --exports ExportSecchiJoined ExportDepthJoined
+# python Benchmark/RunBenchmark.py --output Baseline.json
+# python Benchmark/RunBenchmark.py --baseline Baseline.json --tolerance 0.25
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+BENCHMARK_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [BENCHMARK_FOLDER, os.path.dirname(BENCHMARK_FOLDER)]
+
+import arcpy
+import SyntheticGeoDB
+import TrimbleGeoDBToDatabase
+
+from TrimbleGeoDBToDatabase import Continuous
+
+def GetBenchmarks(RowCount):
+    """
+    Returns the list of (name, feature class, export function, keyword
+    arguments) of the exports that are benchmarked for 'RowCount' rows.
+    The continuous exports are given the date range of all the rows.
+
+    NOTE: the stand-in 'arcpy.da.FeatureClassToNumPyArray' builds its
+    array in Python, so the columnar export is slower here, relative to
+    the others, than it is with ArcGIS.
+    """
+    FromDate, ToDate = SyntheticGeoDB.GetDateRange(RowCount)
+
+    return [('ExportSecchiJoined', 'Secchi_Joined', TrimbleGeoDBToDatabase.ExportSecchiJoined, {}),
+            ('ExportDepthJoined', 'Depth_Joined', TrimbleGeoDBToDatabase.ExportDepthJoined, {}),
+            ('ExportDepthJoined_Columnar', 'Depth_Joined', TrimbleGeoDBToDatabase.ExportDepthJoined, {'Columnar': True}),
+            ('ExportLoonsJoined', 'Loons_Joined', TrimbleGeoDBToDatabase.ExportLoonsJoined, {}),
+            ('ExportWaterSampleJoined', 'Water_Sample_Joined', TrimbleGeoDBToDatabase.ExportWaterSampleJoined, {}),
+            ('ExportMonumentJoined', 'Monument_Joined', TrimbleGeoDBToDatabase.ExportMonumentJoined, {}),
+            ('ExportContinuousJoined_DeploymentInsert', 'Deployment_Joined', TrimbleGeoDBToDatabase.ExportContinuousJoined,
+             {'ContinuousType': Continuous.DEPLOYMENT_INSERT, 'fromDate': FromDate, 'toDate': ToDate}),
+            ('ExportContinuousJoined_DeploymentUpdate', 'Deployment_Joined', TrimbleGeoDBToDatabase.ExportContinuousJoined,
+             {'ContinuousType': Continuous.DEPLOYMENT_UPDATE, 'fromDate': FromDate, 'toDate': ToDate}),
+            ('ExportContinuousJoined_RetrievalUpdate', 'Retrieval_Joined', TrimbleGeoDBToDatabase.ExportContinuousJoined,
+             {'ContinuousType': Continuous.RETRIEVAL_UPDATE, 'fromDate': FromDate, 'toDate': ToDate})]
+
+def RunExport(ExportFunction, Arguments, MeasureMemory = False):
+    """
+    Runs one export in a new temporary workspace folder, and returns
+    its (seconds, peak memory bytes, SQL script bytes). The peak memory
+    is None unless 'MeasureMemory' is True. The folder is removed
+    afterwards.
+    """
+    Folder = tempfile.mkdtemp(prefix='Benchmark_')
+
+    try:
+        arcpy.env.workspace = os.path.join(Folder, 'Benchmark.gdb')
+
+        if MeasureMemory:
+            tracemalloc.start()
+
+        try:
+            Start = time.perf_counter()
+            SqlFilePath = ExportFunction(RaiseErrors = True, **Arguments)
+            Seconds = time.perf_counter() - Start
+
+            PeakMemory = (tracemalloc.get_traced_memory()[1] if MeasureMemory else None)
+        finally:
+            if MeasureMemory:
+                tracemalloc.stop()
+
+        return (Seconds, PeakMemory, os.path.getsize(SqlFilePath))
+    finally:
+        shutil.rmtree(Folder, ignore_errors=True)
+
+def RunBenchmarks(RowCounts, Names = None, MeasureMemory = True):
+    """
+    Runs the benchmarks (see 'GetBenchmarks') for each row count in
+    'RowCounts', and returns a list of the results, one dictionary per
+    export and row count, with the keys:
+    - 'Benchmark' = the name of the benchmark.
+    - 'Rows' = the number of rows in the feature class.
+    - 'Seconds' = the time of the export.
+    - 'RowsPerSecond' = 'Rows' / 'Seconds'.
+    - 'PeakMemoryBytes' = the peak memory of the export, or None if
+      'MeasureMemory' is False.
+    - 'OutputBytes' = the size of the SQL script.
+
+    If 'Names' is given, only the benchmarks with those names are run.
+    """
+    Results = []
+
+    for RowCount in RowCounts:
+        SyntheticGeoDB.CreateSyntheticGeoDB(RowCount)
+
+        for Name, FeatureClass, ExportFunction, Arguments in GetBenchmarks(RowCount):
+            if Names is not None and Name not in Names:
+                continue
+
+            Seconds, PeakMemory, OutputBytes = RunExport(ExportFunction, Arguments)
+
+            if MeasureMemory:
+                PeakMemory = RunExport(ExportFunction, Arguments, MeasureMemory = True)[1]
+
+            Result = {'Benchmark': Name,
+                      'Rows': RowCount,
+                      'Seconds': Seconds,
+                      'RowsPerSecond': RowCount / Seconds if Seconds > 0 else None,
+                      'PeakMemoryBytes': PeakMemory,
+                      'OutputBytes': OutputBytes}
+
+            Results.append(Result)
+            PrintResult(Result)
+
+    return Results
+
+def PrintResult(Result):
+    PeakMemory = ('-' if Result['PeakMemoryBytes'] is None else format(Result['PeakMemoryBytes'] / 1048576, '.1f') + ' MiB')
+
+    print(Result['Benchmark'].ljust(42) +
+          str(Result['Rows']).rjust(9) + ' rows' +
+          format(Result['RowsPerSecond'] or 0, ',.0f').rjust(12) + ' rows/s' +
+          PeakMemory.rjust(14) + ' peak' +
+          format(Result['OutputBytes'], ',').rjust(16) + ' bytes',
+          flush=True)
+
+def CompareResults(Results, Baseline, Tolerance):
+    """
+    Compares 'Results' with the 'Baseline' results (see
+    'RunBenchmarks'), and returns a list of the regressions: the
+    benchmarks whose rows per second fell, or whose peak memory grew,
+    by more than 'Tolerance' (a fraction, e.g. 0.25 for 25%). The
+    benchmarks that are not in both are not compared.
+    """
+    Baselines = {(Result['Benchmark'], Result['Rows']): Result for Result in Baseline}
+    Regressions = []
+
+    for Result in Results:
+        Old = Baselines.get((Result['Benchmark'], Result['Rows']))
+
+        if Old is None:
+            continue
+
+        if Old['RowsPerSecond'] and Result['RowsPerSecond'] is not None:
+            if Result['RowsPerSecond'] < Old['RowsPerSecond'] * (1 - Tolerance):
+                Regressions.append(Result['Benchmark'] + ' (' + str(Result['Rows']) + ' rows): ' +
+                                   format(Result['RowsPerSecond'], ',.0f') + ' rows/s, was ' +
+                                   format(Old['RowsPerSecond'], ',.0f'))
+
+        if Old['PeakMemoryBytes'] and Result['PeakMemoryBytes'] is not None:
+            if Result['PeakMemoryBytes'] > Old['PeakMemoryBytes'] * (1 + Tolerance):
+                Regressions.append(Result['Benchmark'] + ' (' + str(Result['Rows']) + ' rows): ' +
+                                   format(Result['PeakMemoryBytes'], ',') + ' peak bytes, was ' +
+                                   format(Old['PeakMemoryBytes'], ','))
+
+    return Regressions
+
+def Main():
+    Parser = argparse.ArgumentParser(description='Benchmark the Export*Joined functions on synthetic feature classes.')
+    Parser.add_argument('--rows', type=int, nargs='+', default=SyntheticGeoDB.ROW_COUNTS,
+                        help='the row counts of the synthetic feature classes (default: %(default)s)')
+    Parser.add_argument('--exports', nargs='+', default=None,
+                        help='the names of the benchmarks to run (default: all)')
+    Parser.add_argument('--no-memory', action='store_true',
+                        help='do not measure the peak memory (the exports are run once instead of twice)')
+    Parser.add_argument('--output', default=None,
+                        help='write the results to this JSON file')
+    Parser.add_argument('--baseline', default=None,
+                        help='compare the results with this JSON results file')
+    Parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='the slowdown or memory growth, as a fraction, that is a regression (default: %(default)s)')
+    Arguments = Parser.parse_args()
+
+    Results = RunBenchmarks(Arguments.rows, Arguments.exports, not Arguments.no_memory)
+
+    if Arguments.output is not None:
+        with open(Arguments.output, 'w') as OutputFile:
+            json.dump({'Python': sys.version, 'Results': Results}, OutputFile, indent=2)
+
+    if Arguments.baseline is not None:
+        with open(Arguments.baseline, 'r') as BaselineFile:
+            Baseline = json.load(BaselineFile)['Results']
+
+        Regressions = CompareResults(Results, Baseline, Arguments.tolerance)
+
+        for Regression in Regressions:
+            print('REGRESSION: ' + Regression)
+
+        if Regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,196 @@
+# SyntheticGeoDB.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module makes the synthetic '_Joined' feature classes that the
+# benchmarks export (see 'RunBenchmark.py'). They are registered with
+# the benchmark 'arcpy' stand-in, and have the fields of the feature
+# classes made by 'TableUtility.TransformTable'.
+#
+# The rows are made from the row number alone, so the same row count
+# always gives the same data, and no row is held in memory. The data
+# has the cases the export functions handle: null creation datetimes,
+# blank and null comments, null depths, blank sample numbers, Yes/No
+# values and repeated primary keys.
+
+import datetime
+import arcpy
+
+# The row counts that are benchmarked by default.
+ROW_COUNTS = [1000, 10000, 100000, 1000000]
+
+# The number of lakes the rows are spread over.
+LAKE_COUNT = 200
+
+# The first sample date.
+START_DATETIME = datetime.datetime(2024, 6, 1, 8, 0, 0)
+
+# The fields of every '_Joined' feature class.
+COMMON_FIELDS = [('OBJECTID', 'OID'), ('Shape', 'Geometry'),
+                 ('Horz_Prec', 'Double'), ('Vert_Prec', 'Double'), ('Corr_Type', 'String'),
+                 ('GNSS_Heigh', 'Double'), ('Rcvr_Type', 'String'), ('Max_PDOP', 'Double'), ('Max_HDOP', 'Double'),
+                 ('LakeNum', 'String'), ('LakeNumField', 'String'), ('Datafile', 'String'),
+                 ('GPS_Date', 'Date'), ('GPS_Time', 'String'),
+                 ('CreationDateTimeLocal', 'Date'), ('XCurrentMapCS', 'Double'), ('YCurrentMapCS', 'Double')]
+
+def GetCommonValues(i):
+    """
+    The values of the 'COMMON_FIELDS' of row 'i'. Every 50th row has no
+    creation datetime. The lakes take turns, and each lake is sampled
+    on the next day, so that most primary keys are distinct; every
+    97th row repeats the key of the row before it.
+    """
+    Lake = (i if i % 97 else i - 1) % LAKE_COUNT
+    Day = (i if i % 97 else i - 1) // LAKE_COUNT
+
+    if i % 50 == 49:
+        CreationDateTime = None
+    else:
+        CreationDateTime = START_DATETIME + datetime.timedelta(days=Day, seconds=(i % 3600) * 7)
+
+    return {'OBJECTID': i + 1,
+            'Shape': (-150.0 + Lake * 0.01, 65.0 + Lake * 0.005),
+            'Horz_Prec': 0.25 + (i % 7) * 0.125,
+            'Vert_Prec': 0.5 + (i % 5) * 0.25,
+            'Corr_Type': 'Postprocessed Code',
+            'GNSS_Heigh': 120.0 + (i % 300) * 0.1,
+            'Rcvr_Type': 'Geo 7X',
+            'Max_PDOP': 1.5,
+            'Max_HDOP': 0.9,
+            'LakeNum': 'LAKE' + str(Lake).zfill(3),
+            'LakeNumField': 'LAKE' + str(Lake).zfill(3),
+            'Datafile': 'R' + str(Day).zfill(5) + '.ssf',
+            'GPS_Date': CreationDateTime,
+            'GPS_Time': '08:00:00am',
+            'CreationDateTimeLocal': CreationDateTime,
+            'XCurrentMapCS': -150.123456789 + Lake * 0.01 + (i % 13) * 1e-5,
+            'YCurrentMapCS': 64.98765432 + Lake * 0.005 + (i % 11) * 1e-5}
+
+def GetComment(i, Text):
+    """
+    A comment that is blank for every third row, has surrounding
+    blanks for every other row, and is plain otherwise.
+    """
+    if i % 3 == 0:
+        return '  '
+    elif i % 2 == 0:
+        return ' ' + Text + ' ' + str(i) + ' '
+    else:
+        return Text + ' ' + str(i)
+
+def GetSecchiValues(i):
+    return {'Lake_Depth_in_meters': 3.3 + (i % 10) * 0.1,
+            'Secchi_Depth_in_meters': (None if i % 5 == 0 else 0.75 + (i % 40) * 0.05),
+            'OnBottom': ('Yes' if i % 4 == 0 else 'No'),
+            'Comments': GetComment(i, 'secchi')}
+
+def GetDepthValues(i):
+    return {'Depth_in_meters': 0.5 + (i % 80) * 0.05,
+            'Comment': GetComment(i, 'depth')}
+
+def GetLoonsValues(i):
+    return {'Loon_Species': ('PALO' if i % 3 else 'COLO'),
+            'a___of_Adults': 1 + i % 2,
+            'a___of_Young': i % 3,
+            'On_Water_': 'Yes',
+            'Identification_Method': ('Visual' if i % 2 else 'Aural'),
+            'Loon_Comments': GetComment(i, 'loon')}
+
+def GetWaterSampleValues(i):
+    return {'Depth_in_meters': (None if i % 4 == 0 else 1.5 + (i % 6) * 0.5),
+            'Water_Bottles_Collected_': ('Yes' if i % 2 else 'No'),
+            'Sample_Number__A__B__C_': ('' if i % 3 == 0 else 'ABC'[i % 3]),
+            'Comment': GetComment(i, 'sample')}
+
+def GetMonumentValues(i):
+    return {'MonType': ('Rebar' if i % 2 else 'Stake'),
+            'Location': GetComment(i, 'shore'),
+            'Comment': GetComment(i + 1, 'monument'),
+            'AccessType': ('Float' if i % 3 else 'Wheel'),
+            'DeviceType': 'Geo 7X',
+            'CorrStatus': 'Postprocessed',
+            'HorizEstAcc': 0.3,
+            'VertEstAcc': 0.4,
+            'FeatureHeight': 100.5 + (i % 50) * 0.1}
+
+def GetContinuousValues(i):
+    return {'Lake_Depth_in_meters': 3.0,
+            'Deployment_Type': (None if i % 3 == 0 else 'Sonde'),
+            'Comments': GetComment(i, 'deployment')}
+
+# The name, extra fields and function of the extra values of each
+# synthetic feature class.
+FEATURE_CLASSES = [('Secchi_Joined',
+                    [('Lake_Depth_in_meters', 'Double'), ('Secchi_Depth_in_meters', 'Double'), ('OnBottom', 'String'), ('Comments', 'String')],
+                    GetSecchiValues),
+                   ('Depth_Joined',
+                    [('Depth_in_meters', 'Double'), ('Comment', 'String')],
+                    GetDepthValues),
+                   ('Loons_Joined',
+                    [('Loon_Species', 'String'), ('a___of_Adults', 'Integer'), ('a___of_Young', 'Integer'), ('On_Water_', 'String'),
+                     ('Identification_Method', 'String'), ('Loon_Comments', 'String')],
+                    GetLoonsValues),
+                   ('Water_Sample_Joined',
+                    [('Depth_in_meters', 'Double'), ('Water_Bottles_Collected_', 'String'), ('Sample_Number__A__B__C_', 'String'), ('Comment', 'String')],
+                    GetWaterSampleValues),
+                   ('Monument_Joined',
+                    [('MonType', 'String'), ('Location', 'String'), ('Comment', 'String'), ('AccessType', 'String'),
+                     ('DeviceType', 'String'), ('CorrStatus', 'String'), ('HorizEstAcc', 'Double'), ('VertEstAcc', 'Double'),
+                     ('FeatureHeight', 'Double')],
+                    GetMonumentValues),
+                   ('Deployment_Joined',
+                    [('Lake_Depth_in_meters', 'Double'), ('Deployment_Type', 'String'), ('Comments', 'String')],
+                    GetContinuousValues),
+                   ('Retrieval_Joined',
+                    [('Lake_Depth_in_meters', 'Double'), ('Deployment_Type', 'String'), ('Comments', 'String')],
+                    GetContinuousValues)]
+
+def GetRowFunction(FieldNames, ValuesFunction, HasNullDates):
+    """
+    Returns the function that makes row 'i' of a feature class: the
+    common values and the feature class's own values, in the order of
+    'FieldNames'.
+    """
+    def GetRow(i):
+        Values = GetCommonValues(i)
+        Values.update(ValuesFunction(i))
+
+        # The monument and continuous feature classes always have a
+        # creation datetime.
+        if not HasNullDates and Values['CreationDateTimeLocal'] is None:
+            Values['CreationDateTimeLocal'] = START_DATETIME + datetime.timedelta(days=i // LAKE_COUNT)
+
+        return tuple(Values[Name] for Name in FieldNames)
+
+    return GetRow
+
+def CreateSyntheticGeoDB(RowCount):
+    """
+    Registers the synthetic '_Joined' feature classes, each with
+    'RowCount' rows, with the benchmark 'arcpy' stand-in. Returns the
+    names of the feature classes.
+    """
+    Names = []
+
+    for Name, ExtraFields, ValuesFunction in FEATURE_CLASSES:
+        Fields = COMMON_FIELDS + ExtraFields
+        FieldNames = [FieldName for FieldName, FieldType in Fields]
+        HasNullDates = Name not in ('Monument_Joined', 'Deployment_Joined', 'Retrieval_Joined')
+
+        arcpy.RegisterFeatureClass(Name, Fields, RowCount, GetRowFunction(FieldNames, ValuesFunction, HasNullDates))
+        Names.append(Name)
+
+    return Names
+
+def GetDateRange(RowCount):
+    """
+    The ('YYYY-MM-DD', 'YYYY-MM-DD') range of the creation dates of
+    'RowCount' rows, for the continuous exports.
+    """
+    LastDay = START_DATETIME + datetime.timedelta(days=RowCount // LAKE_COUNT + 1)
+
+    return (START_DATETIME.strftime('%Y-%m-%d'), LastDay.strftime('%Y-%m-%d'))
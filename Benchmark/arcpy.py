@@ -0,0 +1,248 @@
+# arcpy.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module is a stand-in for the parts of ArcGIS's 'arcpy' module
+# that the export functions in 'TrimbleGeoDBToDatabase' use, so that
+# they can be benchmarked on a system without ArcGIS (see
+# 'RunBenchmark.py'). It is NOT a geodatabase: the feature classes are
+# registered with 'RegisterFeatureClass' (see 'SyntheticGeoDB.py'),
+# and their rows are made by a function as the cursor reads them, so
+# that the data is never held in memory and the memory measured is
+# that of the export.
+#
+# Only this folder should be on the Python path ahead of the real
+# 'arcpy'; it is never imported by the tool itself.
+
+import datetime
+import re
+import types
+
+class Environment:
+    def __init__(self):
+        self.workspace = None
+        self.overwriteOutput = False
+
+env = Environment()
+
+# The messages reported with 'AddMessage'.
+MESSAGES = []
+
+def AddMessage(Message):
+    MESSAGES.append(Message)
+
+# The progressor is not shown; its calls do nothing.
+def SetProgressor(Type, Message = '', Minimum = 0, Maximum = 100, Interval = 1):
+    pass
+
+def SetProgressorLabel(Label):
+    pass
+
+def SetProgressorPosition(Position = None):
+    pass
+
+def ResetProgressor():
+    pass
+
+# The registered feature classes: the name of each feature class and
+# its 'FeatureClass'.
+FEATURE_CLASSES = {}
+
+class Field:
+    """
+    The 'name' and 'type' of a field, as listed by 'ListFields'.
+    """
+
+    def __init__(self, Name, Type):
+        self.name = Name
+        self.type = Type
+
+class FeatureClass:
+    """
+    A registered feature class.
+
+    Parameters:
+    - Fields = a list of the (name, type) of each field. The types are
+      the 'arcpy' field types, e.g. 'OID', 'String', 'Double', 'Date'.
+    - RowCount = the number of rows.
+    - RowFunction = a function that takes the row number (from 0) and
+      returns the tuple of the row's values, in the order of 'Fields'.
+    """
+
+    def __init__(self, Fields, RowCount, RowFunction):
+        self.Fields = [Field(Name, Type) for Name, Type in Fields]
+        self.FieldNames = [Name for Name, Type in Fields]
+        self.RowCount = RowCount
+        self.RowFunction = RowFunction
+
+    def IterRows(self, FieldNames, WhereClause = None):
+        Positions = [self.FieldNames.index(Name) for Name in FieldNames]
+        Condition = GetWhereFunction(self.FieldNames, WhereClause)
+
+        for i in range(self.RowCount):
+            Row = self.RowFunction(i)
+
+            if Condition is None or Condition(Row):
+                yield tuple(Row[Position] for Position in Positions)
+
+def RegisterFeatureClass(Name, Fields, RowCount, RowFunction):
+    """
+    Registers the feature class 'Name' (see 'FeatureClass'), replacing
+    any feature class of the same name.
+    """
+    FEATURE_CLASSES[Name] = FeatureClass(Fields, RowCount, RowFunction)
+
+def GetFeatureClass(Name):
+    # A feature class may be given by its path in the workspace.
+    Name = Name.replace('\\', '/').split('/')[-1]
+
+    if Name not in FEATURE_CLASSES:
+        raise Exception("The feature class '" + Name + "' does not exist.")
+
+    return FEATURE_CLASSES[Name]
+
+def ListFields(FeatureClassName):
+    return list(GetFeatureClass(FeatureClassName).Fields)
+
+def Exists(FeatureClassName):
+    return FeatureClassName.replace('\\', '/').split('/')[-1] in FEATURE_CLASSES
+
+# The terms of the where clauses that the stand-in cursors understand:
+# '<field> IS [NOT] NULL', '<field> <operator> <value>', where the
+# value is a number, a 'quoted' text, or a date
+# (date 'YYYY-MM-DD' or timestamp 'YYYY-MM-DD HH:MM:SS'), and
+# '<field> IN (<value>, ...)'; joined by AND.
+WHERE_VALUE = r"(?:(?:date|timestamp)\s+)?(?:'(?:[^']|'')*'|[-+0-9.]+)"
+WHERE_NULL_TERM = re.compile(r"^\s*(\w+)\s+IS\s+(NOT\s+)?NULL\s*$", re.IGNORECASE)
+WHERE_COMPARE_TERM = re.compile(r"^\s*(\w+)\s*(<=|>=|<>|=|<|>)\s*(?:(date|timestamp)\s+)?('(?:[^']|'')*'|[-+0-9.]+)\s*$", re.IGNORECASE)
+WHERE_IN_TERM = re.compile(r"^\s*(\w+)\s+IN\s*\(\s*(" + WHERE_VALUE + r"(?:\s*,\s*" + WHERE_VALUE + r")*)\s*\)\s*$", re.IGNORECASE)
+WHERE_IN_VALUE = re.compile(r"(?:(date|timestamp)\s+)?('(?:[^']|'')*'|[-+0-9.]+)", re.IGNORECASE)
+
+COMPARE_OPERATORS = {'=': lambda a, b: a == b,
+                     '<>': lambda a, b: a != b,
+                     '<': lambda a, b: a < b,
+                     '<=': lambda a, b: a <= b,
+                     '>': lambda a, b: a > b,
+                     '>=': lambda a, b: a >= b}
+
+def GetWhereFunction(FieldNames, WhereClause):
+    """
+    Returns a function that takes a row (a tuple in the order of
+    'FieldNames') and returns True if it matches 'WhereClause', or None
+    if there is no where clause. A clause that is not understood raises
+    an exception, so that a benchmark never silently reads the wrong
+    rows.
+    """
+    if WhereClause is None or WhereClause.strip() == '':
+        return None
+
+    Terms = []
+
+    for Term in re.split(r"\s+AND\s+", WhereClause.strip(), flags=re.IGNORECASE):
+        Term = Term.strip()
+
+        while Term.startswith('(') and Term.endswith(')'):
+            Term = Term[1:-1].strip()
+
+        Match = WHERE_NULL_TERM.match(Term)
+
+        if Match:
+            Position = FieldNames.index(Match.group(1))
+            IsNull = Match.group(2) is None
+            Terms.append(lambda Row, p=Position, n=IsNull: (Row[p] is None) == n)
+            continue
+
+        Match = WHERE_COMPARE_TERM.match(Term)
+
+        if Match:
+            Position = FieldNames.index(Match.group(1))
+            Operator = COMPARE_OPERATORS[Match.group(2)]
+            Value = GetWhereValue(Match.group(3), Match.group(4))
+            Terms.append(lambda Row, p=Position, o=Operator, v=Value: Row[p] is not None and o(Row[p], v))
+            continue
+
+        Match = WHERE_IN_TERM.match(Term)
+
+        if Match:
+            Position = FieldNames.index(Match.group(1))
+            Values = set(GetWhereValue(Kind or None, Text) for Kind, Text in WHERE_IN_VALUE.findall(Match.group(2)))
+            Terms.append(lambda Row, p=Position, v=Values: Row[p] in v)
+            continue
+
+        raise Exception("The where clause term '" + Term + "' is not supported by the benchmark arcpy stand-in.")
+
+    return lambda Row: all(Term(Row) for Term in Terms)
+
+def GetWhereValue(Kind, Text):
+    if Text.startswith("'"):
+        Text = Text[1:-1].replace("''", "'")
+
+        if Kind is None:
+            return Text
+        elif Kind.lower() == 'date':
+            return datetime.datetime.strptime(Text, '%Y-%m-%d')
+        else:
+            return datetime.datetime.strptime(Text, '%Y-%m-%d %H:%M:%S')
+
+    return float(Text)
+
+class SearchCursor:
+    """
+    A read-only cursor over the 'FieldNames' of a registered feature
+    class, as with 'arcpy.da.SearchCursor'.
+    """
+
+    def __init__(self, FeatureClassName, FieldNames, where_clause = None, spatial_reference = None):
+        self.Rows = GetFeatureClass(FeatureClassName).IterRows(list(FieldNames), where_clause)
+
+    def __iter__(self):
+        return self.Rows
+
+    def __next__(self):
+        return next(self.Rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ExceptionType, ExceptionValue, Traceback):
+        self.Rows.close()
+
+# The NumPy types of the 'arcpy' field types, for
+# 'FeatureClassToNumPyArray'.
+NUMPY_TYPES = {'OID': 'i4',
+               'Integer': 'i4',
+               'SmallInteger': 'i2',
+               'Double': 'f8',
+               'Single': 'f4',
+               'Date': 'M8[us]',
+               'String': 'U255'}
+
+def FeatureClassToNumPyArray(FeatureClassName, FieldNames, where_clause = None, null_value = None):
+    """
+    Returns the 'FieldNames' of a registered feature class as a NumPy
+    structured array, as with 'arcpy.da.FeatureClassToNumPyArray'. The
+    nulls are replaced by their 'null_value', if any.
+    """
+    import numpy
+
+    Class = GetFeatureClass(FeatureClassName)
+    Types = {Field.name: Field.type for Field in Class.Fields}
+    NullValues = ({} if null_value is None else null_value)
+
+    DType = [(Name, NUMPY_TYPES[Types[Name]]) for Name in FieldNames]
+    Rows = [tuple((NullValues.get(Name) if Value is None else Value) for Name, Value in zip(FieldNames, Row))
+            for Row in Class.IterRows(list(FieldNames), where_clause)]
+
+    return numpy.array(Rows, dtype=DType)
+
+da = types.SimpleNamespace(SearchCursor=SearchCursor,
+                           FeatureClassToNumPyArray=FeatureClassToNumPyArray)
+
+def GetCount(FeatureClassName):
+    return [str(GetFeatureClass(FeatureClassName).RowCount)]
+
+management = types.SimpleNamespace(GetCount=GetCount)
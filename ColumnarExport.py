@@ -0,0 +1,180 @@
+# ColumnarExport.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains a columnar alternative to the row at a time
+# formatting of the export functions in 'TrimbleGeoDBToDatabase'. The
+# needed fields of a '_Joined' feature class are read into a NumPy
+# structured array with 'arcpy.da.FeatureClassToNumPyArray'. The
+# rounding, null substitution, date and time formatting, and Yes/No to
+# bit conversion are then done on whole columns, and the SQL values of
+# each record are built by joining the preformatted columns. The
+# export functions only write the resulting strings.
+#
+# The formatting matches the row at a time functions, so the SQL
+# scripts are the same.
+
+import arcpy
+import itertools
+import numpy
+import TrimbleUtility
+
+# The value read for a null text field.
+NULL_TEXT = ''
+
+# The value read for a null numeric (floating point) field. It is
+# written as NULL (see 'FormatNumbers').
+NULL_NUMBER = numpy.nan
+
+def ReadColumns(FeatureClassName, FieldNames, TextFieldNames = (), NumberFieldNames = (), WhereClause = None):
+    """
+    Returns the 'FieldNames' of the feature class as a NumPy structured
+    array. The nulls of the 'TextFieldNames' are read as 'NULL_TEXT',
+    and those of the 'NumberFieldNames' as 'NULL_NUMBER'. The parameter
+    'WhereClause' is an optional SQL expression that is passed to the
+    cursor, so that only the matching rows are read.
+    """
+    NullValues = {FieldName: NULL_TEXT for FieldName in TextFieldNames}
+    NullValues.update((FieldName, NULL_NUMBER) for FieldName in NumberFieldNames)
+
+    return arcpy.da.FeatureClassToNumPyArray(FeatureClassName, FieldNames, where_clause=WhereClause, null_value=NullValues)
+
+def FormatText(Column):
+    """
+    The same as 'str(Value)' for each value of a text column.
+    """
+    return Column.astype(str)
+
+def FormatNumbers(Column, Digits = None):
+    """
+    The same as 'str(Value)', or 'str(round(Value, Digits))' if
+    'Digits' is given, for each value of a numeric column read by
+    'ReadColumns', and 'NULL' for each null ('NULL_NUMBER') value.
+    """
+    # The cursor reads single precision fields as Python (double
+    # precision) floats; format them the same way.
+    Values = Column.astype(float)
+    Nulls = numpy.isnan(Values)
+
+    if Digits is not None:
+        # 'numpy.round' rounds the scaled value, so a value whose
+        # scaled value is (close to) a half can be rounded the other
+        # way than by 'round', which rounds the exact binary value
+        # (e.g. 0.65 is 0.7 with 'round', but 0.6 with 'numpy.round').
+        # Only those values are rounded again with 'round'; 'numpy.round'
+        # is the same as 'round' for all the others.
+        Rounded = numpy.round(Values, Digits)
+        Scaled = Values * 10.0 ** Digits
+        Halves = numpy.flatnonzero(numpy.abs(numpy.abs(Scaled - numpy.trunc(Scaled)) - 0.5) < 1e-6)
+
+        for i in Halves.tolist():
+            Rounded[i] = round(float(Values[i]), Digits)
+
+        Values = Rounded
+
+    return numpy.where(Nulls, 'NULL', Values.astype(str))
+
+def FormatDates(Column):
+    """
+    The same as "TrimbleUtility.GetDateTime(Value, 'd')" for each value
+    of a datetime64 column: 'YYYY-MM-DD'.
+    """
+    return numpy.datetime_as_string(Column, unit='D')
+
+def FormatTimes(Column):
+    """
+    The same as "TrimbleUtility.GetDateTime(Value, 't')" for each value
+    of a datetime64 column: 'HH:MM:SS'.
+    """
+    return numpy.char.partition(numpy.datetime_as_string(Column, unit='s'), 'T')[:, 2]
+
+def FormatNullableText(Column, NullStr, Before, After):
+    """
+    For each value of a text column, with the leading and trailing
+    blanks removed: 'NullStr' if the value is empty, otherwise
+    'Before + Value + After'.
+    """
+    Stripped = numpy.char.strip(Column.astype(str))
+
+    return numpy.where(Stripped == '', NullStr, numpy.char.add(numpy.char.add(Before, Stripped), After))
+
+def JoinColumns(*Columns):
+    """
+    Joins the formatted columns (arrays, or strings that are repeated
+    on every row) element by element, and returns a list of strings.
+    This is the one step done row by row: joining the row's pieces
+    into one string is faster with 'str.join' than by concatenating
+    the NumPy string columns one after the other.
+    """
+    Parts = [(itertools.repeat(Column) if isinstance(Column, str) else Column.tolist()) for Column in Columns]
+
+    return list(map(''.join, zip(*Parts)))
+
+def IterDepthJoinedRecords(FeatureClass, SourceFileName, Metrics = None, WhereClause = None):
+    """
+    The columnar equivalent of
+    'TrimbleGeoDBToDatabase.IterDepthJoinedRecords': yields the
+    (PondName, SampleDate, KeyValues, Values) of each valid
+    Depth_Joined record.
+    If 'Metrics' (a 'RunMetrics.RunMetrics') is given, the rows are
+    counted as read by its current stage. If 'WhereClause' is given,
+    only the rows that match it are read. The 'SourceFileName' is
+    written in the SOURCE column, unless the feature class was merged
+    from several geodatabases (see 'TrimbleUtility.SOURCE_FIELD').
+    """
+    FieldNames = ['CreationDateTimeLocal', 'LakeNum', 'YCurrentMapCS', 'XCurrentMapCS', 'Depth_in_meters',
+                  'Comment', 'GNSS_Heigh', 'Vert_Prec', 'Horz_Prec', 'Datafile']
+    TextFieldNames = ['LakeNum', 'Comment', 'Datafile']
+    NumberFieldNames = ['YCurrentMapCS', 'XCurrentMapCS', 'Depth_in_meters', 'GNSS_Heigh', 'Vert_Prec', 'Horz_Prec']
+
+    # The rows of a merged feature class also name their source
+    # geodatabase (see 'TableSpec.IterExportRows').
+    SourceField = TrimbleUtility.GetSourceField(FeatureClass)
+
+    if SourceField is not None:
+        FieldNames.append(SourceField)
+        TextFieldNames.append(SourceField)
+
+    Columns = ReadColumns(FeatureClass, FieldNames, TextFieldNames, NumberFieldNames,
+                          # A record without a creation datetime is not a
+                          # valid record.
+                          WhereClause = ('CreationDateTimeLocal IS NOT NULL' if WhereClause is None else
+                                         'CreationDateTimeLocal IS NOT NULL AND ' + WhereClause))
+
+    if Metrics is not None:
+        Metrics.AddRowsRead(len(Columns))
+
+    if len(Columns) == 0:
+        return
+
+    PondNames = FormatText(Columns['LakeNum'])
+    SampleDates = FormatDates(Columns['CreationDateTimeLocal'])
+
+    if SourceField is None:
+        Sources = SourceFileName
+    else:
+        Sources = numpy.array([TrimbleUtility.GetSourceFileName(Path) for Path in Columns[SourceField].tolist()])
+
+    SampleTimes = FormatTimes(Columns['CreationDateTimeLocal'])
+
+    # The values of the tblPondDepths key, for the validation query.
+    KeyValues = list(map(list, zip(PondNames.tolist(), SampleDates.tolist(), SampleTimes.tolist())))
+
+    Values = JoinColumns("'", PondNames,
+                         "','", SampleDates,
+                         "','", SampleTimes,
+                         "',", FormatNumbers(Columns['YCurrentMapCS'], 6),
+                         ",", FormatNumbers(Columns['XCurrentMapCS'], 6),
+                         ",", FormatNumbers(Columns['Depth_in_meters'], 1),
+                         FormatNullableText(Columns['Comment'], ",NULL,'", ",'", "','"),
+                         FormatText(Columns['Datafile']),
+                         "',", FormatNumbers(Columns['GNSS_Heigh']),
+                         ",", FormatNumbers(Columns['Vert_Prec']),
+                         ",", FormatNumbers(Columns['Horz_Prec']),
+                         ",'", Sources, "'")
+
+    yield from zip(PondNames.tolist(), SampleDates.tolist(), KeyValues, Values)
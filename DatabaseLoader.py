@@ -0,0 +1,254 @@
+# DatabaseLoader.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains the functions that load records directly into
+# a database through a DB-API (PEP 249) connection, as an alternative
+# to writing an SQL script file. The records are sent with
+# parameterized 'executemany' batches inside one transaction, so
+# either all the records are committed or none are (the same as
+# 'TrimbleGeoDBToDatabase.WrapSQLStatementsInTransaction').
+#
+# This module does not import arcpy or any database driver. The
+# connections are made by a function given to the 'ConnectionPool'
+# (e.g. 'pyodbc.connect' for SQL Server, or 'sqlite3.connect' for
+# testing on a local database).
+
+import itertools
+import queue
+import threading
+
+from contextlib import contextmanager
+
+class ConnectionPool:
+    """
+    A pool of DB-API connections that may be shared by several
+    threads, so that several loads can run at once.
+
+    Parameters:
+    - ConnectFunction = a function that takes no arguments and returns
+      a new DB-API connection. For 'sqlite3' the connections are used
+      by other threads than the one that made them, so pass
+      'check_same_thread=False', e.g.:
+        lambda: sqlite3.connect(DBPath, check_same_thread=False)
+    - MaxConnections = the largest number of connections that are
+      open at once. A thread that asks for a connection when all of
+      them are in use waits for one to be returned.
+    - ParamStyle = the DB-API 'paramstyle' of the driver; 'qmark'
+      (default, e.g. pyodbc and sqlite3) or 'format'. The records are
+      sequences of parameters, so the 'named' and 'pyformat' styles
+      are not used.
+    """
+
+    def __init__(self, ConnectFunction, MaxConnections = 4, ParamStyle = 'qmark'):
+        self.ConnectFunction = ConnectFunction
+        self.MaxConnections = MaxConnections
+        self.ParamStyle = ParamStyle
+        self.Idle = queue.LifoQueue()
+        self.Opened = []
+        self.Lock = threading.Lock()
+
+    @contextmanager
+    def Connection(self):
+        """
+        Borrow a connection from the pool for the duration of a 'with'
+        block.
+        """
+        Connection = self.Acquire()
+
+        try:
+            yield Connection
+        finally:
+            self.Idle.put(Connection)
+
+    def Acquire(self):
+        try:
+            return self.Idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.Lock:
+            if len(self.Opened) < self.MaxConnections:
+                Connection = self.ConnectFunction()
+                self.Opened.append(Connection)
+                return Connection
+
+        return self.Idle.get()
+
+    def CloseAll(self):
+        with self.Lock:
+            for Connection in self.Opened:
+                Connection.close()
+
+            self.Opened = []
+            self.Idle = queue.LifoQueue()
+
+def GetPlaceholders(ParamStyle, Columns):
+    if ParamStyle == 'qmark':
+        return ['?' for Column in Columns]
+    elif ParamStyle == 'format':
+        return ['%s' for Column in Columns]
+    else:
+        raise Exception("Value of 'ParamStyle' parameter is not valid.")
+
+def GetInsertStatement(TableName, Columns, ParamStyle = 'qmark'):
+    """
+    Returns a parameterized 'INSERT INTO TableName(Columns) VALUES(...)'
+    statement.
+    """
+    Placeholders = GetPlaceholders(ParamStyle, Columns)
+
+    return "INSERT INTO " + TableName + "(" + ','.join(Columns) + ") VALUES(" + ','.join(Placeholders) + ")"
+
+def GetUpdateStatement(TableName, SetColumns, KeyColumns, ParamStyle = 'qmark'):
+    """
+    Returns a parameterized
+    'UPDATE TableName SET SetColumns = ... WHERE KeyColumns = ...'
+    statement. The parameters of each record are the 'SetColumns'
+    values followed by the 'KeyColumns' values.
+    """
+    SetPlaceholders = GetPlaceholders(ParamStyle, SetColumns)
+    KeyPlaceholders = GetPlaceholders(ParamStyle, KeyColumns)
+
+    return ("UPDATE " + TableName + " SET " +
+            ', '.join(Column + ' = ' + Placeholder for Column, Placeholder in zip(SetColumns, SetPlaceholders)) +
+            " WHERE " +
+            ' AND '.join(Column + ' = ' + Placeholder for Column, Placeholder in zip(KeyColumns, KeyPlaceholders)))
+
+def LoadRecords(Pool, Statement, Records, BatchSize = 1000, Check = None):
+    """
+    Executes the parameterized 'Statement' for each record in
+    'Records' (an iterable of parameter tuples) in batches of
+    'BatchSize' records, on one connection borrowed from 'Pool'.
+
+    All the batches are in one transaction. If every batch succeeds
+    the transaction is committed; otherwise it is rolled back and the
+    error is raised again, and NO records have been loaded.
+
+    'Check' is an optional function that is called with the cursor
+    after the last batch, before the commit, e.g. to check the loaded
+    records against their parent records (see 'CountKeys'). If it
+    raises an error, the transaction is rolled back in the same way.
+
+    Returns the (RecordCount, RowCount) tuple: the number of records
+    sent, and the number of rows inserted or updated, the sum of the
+    cursor's 'rowcount' of each batch (e.g. an UPDATE record whose key
+    matches no row updates none). The RowCount is None if the driver
+    does not report it. The records are read from 'Records' one batch
+    at a time, so a generator may be passed.
+    """
+    RecordIterator = iter(Records)
+    Count = 0
+    RowCount = 0
+
+    with Pool.Connection() as Connection:
+        Cursor = Connection.cursor()
+
+        try:
+            while True:
+                Batch = list(itertools.islice(RecordIterator, BatchSize))
+
+                if len(Batch) == 0:
+                    break
+
+                Cursor.executemany(Statement, Batch)
+                Count = Count + len(Batch)
+
+                # A 'rowcount' of -1 is not known.
+                if RowCount is not None and Cursor.rowcount is not None and Cursor.rowcount >= 0:
+                    RowCount = RowCount + Cursor.rowcount
+                else:
+                    RowCount = None
+
+            if Check is not None:
+                Check(Cursor)
+
+            Connection.commit()
+        except Exception:
+            Connection.rollback()
+            raise
+        finally:
+            Cursor.close()
+
+    return (Count, RowCount)
+
+# The largest number of keys of one 'CountKeys' query: at most 999
+# parameters (the smallest limit, that of older SQLite versions; SQL
+# Server allows 2100), and at most 500 SELECTs joined by UNION ALL (the
+# SQLite limit).
+MAX_KEY_PARAMETERS = 999
+MAX_KEY_SELECTS = 500
+
+def GetCountKeysQuery(TableName, KeyColumns, KeyCount, ParamStyle = 'qmark'):
+    """
+    Returns the parameterized query that counts the rows of 'TableName'
+    of each of 'KeyCount' keys, e.g. for the key columns PONDNAME and
+    SAMPLEDATE:
+
+    SELECT Keys.KeyNumber, COUNT(Target.PONDNAME)
+    FROM (SELECT 0 AS KeyNumber, ? AS PONDNAME, ? AS SAMPLEDATE
+          UNION ALL SELECT 1, ?, ? ...) AS Keys
+    LEFT JOIN TableName AS Target
+    ON Target.PONDNAME = Keys.PONDNAME AND Target.SAMPLEDATE = Keys.SAMPLEDATE
+    GROUP BY Keys.KeyNumber
+
+    The parameters are the values of the keys, in order. The counts are
+    returned by the number of the key, so the values of a key need not
+    be the same type as those of its columns (e.g. a date as text).
+    """
+    Placeholders = GetPlaceholders(ParamStyle, KeyColumns)
+
+    Selects = ["SELECT 0 AS KeyNumber, " + ', '.join(Placeholder + ' AS ' + Column for Column, Placeholder in zip(KeyColumns, Placeholders))]
+
+    for i in range(1, KeyCount):
+        Selects.append("SELECT " + str(i) + ", " + ', '.join(Placeholders))
+
+    return ("SELECT Keys.KeyNumber, COUNT(Target." + KeyColumns[0] + ") FROM (" + ' UNION ALL '.join(Selects) + ") AS Keys" +
+            " LEFT JOIN " + TableName + " AS Target ON " +
+            ' AND '.join('Target.' + Column + ' = Keys.' + Column for Column in KeyColumns) +
+            " GROUP BY Keys.KeyNumber")
+
+def CountKeys(Cursor, TableName, KeyColumns, Keys, ParamStyle = 'qmark'):
+    """
+    Returns the list of the (Key, Count) of each of the 'Keys' (tuples
+    of the values of the 'KeyColumns'): the number of rows of
+    'TableName' with that key. The keys are counted by set, with one
+    query (see 'GetCountKeysQuery') per chunk of up to
+    'MAX_KEY_PARAMETERS' values and 'MAX_KEY_SELECTS' keys, on
+    'Cursor', so the rows of its open transaction are counted.
+    """
+    ChunkSize = max(1, min(MAX_KEY_SELECTS, MAX_KEY_PARAMETERS // len(KeyColumns)))
+
+    Counts = []
+
+    for Start in range(0, len(Keys), ChunkSize):
+        Chunk = Keys[Start:Start + ChunkSize]
+
+        Cursor.execute(GetCountKeysQuery(TableName, KeyColumns, len(Chunk), ParamStyle),
+                       [Value for Key in Chunk for Value in Key])
+
+        ChunkCounts = dict((int(KeyNumber), Count) for KeyNumber, Count in Cursor.fetchall())
+
+        Counts.extend((Key, ChunkCounts.get(i, 0)) for i, Key in enumerate(Chunk))
+
+    return Counts
+
+def GetMissingKeys(Pool, TableName, KeyColumns, Keys):
+    """
+    Returns the list of the 'Keys' (tuples of the values of the
+    'KeyColumns') that match no row of 'TableName', e.g. the keys of
+    the UPDATE records that updated no row (see 'LoadRecords'). The
+    keys are counted by set (see 'CountKeys'), on one connection
+    borrowed from 'Pool'.
+    """
+    with Pool.Connection() as Connection:
+        Cursor = Connection.cursor()
+
+        try:
+            return [Key for Key, Count in CountKeys(Cursor, TableName, KeyColumns, Keys, Pool.ParamStyle) if Count == 0]
+        finally:
+            Cursor.close()
@@ -26,6 +26,10 @@ def TransformGeoDB():
     # Transform and write SQL 'INSERT' statements.
     TrimbleGeoDBToDatabase.ExportSecchiJoined()
 
+    # Or, run all the exports at once; 'Results' lists the success or
+    # failure and the time of each export.
+    # Results = TrimbleGeoDBToDatabase.ExportAll(Workers = 4)
+
     # Find duplicate keys in records; collect duplicates in a
     # dictionary.
     # 'd' is a dictionary.
@@ -25,7 +25,7 @@ def TransformGeoDB():
     """
     This script transforms Feature Classes, processed by Trimble
     Pathfinder, and transforms them into '_Joined' Feature Classes by
-    using the imported function 'TableUtility.TransformTable'.
+    using the imported function 'TableUtility.TransformAll'.
     """
 
     GEO_DB_PATH = "C:/fake_dir/fake.gdb"
@@ -41,55 +41,30 @@ def TransformGeoDB():
     RetrievalFCName = "GCS_2011_Retrieval_8_15_2024"
 
     KeepFieldsFun = TableUtility.GetKeptFieldsFromPathfinder
-    AlterFieldsFun = TableUtility.AlterFieldNamesFromPathFinder
-
-    print("Transforming WATER_SAMPLE")
-    TableUtility.TransformTable(Feature.WATER_SAMPLE,
-                                WaterSampleFCName,
-                                MonumentFCName,
-                                KeepFieldsFun,
-                                AlterFieldsFun,
-                                "Water_Sample_Joined")
-
-    print("Transforming DEPTH")
-    TableUtility.TransformTable(Feature.DEPTH,
-                                DepthFCName,
-                                MonumentFCName,
-                                KeepFieldsFun,
-                                AlterFieldsFun,
-                                "Depth_Joined")
-
-    print("Transforming SECCHI")
-    TableUtility.TransformTable(Feature.SECCHI,
-                                SecchiFCName,
-                                MonumentFCName,
-                                KeepFieldsFun,
-                                AlterFieldsFun,
-                                "Secchi_Joined")
-
-    print("Transforming LOON")
-    TableUtility.TransformTable(Feature.LOON,
-                                LoonFCName,
-                                MonumentFCName,
-                                KeepFieldsFun,
-                                AlterFieldsFun,
-                                "Loons_Joined")
-
-    print("Transforming DEPLOYMENT")
-    TableUtility.TransformTable(Feature.DEPLOYMENT,
-                                DeploymentFCName,
-                                MonumentFCName,
-                                KeepFieldsFun,
-                                AlterFieldsFun,
-                                "Deployment_Joined")
-
-    print("Transforming RETRIEVAL")
-    TableUtility.TransformTable(Feature.RETRIEVAL,
-                                RetrievalFCName,
-                                MonumentFCName,
-                                KeepFieldsFun,
-                                AlterFieldsFun,
-                                "Retrieval_Joined")
+    RenameFieldsFun = TableUtility.GetFieldRenamesFromPathfinder
+
+    # Transform all the feature types in parallel worker processes.
+    # Each feature type is transformed in its own scratch geodatabase
+    # and then copied into 'GEO_DB_PATH'. With 'UseCache = True', the
+    # feature types whose inputs have not changed since the last run
+    # are not transformed again. To transform a single feature
+    # type, call 'TableUtility.TransformTable' instead, e.g.:
+    #   TableUtility.TransformTable(Feature.DEPTH, DepthFCName, MonumentFCName,
+    #                               KeepFieldsFun, RenameFieldsFun, "Depth_Joined")
+    Reports = TableUtility.TransformAll([(Feature.WATER_SAMPLE, WaterSampleFCName, "Water_Sample_Joined"),
+                                         (Feature.DEPTH, DepthFCName, "Depth_Joined"),
+                                         (Feature.SECCHI, SecchiFCName, "Secchi_Joined"),
+                                         (Feature.LOON, LoonFCName, "Loons_Joined"),
+                                         (Feature.DEPLOYMENT, DeploymentFCName, "Deployment_Joined"),
+                                         (Feature.RETRIEVAL, RetrievalFCName, "Retrieval_Joined")],
+                                        MonumentFCName,
+                                        KeepFieldsFun,
+                                        RenameFieldsFun,
+                                        UseCache = True)
+
+    for FeatureType, Report in Reports.items():
+        if not Report['Succeeded']:
+            print(FeatureType.name + ': ' + Report['Error'])
 
 if __name__ == "__main__":
     TransformGeoDB()
@@ -0,0 +1,72 @@
+##### Command line usage ######
+# When the variable 'GEO_DB_FOLDER' is set to the folder of the
+# season's geodatabases (see below), the expectation is that the user
+# will execute this program by using the installed ArcGIS Python
+# typically located at a file path that looks similar to (might be
+# located somewhere else on your system):
+# c:\Progra~1\ArcGIS\Pro\bin\Python\scripts\propy.bat
+
+# Executing 'ExampleScript4.py' from ArcGIS Pro commandline:
+
+# >c:\Progra~1\ArcGIS\Pro\bin\Python\scripts\propy.bat ExampleScript4.py
+
+# The merged geodatabase and the output are written to the folder
+# 'GEO_DB_FOLDER'.
+
+# Example script 'ExampleScript4.py':
+
+import arcpy
+import BatchExport
+import TableUtility
+from TableUtility import Feature
+
+GEO_DB_FOLDER = "C:/fake_dir/2026"
+
+def GetTransforms(GeoDBPath):
+    """
+    The transforms of one of the season's geodatabases. The Pathfinder
+    feature class names differ from one geodatabase to the next, so
+    they are looked up in each geodatabase. Each output feature class
+    is made from one feature class, so more than one match of a
+    pattern is an error (the transforms of that geodatabase fail, and
+    it is not merged; see 'BatchExport.RunBatchTransforms').
+    """
+    arcpy.env.workspace = GeoDBPath
+
+    Transforms = []
+
+    for FeatureType, Pattern, OutputFeatureClass in [(Feature.WATER_SAMPLE, "*_Sample_*", "Water_Sample_Joined"),
+                                                     (Feature.DEPTH, "*_Depths_*", "Depth_Joined"),
+                                                     (Feature.SECCHI, "*_Secchi_*", "Secchi_Joined"),
+                                                     (Feature.LOON, "Loons_*", "Loons_Joined")]:
+        TargetFeatures = [Name for Name in arcpy.ListFeatureClasses(Pattern) if not Name.endswith("_Joined")]
+
+        if len(TargetFeatures) > 1:
+            raise Exception("More than one feature class of " + GeoDBPath + " matches '" + Pattern + "' (" +
+                            ', '.join(TargetFeatures) + "); each would replace the " + OutputFeatureClass + " of the other.")
+
+        for Name in TargetFeatures:
+            Transforms.append((FeatureType, Name, OutputFeatureClass))
+
+    return Transforms
+
+def ExportSeason():
+    """
+    Transforms every geodatabase in 'GEO_DB_FOLDER' in parallel worker
+    processes, merges their '_Joined' feature classes without the rows
+    that are in more than one geodatabase, and writes one SQL script
+    per table with the imported function 'BatchExport.ExportBatch'.
+    """
+    Report = BatchExport.ExportBatch(GEO_DB_FOLDER,
+                                     Transforms = GetTransforms,
+                                     JoinFeatures = "monuments2021",
+                                     KeepFieldsFunction = TableUtility.GetKeptFieldsFromPathfinder,
+                                     RenameFieldsFunction = TableUtility.GetFieldRenamesFromPathfinder,
+                                     UseCache = True)
+
+    for Result in Report['Exports']:
+        if not Result['Succeeded']:
+            print(Result['Function'] + ': ' + Result['Error'])
+
+if __name__ == "__main__":
+    ExportSeason()
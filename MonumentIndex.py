@@ -0,0 +1,227 @@
+# MonumentIndex.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains a nearest neighbour index of the monument
+# points (a KD-tree), which assigns the attributes of the closest
+# monument (e.g. 'LakeNum') to each observation point in memory. It
+# is the equivalent of the 'CLOSEST' match option of
+# 'arcpy.SpatialJoin_analysis' (see 'TableUtility.CreateTableJoin'),
+# and also reports the join distance.
+#
+# An index can be saved to, and loaded from, a NumPy '.npz' file, so
+# that the monuments are read from the geodatabase once and reused by
+# later transforms (see 'TableUtility.LoadMonumentIndex').
+#
+# This module does not import arcpy, so it can be used and tested
+# with synthetic point sets on any system. Reading the monuments from
+# a geodatabase is done by 'TableUtility.ReadMonumentIndex'.
+
+import datetime
+import math
+import os
+import numpy
+
+class MonumentIndex:
+    """
+    A KD-tree over the monument points.
+
+    Parameters:
+    - Points = a list of the (X, Y) coordinates of the monuments.
+    - Attributes = a list with the attribute values of each monument
+      (e.g. a tuple of the 'FieldNames' values), in the same order as
+      'Points'. The default (None) is the monument's position in
+      'Points'.
+    - FieldNames = the names of the attribute values, if any.
+    - Key = the invalidation key of the index, if any; it is saved and
+      loaded with the index (see 'Save' and 'Load').
+    - Order = the tree order of an index that was saved; used by
+      'Load', so that the tree is not built again.
+
+    The distances are planar (Euclidean), in the units of the
+    coordinates, as with 'arcpy.SpatialJoin_analysis' on projected
+    data. When two monuments are at the same distance, the one that
+    comes first in 'Points' is the closest.
+    """
+
+    def __init__(self, Points, Attributes = None, FieldNames = None, Key = None, Order = None):
+        self.Xs = [float(Point[0]) for Point in Points]
+        self.Ys = [float(Point[1]) for Point in Points]
+        self.Attributes = (list(range(len(self.Xs))) if Attributes is None else list(Attributes))
+        self.FieldNames = ([] if FieldNames is None else list(FieldNames))
+        self.Key = Key
+
+        if len(self.Attributes) != len(self.Xs):
+            raise Exception("The 'Points' and 'Attributes' arguments are not the same length.")
+
+        # The tree is stored implicitly: the point at the middle of each
+        # range of 'Order' splits the rest of the range on the X (even
+        # depth) or Y (odd depth) coordinate.
+        if Order is None:
+            self.Order = list(range(len(self.Xs)))
+            self.Build(0, len(self.Order), 0)
+        else:
+            self.Order = list(Order)
+
+    def __len__(self):
+        return len(self.Xs)
+
+    def Build(self, Low, High, Depth):
+        Stack = [(Low, High, Depth)]
+
+        while Stack:
+            Low, High, Depth = Stack.pop()
+
+            if High - Low <= 1:
+                continue
+
+            Coordinates = (self.Xs if Depth % 2 == 0 else self.Ys)
+            self.Order[Low:High] = sorted(self.Order[Low:High], key=lambda i: (Coordinates[i], i))
+
+            Middle = (Low + High) // 2
+
+            Stack.append((Low, Middle, Depth + 1))
+            Stack.append((Middle + 1, High, Depth + 1))
+
+    def Nearest(self, X, Y):
+        """
+        Returns the (position, distance) of the monument closest to the
+        point (X, Y), or (None, None) if the index is empty.
+        """
+        BestDistance2 = math.inf
+        Best = None
+
+        Xs = self.Xs
+        Ys = self.Ys
+        Order = self.Order
+
+        # Each entry is a range of 'Order' and the least squared
+        # distance from (X, Y) to any point in that range.
+        Stack = [(0, len(Order), 0, 0.0)]
+
+        while Stack:
+            Low, High, Depth, Bound2 = Stack.pop()
+
+            if Low >= High or Bound2 > BestDistance2:
+                continue
+
+            Middle = (Low + High) // 2
+            i = Order[Middle]
+
+            Distance2 = (Xs[i] - X) ** 2 + (Ys[i] - Y) ** 2
+
+            if Distance2 < BestDistance2 or (Distance2 == BestDistance2 and i < Best):
+                BestDistance2 = Distance2
+                Best = i
+
+            Difference = ((X - Xs[i]) if Depth % 2 == 0 else (Y - Ys[i]))
+
+            if Difference < 0:
+                Near = (Low, Middle)
+                Far = (Middle + 1, High)
+            else:
+                Near = (Middle + 1, High)
+                Far = (Low, Middle)
+
+            # The far side is searched after the near side, and only if
+            # it may hold a closer point.
+            Stack.append((Far[0], Far[1], Depth + 1, max(Bound2, Difference * Difference)))
+            Stack.append((Near[0], Near[1], Depth + 1, Bound2))
+
+        if Best is None:
+            return (None, None)
+
+        return (Best, math.sqrt(BestDistance2))
+
+    def Closest(self, Point):
+        """
+        Returns the (attributes, distance) of the monument closest to
+        'Point' (an (X, Y) pair). A point that is None (no geometry),
+        or any point if the index is empty, returns (None, None); its
+        attributes are null, as with the 'KEEP_ALL' option of
+        'arcpy.SpatialJoin_analysis'.
+        """
+        if Point is None:
+            return (None, None)
+
+        Position, Distance = self.Nearest(Point[0], Point[1])
+
+        if Position is None:
+            return (None, None)
+
+        return (self.Attributes[Position], Distance)
+
+    def Join(self, Points):
+        """
+        A generator that yields the 'Closest' (attributes, distance) of
+        each point in 'Points', in order.
+        """
+        for Point in Points:
+            yield self.Closest(Point)
+
+    def Save(self, IndexPath):
+        """
+        Saves the index to the NumPy '.npz' file 'IndexPath'. The
+        attribute values must be text, numbers, datetimes or None. The
+        file is replaced in one step, so an index that is being saved
+        by one process is never read half written by another.
+        """
+        Arrays = {'Xs': numpy.array(self.Xs, dtype=float),
+                  'Ys': numpy.array(self.Ys, dtype=float),
+                  'Order': numpy.array(self.Order, dtype=numpy.int64),
+                  'FieldNames': numpy.array(self.FieldNames, dtype=str),
+                  'Key': numpy.array('' if self.Key is None else self.Key)}
+
+        for i in range(len(self.FieldNames)):
+            Values = [Attributes[i] for Attributes in self.Attributes]
+            Arrays['Values' + str(i)], Arrays['Nulls' + str(i)] = GetColumnArrays(Values)
+
+        TempPath = IndexPath + '.' + str(os.getpid()) + '.tmp.npz'
+        numpy.savez(TempPath, **Arrays)
+        os.replace(TempPath, IndexPath)
+
+    @classmethod
+    def Load(cls, IndexPath):
+        """
+        Returns the index saved in the '.npz' file 'IndexPath'.
+        """
+        with numpy.load(IndexPath) as Arrays:
+            FieldNames = Arrays['FieldNames'].tolist()
+
+            Columns = [GetColumnValues(Arrays['Values' + str(i)], Arrays['Nulls' + str(i)]) for i in range(len(FieldNames))]
+            Attributes = list(zip(*Columns)) if Columns else [() for x in Arrays['Xs']]
+
+            return cls(list(zip(Arrays['Xs'].tolist(), Arrays['Ys'].tolist())),
+                       Attributes,
+                       FieldNames,
+                       Arrays['Key'].item(),
+                       Arrays['Order'].tolist())
+
+def GetColumnArrays(Values):
+    """
+    Returns a NumPy array of the values of one attribute, with the
+    nulls replaced by a placeholder, and a boolean array of where the
+    nulls are.
+    """
+    Nulls = numpy.array([Value is None for Value in Values], dtype=bool)
+    NotNull = [Value for Value in Values if Value is not None]
+
+    if NotNull and all(isinstance(Value, datetime.datetime) for Value in NotNull):
+        return (numpy.array([(datetime.datetime(1970, 1, 1) if Value is None else Value) for Value in Values], dtype='datetime64[us]'), Nulls)
+    elif NotNull and all(isinstance(Value, int) for Value in NotNull):
+        return (numpy.array([(0 if Value is None else Value) for Value in Values], dtype=numpy.int64), Nulls)
+    elif NotNull and all(isinstance(Value, (int, float)) for Value in NotNull):
+        return (numpy.array([(0.0 if Value is None else Value) for Value in Values], dtype=float), Nulls)
+    else:
+        return (numpy.array([('' if Value is None else str(Value)) for Value in Values], dtype=str), Nulls)
+
+def GetColumnValues(Array, Nulls):
+    """
+    The reverse of 'GetColumnArrays': a list of the Python values of
+    one attribute, with None for the nulls.
+    """
+    return [(None if IsNull else Value) for Value, IsNull in zip(Array.tolist(), Nulls.tolist())]
@@ -0,0 +1,227 @@
+# RunMetrics.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains the instrumentation of the export functions
+# (see 'TrimbleGeoDBToDatabase') and the transforms (see
+# 'TableUtility.TransformTable'). A run is made up of stages (e.g. the
+# join, the field calculations, or the reading and writing of an
+# export). For each stage the wall time, the rows read, skipped and
+# emitted, the bytes written and the peak memory of the process are
+# recorded.
+#
+# As a run goes, its stage and the number of rows read are shown with
+# the ArcGIS progressor. When it is done, the metrics may be written
+# to a JSON file.
+
+import arcpy
+import datetime
+import json
+import os
+import sys
+import time
+
+# The number of rows read between the updates of the progressor label.
+PROGRESS_INTERVAL = 10000
+
+def GetPeakMemory():
+    """
+    Returns the peak memory (resident set size) of this process so far,
+    in bytes, or None if it cannot be read on this system.
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        Peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # The peak is in bytes on macOS and in kilobytes elsewhere.
+        return (Peak if sys.platform == 'darwin' else Peak * 1024)
+
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD),
+                        ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t),
+                        ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t),
+                        ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        GetCurrentProcess = ctypes.windll.kernel32.GetCurrentProcess
+        GetCurrentProcess.restype = wintypes.HANDLE
+
+        GetProcessMemoryInfo = ctypes.windll.psapi.GetProcessMemoryInfo
+        GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        GetProcessMemoryInfo.restype = wintypes.BOOL
+
+        Counters = ProcessMemoryCounters()
+        Counters.cb = ctypes.sizeof(Counters)
+
+        if GetProcessMemoryInfo(GetCurrentProcess(), ctypes.byref(Counters), Counters.cb):
+            return Counters.PeakWorkingSetSize
+
+    return None
+
+def GetMetricsPath(OutputPath):
+    """
+    The path of the JSON metrics file of the run that wrote
+    'OutputPath', e.g. 'fake.gdb_Depth_Joined_Insert_....sql' has the
+    metrics file 'fake.gdb_Depth_Joined_Insert_..._Metrics.json'.
+    """
+    return os.path.splitext(OutputPath)[0] + '_Metrics.json'
+
+class StageMetrics:
+    """
+    The metrics of one stage of a run (see 'RunMetrics').
+    """
+
+    def __init__(self, Name):
+        self.Name = Name
+        self.StartTime = time.perf_counter()
+        self.Seconds = None
+        self.RowsRead = 0
+        self.RowsEmitted = 0
+        self.BytesWritten = 0
+        self.PeakMemoryBytes = None
+
+    def Stop(self):
+        if self.Seconds is None:
+            self.Seconds = time.perf_counter() - self.StartTime
+            self.PeakMemoryBytes = GetPeakMemory()
+
+    def GetReport(self):
+        """
+        Returns the metrics of the stage as a dictionary. The rows
+        skipped are the rows read that were not emitted (e.g. the rows
+        without a creation datetime); a stage that does not read rows
+        skips none.
+        """
+        return {'Stage': self.Name,
+                'Seconds': self.Seconds,
+                'RowsRead': self.RowsRead,
+                'RowsSkipped': max(self.RowsRead - self.RowsEmitted, 0),
+                'RowsEmitted': self.RowsEmitted,
+                'BytesWritten': self.BytesWritten,
+                'PeakMemoryBytes': self.PeakMemoryBytes}
+
+class RunMetrics:
+    """
+    The metrics of a run, made up of one or more stages.
+
+    Parameters:
+    - Name = the name of the run, e.g. the name of the feature class,
+      shown with the progressor.
+
+    Use 'StartStage' to start each stage (which stops the previous
+    one), 'CountRows', 'AddRowsRead', 'AddRowsEmitted' and
+    'SetBytesWritten' to count the work of the current stage, and
+    'Finish' at the end of the run.
+
+    NOTE: the peak memory is the peak of the whole process up to the
+    end of the stage, as reported by the operating system; it never
+    goes down from one stage to the next.
+    """
+
+    def __init__(self, Name):
+        self.Name = Name
+        self.Started = datetime.datetime.now()
+        self.StartTime = time.perf_counter()
+        self.Seconds = None
+        self.Stages = []
+        self.Stage = None
+
+    def StartStage(self, StageName):
+        self.Stop()
+
+        self.Stage = StageMetrics(StageName)
+        self.Stages.append(self.Stage)
+
+        arcpy.SetProgressor('default', self.Name + ': ' + StageName)
+
+        return self.Stage
+
+    def Stop(self):
+        """
+        Stop the current stage, if any.
+        """
+        if self.Stage is not None:
+            self.Stage.Stop()
+
+    def CountRows(self, Rows):
+        """
+        A generator that yields the rows of 'Rows', counts them as read
+        by the current stage, and updates the progressor label every
+        'PROGRESS_INTERVAL' rows.
+        """
+        Stage = self.Stage
+        Count = 0
+
+        try:
+            for Row in Rows:
+                Count = Count + 1
+
+                if Count % PROGRESS_INTERVAL == 0:
+                    arcpy.SetProgressorLabel(self.Name + ': ' + Stage.Name + ', ' + format(Count, ',') + ' rows read')
+
+                yield Row
+        finally:
+            Stage.RowsRead = Stage.RowsRead + Count
+
+    def AddRowsRead(self, Count):
+        self.Stage.RowsRead = self.Stage.RowsRead + Count
+
+    def AddRowsEmitted(self, Count = 1):
+        self.Stage.RowsEmitted = self.Stage.RowsEmitted + Count
+
+    def SetBytesWritten(self, Bytes):
+        self.Stage.BytesWritten = Bytes
+
+    def GetReport(self):
+        """
+        Returns the metrics of the run, and of each of its stages, as a
+        dictionary.
+        """
+        return {'Name': self.Name,
+                'Started': self.Started.isoformat(),
+                'Seconds': self.Seconds,
+                'PeakMemoryBytes': GetPeakMemory(),
+                'Stages': [Stage.GetReport() for Stage in self.Stages]}
+
+    def Finish(self, MetricsPath = None):
+        """
+        Stops the run and resets the progressor. If 'MetricsPath' is
+        given, the metrics (see 'GetReport') are written to it as JSON.
+        Returns the metrics.
+        """
+        self.Stop()
+        self.Seconds = time.perf_counter() - self.StartTime
+
+        arcpy.ResetProgressor()
+
+        Report = self.GetReport()
+
+        if MetricsPath is not None:
+            WriteMetrics(MetricsPath, Report)
+
+        return Report
+
+def WriteMetrics(MetricsPath, Report):
+    """
+    Writes the metrics 'Report' (a dictionary, or a list of them) to
+    the JSON file 'MetricsPath'.
+    """
+    with open(MetricsPath, 'w') as MetricsFile:
+        json.dump(Report, MetricsFile, indent=2)
@@ -0,0 +1,165 @@
+# SQLWriter.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains the writer that the export functions use to
+# stream their SQL scripts to file. A script is made up of sections
+# (for example: the header, the existence check, the body and the
+# validation footer). Each section is streamed to its own temporary
+# file as the rows are read, and the sections are assembled, in the
+# order they were added, when the writer is closed. This replaces
+# building each part of the script by repeated string concatenation,
+# so that generation time and memory grow linearly with the number of
+# rows.
+
+import shutil
+import tempfile
+
+# Sections smaller than this are kept in memory; larger sections are
+# rolled over to a temporary file on disk.
+SPOOL_MAX_SIZE = 1024 * 1024
+
+class SQLSection:
+    """
+    One section of an SQL script.
+
+    The parameter 'TrimEnd' is the number of trailing characters that
+    are dropped from the section when it is closed. This is used for
+    the sections that are built from a repeated item where the last
+    item's separator (for example ' And \\n' or ' Or\\n') must be
+    removed. Only the last 'TrimEnd' characters are held back in
+    memory; everything before them is streamed to the spool file.
+    """
+
+    def __init__(self, TrimEnd = 0):
+        self.TrimEnd = TrimEnd
+        self.Tail = ''
+        self.Size = 0
+        self.File = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+')
+
+    def write(self, Text):
+        self.Size += len(Text)
+
+        if self.TrimEnd == 0:
+            self.File.write(Text)
+            return
+
+        self.Tail += Text
+
+        if len(self.Tail) > self.TrimEnd:
+            self.File.write(self.Tail[:-self.TrimEnd])
+            self.Tail = self.Tail[-self.TrimEnd:]
+
+    def CopyTo(self, TargetFile):
+        """
+        Copy the section (less the trimmed 'Tail') to 'TargetFile', and
+        release the spool file.
+        """
+        self.File.seek(0)
+        shutil.copyfileobj(self.File, TargetFile)
+        self.File.close()
+
+class SQLScriptWriter:
+    """
+    Streams an SQL script to the file 'SqlFilePath' in sections.
+
+    Use the 'AddSection' method to add the sections in the order they
+    must appear in the script. The sections may then be written to in
+    any order. The script file is written when the writer is closed
+    (or at the end of a 'with' block), replacing any file of the same
+    name.
+
+    The attribute 'name' is the path of the script file, the same as
+    the 'name' attribute of a file object.
+
+    The 'GetSize' method returns the number of characters written to
+    the sections so far, e.g. to limit the size of a script.
+    """
+
+    def __init__(self, SqlFilePath):
+        self.name = SqlFilePath
+        self.Sections = []
+
+    def AddSection(self, TrimEnd = 0):
+        Section = SQLSection(TrimEnd)
+        self.Sections.append(Section)
+
+        return Section
+
+    def GetSize(self):
+        return sum(Section.Size for Section in self.Sections)
+
+    def close(self):
+        with open(self.name, 'w') as SqlFile:
+            for Section in self.Sections:
+                Section.CopyTo(SqlFile)
+
+        self.Sections = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ExceptionType, ExceptionValue, Traceback):
+        self.close()
+
+# SQL Server allows at most 1000 rows in the 'VALUES' list of an
+# INSERT statement.
+MAX_INSERT_ROWS = 1000
+
+class InsertBatcher:
+    """
+    Writes INSERT statements to 'Section' (an 'SQLSection' or a file),
+    grouping up to 'BatchSize' rows into each statement.
+
+    Parameters:
+    - Section = the section the statements are written to.
+    - Head = the start of the statement up to and including the
+      opening parenthesis of the first row, e.g.
+      "INSERT INTO tblLoons(PONDNAME,...) VALUES(".
+    - Close = the end of the statement after the last row, e.g. ");\\n".
+    - BatchSize = the number of rows per statement. The default (1)
+      writes one statement per row, exactly as 'Head + Values + Close'.
+      Values over 'MAX_INSERT_ROWS' are capped at 'MAX_INSERT_ROWS'.
+
+    The rows are written as they are added; nothing is buffered.
+    """
+
+    def __init__(self, Section, Head, Close, BatchSize = 1):
+        self.Section = Section
+        self.Head = Head
+        self.Close = Close
+        self.BatchSize = max(1, min(BatchSize, MAX_INSERT_ROWS))
+        self.Count = 0
+
+        # The rows after the first are indented one level past the
+        # start of the last line of 'Head'.
+        LastLine = Head.split('\n')[-1]
+        self.RowSeparator = "),\n" + LastLine[:len(LastLine) - len(LastLine.lstrip())] + "    ("
+
+    def Add(self, Values):
+        """
+        Add one row. 'Values' is the comma separated list of SQL
+        values of the row, without the enclosing parentheses.
+        """
+        if self.Count == 0:
+            self.Section.write(self.Head + Values)
+        else:
+            self.Section.write(self.RowSeparator + Values)
+
+        self.Count = self.Count + 1
+
+        if self.Count == self.BatchSize:
+            self.Section.write(self.Close)
+            self.Count = 0
+
+    def Flush(self):
+        """
+        Close the last, partially filled, statement.
+        """
+        if self.Count > 0:
+            self.Section.write(self.Close)
+            self.Count = 0
@@ -0,0 +1,531 @@
+# TableSpec.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This module contains the declarative specifications of the database
+# tables that the export functions write (see
+# 'TrimbleGeoDBToDatabase'), and the engine that turns the rows of a
+# '_Joined' feature class into their SQL values. A 'TableSpec' lists,
+# for each target column, its source field, type, rounding and null
+# representation, the key columns of the table, and the form of
+# the INSERT statements of its script (see 'ScriptLayout').
+#
+# A spec is compiled once per export (see 'CompileFormatter') into a
+# Python function that formats one row as the SQL values of its INSERT
+# statement, the assignments of its UPDATE statement, or the
+# parameters of a DB-API statement (see 'DatabaseLoader'). The quoting,
+# rounding and null handling of each column are written into the code
+# of that function, and its constant text (the quotes, separators and
+# constant columns) is joined ahead of time, so the export loop does
+# no per-field interpretation of the spec.
+#
+# The rows are read, checked and normalized by 'IterExportRows', which
+# is shared by all the export functions.
+
+import importlib
+import TrimbleUtility
+
+# The sources of the columns that are read from the normalized values
+# of a row (see 'TrimbleUtility.NormalizeRow') instead of the row
+# itself. They are already formatted as text, and are never null.
+NORMALIZED_FIELDS = ('PondName', 'SampleDate', 'SampleTime', 'Latitude', 'Longitude')
+
+# The column types (see 'Column').
+COLUMN_TYPES = ('Text', 'Number', 'Date', 'Time', 'Source')
+
+class Column:
+    """
+    One column of a 'TableSpec'.
+
+    Parameters:
+    - Name = the name of the target column.
+    - Field = the source of the value: a field of the row, or one of
+      the 'NORMALIZED_FIELDS'. None for a column with a constant
+      'Value'.
+    - Type = the type of the value (see 'COLUMN_TYPES'):
+      - 'Text' (default) is quoted.
+      - 'Number' is written as is, or rounded (see 'Digits').
+      - 'Date' and 'Time' are the 'YYYY-MM-DD' date and 'HH:MM:SS'
+        time of a datetime field, quoted.
+      - 'Source' is the name of the source geodatabase, quoted; it has
+        no 'Field'.
+    - Digits = the number of decimals a 'Number' is rounded to. The
+      default (None) is not rounded.
+    - Strip = if True, the leading and trailing blanks of a 'Text' are
+      removed.
+    - BlankIsNull = if True, a blank 'Text' is null.
+    - Values = an optional dictionary of the value that is written for
+      each source value (e.g. {'Yes': '1'}). Any other source value is
+      written as 'Default'.
+    - Default = see 'Values'. The default (None) is null.
+    - Function = an optional function that is applied to the source
+      value before it is formatted (e.g.
+      'TrimbleUtility.GetSampleNumber').
+    - Value = the constant value of a column without a 'Field'.
+    - Null = the SQL text of a null value. The default is 'NULL'.
+    """
+
+    def __init__(self, Name, Field = None, Type = 'Text', Digits = None, Strip = False, BlankIsNull = False,
+                 Values = None, Default = None, Function = None, Value = None, Null = 'NULL'):
+        if Type not in COLUMN_TYPES:
+            raise Exception("The type '" + str(Type) + "' of column '" + Name + "' is not valid.")
+
+        if Field is None and Value is None and Type != 'Source':
+            raise Exception("The column '" + Name + "' has neither a 'Field' nor a 'Value'.")
+
+        self.Name = Name
+        self.Field = Field
+        self.Type = Type
+        self.Digits = Digits
+        self.Strip = Strip
+        self.BlankIsNull = BlankIsNull
+        self.Values = Values
+        self.Default = Default
+        self.Function = Function
+        self.Value = Value
+        self.Null = Null
+
+    def IsNormalized(self):
+        return self.Field in NORMALIZED_FIELDS
+
+    def GetLiteral(self, Value, SourceFileName = None):
+        """
+        The SQL text of the Python 'Value' of this column. Used for the
+        constant columns and the 'Values' of a column, which are
+        formatted when the spec is compiled.
+        """
+        Text = self.GetDataValue(Value, SourceFileName)
+
+        if Text is None:
+            return self.Null
+
+        if self.Type == 'Number':
+            return Text
+
+        return "'" + Text + "'"
+
+    def GetDataValue(self, Value, SourceFileName = None):
+        """
+        The text of the Python 'Value' of this column in a data file
+        (see 'CompileFormatter'): its SQL text without the quotes, or
+        None if the value is null.
+        """
+        if self.Type == 'Source':
+            Value = SourceFileName
+
+        if Value is None:
+            return None
+
+        if self.Type == 'Number':
+            return str(Value if self.Digits is None else round(Value, self.Digits))
+
+        if self.Type == 'Date':
+            return TrimbleUtility.GetDateStr(Value)
+
+        if self.Type == 'Time':
+            return TrimbleUtility.GetTimeStr(Value)
+
+        return str(Value)
+
+class ScriptLayout:
+    """
+    The form of the INSERT statements and of the validation query of the
+    SQL insert script of a 'TableSpec' (see 'WriteJoinedTableScript' in
+    'TrimbleGeoDBToDatabase'). Each table keeps the form its own export
+    function has always written; the default is the form of the
+    tblPondDepths script.
+
+    Parameters:
+    - Insert = the start of each INSERT statement, up to the opening
+      parenthesis of the values. '{Table}' is replaced by the name of
+      the table, and '{Columns}' by the names of its columns joined by
+      'ColumnSeparator'.
+    - ColumnSeparator = see 'Insert'.
+    - Close = the end of each INSERT statement, after the values.
+    - Separator = the separator of the values.
+    - Indent = the indentation of the INSERT statements.
+    - Comment = an optional comment that is written before the INSERT
+      statements.
+    - Select = the SELECT of the validation query. '{Table}' and
+      '{Columns}' are replaced as in 'Insert', with the column names
+      joined by ','.
+    - Condition = the condition of the validation query that selects
+      one record. '{0}', '{1}', ... are replaced by the values of the
+      key columns. The default (None) is the condition on all the key
+      columns (see 'GetCondition').
+    - Database = the optional name of the database the script USEs.
+    """
+
+    def __init__(self, Insert = 'INSERT INTO {Table}({Columns}) VALUES(', ColumnSeparator = ',', Close = ');\n', Separator = ',',
+                 Indent = '      ', Comment = '', Select = 'SELECT {Columns} FROM {Table}', Condition = None, Database = None):
+        self.Insert = Insert
+        self.ColumnSeparator = ColumnSeparator
+        self.Close = Close
+        self.Separator = Separator
+        self.Indent = Indent
+        self.Comment = Comment
+        self.Select = Select
+        self.Condition = Condition
+        self.Database = Database
+
+    def GetUniform(self):
+        """
+        The layout of the 'Layout.UNIFORM' scripts (see
+        'TrimbleGeoDBToDatabase'): the default INSERT statements and
+        validation query, with the indentation, comment and database
+        of this layout.
+        """
+        return ScriptLayout(Indent = self.Indent, Comment = self.Comment, Database = self.Database)
+
+    def GetInsert(self, Spec):
+        return self.Indent + self.Insert.format(Table = Spec.Table, Columns = Spec.GetColumnNames(self.ColumnSeparator))
+
+    def GetSelect(self, Spec):
+        return self.Select.format(Table = Spec.Table, Columns = Spec.GetColumnNames())
+
+    def GetCondition(self, Spec):
+        """
+        The 'Condition' of the validation query, e.g. "PONDNAME =
+        '{0}' And SAMPLEDATE = '{1}'" for the default condition of the
+        key columns PONDNAME and SAMPLEDATE. The numbers are not quoted.
+        """
+        if self.Condition is not None:
+            return self.Condition
+
+        Terms = []
+
+        for i, Column in enumerate(Spec.GetKeyColumns()):
+            Value = '{' + str(i) + '}'
+            Terms.append(Column.Name + ' = ' + (Value if Column.Type == 'Number' else "'" + Value + "'"))
+
+        return ' And '.join(Terms)
+
+class TableSpec:
+    """
+    The specification of the table that one '_Joined' feature class is
+    exported to.
+
+    Parameters:
+    - FeatureClass = the name of the '_Joined' feature class.
+    - Table = the name of the target table.
+    - Columns = the list of the 'Column's of the table, in the order of
+      its INSERT statement.
+    - KeyColumns = the names of the columns of the table's primary key.
+    - Purpose = the purpose of the export, for the header of the
+      script. The default (None) names the feature class.
+    - FieldNames = the fields that are read from the feature class. The
+      default (None) is 'CreationDateTimeLocal', 'LakeNum' and the
+      source fields of the 'Columns' (the normalized values also need
+      'YCurrentMapCS' and 'XCurrentMapCS' if they are used).
+    - ColumnarRecords = an optional columnar equivalent of the row at a
+      time records (see 'ColumnarExport.IterDepthJoinedRecords'):
+      ColumnarRecords(FeatureClass, SourceFileName, Metrics, WhereClause).
+      It may be given as the 'Module.Function' name of the function,
+      so that its module (e.g. 'ColumnarExport', which needs NumPy) is
+      imported only when it is used (see 'GetColumnarRecords').
+    - EventKeyColumns = the names of the (PondName, SampleDate) columns
+      of a table whose records belong to an Event (tblEvents), e.g. for
+      the parent Event check of a bulk insert. The default (None) is a
+      table without parent Events.
+    - OneRecordPerEvent = if True, the table holds at most one record
+      per Event (e.g. tblLoons), so the records of an Event are only
+      inserted if it has none yet. Needs 'EventKeyColumns'.
+    - Layout = the 'ScriptLayout' of the table's insert script. The
+      default (None) is the default 'ScriptLayout'.
+
+    See 'ExportJoinedTable' in 'TrimbleGeoDBToDatabase', which writes
+    the script of a spec.
+    """
+
+    def __init__(self, FeatureClass, Table, Columns, KeyColumns, Purpose = None, FieldNames = None, ColumnarRecords = None,
+                 EventKeyColumns = None, OneRecordPerEvent = False, Layout = None):
+        self.FeatureClass = FeatureClass
+        self.Table = Table
+        self.Columns = list(Columns)
+        self.KeyColumns = list(KeyColumns)
+        self.ColumnarRecords = ColumnarRecords
+        self.EventKeyColumns = (list(EventKeyColumns) if EventKeyColumns is not None else None)
+        self.OneRecordPerEvent = OneRecordPerEvent
+        self.Layout = (Layout if Layout is not None else ScriptLayout())
+
+        if OneRecordPerEvent and EventKeyColumns is None:
+            raise Exception("The table spec of '" + FeatureClass + "' has one record per Event, but no 'EventKeyColumns'.")
+
+        if Purpose is None:
+            Purpose = ("Transfer " + FeatureClass + " data from the field Trimble data collection application to the "
+                       "AK_ShallowLakes monitoring SQL Server database.")
+
+        self.Purpose = Purpose
+
+        for Name in self.KeyColumns + (self.EventKeyColumns or []):
+            self.GetColumn(Name)
+
+        if FieldNames is None:
+            FieldNames = ['CreationDateTimeLocal', 'LakeNum']
+
+            for Column in self.Columns:
+                if Column.IsNormalized():
+                    if Column.Field in ('Latitude', 'Longitude'):
+                        Fields = ['YCurrentMapCS', 'XCurrentMapCS']
+                    else:
+                        Fields = []
+                elif Column.Field is not None:
+                    Fields = [Column.Field]
+                else:
+                    Fields = []
+
+                for Field in Fields:
+                    if Field not in FieldNames:
+                        FieldNames.append(Field)
+
+        self.FieldNames = list(FieldNames)
+
+    def GetColumnarRecords(self):
+        """
+        Returns the 'ColumnarRecords' function, importing its module
+        if it was given by name.
+        """
+        if isinstance(self.ColumnarRecords, str):
+            ModuleName, FunctionName = self.ColumnarRecords.rsplit('.', 1)
+
+            return getattr(importlib.import_module(ModuleName), FunctionName)
+
+        return self.ColumnarRecords
+
+    def GetColumn(self, Name):
+        for Column in self.Columns:
+            if Column.Name == Name:
+                return Column
+
+        raise Exception("The table spec of " + self.Table + " has no column '" + Name + "'.")
+
+    def GetColumnNames(self, Separator = ','):
+        return Separator.join(Column.Name for Column in self.Columns)
+
+    def GetKeyColumns(self):
+        return [self.GetColumn(Name) for Name in self.KeyColumns]
+
+    def GetValueColumns(self):
+        """
+        The columns that are not in the key, e.g. for the SET clause of
+        an UPDATE statement.
+        """
+        return [Column for Column in self.Columns if Column.Name not in self.KeyColumns]
+
+def CompileFormatter(Columns, SourceFileName = None, Separator = ',', Assignments = False, Name = 'FormatRow', DataValues = False,
+                     Parameters = False):
+    """
+    Compiles the 'Columns' of a table spec into a function
+    'FormatRow(Row, Normal)' that returns the SQL text of one row (a
+    dictionary record) and its normalized values (see
+    'TrimbleUtility.NormalizeRow'):
+    - the values of the columns, joined by 'Separator', e.g.
+      "'LAKE001','2024-06-01',1.5,NULL", for an INSERT statement, or
+    - if 'Assignments' is True, the 'NAME = value' of each column,
+      joined by 'Separator', for the SET clause of an UPDATE statement
+      (e.g. with the separator ', ') or a WHERE clause (' And '), or
+    - if 'DataValues' is True, the list of the text values of the
+      columns, unquoted and None for a null, e.g.
+      ['LAKE001', '2024-06-01', '1.5', None], for a row of a delimited
+      data file (see 'Column.GetDataValue'), or
+    - if 'Parameters' is True, the tuple of the Python values of the
+      columns, None for a null, e.g. ('LAKE001', '2024-06-01', 1.5,
+      None), for the parameters of a DB-API statement (see
+      'DatabaseLoader.LoadRecords'). The numbers are rounded, and the
+      dates and times are text, as in the SQL text.
+
+    'SourceFileName' is the name of the source geodatabase, written in
+    the 'Source' columns of the rows that do not name their own (see
+    'IterExportRows').
+
+    The function's code is generated from the columns, so each column
+    is formatted by its own statements, and the constant text is
+    joined when it is compiled. The code is kept in the function's
+    'Source' attribute.
+    """
+    Statements = []
+    Parts = []
+    Items = []
+
+    # The parameters are a list of items, as the data values are.
+    Listed = DataValues or Parameters
+    Namespace = {'GetDateStr': TrimbleUtility.GetDateStr,
+                 'GetTimeStr': TrimbleUtility.GetTimeStr}
+
+    for i, Column in enumerate(Columns):
+        if i > 0:
+            Parts.append((True, Separator))
+
+        if Assignments:
+            Parts.append((True, Column.Name + ' = '))
+
+        if Column.Type == 'Source' and SourceFileName is not None:
+            # The source geodatabase of a merged row (see
+            # 'IterExportRows'), or else 'SourceFileName'.
+            Value = "Normal.get('SourceFileName', " + repr(SourceFileName) + ")"
+
+            if Listed:
+                Items.append(Value)
+            else:
+                Parts.extend([(True, "'"), (False, Value), (True, "'")])
+
+            continue
+
+        if Column.Type == 'Source' or Column.Field is None:
+            if Parameters:
+                Items.append(repr(SourceFileName if Column.Type == 'Source' else Column.Value))
+            elif DataValues:
+                Items.append(repr(Column.GetDataValue(Column.Value, SourceFileName)))
+            else:
+                Parts.append((True, Column.GetLiteral(Column.Value, SourceFileName)))
+
+            continue
+
+        if Column.IsNormalized():
+            Value = "Normal[" + repr(Column.Field) + "]"
+
+            if Parameters and Column.Type == 'Number':
+                Items.append("float(" + Value + ")")
+            elif Listed:
+                Items.append(Value)
+            elif Column.Type == 'Number':
+                Parts.append((False, Value))
+            else:
+                Parts.extend([(True, "'"), (False, Value), (True, "'")])
+
+            continue
+
+        Variable = 'v' + str(i)
+        Null = ('None' if Listed else repr(Column.Null))
+        Quote = ('' if Listed else "\"'\" + ")
+        EndQuote = ('' if Listed else " + \"'\"")
+
+        Statements.append(Variable + " = Row[" + repr(Column.Field) + "]")
+
+        if Column.Function is not None:
+            Namespace['Function' + str(i)] = Column.Function
+            Statements.append(Variable + " = Function" + str(i) + "(" + Variable + ")")
+
+        if Column.Strip:
+            Statements.append("if " + Variable + " is not None: " + Variable + " = " + Variable + ".strip()")
+
+        if Column.Values is not None:
+            # The value of each source value is formatted now.
+            if Parameters:
+                Format = (lambda Value: Value)
+            else:
+                Format = (Column.GetDataValue if DataValues else Column.GetLiteral)
+
+            Namespace['Values' + str(i)] = {Key: Format(Value) for Key, Value in Column.Values.items()}
+            Namespace['Default' + str(i)] = Format(Column.Default)
+            Statements.append(Variable + " = Values" + str(i) + ".get(" + Variable + ", Default" + str(i) + ")")
+        else:
+            if Column.Type == 'Number' and Parameters:
+                Text = (Variable if Column.Digits is None else
+                        "round(" + Variable + ", " + str(Column.Digits) + ")")
+            elif Column.Type == 'Number':
+                Text = ("str(" + Variable + ")" if Column.Digits is None else
+                        "str(round(" + Variable + ", " + str(Column.Digits) + "))")
+            elif Column.Type == 'Date':
+                Text = Quote + "GetDateStr(" + Variable + ")" + EndQuote
+            elif Column.Type == 'Time':
+                Text = Quote + "GetTimeStr(" + Variable + ")" + EndQuote
+            else:
+                Text = Quote + "str(" + Variable + ")" + EndQuote
+
+            if Column.BlankIsNull:
+                IsNull = Variable + " is None or " + Variable + (" == ''" if Column.Strip else ".strip() == ''")
+            else:
+                IsNull = Variable + " is None"
+
+            Statements.append(Variable + " = (" + Null + " if " + IsNull + " else " + Text + ")")
+
+        Parts.append((False, Variable))
+        Items.append(Variable)
+
+    # The adjacent constant parts are joined.
+    Terms = []
+
+    for IsConstant, Text in Parts:
+        if IsConstant and Terms and Terms[-1][0]:
+            Terms[-1] = (True, Terms[-1][1] + Text)
+        else:
+            Terms.append((IsConstant, Text))
+
+    Expression = (' + '.join((repr(Text) if IsConstant else Text) for IsConstant, Text in Terms) or "''")
+
+    if DataValues:
+        Expression = "[" + ", ".join(Items) + "]"
+    elif Parameters:
+        Expression = "(" + "".join(Item + ", " for Item in Items) + ")"
+
+    Source = ("def " + Name + "(Row, Normal):\n" +
+              ''.join("    " + Statement + "\n" for Statement in Statements) +
+              "    return " + Expression + "\n")
+
+    exec(compile(Source, '<TableSpec.' + Name + '>', 'exec'), Namespace)
+
+    Formatter = Namespace[Name]
+    Formatter.Source = Source
+
+    return Formatter
+
+def IterExportRows(FeatureClass, FieldNames, Manifest = None, KeyCounts = None, SkipDuplicates = False, Metrics = None, WhereClause = None,
+                   ChangedKeys = None):
+    """
+    Reads the 'FieldNames' of a '_Joined' feature class one row at a
+    time, and yields the (Row, Normal) of each row that is to be
+    exported: the dictionary record and its normalized values (see
+    'TrimbleUtility.NormalizeRow').
+
+    A row without a creation datetime is not a valid record, and is
+    not yielded.
+
+    If 'KeyCounts' is given, the primary key of each row is counted in
+    it (see 'TrimbleUtility.UpdateKeyCounts'). If 'SkipDuplicates' is
+    also True, only the first row of each key is yielded.
+
+    If 'Manifest' is given, only the rows that are not yet in it are
+    yielded (see 'TrimbleUtility.UpdateExportManifest'). If
+    'ChangedKeys' (a list) is also given, the changed rows whose key
+    has already been exported are not yielded, and their keys are
+    appended to it (they are recorded, so they are reported once);
+    this is for the exports that INSERT the rows.
+
+    If 'Metrics' (a 'RunMetrics.RunMetrics') is given, the rows are
+    counted as read by its current stage. If 'WhereClause' is given,
+    only the rows that match it are read (see
+    'TrimbleUtility.GetRowFilterWhereClause').
+
+    If the feature class was merged from several geodatabases (see
+    'TrimbleUtility.SOURCE_FIELD'), the 'SourceFileName' of each row's
+    normalized values is the geodatabase it was merged from.
+    """
+    # The rows of a merged feature class also name their source
+    # geodatabase.
+    SourceField = TrimbleUtility.GetSourceField(FeatureClass)
+
+    if SourceField is not None:
+        FieldNames = list(FieldNames) + [SourceField]
+
+    for Row in TrimbleUtility.IterFeatureClassRows(FeatureClass, FieldNames, WhereClause = WhereClause, Metrics = Metrics):
+        if Row['CreationDateTimeLocal'] is None:
+            continue
+
+        # The keys are made from the same normalized values as the
+        # records.
+        Normal = TrimbleUtility.NormalizeRow(Row)
+
+        # A row with a key that has already been read is a duplicate.
+        if KeyCounts is not None and TrimbleUtility.UpdateKeyCounts(KeyCounts, FeatureClass, Row, Normal) > 1:
+            if SkipDuplicates:
+                continue
+
+        if Manifest is not None and not TrimbleUtility.UpdateExportManifest(Manifest, FeatureClass, Row, Normal, ChangedKeys):
+            continue
+
+        yield (Row, Normal)
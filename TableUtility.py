@@ -17,9 +17,21 @@
 #   - Combining the date and time columns into a date/time column.
 #   - Calculating the coordinates from the joined feature class
 #     coordinate system (which should be NAD 83).
+# - Run the transforms of several feature types in parallel.
+# - Join the closest monuments with an in memory index, as an
+#   alternative to the spatial join.
 
 import arcpy
+import datetime
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+import time
+import concurrent.futures
+import MonumentIndex
+import RunMetrics
 
 from enum import Enum
 
@@ -37,7 +49,7 @@ class Feature(Enum):
 # 'target_features' in the documentation for the
 # 'arcpy.SpatialJoin_analysis' function. A better name might have been
 # 'TargetLayer'.
-def CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, AlterFunction, OutputFeatureClass, OverwriteOutput):
+def CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass, OverwriteOutput):
     """
     This function:
     - Joins two tables (one-to-one, keep all columns, closest points).
@@ -46,7 +58,10 @@ def CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunctio
       - The specific fields to keep are retrieved by the
         'KeepFieldsFunction'.
     - Renames a subset of the columns of the join to those indicated
-      by the 'AlterFunction' argument.
+      by the 'RenameFieldsFunction' argument.
+      - The renames are set as the output field names in the join's
+        field mappings, so the join writes the final column names and
+        no columns are altered after the join.
     """
 
     arcpy.env.overwriteOutput = OverwriteOutput
@@ -62,6 +77,9 @@ def CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunctio
     # Remove the fields we don't want.
     RemoveFields(FieldMappings, KeepFields)
 
+    # Rename fields to match the older 'Positions' names.
+    RenameFields(FieldMappings, RenameFieldsFunction(FeatureType))
+
     # Run the Spatial Join tool.
     arcpy.SpatialJoin_analysis(TargetFeatures,
                                JoinFeatures,
@@ -71,8 +89,223 @@ def CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunctio
                                FieldMappings,
                                "CLOSEST")
 
-    # Rename fields to match the older 'Positions' names.
-    AlterFunction(OutputFeatureClass, FeatureType)
+# The 'AddFields' field type of each 'arcpy.Field.type'.
+ADD_FIELD_TYPES = {'String': 'TEXT',
+                   'Double': 'DOUBLE',
+                   'Single': 'FLOAT',
+                   'Integer': 'LONG',
+                   'SmallInteger': 'SHORT',
+                   'Date': 'DATE'}
+
+def ReadMonumentIndex(JoinFeatures, FieldNames, SpatialReference = None):
+    """
+    Reads the points and the 'FieldNames' values of the monuments
+    feature class 'JoinFeatures' into a 'MonumentIndex.MonumentIndex'.
+    If 'SpatialReference' is given, the points are projected to it as
+    they are read.
+    """
+    Points = []
+    Attributes = []
+
+    with arcpy.da.SearchCursor(JoinFeatures, ['SHAPE@XY'] + FieldNames, spatial_reference=SpatialReference) as Cursor:
+        for Row in Cursor:
+            # A monument without a geometry can not be the closest.
+            if Row[0] is None:
+                continue
+
+            Points.append(Row[0])
+            Attributes.append(tuple(Row[1:]))
+
+    return MonumentIndex.MonumentIndex(Points, Attributes, FieldNames)
+
+# The monument fields that are saved in the monument index file (see
+# 'LoadMonumentIndex').
+MONUMENT_INDEX_FIELDS = ['LakeNum', 'LakeNumField', 'MonType', 'Location', 'AccessType']
+
+def GetMonumentIndexPath(JoinFeatures, SpatialReference = None):
+    """
+    The path of the monument index file of the monuments feature class
+    'JoinFeatures' (a path, or a name in the current
+    'arcpy.env.workspace'), with the points projected to
+    'SpatialReference'. The file is written next to the geodatabase,
+    e.g. 'fake.gdb_monuments2021_3338_MonumentIndex.npz'. Each
+    spatial reference has its own file, named by its factory code
+    (WKID), or by a hash of its definition if it has none, so that the
+    indexes of targets in different coordinate systems do not replace
+    each other.
+    """
+    if not os.path.isabs(JoinFeatures):
+        JoinFeatures = os.path.join(arcpy.env.workspace, JoinFeatures)
+
+    GeoDBPath = os.path.dirname(JoinFeatures)
+
+    if SpatialReference is None:
+        SpatialReferenceName = ''
+    elif SpatialReference.factoryCode:
+        SpatialReferenceName = '_' + str(SpatialReference.factoryCode)
+    else:
+        SpatialReferenceName = '_' + hashlib.sha1(SpatialReference.exportToString().encode('utf-8')).hexdigest()[:12]
+
+    return (os.path.dirname(GeoDBPath) + '/' + os.path.basename(GeoDBPath) + '_' + os.path.basename(JoinFeatures) +
+            SpatialReferenceName + '_MonumentIndex.npz')
+
+def GetMonumentIndexKey(JoinFeatures, FieldNames, SpatialReference = None, ContentHash = False, Fingerprint = None):
+    """
+    Returns the invalidation key of a monument index: a hash of the
+    monuments' row count, extent, fields, the index's 'FieldNames' and
+    the 'SpatialReference' the points are projected to. By default
+    (ContentHash = False) these are read from the feature class's
+    metadata, without reading its rows, so an edit that changes
+    neither the row count nor the extent (e.g. a corrected 'LakeNum',
+    or a monument moved within the extent) is not seen, and the old
+    index is used.
+
+    If 'ContentHash = True', the key also includes a hash of every row
+    (see 'GetFeatureClassFingerprint'), so that such an edit also makes
+    a new index. This reads the monuments' rows. 'Fingerprint' is the
+    hash of the rows, if it is already known (see 'TransformAll').
+    """
+    Extent = arcpy.Describe(JoinFeatures).extent
+
+    Inputs = {'RowCount': int(arcpy.management.GetCount(JoinFeatures)[0]),
+              'Extent': [Extent.XMin, Extent.YMin, Extent.XMax, Extent.YMax],
+              'Fields': [[f.name, f.type] for f in arcpy.ListFields(JoinFeatures)],
+              'IndexFields': FieldNames,
+              'SpatialReference': (None if SpatialReference is None else SpatialReference.exportToString())}
+
+    if ContentHash:
+        Inputs['Content'] = (Fingerprint if Fingerprint is not None else GetFeatureClassFingerprint(JoinFeatures))
+
+    return hashlib.sha1(json.dumps(Inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+def LoadMonumentIndex(JoinFeatures, SpatialReference = None, ContentHash = False, Fingerprint = None, Key = None):
+    """
+    Returns the 'MonumentIndex.MonumentIndex' of the
+    'MONUMENT_INDEX_FIELDS' (those it has) of the monuments feature class
+    'JoinFeatures', with the points projected to 'SpatialReference'.
+
+    The index is loaded from its file (see 'GetMonumentIndexPath') if
+    the file's invalidation key (see 'GetMonumentIndexKey', and its
+    'ContentHash' and 'Fingerprint' parameters) is the current key.
+    Otherwise the monuments are read from the geodatabase, and the
+    index file is written for the next time. The key of the returned
+    index is its 'Key' attribute.
+
+    If 'Key' is given, it is the current key, already worked out in
+    this run (e.g. by 'TransformAll'), and it is not worked out again.
+    """
+    IndexPath = GetMonumentIndexPath(JoinFeatures, SpatialReference)
+
+    # Only the fields that the monuments have are kept.
+    JoinFieldNames = [f.name for f in arcpy.ListFields(JoinFeatures)]
+    FieldNames = [Name for Name in MONUMENT_INDEX_FIELDS if Name in JoinFieldNames]
+
+    if Key is None:
+        Key = GetMonumentIndexKey(JoinFeatures, FieldNames, SpatialReference, ContentHash, Fingerprint)
+
+    if os.path.exists(IndexPath):
+        Index = MonumentIndex.MonumentIndex.Load(IndexPath)
+
+        if Index.Key == Key:
+            return Index
+
+    Index = ReadMonumentIndex(JoinFeatures, FieldNames, SpatialReference)
+    Index.Key = Key
+    Index.Save(IndexPath)
+
+    return Index
+
+def CreateIndexedTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass, OverwriteOutput,
+                           DistanceFieldName = None, ContentHash = False, MonumentIndexKeys = None):
+    """
+    The same as 'CreateTableJoin', but the closest monument of each
+    target point is found with an in memory 'MonumentIndex' instead
+    of 'arcpy.SpatialJoin_analysis':
+    - The target features are copied with their kept and renamed
+      fields (see 'CreateTableJoin').
+    - The kept fields of the join features (the monuments) are added.
+    - The attributes of the closest monument are filled in, in one
+      'arcpy.da.UpdateCursor' pass. The monuments are projected to the
+      coordinate system of the target features.
+    - The monument index is loaded from its file when it holds all
+      the needed fields (see 'LoadMonumentIndex'), so the monuments
+      are read from the geodatabase only when they have changed. The
+      'ContentHash' parameter is passed to 'LoadMonumentIndex'.
+    - If 'MonumentIndexKeys' (a dictionary of the index keys, by index
+      file path) is given, the key of the index is taken from it, or
+      added to it when it is worked out, so the key is worked out once
+      for all the joins that share the dictionary (see 'TransformAll').
+    - If 'DistanceFieldName' is given, the join distance (in the units
+      of the target features' coordinate system) is written to a new
+      field with that name.
+
+    NOTE: unlike 'arcpy.SpatialJoin_analysis', the 'Join_Count' and
+    'TARGET_FID' fields are not added.
+    """
+    arcpy.env.overwriteOutput = OverwriteOutput
+
+    KeepFields = KeepFieldsFunction(FeatureType)
+    Renames = RenameFieldsFunction(FeatureType)
+
+    TargetFieldNames = [f.name for f in arcpy.ListFields(TargetFeatures)]
+
+    # The join features' fields that are kept. As with the spatial
+    # join's field mappings, a field that is also in the target
+    # features is taken from the target features.
+    JoinFields = [f for f in arcpy.ListFields(JoinFeatures) if f.name in KeepFields and f.name not in TargetFieldNames]
+    JoinFieldNames = [f.name for f in JoinFields]
+
+    FieldMappings = arcpy.FieldMappings()
+    FieldMappings.addTable(TargetFeatures)
+
+    RemoveFields(FieldMappings, KeepFields)
+    RenameFields(FieldMappings, Renames)
+
+    arcpy.conversion.FeatureClassToFeatureClass(TargetFeatures, arcpy.env.workspace, OutputFeatureClass, field_mapping=FieldMappings)
+
+    SpatialReference = arcpy.Describe(TargetFeatures).spatialReference
+
+    # The monument index file is used when it holds all the needed
+    # fields.
+    if all(Name in MONUMENT_INDEX_FIELDS for Name in JoinFieldNames):
+        IndexPath = GetMonumentIndexPath(JoinFeatures, SpatialReference)
+        Key = (MonumentIndexKeys.get(IndexPath) if MonumentIndexKeys is not None else None)
+
+        Index = LoadMonumentIndex(JoinFeatures, SpatialReference, ContentHash, Key = Key)
+
+        if MonumentIndexKeys is not None:
+            MonumentIndexKeys[IndexPath] = Index.Key
+    else:
+        Index = ReadMonumentIndex(JoinFeatures, JoinFieldNames, SpatialReference)
+
+    Positions = [Index.FieldNames.index(Name) for Name in JoinFieldNames]
+
+    OutputFieldNames = [Renames.get(Name, Name) for Name in JoinFieldNames]
+    NewFields = [[OutputName, ADD_FIELD_TYPES[f.type], OutputName, (f.length if f.type == 'String' else None)]
+                 for OutputName, f in zip(OutputFieldNames, JoinFields)]
+
+    if DistanceFieldName is not None:
+        OutputFieldNames.append(DistanceFieldName)
+        NewFields.append([DistanceFieldName, "DOUBLE"])
+
+    if len(NewFields) == 0:
+        return
+
+    arcpy.management.AddFields(OutputFeatureClass, NewFields)
+
+    with arcpy.da.UpdateCursor(OutputFeatureClass, ['SHAPE@XY'] + OutputFieldNames) as Cursor:
+        for Row in Cursor:
+            Attributes, Distance = Index.Closest(Row[0])
+
+            if Attributes is None:
+                Values = [None] * len(JoinFieldNames)
+            else:
+                Values = [Attributes[Position] for Position in Positions]
+
+            if DistanceFieldName is not None:
+                Values.append(Distance)
+
+            Cursor.updateRow([Row[0]] + Values)
 
 def GetKeptFieldsFromPathfinder(FeatureType):
 
@@ -208,102 +441,85 @@ def RemoveFields(FieldMappings, KeepFields):
         if f.name not in KeepFields:
             FieldMappings.removeFieldMap(FieldMappings.findFieldMapIndex(f.name))
 
-def AlterFieldNamesFromPathFinder(FeatureClassName, FeatureType):
+# The Pathfinder field names, and the older 'Positions' names they are
+# renamed to, for each feature type. See 'GetFieldRenamesFromPathfinder'.
+PATHFINDER_FIELD_RENAMES = {
+    Feature.WATER_SAMPLE: {"SampleNum": "Sample_Number__A__B__C_",
+                           "Depth_m": "Depth_in_meters",
+                           "SampCom": "Comment",
+                           "WaterSamp": "Water_Bottles_Collected_"},
+
+    Feature.DEPTH: {"Depth_m": "Depth_in_meters",
+                    "DepthCom": "Comment"},
+
+    Feature.SECCHI: {"Depth_m": "Lake_Depth_in_meters",
+                     "SecchiDept": "Secchi_Depth_in_meters",
+                     # "OnBottom": "Is_the_Secchi_on_the_lake_bottom_",
+                     "SeccCom": "Comments"},
+
+    Feature.LOON: {"Species": "Loon_Species",
+                   "NumAdults": "a___of_Adults",
+                   "NumYoung": "a___of_Young",
+                   "OnWater": "On_Water_",
+                   "Identifica": "Identification_Method",
+                   "Comments": "Loon_Comments"},
+
+    Feature.DEPLOYMENT: {"Depth_m": "Lake_Depth_in_meters",
+                         "DeployType": "Deployment_Type",
+                         "DepCom": "Comments"},
+
+    Feature.RETRIEVAL: {"Depth_m": "Lake_Depth_in_meters",
+                        "DeployType": "Deployment_Type",
+                        "RetCom": "Comments"},
+
+    Feature.MONUMENT: {"Rcvr_Type": "DeviceType",
+                       "Corr_Type": "CorrStatus",
+                       "Horz_Prec": "HorizEstAcc",
+                       "Vert_Prec": "VertEstAcc",
+                       "GNSS_Heigh": "FeatureHeight"}
+}
+
+def GetFieldRenamesFromPathfinder(FeatureType):
     """
     The program GIS Pathfinder Office creates a different set of
-    column names than Positions software. This function renames the
-    feature class column names to those in this existing code (which
-    was written with the Positions column names).
+    column names than Positions software. This function returns a
+    dictionary of the Pathfinder column names and the names in this
+    existing code (which was written with the Positions column names).
     """
+    return PATHFINDER_FIELD_RENAMES[FeatureType]
 
-    if FeatureType == Feature.WATER_SAMPLE:
-        Fields = arcpy.ListFields(FeatureClassName)
-
-        for f in Fields:
-            if f.name == "SampleNum":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Sample_Number__A__B__C_")
-            elif f.name == "Depth_m":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Depth_in_meters")
-            elif f.name == "SampCom":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Comment")
-            elif f.name == "WaterSamp":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Water_Bottles_Collected_")
-
-    elif FeatureType == Feature.DEPTH:
-        Fields = arcpy.ListFields(FeatureClassName)
-
-        for f in Fields:
-            if f.name == "Depth_m":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Depth_in_meters")
-            elif f.name == "DepthCom":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Comment")
-
-    elif FeatureType == Feature.SECCHI:
-        Fields = arcpy.ListFields(FeatureClassName)
-
-        for f in Fields:
-            if f.name == "Depth_m":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Lake_Depth_in_meters")
-            elif f.name == "SecchiDept":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Secchi_Depth_in_meters")
-            # elif f.name == "OnBottom":
-            #     arcpy.AlterField_management(FeatureClassName, f.name, "Is_the_Secchi_on_the_lake_bottom_")
-            elif f.name == "SeccCom":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Comments")
-
-    elif FeatureType == Feature.LOON:
-        Fields = arcpy.ListFields(FeatureClassName)
-
-        for f in Fields:
-            if f.name == "Species":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Loon_Species")
-            elif f.name == "NumAdults":
-                arcpy.AlterField_management(FeatureClassName, f.name, "a___of_Adults")
-            elif f.name == "NumYoung":
-                arcpy.AlterField_management(FeatureClassName, f.name, "a___of_Young")
-            elif f.name == "OnWater":
-                arcpy.AlterField_management(FeatureClassName, f.name, "On_Water_")
-            elif f.name == "Identifica":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Identification_Method")
-            elif f.name == "Comments":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Loon_Comments")
+def RenameFields(FieldMappings, Renames):
+    """
+    Sets the output field name (and alias) of each field map in
+    'FieldMappings' whose name is a key of the 'Renames' dictionary, so
+    that the join writes the renamed fields directly.
+    """
+    for i in range(FieldMappings.fieldCount):
+        FieldMap = FieldMappings.getFieldMap(i)
+        OutputField = FieldMap.outputField
 
-    elif FeatureType == Feature.DEPLOYMENT:
-        Fields = arcpy.ListFields(FeatureClassName)
+        if OutputField.name in Renames:
+            OutputField.name = Renames[OutputField.name]
+            OutputField.aliasName = OutputField.name
+            FieldMap.outputField = OutputField
 
-        for f in Fields:
-            if f.name == "Depth_m":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Lake_Depth_in_meters")
-            elif f.name == "DeployType":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Deployment_Type")
-            elif f.name == "DepCom":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Comments")
+            FieldMappings.replaceFieldMap(i, FieldMap)
 
-    elif FeatureType == Feature.RETRIEVAL:
-        Fields = arcpy.ListFields(FeatureClassName)
+def AlterFieldNamesFromPathFinder(FeatureClassName, FeatureType):
+    """
+    Renames the Pathfinder columns of an existing feature class to the
+    Positions names (see 'PATHFINDER_FIELD_RENAMES'), with one
+    'arcpy.AlterField_management' call per column.
 
-        for f in Fields:
-            if f.name == "Depth_m":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Lake_Depth_in_meters")
-            elif f.name == "DeployType":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Deployment_Type")
-            elif f.name == "RetCom":
-                arcpy.AlterField_management(FeatureClassName, f.name, "Comments")
+    NOTE: 'CreateTableJoin' no longer uses this function; it renames
+    the columns in the join's field mappings. This function is kept for
+    feature classes that were joined without renaming.
+    """
+    Renames = GetFieldRenamesFromPathfinder(FeatureType)
 
-    elif FeatureType == Feature.MONUMENT:
-        Fields = arcpy.ListFields(FeatureClassName)
-
-        for f in Fields:
-            if f.name == "Rcvr_Type":
-                arcpy.AlterField_management(FeatureClassName, f.name, "DeviceType")
-            elif f.name == "Corr_Type":
-                arcpy.AlterField_management(FeatureClassName, f.name, "CorrStatus")
-            elif f.name == "Horz_Prec":
-                arcpy.AlterField_management(FeatureClassName, f.name, "HorizEstAcc")
-            elif f.name == "Vert_Prec":
-                arcpy.AlterField_management(FeatureClassName, f.name, "VertEstAcc")
-            elif f.name == "GNSS_Heigh":
-                arcpy.AlterField_management(FeatureClassName, f.name, "FeatureHeight")
+    for f in arcpy.ListFields(FeatureClassName):
+        if f.name in Renames:
+            arcpy.AlterField_management(FeatureClassName, f.name, Renames[f.name])
 
 def AddNewDateField(TargetFeatureClassName, FieldName):
     arcpy.management.AddField(TargetFeatureClassName, FieldName, "DATE")
@@ -320,7 +536,172 @@ def CombineDateAndTime(TargetFeatureClassName, TargetFieldName, DateFieldName, T
     Expression = "!" + DateFieldName + "!.strftime('%Y-%m-%d') + ' ' + !" + TimeFieldName + "!"
     arcpy.management.CalculateField(TargetFeatureClassName, TargetFieldName, Expression)
 
-def TransformTable(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, AlterFunction, OutputFeatureClass, OverwriteOutput = True):
+# The text formats of the Trimble Pathfinder 'GPS_Time' field, tried in
+# this order by 'ParseGPSTime'.
+GPS_TIME_FORMATS = ['%H:%M:%S', '%I:%M:%S%p', '%I:%M:%S %p', '%H:%M:%S.%f', '%H:%M']
+
+def ParseGPSTime(TimeText):
+    """
+    Returns the 'datetime.time' of a Pathfinder 'GPS_Time' text value,
+    or None if the value is empty or in none of the
+    'GPS_TIME_FORMATS'.
+    """
+    if TimeText is None:
+        return None
+
+    TimeText = TimeText.strip()
+
+    for TimeFormat in GPS_TIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(TimeText, TimeFormat).time()
+        except ValueError:
+            pass
+
+    return None
+
+def CalculateDateTimeAndPointGeometry(TargetFeatureClassName, TargetFieldName, DateFieldName, TimeFieldName, XFieldName, YFieldName,
+                                      Metrics = None):
+    """
+    Adds the date/time field 'TargetFieldName' and the coordinate
+    fields 'XFieldName' and 'YFieldName' with one 'AddFields' call,
+    then fills all three in a single 'arcpy.da.UpdateCursor' pass.
+    This replaces 'AddNewDateField', 'AddNewDoubleField',
+    'CombineDateAndTime' and 'CalculatePointGeometry', which rewrite
+    the table once per step.
+
+    - The date/time is the date of the ESRI 'Date' field
+      'DateFieldName' combined with the time of the 'Text' field
+      'TimeFieldName' (see 'ParseGPSTime'). It is NULL if either is
+      missing.
+    - The coordinates are the point geometry projected to the
+      geographic coordinate system of the feature class (decimal
+      degrees; see 'CalculatePointGeometry'). The geometries are read
+      first, in their own coordinate system, by a 'SearchCursor', and
+      each is projected with 'projectAs'. The geometry is not a field
+      of the 'UpdateCursor', so it is never written back.
+    - If 'Metrics' (a 'RunMetrics.RunMetrics') is given, the adding of
+      the fields and the cursor pass are recorded as its 'Add fields'
+      and 'Calculate' stages.
+    """
+    if Metrics is not None:
+        Metrics.StartStage('Add fields')
+
+    arcpy.management.AddFields(TargetFeatureClassName,
+                               [[TargetFieldName, "DATE"],
+                                [XFieldName, "DOUBLE"],
+                                [YFieldName, "DOUBLE"]])
+
+    GCS = arcpy.Describe(TargetFeatureClassName).spatialReference.GCS
+
+    if Metrics is not None:
+        Metrics.StartStage('Calculate')
+
+    # The geographic coordinates of each point, by object ID.
+    Points = {}
+
+    with arcpy.da.SearchCursor(TargetFeatureClassName, ["OID@", "SHAPE@"]) as Cursor:
+        for ObjectID, Shape in Cursor:
+            if Shape is None:
+                Points[ObjectID] = (None, None)
+            else:
+                Point = Shape.projectAs(GCS).firstPoint
+                Points[ObjectID] = (Point.X, Point.Y)
+
+    Fields = ["OID@", DateFieldName, TimeFieldName, TargetFieldName, XFieldName, YFieldName]
+
+    with arcpy.da.UpdateCursor(TargetFeatureClassName, Fields) as Cursor:
+        Rows = (Cursor if Metrics is None else Metrics.CountRows(Cursor))
+
+        for Row in Rows:
+            ObjectID, GPSDate, GPSTime = Row[0], Row[1], Row[2]
+
+            Time = ParseGPSTime(GPSTime)
+
+            if GPSDate is None or Time is None:
+                Row[3] = None
+            else:
+                Row[3] = datetime.datetime.combine(GPSDate.date(), Time)
+
+            Row[4], Row[5] = Points.get(ObjectID, (None, None))
+
+            Cursor.updateRow(Row)
+
+    # Every row read is updated.
+    if Metrics is not None:
+        Metrics.AddRowsEmitted(Metrics.Stage.RowsRead)
+
+def GetFeatureClassFingerprint(FeatureClassName):
+    """
+    Returns a hash of the row count, the field names and the contents
+    (including the geometry) of a feature class. The hash changes when
+    any row is added, deleted or edited.
+    """
+    FieldNames = [f.name for f in arcpy.ListFields(FeatureClassName) if f.type not in ('OID', 'Geometry')]
+    FieldNames.append('SHAPE@WKB')
+
+    Hash = hashlib.sha1(repr(FieldNames).encode('utf-8'))
+
+    RowCount = 0
+    with arcpy.da.SearchCursor(FeatureClassName, FieldNames) as Cursor:
+        for Row in Cursor:
+            Hash.update(repr(Row).encode('utf-8'))
+            RowCount = RowCount + 1
+
+    return str(RowCount) + ':' + Hash.hexdigest()
+
+def GetTransformFingerprint(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction):
+    """
+    Returns the fingerprint of the inputs of a transform (see
+    'TransformTable'): the fingerprints of the target and join feature
+    classes, the feature type, and the kept and renamed fields. If the
+    fingerprint has not changed, the transform's output would be the
+    same as the last time.
+    """
+    Inputs = {'FeatureType': FeatureType.name,
+              'TargetFeatures': GetFeatureClassFingerprint(TargetFeatures),
+              'JoinFeatures': GetFeatureClassFingerprint(JoinFeatures),
+              'KeepFields': KeepFieldsFunction(FeatureType),
+              'RenameFields': RenameFieldsFunction(FeatureType)}
+
+    return hashlib.sha1(json.dumps(Inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+def GetTransformCachePath(GeoDBPath, OutputFeatureClass):
+    """
+    The path of the transform cache file of an output feature class.
+    The file is written next to the geodatabase, e.g.
+    'fake.gdb_Depth_Joined_TransformCache.json'.
+    """
+    return os.path.dirname(GeoDBPath) + '/' + os.path.basename(GeoDBPath) + '_' + OutputFeatureClass + '_TransformCache.json'
+
+def ReadTransformCache(GeoDBPath, OutputFeatureClass):
+    """
+    Returns the fingerprint of the inputs that the output feature class
+    was last made from, or None.
+    """
+    CachePath = GetTransformCachePath(GeoDBPath, OutputFeatureClass)
+
+    if not os.path.exists(CachePath):
+        return None
+
+    with open(CachePath, 'r') as CacheFile:
+        return json.load(CacheFile)['Fingerprint']
+
+def WriteTransformCache(GeoDBPath, OutputFeatureClass, Fingerprint):
+    with open(GetTransformCachePath(GeoDBPath, OutputFeatureClass), 'w') as CacheFile:
+        json.dump({'OutputFeatureClass': OutputFeatureClass, 'Fingerprint': Fingerprint}, CacheFile)
+
+def GetTransformMetricsPath(GeoDBPath, Name):
+    """
+    The path of a JSON metrics file of a transform run (see
+    'RunMetrics'), written next to the geodatabase, e.g.
+    'fake.gdb_Depth_Joined_Transform_2026-10-17T09.30.00_Metrics.json'.
+    """
+    DatetimeStr = datetime.datetime.now().strftime('%Y-%m-%dT%H.%M.%S')
+
+    return os.path.dirname(GeoDBPath) + '/' + os.path.basename(GeoDBPath) + '_' + Name + '_Transform_' + DatetimeStr + '_Metrics.json'
+
+def TransformTable(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass, OverwriteOutput = True, UseCache = False,
+                   UseMonumentIndex = False, WriteMetrics = False, MonumentIndexContentHash = False, MonumentIndexKeys = None):
     """
     This function:
     - Creates a table join.
@@ -331,20 +712,62 @@ def TransformTable(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction
     - Creates new columns 'XCurrentMapCS' and 'YCurrentMapCS' and
       calculates the point geometry (lat/long) for the underlying
       coordinate system.
+      - The three new columns are filled in one pass (see
+        'CalculateDateTimeAndPointGeometry').
+    - If 'UseCache = True', then the fingerprint of the inputs (see
+      'GetTransformFingerprint') is saved next to the geodatabase
+      (the current 'arcpy.env.workspace'). When the output already
+      exists and the inputs have not changed since it was made, the
+      output is kept and the transform is skipped.
+    - If 'UseMonumentIndex = True', then the closest monuments are found
+      with an in memory index (see 'CreateIndexedTableJoin') instead of
+      'arcpy.SpatialJoin_analysis'. The saved index is checked against
+      the monuments' metadata, or also a hash of their rows if
+      'MonumentIndexContentHash = True' (see 'GetMonumentIndexKey').
+      The 'MonumentIndexKeys' are passed to 'CreateIndexedTableJoin'.
+    - The time of each stage (the cache check, the join, which also
+      renames the fields, the adding of the fields and their
+      calculation) and the rows updated are recorded (see
+      'RunMetrics'), and shown with the progressor. If
+      'WriteMetrics = True', they are also written to a JSON file next
+      to the geodatabase (see 'GetTransformMetricsPath').
+
+    Returns the metrics of the transform (see
+    'RunMetrics.RunMetrics.GetReport').
     """
+    GeoDBPath = arcpy.env.workspace
+
+    Metrics = RunMetrics.RunMetrics(OutputFeatureClass)
+    MetricsPath = (GetTransformMetricsPath(GeoDBPath, OutputFeatureClass) if WriteMetrics else None)
 
     if arcpy.Exists(TargetFeatures):
-        CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, AlterFunction, OutputFeatureClass, OverwriteOutput)
+        if UseCache:
+            Metrics.StartStage('Cache check')
+            Fingerprint = GetTransformFingerprint(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction)
+
+            if arcpy.Exists(OutputFeatureClass) and ReadTransformCache(GeoDBPath, OutputFeatureClass) == Fingerprint:
+                print(OutputFeatureClass + " is up to date; the transform is skipped.")
+                return Metrics.Finish(MetricsPath)
+
+        Metrics.StartStage('Join')
 
-        AddNewDateField(OutputFeatureClass, "CreationDateTimeLocal")
-        AddNewDoubleField(OutputFeatureClass, "XCurrentMapCS")
-        AddNewDoubleField(OutputFeatureClass, "YCurrentMapCS")
+        if UseMonumentIndex:
+            CreateIndexedTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass, OverwriteOutput,
+                                   ContentHash = MonumentIndexContentHash, MonumentIndexKeys = MonumentIndexKeys)
+        else:
+            CreateTableJoin(FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass, OverwriteOutput)
 
-        CombineDateAndTime(OutputFeatureClass, "CreationDateTimeLocal", "GPS_Date", "GPS_Time")
-        CalculatePointGeometry(OutputFeatureClass, "XCurrentMapCS", "YCurrentMapCS")
+        CalculateDateTimeAndPointGeometry(OutputFeatureClass, "CreationDateTimeLocal", "GPS_Date", "GPS_Time",
+                                          "XCurrentMapCS", "YCurrentMapCS", Metrics)
+
+        if UseCache:
+            Metrics.StartStage('Cache write')
+            WriteTransformCache(GeoDBPath, OutputFeatureClass, Fingerprint)
     else:
         print("TargetFeatures argument does not exit.")
 
+    return Metrics.Finish(MetricsPath)
+
 def CalculatePointGeometry(TargetFeatureClassName, XFieldName, YFieldName):
     """
     From the Python docs:
@@ -360,3 +783,218 @@ def CalculatePointGeometry(TargetFeatureClassName, XFieldName, YFieldName):
                                                  [[XFieldName, "POINT_X"],
                                                   [YFieldName, "POINT_Y"]],
                                                  coordinate_format="DD")
+
+def TransformAll(Transforms, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, Workers = None, ScratchFolder = None, OverwriteOutput = True, UseCache = False,
+                 UseMonumentIndex = False, WriteMetrics = False, MonumentIndexContentHash = False):
+    """
+    Runs 'TransformTable' for several feature types at once, each in
+    its own worker process.
+
+    To avoid geodatabase lock contention, each worker writes its
+    output feature class to its own scratch file geodatabase. The
+    source geodatabase (the current 'arcpy.env.workspace') is only
+    read by the workers. When all the workers have finished, the
+    outputs are copied, one at a time, into the source geodatabase,
+    and the scratch geodatabases are deleted.
+
+    Parameters:
+    - Transforms = a list of (FeatureType, TargetFeatures,
+      OutputFeatureClass) tuples; one per feature type. See
+      'TransformTable'.
+    - JoinFeatures, KeepFieldsFunction, RenameFieldsFunction = see
+      'TransformTable'. These are the same for every feature type. The
+      functions must be module level functions (not lambdas) so that
+      they can be sent to a worker process.
+    - Workers = the number of worker processes. The default (None) is
+      one worker per feature type, up to the number of processors.
+    - ScratchFolder = the folder where the scratch geodatabases are
+      created. The default (None) is a new temporary folder.
+    - OverwriteOutput = if True (default), then any previously created
+      output feature class in the source geodatabase is overwritten.
+    - UseCache = if True, the outputs whose inputs have not changed
+      since they were made are kept, and only the other feature types
+      are transformed (see 'TransformTable').
+    - UseMonumentIndex, MonumentIndexContentHash = see
+      'TransformTable'. The key of each monument index is worked out
+      once, before the workers start, and passed to them.
+    - WriteMetrics = if True, the metrics of every transform (see
+      'TransformTable') and of the copy into the source geodatabase
+      are written to one JSON file next to the geodatabase (see
+      'GetTransformMetricsPath').
+
+    NOTE: the calling script must guard its entry point with
+    "if __name__ == '__main__':" (see 'ExampleScript2.py').
+
+    Returns a dictionary with one error report per feature type, with
+    the keys:
+    - 'OutputFeatureClass' = the name of the output feature class.
+    - 'Succeeded' = True or False.
+    - 'Cached' = True if the existing output was kept.
+    - 'Error' = the error message (of the transform or of the copy
+      into the source geodatabase), or None.
+    - 'Seconds' = the time the transform took in its worker.
+    - 'Metrics' = the metrics of the transform's stages in its worker
+      (see 'TransformTable'), or None if it failed before it started.
+    """
+    GeoDBPath = arcpy.env.workspace
+
+    # A temporary scratch folder is removed when done; a given one is
+    # kept.
+    RemoveScratchFolder = ScratchFolder is None
+
+    if RemoveScratchFolder:
+        ScratchFolder = tempfile.mkdtemp(prefix='TransformAll_')
+
+    if Workers is None:
+        Workers = min(len(Transforms), os.cpu_count() or 1)
+
+    Reports = {}
+
+    if len(Transforms) == 0:
+        return Reports
+
+    # Make the monument index files before the workers start, so that
+    # they all load them instead of each reading the monuments. There
+    # is one index per coordinate system of the targets (see
+    # 'GetMonumentIndexPath'). The keys of the indexes are passed to
+    # the workers, so they are not worked out again, and the monuments'
+    # rows are hashed at most once.
+    MonumentIndexKeys = None
+
+    if UseMonumentIndex:
+        JoinPath = os.path.join(GeoDBPath, JoinFeatures)
+        SpatialReferences = {}
+
+        for FeatureType, TargetFeatures, OutputFeatureClass in Transforms:
+            TargetPath = os.path.join(GeoDBPath, TargetFeatures)
+
+            if arcpy.Exists(TargetPath):
+                SpatialReference = arcpy.Describe(TargetPath).spatialReference
+                SpatialReferences.setdefault(GetMonumentIndexPath(JoinPath, SpatialReference), SpatialReference)
+
+        Fingerprint = (GetFeatureClassFingerprint(JoinPath) if MonumentIndexContentHash and len(SpatialReferences) > 0 else None)
+
+        MonumentIndexKeys = {IndexPath: LoadMonumentIndex(JoinPath, SpatialReference, MonumentIndexContentHash, Fingerprint).Key
+                             for IndexPath, SpatialReference in SpatialReferences.items()}
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=Workers) as Executor:
+        Futures = {}
+
+        for FeatureType, TargetFeatures, OutputFeatureClass in Transforms:
+            if UseCache and arcpy.Exists(os.path.join(GeoDBPath, OutputFeatureClass)):
+                CachedFingerprint = ReadTransformCache(GeoDBPath, OutputFeatureClass)
+            else:
+                CachedFingerprint = None
+
+            Futures[FeatureType] = Executor.submit(RunTransform, GeoDBPath, ScratchFolder, FeatureType, TargetFeatures,
+                                                   JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass,
+                                                   UseCache, CachedFingerprint, UseMonumentIndex, MonumentIndexContentHash, MonumentIndexKeys)
+
+        for FeatureType, Future in Futures.items():
+            Reports[FeatureType] = Future.result()
+
+    # Merge the outputs into the source geodatabase. This is done in
+    # this process, one feature class at a time, so that only one
+    # process writes to the source geodatabase.
+    arcpy.env.workspace = GeoDBPath
+    arcpy.env.overwriteOutput = OverwriteOutput
+
+    Metrics = RunMetrics.RunMetrics('TransformAll')
+    Metrics.StartStage('Copy')
+
+    for FeatureType, Report in Reports.items():
+        ScratchGeoDB = Report.pop('ScratchGeoDB')
+        Fingerprint = Report.pop('Fingerprint')
+
+        if Report['Succeeded'] and not Report['Cached']:
+            try:
+                arcpy.management.CopyFeatures(os.path.join(ScratchGeoDB, Report['OutputFeatureClass']),
+                                              os.path.join(GeoDBPath, Report['OutputFeatureClass']))
+
+                if UseCache:
+                    WriteTransformCache(GeoDBPath, Report['OutputFeatureClass'], Fingerprint)
+            except Exception as e:
+                Report['Succeeded'] = False
+                Report['Error'] = 'Error copying into ' + GeoDBPath + ': ' + str(e)
+
+        if arcpy.Exists(ScratchGeoDB):
+            arcpy.management.Delete(ScratchGeoDB)
+
+        if Report['Cached']:
+            print(Report['OutputFeatureClass'] + " is up to date; the transform of " + FeatureType.name + " is skipped.")
+        elif Report['Succeeded']:
+            print("Transformed " + FeatureType.name + " into " + Report['OutputFeatureClass'] + " in " + format(Report['Seconds'], '.2f') + " seconds.")
+        else:
+            print("Transforming " + FeatureType.name + " FAILED: " + Report['Error'])
+
+    if RemoveScratchFolder:
+        shutil.rmtree(ScratchFolder, ignore_errors=True)
+
+    Metrics.Finish()
+
+    if WriteMetrics:
+        RunMetrics.WriteMetrics(GetTransformMetricsPath(GeoDBPath, 'TransformAll'),
+                                {'TransformAll': Metrics.GetReport(),
+                                 'Transforms': {FeatureType.name: Report['Metrics'] for FeatureType, Report in Reports.items()}})
+
+    return Reports
+
+def RunTransform(GeoDBPath, ScratchFolder, FeatureType, TargetFeatures, JoinFeatures, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass,
+                 UseCache = False, CachedFingerprint = None, UseMonumentIndex = False, MonumentIndexContentHash = False,
+                 MonumentIndexKeys = None):
+    """
+    Runs one transform of function 'TransformAll' in a worker process,
+    writing to a new scratch file geodatabase, and returns its report.
+    If 'UseCache' is True and the fingerprint of the inputs is
+    'CachedFingerprint', the transform is skipped. The
+    'MonumentIndexKeys' are the keys of the monument indexes worked out
+    by 'TransformAll' (see 'CreateIndexedTableJoin'). Errors are
+    returned, not raised.
+    """
+    StartTime = time.perf_counter()
+
+    ScratchGeoDB = os.path.join(ScratchFolder, FeatureType.name + '.gdb')
+
+    Report = {'OutputFeatureClass': OutputFeatureClass,
+              'ScratchGeoDB': ScratchGeoDB,
+              'Fingerprint': None,
+              'Succeeded': False,
+              'Cached': False,
+              'Error': None,
+              'Metrics': None}
+
+    try:
+        TargetPath = os.path.join(GeoDBPath, TargetFeatures)
+        JoinPath = os.path.join(GeoDBPath, JoinFeatures)
+
+        if not arcpy.Exists(TargetPath):
+            raise Exception("TargetFeatures argument does not exist: " + TargetPath)
+
+        if UseCache:
+            Report['Fingerprint'] = GetTransformFingerprint(FeatureType, TargetPath, JoinPath, KeepFieldsFunction, RenameFieldsFunction)
+
+            if Report['Fingerprint'] == CachedFingerprint:
+                Report['Succeeded'] = True
+                Report['Cached'] = True
+                Report['Seconds'] = time.perf_counter() - StartTime
+
+                return Report
+
+        arcpy.management.CreateFileGDB(ScratchFolder, FeatureType.name + '.gdb')
+
+        # The output, and the field changes made to it, are in the
+        # scratch geodatabase.
+        arcpy.env.workspace = ScratchGeoDB
+
+        Report['Metrics'] = TransformTable(FeatureType, TargetPath, JoinPath, KeepFieldsFunction, RenameFieldsFunction, OutputFeatureClass,
+                                           UseMonumentIndex = UseMonumentIndex,
+                                           MonumentIndexContentHash = MonumentIndexContentHash,
+                                           MonumentIndexKeys = MonumentIndexKeys)
+
+        Report['Succeeded'] = True
+    except Exception as e:
+        Report['Error'] = str(e)
+
+    Report['Seconds'] = time.perf_counter() - StartTime
+
+    return Report
@@ -0,0 +1,93 @@
+# TestBatchExport.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the parts of the batch mode (see 'BatchExport')
+# that do not need ArcGIS: the list of the geodatabases of a batch,
+# the order of the sources of the merged rows, and the error when no
+# geodatabase is left to merge. The 'arcpy' stand-in of the benchmarks
+# (see 'Benchmark/arcpy.py') is used instead of ArcGIS; it has no
+# geoprocessing tools, so the merge itself is not tested.
+# 'BatchExport' imports 'TableUtility', which needs NumPy (see
+# 'MonumentIndex'); the tests are skipped without it.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestBatchExport
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+try:
+    import BatchExport
+except ImportError:
+    BatchExport = None
+
+def GetFailingTransforms(GeoDBPath):
+    """
+    The transforms of a geodatabase that cannot be transformed.
+    """
+    raise Exception("No Pathfinder feature classes in " + GeoDBPath)
+
+@unittest.skipIf(BatchExport is None, "NumPy is not installed.")
+class TestBatchExport(unittest.TestCase):
+
+    def setUp(self):
+        self.Folder = tempfile.mkdtemp()
+
+        for Name in ['Crew2.gdb', 'Crew1.gdb', BatchExport.MERGED_GEO_DB_NAME]:
+            os.mkdir(os.path.join(self.Folder, Name))
+
+    def tearDown(self):
+        shutil.rmtree(self.Folder)
+
+    def test_GetGeoDBPaths(self):
+        Expected = [os.path.join(self.Folder, 'Crew1.gdb'), os.path.join(self.Folder, 'Crew2.gdb')]
+
+        # The merged geodatabase of an earlier run is not an input.
+        self.assertEqual(BatchExport.GetGeoDBPaths(self.Folder), Expected)
+        self.assertEqual(BatchExport.GetGeoDBPaths(os.path.join(self.Folder, '*.gdb')), Expected)
+
+        # A list is used in its own order.
+        self.assertEqual(BatchExport.GetGeoDBPaths(list(reversed(Expected))), list(reversed(Expected)))
+
+        with self.assertRaises(Exception):
+            BatchExport.GetGeoDBPaths(os.path.join(self.Folder, '*.mdb'))
+
+    def test_GetSourceRank(self):
+        GeoDBPaths = BatchExport.GetGeoDBPaths(self.Folder)
+
+        self.assertEqual(BatchExport.GetSourceRank(GeoDBPaths, os.path.join(GeoDBPaths[1], 'Depth_Joined')), 1)
+
+        # A source that is not under one of the geodatabases is matched
+        # by its geodatabase name, or ranked last.
+        self.assertEqual(BatchExport.GetSourceRank(GeoDBPaths, 'D:/Copies/Crew1.gdb/Depth_Joined'), 0)
+        self.assertEqual(BatchExport.GetSourceRank(GeoDBPaths, 'D:/Copies/Crew3.gdb/Depth_Joined'), 2)
+
+    def test_NoGeoDBToMerge(self):
+        MergedGeoDB = os.path.join(self.Folder, BatchExport.MERGED_GEO_DB_NAME)
+        Marker = os.path.join(MergedGeoDB, 'Earlier run')
+
+        open(Marker, 'w').close()
+
+        with self.assertRaises(Exception) as Context:
+            BatchExport.ExportBatch(self.Folder, Transforms = GetFailingTransforms, Workers = 1)
+
+        self.assertIn('no geodatabase to merge', str(Context.exception))
+
+        # The merged geodatabase of the earlier run is kept.
+        self.assertTrue(os.path.exists(Marker))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# TestBenchmark.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the 'arcpy' stand-in of the benchmarks (see
+# 'Benchmark/arcpy.py'), the synthetic feature classes it reads (see
+# 'Benchmark/SyntheticGeoDB.py'), and a short run of the benchmarks
+# and their comparison with a baseline (see
+# 'Benchmark/RunBenchmark.py'), so that the other tests, which run the
+# exporters on the stand-in, read the rows they expect.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestBenchmark
+
+import contextlib
+import datetime
+import io
+import os
+import sys
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import arcpy
+import RunBenchmark
+import SyntheticGeoDB
+
+class TestStandIn(unittest.TestCase):
+
+    def setUp(self):
+        SyntheticGeoDB.CreateSyntheticGeoDB(100)
+
+    def ReadRows(self, FieldNames, WhereClause = None):
+        with arcpy.da.SearchCursor('Depth_Joined', FieldNames, where_clause = WhereClause) as Cursor:
+            return list(Cursor)
+
+    def test_Deterministic(self):
+        Rows = self.ReadRows(['LakeNum', 'CreationDateTimeLocal', 'Depth_in_meters'])
+
+        SyntheticGeoDB.CreateSyntheticGeoDB(100)
+
+        self.assertEqual(self.ReadRows(['LakeNum', 'CreationDateTimeLocal', 'Depth_in_meters']), Rows)
+        self.assertEqual(len(Rows), 100)
+        self.assertEqual(arcpy.management.GetCount('Depth_Joined'), ['100'])
+
+    def test_FieldProjection(self):
+        # The cursor returns the fields in the order they are asked for,
+        # and a feature class may be given by its path.
+        self.assertEqual(self.ReadRows(['LakeNum', 'OBJECTID'])[1], ('LAKE001', 2))
+        self.assertEqual(self.ReadRows(['OBJECTID'])[1], (2,))
+        self.assertTrue(arcpy.Exists('C:/Data/Synthetic.gdb/Depth_Joined'))
+        self.assertEqual([Field.name for Field in arcpy.ListFields('Depth_Joined')][:2], ['OBJECTID', 'Shape'])
+
+    def test_WhereClause(self):
+        # Every 50th row has no creation datetime.
+        self.assertEqual(len(self.ReadRows(['OBJECTID'], "CreationDateTimeLocal IS NULL")), 2)
+
+        Rows = self.ReadRows(['LakeNum', 'CreationDateTimeLocal'], "LakeNum = 'LAKE005' AND CreationDateTimeLocal IS NOT NULL")
+
+        self.assertEqual([Row[0] for Row in Rows], ['LAKE005'])
+
+        Rows = self.ReadRows(['CreationDateTimeLocal'], "CreationDateTimeLocal >= timestamp '2024-06-01 08:05:00'")
+
+        self.assertTrue(all(Row[0] >= datetime.datetime(2024, 6, 1, 8, 5) for Row in Rows))
+
+    def test_UnsupportedWhereClause(self):
+        # A clause that is not understood is never taken as no clause.
+        with self.assertRaises(Exception):
+            self.ReadRows(['OBJECTID'], "LakeNum LIKE 'LAKE%'")
+
+class TestRunBenchmark(unittest.TestCase):
+
+    def test_RunBenchmarks(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            Results = RunBenchmark.RunBenchmarks([100], ['ExportSecchiJoined', 'ExportDepthJoined'])
+
+        self.assertEqual([(Result['Benchmark'], Result['Rows']) for Result in Results],
+                         [('ExportSecchiJoined', 100), ('ExportDepthJoined', 100)])
+
+        for Result in Results:
+            self.assertGreater(Result['OutputBytes'], 0)
+            self.assertGreater(Result['PeakMemoryBytes'], 0)
+
+    def test_CompareResults(self):
+        Baseline = [{'Benchmark': 'ExportDepthJoined', 'Rows': 1000, 'RowsPerSecond': 1000.0, 'PeakMemoryBytes': 1000}]
+
+        Slower = [{'Benchmark': 'ExportDepthJoined', 'Rows': 1000, 'RowsPerSecond': 700.0, 'PeakMemoryBytes': 1000}]
+        Larger = [{'Benchmark': 'ExportDepthJoined', 'Rows': 1000, 'RowsPerSecond': 1000.0, 'PeakMemoryBytes': 1300}]
+        Within = [{'Benchmark': 'ExportDepthJoined', 'Rows': 1000, 'RowsPerSecond': 800.0, 'PeakMemoryBytes': 1200}]
+        Other = [{'Benchmark': 'ExportDepthJoined', 'Rows': 10000, 'RowsPerSecond': 1.0, 'PeakMemoryBytes': 10 ** 9}]
+
+        self.assertEqual(len(RunBenchmark.CompareResults(Slower, Baseline, 0.25)), 1)
+        self.assertEqual(len(RunBenchmark.CompareResults(Larger, Baseline, 0.25)), 1)
+        self.assertEqual(RunBenchmark.CompareResults(Within, Baseline, 0.25), [])
+        self.assertEqual(RunBenchmark.CompareResults(Other, Baseline, 0.25), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# TestColumnarExport.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests that the columnar Depth_Joined records (see
+# 'ColumnarExport') are the same as the row at a time records of
+# 'TrimbleGeoDBToDatabase', with the 'arcpy' stand-in of the
+# benchmarks (see 'Benchmark/arcpy.py') instead of ArcGIS. It needs
+# NumPy; the tests are skipped without it.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestColumnarExport
+
+import datetime
+import os
+import sys
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import arcpy
+import TrimbleGeoDBToDatabase
+
+try:
+    import numpy
+    import ColumnarExport
+except ImportError:
+    numpy = None
+
+DEPTH_FIELDS = [('OBJECTID', 'OID'), ('CreationDateTimeLocal', 'Date'), ('LakeNum', 'String'),
+                ('YCurrentMapCS', 'Double'), ('XCurrentMapCS', 'Double'), ('Depth_in_meters', 'Double'),
+                ('Comment', 'String'), ('GNSS_Heigh', 'Double'), ('Vert_Prec', 'Double'), ('Horz_Prec', 'Double'),
+                ('Datafile', 'String')]
+
+# Depths and coordinates that are halves when scaled (which
+# 'numpy.round' rounds to even), and null numbers.
+DEPTHS = [0.65, 1.05, 2.25, 0.15, 0.35, None, 3.0, 1.25]
+LATITUDES = [64.1234565, 65.0000005, 64.5, 64.98765432]
+HEIGHTS = [120.5, None, 99.95]
+
+def GetDepthRow(i):
+    CreationDateTime = (None if i % 10 == 9 else datetime.datetime(2024, 6, 1, 8, 0, 0) + datetime.timedelta(days=i // 3, seconds=i * 7))
+
+    return (i + 1,
+            CreationDateTime,
+            'LAKE' + str(i % 4).zfill(3),
+            LATITUDES[i % len(LATITUDES)],
+            -150.0000015 - (i % 5) * 0.25,
+            DEPTHS[i % len(DEPTHS)],
+            ('  ' if i % 3 == 0 else ' depth ' + str(i) + ' '),
+            HEIGHTS[i % len(HEIGHTS)],
+            (None if i % 6 == 0 else 0.5 + (i % 5) * 0.25),
+            0.25,
+            'R' + str(i // 3).zfill(5) + '.ssf')
+
+@unittest.skipIf(numpy is None, "NumPy is not installed.")
+class TestColumnarExport(unittest.TestCase):
+
+    def setUp(self):
+        arcpy.RegisterFeatureClass('Depth_Joined', DEPTH_FIELDS, 60, GetDepthRow)
+
+    def test_RecordsAreTheSameAsTheRowRecords(self):
+        RowRecords = list(TrimbleGeoDBToDatabase.IterDepthJoinedRecords('Depth_Joined', 'Test.gdb'))
+        ColumnarRecords = list(ColumnarExport.IterDepthJoinedRecords('Depth_Joined', 'Test.gdb'))
+
+        self.assertEqual(len(RowRecords), 54)
+        self.assertEqual(ColumnarRecords, RowRecords)
+
+    def test_RecordsAreTheSameWithWhereClause(self):
+        WhereClause = "LakeNum = 'LAKE001'"
+
+        RowRecords = list(TrimbleGeoDBToDatabase.IterDepthJoinedRecords('Depth_Joined', 'Test.gdb', WhereClause = WhereClause))
+        ColumnarRecords = list(ColumnarExport.IterDepthJoinedRecords('Depth_Joined', 'Test.gdb', WhereClause = WhereClause))
+
+        self.assertEqual(ColumnarRecords, RowRecords)
+
+    def test_FormatNumbersRoundsAsRound(self):
+        Values = [0.65, 1.05, 2.675, -0.65, 0.25, 64.1234565, 1e-07]
+        Column = numpy.array(Values)
+
+        self.assertEqual(ColumnarExport.FormatNumbers(Column, 1).tolist(), [str(round(Value, 1)) for Value in Values])
+        self.assertEqual(ColumnarExport.FormatNumbers(Column, 2).tolist(), [str(round(Value, 2)) for Value in Values])
+        self.assertEqual(ColumnarExport.FormatNumbers(Column, 6).tolist(), [str(round(Value, 6)) for Value in Values])
+        self.assertEqual(ColumnarExport.FormatNumbers(Column).tolist(), [str(Value) for Value in Values])
+
+    def test_FormatNumbersWritesNullsAsNull(self):
+        Column = numpy.array([1.5, ColumnarExport.NULL_NUMBER, 0.65])
+
+        self.assertEqual(ColumnarExport.FormatNumbers(Column, 1).tolist(), ['1.5', 'NULL', '0.7'])
+        self.assertEqual(ColumnarExport.FormatNumbers(Column).tolist(), ['1.5', 'NULL', '0.65'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer Deployment_Joined data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+
+Source geodatabase: X
+FeatureClass: Deployment_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+BEGIN TRY
+    BEGIN TRANSACTION
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE199', '2024-05-31', '08:00:00', NULL, 65.98265432000001, -148.13345678899998, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE001', '2024-06-01', '08:00:07', 'Sonde', 64.99266432, -150.113446789, 'deployment 1')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE002', '2024-06-01', '08:00:14', 'Sonde', 64.99767432000002, -150.10343678899997, ' deployment 2 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE003', '2024-06-01', '08:00:21', NULL, 65.00268432, -150.09342678899998, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE004', '2024-06-01', '08:00:28', 'Sonde', 65.00769432, -150.08341678899998, ' deployment 4 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE005', '2024-06-01', '08:00:35', 'Sonde', 65.01270432000001, -150.073406789, 'deployment 5')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE006', '2024-06-01', '08:00:42', NULL, 65.01771432000001, -150.063396789, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE007', '2024-06-01', '08:00:49', 'Sonde', 65.02272432, -150.053386789, 'deployment 7')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE008', '2024-06-01', '08:00:56', 'Sonde', 65.02773432000001, -150.04337678899998, ' deployment 8 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE009', '2024-06-01', '08:01:03', NULL, 65.03274432, -150.03336678899998, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE010', '2024-06-01', '08:01:10', 'Sonde', 65.03775432, -150.023356789, ' deployment 10 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE011', '2024-06-01', '08:01:17', 'Sonde', 65.04265432000001, -150.01334678899997, 'deployment 11')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE012', '2024-06-01', '08:01:24', NULL, 65.04766432000001, -150.00333678899997, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE013', '2024-06-01', '08:01:31', 'Sonde', 65.05267432000001, -149.993456789, 'deployment 13')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE014', '2024-06-01', '08:01:38', 'Sonde', 65.05768431999999, -149.983446789, ' deployment 14 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE015', '2024-06-01', '08:01:45', NULL, 65.06269432, -149.97343678899998, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE016', '2024-06-01', '08:01:52', 'Sonde', 65.06770432, -149.96342678899998, ' deployment 16 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE017', '2024-06-01', '08:01:59', 'Sonde', 65.07271432, -149.953416789, 'deployment 17')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE018', '2024-06-01', '08:02:06', NULL, 65.07772432, -149.943406789, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE019', '2024-06-01', '08:02:13', 'Sonde', 65.08273432, -149.933396789, 'deployment 19')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE020', '2024-06-01', '08:02:20', 'Sonde', 65.08774432, -149.923386789, ' deployment 20 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE021', '2024-06-01', '08:02:27', NULL, 65.09275432000001, -149.91337678899998, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE022', '2024-06-01', '08:02:34', 'Sonde', 65.09765432, -149.903366789, ' deployment 22 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE023', '2024-06-01', '08:02:41', 'Sonde', 65.10266432, -149.893356789, 'deployment 23')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE024', '2024-06-01', '08:02:48', NULL, 65.10767432000002, -149.88334678899997, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE025', '2024-06-01', '08:02:55', 'Sonde', 65.11268432, -149.87333678899998, 'deployment 25')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE026', '2024-06-01', '08:03:02', 'Sonde', 65.11769432, -149.863456789, ' deployment 26 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE027', '2024-06-01', '08:03:09', NULL, 65.12270432000001, -149.85344678899997, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE028', '2024-06-01', '08:03:16', 'Sonde', 65.12771432000001, -149.84343678899998, ' deployment 28 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE029', '2024-06-01', '08:03:23', 'Sonde', 65.13272432, -149.833426789, 'deployment 29')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE030', '2024-06-01', '08:03:30', NULL, 65.13773432, -149.82341678899996, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE031', '2024-06-01', '08:03:37', 'Sonde', 65.14274432, -149.813406789, 'deployment 31')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE032', '2024-06-01', '08:03:44', 'Sonde', 65.14775432, -149.803396789, ' deployment 32 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE033', '2024-06-01', '08:03:51', NULL, 65.15265432000001, -149.79338678899998, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE034', '2024-06-01', '08:03:58', 'Sonde', 65.15766432000001, -149.783376789, ' deployment 34 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE035', '2024-06-01', '08:04:05', 'Sonde', 65.16267432000001, -149.773366789, 'deployment 35')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE036', '2024-06-01', '08:04:12', NULL, 65.16768432, -149.76335678899997, NULL)
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE037', '2024-06-01', '08:04:19', 'Sonde', 65.17269432, -149.75334678899998, 'deployment 37')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE038', '2024-06-01', '08:04:26', 'Sonde', 65.17770432, -149.74333678899998, ' deployment 38 ')
+
+INSERT INTO dbo.tblContinuousDataDeployments
+([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])
+VALUES ('LAKE039', '2024-06-01', '08:04:33', NULL, 65.18271432, -149.733456789, NULL)
+
+
+     COMMIT TRANSACTION
+     PRINT N'Successfully inserted ALL records and committed them.'
+END TRY
+BEGIN CATCH -- ROLLBACK
+    IF @@TRANCOUNT > 0
+    BEGIN
+        DECLARE @error_msg NVARCHAR(MAX)
+        SELECT @error_msg = ERROR_MESSAGE()
+        PRINT N'Error: ' + @error_msg + char(13) + char(10) + char(13) + char(10)
+        ROLLBACK TRANSACTION
+        PRINT N'Rolling back transaction; NO records have been inserted.'
+    END
+END CATCH
+
@@ -0,0 +1,271 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer Deployment_Joined data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+
+Source geodatabase: X
+FeatureClass: Deployment_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+BEGIN TRY
+    BEGIN TRANSACTION
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.982654,
+    [DeployLongitude] = -148.133457
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE199' AND DateDeployed = '2024-05-31'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 64.992664,
+    [DeployLongitude] = -150.113447
+--  [DeploymentNotes] = 'deployment 1'
+WHERE SiteName = 'LAKE001' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 64.997674,
+    [DeployLongitude] = -150.103437
+--  [DeploymentNotes] = ' deployment 2 '
+WHERE SiteName = 'LAKE002' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.002684,
+    [DeployLongitude] = -150.093427
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE003' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.007694,
+    [DeployLongitude] = -150.083417
+--  [DeploymentNotes] = ' deployment 4 '
+WHERE SiteName = 'LAKE004' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.012704,
+    [DeployLongitude] = -150.073407
+--  [DeploymentNotes] = 'deployment 5'
+WHERE SiteName = 'LAKE005' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.017714,
+    [DeployLongitude] = -150.063397
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE006' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.022724,
+    [DeployLongitude] = -150.053387
+--  [DeploymentNotes] = 'deployment 7'
+WHERE SiteName = 'LAKE007' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.027734,
+    [DeployLongitude] = -150.043377
+--  [DeploymentNotes] = ' deployment 8 '
+WHERE SiteName = 'LAKE008' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.032744,
+    [DeployLongitude] = -150.033367
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE009' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.037754,
+    [DeployLongitude] = -150.023357
+--  [DeploymentNotes] = ' deployment 10 '
+WHERE SiteName = 'LAKE010' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.042654,
+    [DeployLongitude] = -150.013347
+--  [DeploymentNotes] = 'deployment 11'
+WHERE SiteName = 'LAKE011' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.047664,
+    [DeployLongitude] = -150.003337
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE012' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.052674,
+    [DeployLongitude] = -149.993457
+--  [DeploymentNotes] = 'deployment 13'
+WHERE SiteName = 'LAKE013' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.057684,
+    [DeployLongitude] = -149.983447
+--  [DeploymentNotes] = ' deployment 14 '
+WHERE SiteName = 'LAKE014' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.062694,
+    [DeployLongitude] = -149.973437
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE015' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.067704,
+    [DeployLongitude] = -149.963427
+--  [DeploymentNotes] = ' deployment 16 '
+WHERE SiteName = 'LAKE016' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.072714,
+    [DeployLongitude] = -149.953417
+--  [DeploymentNotes] = 'deployment 17'
+WHERE SiteName = 'LAKE017' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.077724,
+    [DeployLongitude] = -149.943407
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE018' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.082734,
+    [DeployLongitude] = -149.933397
+--  [DeploymentNotes] = 'deployment 19'
+WHERE SiteName = 'LAKE019' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.087744,
+    [DeployLongitude] = -149.923387
+--  [DeploymentNotes] = ' deployment 20 '
+WHERE SiteName = 'LAKE020' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.092754,
+    [DeployLongitude] = -149.913377
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE021' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.097654,
+    [DeployLongitude] = -149.903367
+--  [DeploymentNotes] = ' deployment 22 '
+WHERE SiteName = 'LAKE022' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.102664,
+    [DeployLongitude] = -149.893357
+--  [DeploymentNotes] = 'deployment 23'
+WHERE SiteName = 'LAKE023' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.107674,
+    [DeployLongitude] = -149.883347
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE024' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.112684,
+    [DeployLongitude] = -149.873337
+--  [DeploymentNotes] = 'deployment 25'
+WHERE SiteName = 'LAKE025' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.117694,
+    [DeployLongitude] = -149.863457
+--  [DeploymentNotes] = ' deployment 26 '
+WHERE SiteName = 'LAKE026' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.122704,
+    [DeployLongitude] = -149.853447
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE027' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.127714,
+    [DeployLongitude] = -149.843437
+--  [DeploymentNotes] = ' deployment 28 '
+WHERE SiteName = 'LAKE028' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.132724,
+    [DeployLongitude] = -149.833427
+--  [DeploymentNotes] = 'deployment 29'
+WHERE SiteName = 'LAKE029' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.137734,
+    [DeployLongitude] = -149.823417
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE030' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.142744,
+    [DeployLongitude] = -149.813407
+--  [DeploymentNotes] = 'deployment 31'
+WHERE SiteName = 'LAKE031' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.147754,
+    [DeployLongitude] = -149.803397
+--  [DeploymentNotes] = ' deployment 32 '
+WHERE SiteName = 'LAKE032' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.152654,
+    [DeployLongitude] = -149.793387
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE033' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.157664,
+    [DeployLongitude] = -149.783377
+--  [DeploymentNotes] = ' deployment 34 '
+WHERE SiteName = 'LAKE034' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.162674,
+    [DeployLongitude] = -149.773367
+--  [DeploymentNotes] = 'deployment 35'
+WHERE SiteName = 'LAKE035' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.167684,
+    [DeployLongitude] = -149.763357
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE036' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.172694,
+    [DeployLongitude] = -149.753347
+--  [DeploymentNotes] = 'deployment 37'
+WHERE SiteName = 'LAKE037' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.177704,
+    [DeployLongitude] = -149.743337
+--  [DeploymentNotes] = ' deployment 38 '
+WHERE SiteName = 'LAKE038' AND DateDeployed = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [DeployLatitude] = 65.182714,
+    [DeployLongitude] = -149.733457
+--  [DeploymentNotes] = NULL
+WHERE SiteName = 'LAKE039' AND DateDeployed = '2024-06-01'
+
+
+     COMMIT TRANSACTION
+     PRINT N'Successfully inserted ALL records and committed them.'
+END TRY
+BEGIN CATCH -- ROLLBACK
+    IF @@TRANCOUNT > 0
+    BEGIN
+        DECLARE @error_msg NVARCHAR(MAX)
+        SELECT @error_msg = ERROR_MESSAGE()
+        PRINT N'Error: ' + @error_msg + char(13) + char(10) + char(13) + char(10)
+        ROLLBACK TRANSACTION
+        PRINT N'Rolling back transaction; NO records have been inserted.'
+    END
+END CATCH
+
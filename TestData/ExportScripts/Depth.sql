@@ -0,0 +1,145 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer lake depth data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+Source geodatabase: X
+FeatureClass: Depth_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+BEGIN TRANSACTION -- COMMIT ROLLBACK
+
+-- Determine if all the necessary parent Event records exist before trying to insert
+IF
+ EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE199' And SampleDate = '2024-05-31') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE001' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE002' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE003' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE004' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE005' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE006' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE007' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE008' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE009' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE010' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE011' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE012' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE013' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE014' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE015' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE016' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE017' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE018' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE019' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE020' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE021' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE022' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE023' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE024' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE025' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE026' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE027' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE028' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE029' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE030' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE031' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE032' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE033' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE034' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE035' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE036' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE037' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE038' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE039' And SampleDate = '2024-06-01') 
+
+    BEGIN
+    -- Insert the records
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE199','2024-05-31','08:00:00',65.982654,-148.133457,0.5,NULL,'R-0001.ssf',120.0,0.5,0.25,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE001','2024-06-01','08:00:07',64.992664,-150.113447,0.6,'depth 1','R00000.ssf',120.1,0.75,0.375,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE002','2024-06-01','08:00:14',64.997674,-150.103437,0.6,'depth 2','R00000.ssf',120.2,1.0,0.5,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE003','2024-06-01','08:00:21',65.002684,-150.093427,0.7,NULL,'R00000.ssf',120.3,1.25,0.625,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE004','2024-06-01','08:00:28',65.007694,-150.083417,0.7,'depth 4','R00000.ssf',120.4,1.5,0.75,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE005','2024-06-01','08:00:35',65.012704,-150.073407,0.8,'depth 5','R00000.ssf',120.5,0.5,0.875,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE006','2024-06-01','08:00:42',65.017714,-150.063397,0.8,NULL,'R00000.ssf',120.6,0.75,1.0,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE007','2024-06-01','08:00:49',65.022724,-150.053387,0.9,'depth 7','R00000.ssf',120.7,1.0,0.25,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE008','2024-06-01','08:00:56',65.027734,-150.043377,0.9,'depth 8','R00000.ssf',120.8,1.25,0.375,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE009','2024-06-01','08:01:03',65.032744,-150.033367,0.9,NULL,'R00000.ssf',120.9,1.5,0.5,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE010','2024-06-01','08:01:10',65.037754,-150.023357,1.0,'depth 10','R00000.ssf',121.0,0.5,0.625,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE011','2024-06-01','08:01:17',65.042654,-150.013347,1.1,'depth 11','R00000.ssf',121.1,0.75,0.75,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE012','2024-06-01','08:01:24',65.047664,-150.003337,1.1,NULL,'R00000.ssf',121.2,1.0,0.875,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE013','2024-06-01','08:01:31',65.052674,-149.993457,1.1,'depth 13','R00000.ssf',121.3,1.25,1.0,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE014','2024-06-01','08:01:38',65.057684,-149.983447,1.2,'depth 14','R00000.ssf',121.4,1.5,0.25,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE015','2024-06-01','08:01:45',65.062694,-149.973437,1.2,NULL,'R00000.ssf',121.5,0.5,0.375,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE016','2024-06-01','08:01:52',65.067704,-149.963427,1.3,'depth 16','R00000.ssf',121.6,0.75,0.5,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE017','2024-06-01','08:01:59',65.072714,-149.953417,1.4,'depth 17','R00000.ssf',121.7,1.0,0.625,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE018','2024-06-01','08:02:06',65.077724,-149.943407,1.4,NULL,'R00000.ssf',121.8,1.25,0.75,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE019','2024-06-01','08:02:13',65.082734,-149.933397,1.5,'depth 19','R00000.ssf',121.9,1.5,0.875,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE020','2024-06-01','08:02:20',65.087744,-149.923387,1.5,'depth 20','R00000.ssf',122.0,0.5,1.0,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE021','2024-06-01','08:02:27',65.092754,-149.913377,1.6,NULL,'R00000.ssf',122.1,0.75,0.25,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE022','2024-06-01','08:02:34',65.097654,-149.903367,1.6,'depth 22','R00000.ssf',122.2,1.0,0.375,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE023','2024-06-01','08:02:41',65.102664,-149.893357,1.7,'depth 23','R00000.ssf',122.3,1.25,0.5,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE024','2024-06-01','08:02:48',65.107674,-149.883347,1.7,NULL,'R00000.ssf',122.4,1.5,0.625,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE025','2024-06-01','08:02:55',65.112684,-149.873337,1.8,'depth 25','R00000.ssf',122.5,0.5,0.75,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE026','2024-06-01','08:03:02',65.117694,-149.863457,1.8,'depth 26','R00000.ssf',122.6,0.75,0.875,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE027','2024-06-01','08:03:09',65.122704,-149.853447,1.9,NULL,'R00000.ssf',122.7,1.0,1.0,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE028','2024-06-01','08:03:16',65.127714,-149.843437,1.9,'depth 28','R00000.ssf',122.8,1.25,0.25,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE029','2024-06-01','08:03:23',65.132724,-149.833427,2.0,'depth 29','R00000.ssf',122.9,1.5,0.375,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE030','2024-06-01','08:03:30',65.137734,-149.823417,2.0,NULL,'R00000.ssf',123.0,0.5,0.5,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE031','2024-06-01','08:03:37',65.142744,-149.813407,2.0,'depth 31','R00000.ssf',123.1,0.75,0.625,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE032','2024-06-01','08:03:44',65.147754,-149.803397,2.1,'depth 32','R00000.ssf',123.2,1.0,0.75,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE033','2024-06-01','08:03:51',65.152654,-149.793387,2.2,NULL,'R00000.ssf',123.3,1.25,0.875,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE034','2024-06-01','08:03:58',65.157664,-149.783377,2.2,'depth 34','R00000.ssf',123.4,1.5,1.0,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE035','2024-06-01','08:04:05',65.162674,-149.773367,2.2,'depth 35','R00000.ssf',123.5,0.5,0.25,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE036','2024-06-01','08:04:12',65.167684,-149.763357,2.3,NULL,'R00000.ssf',123.6,0.75,0.375,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE037','2024-06-01','08:04:19',65.172694,-149.753347,2.4,'depth 37','R00000.ssf',123.7,1.0,0.5,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE038','2024-06-01','08:04:26',65.177704,-149.743337,2.4,'depth 38','R00000.ssf',123.8,1.25,0.625,'Synthetic.gdb');
+      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('LAKE039','2024-06-01','08:04:33',65.182714,-149.733457,2.5,NULL,'R00000.ssf',123.9,1.5,0.75,'Synthetic.gdb');
+   END
+ELSE
+   Print 'One or more parent Event records related to the record you are trying to insert does not exist.'
+
+-- Execute the query below to validate the inserted records.
+-- SELECT PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE FROM tblPondDepths WHERE
+   -- (PondName='LAKE199' and  SampleDate = '2024-05-31') Or
+   -- (PondName='LAKE001' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE002' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE003' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE004' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE005' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE006' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE007' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE008' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE009' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE010' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE011' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE012' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE013' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE014' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE015' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE016' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE017' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE018' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE019' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE020' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE021' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE022' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE023' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE024' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE025' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE026' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE027' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE028' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE029' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE030' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE031' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE032' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE033' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE034' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE035' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE036' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE037' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE038' and  SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE039' and  SampleDate = '2024-06-01') 
\ No newline at end of file
@@ -0,0 +1,196 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer loon data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+Source geodatabase: X
+FeatureClass: Loons_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+USE AK_ShallowLakes
+
+-- Execute the query below to view/validate records that may be altered.
+-- SELECT * FROM tblLoons WHERE
+   -- (PondName='LAKE199' and SampleDate = '2024-05-31') Or
+   -- (PondName='LAKE001' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE002' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE003' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE004' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE005' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE006' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE007' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE008' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE009' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE010' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE011' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE012' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE013' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE014' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE015' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE016' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE017' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE018' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE019' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE020' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE021' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE022' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE023' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE024' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE025' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE026' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE027' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE028' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE029' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE030' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE031' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE032' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE033' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE034' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE035' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE036' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE037' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE038' and SampleDate = '2024-06-01') Or
+   -- (PondName='LAKE039' and SampleDate = '2024-06-01') 
+
+-- Determine if all the necessary parent Event records exist before trying to insert
+IF
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE199' And SampleDate = '2024-05-31') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE001' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE002' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE003' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE004' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE005' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE006' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE007' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE008' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE009' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE010' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE011' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE012' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE013' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE014' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE015' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE016' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE017' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE018' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE019' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE020' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE021' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE022' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE023' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE024' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE025' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE026' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE027' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE028' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE029' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE030' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE031' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE032' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE033' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE034' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE035' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE036' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE037' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE038' And SampleDate = '2024-06-01') And 
+    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE039' And SampleDate = '2024-06-01')
+    BEGIN
+        PRINT 'The required parent Event records exist in tblEvents.'
+            IF  NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE199' And SampleDate = '2024-05-31') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE001' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE002' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE003' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE004' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE005' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE006' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE007' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE008' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE009' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE010' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE011' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE012' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE013' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE014' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE015' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE016' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE017' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE018' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE019' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE020' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE021' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE022' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE023' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE024' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE025' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE026' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE027' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE028' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE029' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE030' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE031' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE032' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE033' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE034' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE035' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE036' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE037' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE038' And SampleDate = '2024-06-01') And 
+ NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='LAKE039' And SampleDate = '2024-06-01')
+
+            BEGIN
+           -- Danger zone below. ROLLBACK on error.
+           -- Insert the records
+                PRINT 'inserts'
+                BEGIN TRANSACTION -- COMMIT ROLLBACK
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE199','2024-05-31','COLO',1,0,'Aural','WATER',65.982654,-148.133457,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE001','2024-06-01','PALO',2,1,'Visual','WATER',64.992664,-150.113447,'loon 1','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE002','2024-06-01','PALO',1,2,'Aural','WATER',64.997674,-150.103437,'loon 2','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE003','2024-06-01','COLO',2,0,'Visual','WATER',65.002684,-150.093427,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE004','2024-06-01','PALO',1,1,'Aural','WATER',65.007694,-150.083417,'loon 4','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE005','2024-06-01','PALO',2,2,'Visual','WATER',65.012704,-150.073407,'loon 5','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE006','2024-06-01','COLO',1,0,'Aural','WATER',65.017714,-150.063397,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE007','2024-06-01','PALO',2,1,'Visual','WATER',65.022724,-150.053387,'loon 7','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE008','2024-06-01','PALO',1,2,'Aural','WATER',65.027734,-150.043377,'loon 8','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE009','2024-06-01','COLO',2,0,'Visual','WATER',65.032744,-150.033367,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE010','2024-06-01','PALO',1,1,'Aural','WATER',65.037754,-150.023357,'loon 10','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE011','2024-06-01','PALO',2,2,'Visual','WATER',65.042654,-150.013347,'loon 11','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE012','2024-06-01','COLO',1,0,'Aural','WATER',65.047664,-150.003337,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE013','2024-06-01','PALO',2,1,'Visual','WATER',65.052674,-149.993457,'loon 13','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE014','2024-06-01','PALO',1,2,'Aural','WATER',65.057684,-149.983447,'loon 14','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE015','2024-06-01','COLO',2,0,'Visual','WATER',65.062694,-149.973437,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE016','2024-06-01','PALO',1,1,'Aural','WATER',65.067704,-149.963427,'loon 16','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE017','2024-06-01','PALO',2,2,'Visual','WATER',65.072714,-149.953417,'loon 17','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE018','2024-06-01','COLO',1,0,'Aural','WATER',65.077724,-149.943407,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE019','2024-06-01','PALO',2,1,'Visual','WATER',65.082734,-149.933397,'loon 19','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE020','2024-06-01','PALO',1,2,'Aural','WATER',65.087744,-149.923387,'loon 20','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE021','2024-06-01','COLO',2,0,'Visual','WATER',65.092754,-149.913377,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE022','2024-06-01','PALO',1,1,'Aural','WATER',65.097654,-149.903367,'loon 22','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE023','2024-06-01','PALO',2,2,'Visual','WATER',65.102664,-149.893357,'loon 23','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE024','2024-06-01','COLO',1,0,'Aural','WATER',65.107674,-149.883347,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE025','2024-06-01','PALO',2,1,'Visual','WATER',65.112684,-149.873337,'loon 25','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE026','2024-06-01','PALO',1,2,'Aural','WATER',65.117694,-149.863457,'loon 26','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE027','2024-06-01','COLO',2,0,'Visual','WATER',65.122704,-149.853447,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE028','2024-06-01','PALO',1,1,'Aural','WATER',65.127714,-149.843437,'loon 28','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE029','2024-06-01','PALO',2,2,'Visual','WATER',65.132724,-149.833427,'loon 29','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE030','2024-06-01','COLO',1,0,'Aural','WATER',65.137734,-149.823417,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE031','2024-06-01','PALO',2,1,'Visual','WATER',65.142744,-149.813407,'loon 31','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE032','2024-06-01','PALO',1,2,'Aural','WATER',65.147754,-149.803397,'loon 32','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE033','2024-06-01','COLO',2,0,'Visual','WATER',65.152654,-149.793387,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE034','2024-06-01','PALO',1,1,'Aural','WATER',65.157664,-149.783377,'loon 34','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE035','2024-06-01','PALO',2,2,'Visual','WATER',65.162674,-149.773367,'loon 35','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE036','2024-06-01','COLO',1,0,'Aural','WATER',65.167684,-149.763357,NULL,'Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE037','2024-06-01','PALO',2,1,'Visual','WATER',65.172694,-149.753347,'loon 37','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE038','2024-06-01','PALO',1,2,'Aural','WATER',65.177704,-149.743337,'loon 38','Synthetic.gdb');
+                INSERT INTO tblLoons(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES('LAKE039','2024-06-01','COLO',2,0,'Visual','WATER',65.182714,-149.733457,NULL,'Synthetic.gdb');
+               PRINT '40 records inserted from Loons_Joined into database table tblLoons.'
+               PRINT 'DO NOT FORGET TO COMMIT OR ROLLBACK OR THE DATABASE WILL BE LEFT IN A HANGING STATE!!!!'
+            END
+        ELSE
+            PRINT 'One or more records exist already. Uncomment and use the validation query above to help determine which Loons_Joined\tblLoons records exist already.'
+    END
+ELSE
+    PRINT 'One or more parent Event records (tblEvents) related to the record you are trying to insert does not exist.'
+
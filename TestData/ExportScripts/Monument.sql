@@ -0,0 +1,71 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer monument data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+
+Source geodatabase: X
+FeatureClass: Monument_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+BEGIN TRY
+    BEGIN TRANSACTION
+
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE199','2024-05-31',65.982654,-148.133457,100.5,'Stake','Stake',NULL,'monument 1','Wheel','Geo 7X','08:00:00','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE001','2024-06-01',64.992664,-150.113447,100.6,'Rebar','Rebar','shore 1',' monument 2 ','Float','Geo 7X','08:00:07','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE002','2024-06-01',64.997674,-150.103437,100.7,'Stake','Stake',' shore 2 ',NULL,'Float','Geo 7X','08:00:14','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE003','2024-06-01',65.002684,-150.093427,100.8,'Rebar','Rebar',NULL,' monument 4 ','Wheel','Geo 7X','08:00:21','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE004','2024-06-01',65.007694,-150.083417,100.9,'Stake','Stake',' shore 4 ','monument 5','Float','Geo 7X','08:00:28','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE005','2024-06-01',65.012704,-150.073407,101.0,'Rebar','Rebar','shore 5',NULL,'Float','Geo 7X','08:00:35','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE006','2024-06-01',65.017714,-150.063397,101.1,'Stake','Stake',NULL,'monument 7','Wheel','Geo 7X','08:00:42','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE007','2024-06-01',65.022724,-150.053387,101.2,'Rebar','Rebar','shore 7',' monument 8 ','Float','Geo 7X','08:00:49','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE008','2024-06-01',65.027734,-150.043377,101.3,'Stake','Stake',' shore 8 ',NULL,'Float','Geo 7X','08:00:56','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE009','2024-06-01',65.032744,-150.033367,101.4,'Rebar','Rebar',NULL,' monument 10 ','Wheel','Geo 7X','08:01:03','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE010','2024-06-01',65.037754,-150.023357,101.5,'Stake','Stake',' shore 10 ','monument 11','Float','Geo 7X','08:01:10','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE011','2024-06-01',65.042654,-150.013347,101.6,'Rebar','Rebar','shore 11',NULL,'Float','Geo 7X','08:01:17','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE012','2024-06-01',65.047664,-150.003337,101.7,'Stake','Stake',NULL,'monument 13','Wheel','Geo 7X','08:01:24','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE013','2024-06-01',65.052674,-149.993457,101.8,'Rebar','Rebar','shore 13',' monument 14 ','Float','Geo 7X','08:01:31','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE014','2024-06-01',65.057684,-149.983447,101.9,'Stake','Stake',' shore 14 ',NULL,'Float','Geo 7X','08:01:38','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE015','2024-06-01',65.062694,-149.973437,102.0,'Rebar','Rebar',NULL,' monument 16 ','Wheel','Geo 7X','08:01:45','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE016','2024-06-01',65.067704,-149.963427,102.1,'Stake','Stake',' shore 16 ','monument 17','Float','Geo 7X','08:01:52','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE017','2024-06-01',65.072714,-149.953417,102.2,'Rebar','Rebar','shore 17',NULL,'Float','Geo 7X','08:01:59','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE018','2024-06-01',65.077724,-149.943407,102.3,'Stake','Stake',NULL,'monument 19','Wheel','Geo 7X','08:02:06','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE019','2024-06-01',65.082734,-149.933397,102.4,'Rebar','Rebar','shore 19',' monument 20 ','Float','Geo 7X','08:02:13','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE020','2024-06-01',65.087744,-149.923387,102.5,'Stake','Stake',' shore 20 ',NULL,'Float','Geo 7X','08:02:20','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE021','2024-06-01',65.092754,-149.913377,102.6,'Rebar','Rebar',NULL,' monument 22 ','Wheel','Geo 7X','08:02:27','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE022','2024-06-01',65.097654,-149.903367,102.7,'Stake','Stake',' shore 22 ','monument 23','Float','Geo 7X','08:02:34','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE023','2024-06-01',65.102664,-149.893357,102.8,'Rebar','Rebar','shore 23',NULL,'Float','Geo 7X','08:02:41','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE024','2024-06-01',65.107674,-149.883347,102.9,'Stake','Stake',NULL,'monument 25','Wheel','Geo 7X','08:02:48','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE025','2024-06-01',65.112684,-149.873337,103.0,'Rebar','Rebar','shore 25',' monument 26 ','Float','Geo 7X','08:02:55','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE026','2024-06-01',65.117694,-149.863457,103.1,'Stake','Stake',' shore 26 ',NULL,'Float','Geo 7X','08:03:02','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE027','2024-06-01',65.122704,-149.853447,103.2,'Rebar','Rebar',NULL,' monument 28 ','Wheel','Geo 7X','08:03:09','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE028','2024-06-01',65.127714,-149.843437,103.3,'Stake','Stake',' shore 28 ','monument 29','Float','Geo 7X','08:03:16','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE029','2024-06-01',65.132724,-149.833427,103.4,'Rebar','Rebar','shore 29',NULL,'Float','Geo 7X','08:03:23','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE030','2024-06-01',65.137734,-149.823417,103.5,'Stake','Stake',NULL,'monument 31','Wheel','Geo 7X','08:03:30','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE031','2024-06-01',65.142744,-149.813407,103.6,'Rebar','Rebar','shore 31',' monument 32 ','Float','Geo 7X','08:03:37','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE032','2024-06-01',65.147754,-149.803397,103.7,'Stake','Stake',' shore 32 ',NULL,'Float','Geo 7X','08:03:44','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE033','2024-06-01',65.152654,-149.793387,103.8,'Rebar','Rebar',NULL,' monument 34 ','Wheel','Geo 7X','08:03:51','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE034','2024-06-01',65.157664,-149.783377,103.9,'Stake','Stake',' shore 34 ','monument 35','Float','Geo 7X','08:03:58','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE035','2024-06-01',65.162674,-149.773367,104.0,'Rebar','Rebar','shore 35',NULL,'Float','Geo 7X','08:04:05','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE036','2024-06-01',65.167684,-149.763357,104.1,'Stake','Stake',NULL,'monument 37','Wheel','Geo 7X','08:04:12','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE037','2024-06-01',65.172694,-149.753347,104.2,'Rebar','Rebar','shore 37',' monument 38 ','Float','Geo 7X','08:04:19','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE038','2024-06-01',65.177704,-149.743337,104.3,'Stake','Stake',' shore 38 ',NULL,'Float','Geo 7X','08:04:26','Postprocessed',0.3,0.4)
+        INSERT INTO tblMonuments ([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], [M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], [M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) VALUES ('LAKE039','2024-06-01',65.182714,-149.733457,104.4,'Rebar','Rebar',NULL,' monument 40 ','Wheel','Geo 7X','08:04:33','Postprocessed',0.3,0.4)
+
+     COMMIT TRANSACTION
+     PRINT N'Successfully inserted ALL records and committed them.'
+END TRY
+BEGIN CATCH -- ROLLBACK
+    IF @@TRANCOUNT > 0
+    BEGIN
+        DECLARE @error_msg NVARCHAR(MAX)
+        SELECT @error_msg = ERROR_MESSAGE()
+        PRINT N'Error: ' + @error_msg + char(13) + char(10) + char(13) + char(10)
+        ROLLBACK TRANSACTION
+        PRINT N'Rolling back transaction; NO records have been inserted.'
+    END
+END CATCH
+
@@ -0,0 +1,271 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer Retrieval_Joined data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+
+Source geodatabase: X
+FeatureClass: Retrieval_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+BEGIN TRY
+    BEGIN TRANSACTION
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.982654,
+    [RetrieveLongitude] = -148.133457
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE199' AND DateRetrieved = '2024-05-31'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 64.992664,
+    [RetrieveLongitude] = -150.113447
+--  [RetrievalNotes] = 'deployment 1'
+WHERE SiteName = 'LAKE001' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 64.997674,
+    [RetrieveLongitude] = -150.103437
+--  [RetrievalNotes] = ' deployment 2 '
+WHERE SiteName = 'LAKE002' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.002684,
+    [RetrieveLongitude] = -150.093427
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE003' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.007694,
+    [RetrieveLongitude] = -150.083417
+--  [RetrievalNotes] = ' deployment 4 '
+WHERE SiteName = 'LAKE004' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.012704,
+    [RetrieveLongitude] = -150.073407
+--  [RetrievalNotes] = 'deployment 5'
+WHERE SiteName = 'LAKE005' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.017714,
+    [RetrieveLongitude] = -150.063397
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE006' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.022724,
+    [RetrieveLongitude] = -150.053387
+--  [RetrievalNotes] = 'deployment 7'
+WHERE SiteName = 'LAKE007' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.027734,
+    [RetrieveLongitude] = -150.043377
+--  [RetrievalNotes] = ' deployment 8 '
+WHERE SiteName = 'LAKE008' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.032744,
+    [RetrieveLongitude] = -150.033367
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE009' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.037754,
+    [RetrieveLongitude] = -150.023357
+--  [RetrievalNotes] = ' deployment 10 '
+WHERE SiteName = 'LAKE010' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.042654,
+    [RetrieveLongitude] = -150.013347
+--  [RetrievalNotes] = 'deployment 11'
+WHERE SiteName = 'LAKE011' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.047664,
+    [RetrieveLongitude] = -150.003337
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE012' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.052674,
+    [RetrieveLongitude] = -149.993457
+--  [RetrievalNotes] = 'deployment 13'
+WHERE SiteName = 'LAKE013' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.057684,
+    [RetrieveLongitude] = -149.983447
+--  [RetrievalNotes] = ' deployment 14 '
+WHERE SiteName = 'LAKE014' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.062694,
+    [RetrieveLongitude] = -149.973437
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE015' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.067704,
+    [RetrieveLongitude] = -149.963427
+--  [RetrievalNotes] = ' deployment 16 '
+WHERE SiteName = 'LAKE016' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.072714,
+    [RetrieveLongitude] = -149.953417
+--  [RetrievalNotes] = 'deployment 17'
+WHERE SiteName = 'LAKE017' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.077724,
+    [RetrieveLongitude] = -149.943407
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE018' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.082734,
+    [RetrieveLongitude] = -149.933397
+--  [RetrievalNotes] = 'deployment 19'
+WHERE SiteName = 'LAKE019' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.087744,
+    [RetrieveLongitude] = -149.923387
+--  [RetrievalNotes] = ' deployment 20 '
+WHERE SiteName = 'LAKE020' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.092754,
+    [RetrieveLongitude] = -149.913377
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE021' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.097654,
+    [RetrieveLongitude] = -149.903367
+--  [RetrievalNotes] = ' deployment 22 '
+WHERE SiteName = 'LAKE022' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.102664,
+    [RetrieveLongitude] = -149.893357
+--  [RetrievalNotes] = 'deployment 23'
+WHERE SiteName = 'LAKE023' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.107674,
+    [RetrieveLongitude] = -149.883347
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE024' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.112684,
+    [RetrieveLongitude] = -149.873337
+--  [RetrievalNotes] = 'deployment 25'
+WHERE SiteName = 'LAKE025' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.117694,
+    [RetrieveLongitude] = -149.863457
+--  [RetrievalNotes] = ' deployment 26 '
+WHERE SiteName = 'LAKE026' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.122704,
+    [RetrieveLongitude] = -149.853447
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE027' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.127714,
+    [RetrieveLongitude] = -149.843437
+--  [RetrievalNotes] = ' deployment 28 '
+WHERE SiteName = 'LAKE028' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.132724,
+    [RetrieveLongitude] = -149.833427
+--  [RetrievalNotes] = 'deployment 29'
+WHERE SiteName = 'LAKE029' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.137734,
+    [RetrieveLongitude] = -149.823417
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE030' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.142744,
+    [RetrieveLongitude] = -149.813407
+--  [RetrievalNotes] = 'deployment 31'
+WHERE SiteName = 'LAKE031' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.147754,
+    [RetrieveLongitude] = -149.803397
+--  [RetrievalNotes] = ' deployment 32 '
+WHERE SiteName = 'LAKE032' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.152654,
+    [RetrieveLongitude] = -149.793387
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE033' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.157664,
+    [RetrieveLongitude] = -149.783377
+--  [RetrievalNotes] = ' deployment 34 '
+WHERE SiteName = 'LAKE034' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.162674,
+    [RetrieveLongitude] = -149.773367
+--  [RetrievalNotes] = 'deployment 35'
+WHERE SiteName = 'LAKE035' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.167684,
+    [RetrieveLongitude] = -149.763357
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE036' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.172694,
+    [RetrieveLongitude] = -149.753347
+--  [RetrievalNotes] = 'deployment 37'
+WHERE SiteName = 'LAKE037' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.177704,
+    [RetrieveLongitude] = -149.743337
+--  [RetrievalNotes] = ' deployment 38 '
+WHERE SiteName = 'LAKE038' AND DateRetrieved = '2024-06-01'
+
+UPDATE dbo.tblContinuousDataDeployments
+SET [RetrieveLatitude] = 65.182714,
+    [RetrieveLongitude] = -149.733457
+--  [RetrievalNotes] = NULL
+WHERE SiteName = 'LAKE039' AND DateRetrieved = '2024-06-01'
+
+
+     COMMIT TRANSACTION
+     PRINT N'Successfully inserted ALL records and committed them.'
+END TRY
+BEGIN CATCH -- ROLLBACK
+    IF @@TRANCOUNT > 0
+    BEGIN
+        DECLARE @error_msg NVARCHAR(MAX)
+        SELECT @error_msg = ERROR_MESSAGE()
+        PRINT N'Error: ' + @error_msg + char(13) + char(10) + char(13) + char(10)
+        ROLLBACK TRANSACTION
+        PRINT N'Rolling back transaction; NO records have been inserted.'
+    END
+END CATCH
+
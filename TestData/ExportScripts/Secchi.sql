@@ -0,0 +1,672 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer secchi depth data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+Source geodatabase: X
+FeatureClass: Secchi_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+/*
+READ AND THOROUGHLY UNDERSTAND THIS SCRIPT BEFORE RUNNING.
+Running this script may change records in the Shallow Lakes monitoring database.
+The lakes referenced in this script must exist in the tblPonds table prior to running this script. 
+Secchi depth data is stored in tblEvents. 
+On error, rollback and correct any problems, then run again. Commit changes when finished.
+*/
+
+USE AK_ShallowLakes
+
+-- PREVIEW OF AFFECTED RECORDS: To see the secchi depth values that may be affected uncomment and run the query below:
+-- SELECT PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE 
+-- (Pondname = 'LAKE199' And SampleDate = '2024-05-31') Or 
+-- (Pondname = 'LAKE001' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE002' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE003' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE004' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE005' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE006' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE007' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE008' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE009' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE010' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE011' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE012' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE013' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE014' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE015' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE016' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE017' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE018' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE019' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE020' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE021' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE022' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE023' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE024' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE025' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE026' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE027' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE028' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE029' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE030' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE031' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE032' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE033' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE034' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE035' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE036' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE037' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE038' And SampleDate = '2024-06-01') Or 
+-- (Pondname = 'LAKE039' And SampleDate = '2024-06-01') 
+
+BEGIN TRANSACTION -- COMMIT ROLLBACK -- All queries in this transaction must succeed or fail together. COMMIT if all queries succeed. ROLLBACK if any fail. Failure to COMMIT or ROLLBACK will leave the database in a hanging state.
+
+-- All the lakes in the input geodatabase must exist in tblPonds before events can be created or updated
+IF EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE199') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE001') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE002') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE003') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE004') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE005') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE006') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE007') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE008') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE009') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE010') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE011') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE012') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE013') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE014') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE015') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE016') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE017') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE018') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE019') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE020') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE021') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE022') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE023') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE024') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE025') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE026') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE027') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE028') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE029') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE030') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE031') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE032') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE033') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE034') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE035') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE036') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE037') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE038') And 
+    EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = 'LAKE039')
+BEGIN
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE199' And SampleDate = '2024-05-31')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 1, SECCHINOTES = NULL WHERE Pondname = 'LAKE199' And SampleDate = '2024-05-31'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE199','2024-05-31',NULL,1,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE199' And SampleDate = '2024-05-31'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE199 SampleDate: 2024-05-31'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE001' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 0.8, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 1' WHERE Pondname = 'LAKE001' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE001','2024-06-01',0.8,0,'secchi 1');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE001' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE001 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE002' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 0.8, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 2' WHERE Pondname = 'LAKE002' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE002','2024-06-01',0.8,0,'secchi 2');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE002' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE002 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE003' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 0.9, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE003' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE003','2024-06-01',0.9,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE003' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE003 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE004' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 0.9, SECCHIONBOTTOM = 1, SECCHINOTES = 'secchi 4' WHERE Pondname = 'LAKE004' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE004','2024-06-01',0.9,1,'secchi 4');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE004' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE004 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE005' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 5' WHERE Pondname = 'LAKE005' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE005','2024-06-01',NULL,0,'secchi 5');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE005' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE005 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE006' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.1, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE006' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE006','2024-06-01',1.1,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE006' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE006 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE007' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.1, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 7' WHERE Pondname = 'LAKE007' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE007','2024-06-01',1.1,0,'secchi 7');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE007' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE007 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE008' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.1, SECCHIONBOTTOM = 1, SECCHINOTES = 'secchi 8' WHERE Pondname = 'LAKE008' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE008','2024-06-01',1.1,1,'secchi 8');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE008' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE008 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE009' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.2, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE009' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE009','2024-06-01',1.2,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE009' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE009 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE010' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 10' WHERE Pondname = 'LAKE010' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE010','2024-06-01',NULL,0,'secchi 10');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE010' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE010 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE011' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.3, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 11' WHERE Pondname = 'LAKE011' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE011','2024-06-01',1.3,0,'secchi 11');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE011' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE011 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE012' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.4, SECCHIONBOTTOM = 1, SECCHINOTES = NULL WHERE Pondname = 'LAKE012' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE012','2024-06-01',1.4,1,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE012' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE012 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE013' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.4, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 13' WHERE Pondname = 'LAKE013' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE013','2024-06-01',1.4,0,'secchi 13');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE013' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE013 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE014' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.5, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 14' WHERE Pondname = 'LAKE014' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE014','2024-06-01',1.5,0,'secchi 14');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE014' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE014 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE015' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE015' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE015','2024-06-01',NULL,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE015' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE015 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE016' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.6, SECCHIONBOTTOM = 1, SECCHINOTES = 'secchi 16' WHERE Pondname = 'LAKE016' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE016','2024-06-01',1.6,1,'secchi 16');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE016' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE016 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE017' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.6, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 17' WHERE Pondname = 'LAKE017' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE017','2024-06-01',1.6,0,'secchi 17');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE017' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE017 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE018' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.6, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE018' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE018','2024-06-01',1.6,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE018' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE018 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE019' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.7, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 19' WHERE Pondname = 'LAKE019' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE019','2024-06-01',1.7,0,'secchi 19');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE019' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE019 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE020' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 1, SECCHINOTES = 'secchi 20' WHERE Pondname = 'LAKE020' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE020','2024-06-01',NULL,1,'secchi 20');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE020' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE020 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE021' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.8, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE021' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE021','2024-06-01',1.8,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE021' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE021 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE022' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.9, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 22' WHERE Pondname = 'LAKE022' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE022','2024-06-01',1.9,0,'secchi 22');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE022' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE022 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE023' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 1.9, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 23' WHERE Pondname = 'LAKE023' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE023','2024-06-01',1.9,0,'secchi 23');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE023' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE023 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE024' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.0, SECCHIONBOTTOM = 1, SECCHINOTES = NULL WHERE Pondname = 'LAKE024' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE024','2024-06-01',2.0,1,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE024' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE024 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE025' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 25' WHERE Pondname = 'LAKE025' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE025','2024-06-01',NULL,0,'secchi 25');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE025' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE025 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE026' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.0, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 26' WHERE Pondname = 'LAKE026' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE026','2024-06-01',2.0,0,'secchi 26');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE026' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE026 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE027' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.1, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE027' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE027','2024-06-01',2.1,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE027' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE027 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE028' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.2, SECCHIONBOTTOM = 1, SECCHINOTES = 'secchi 28' WHERE Pondname = 'LAKE028' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE028','2024-06-01',2.2,1,'secchi 28');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE028' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE028 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE029' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.2, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 29' WHERE Pondname = 'LAKE029' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE029','2024-06-01',2.2,0,'secchi 29');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE029' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE029 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE030' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE030' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE030','2024-06-01',NULL,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE030' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE030 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE031' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.3, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 31' WHERE Pondname = 'LAKE031' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE031','2024-06-01',2.3,0,'secchi 31');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE031' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE031 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE032' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.4, SECCHIONBOTTOM = 1, SECCHINOTES = 'secchi 32' WHERE Pondname = 'LAKE032' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE032','2024-06-01',2.4,1,'secchi 32');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE032' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE032 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE033' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.4, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE033' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE033','2024-06-01',2.4,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE033' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE033 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE034' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.5, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 34' WHERE Pondname = 'LAKE034' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE034','2024-06-01',2.5,0,'secchi 34');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE034' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE034 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE035' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = NULL, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 35' WHERE Pondname = 'LAKE035' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE035','2024-06-01',NULL,0,'secchi 35');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE035' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE035 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE036' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.5, SECCHIONBOTTOM = 1, SECCHINOTES = NULL WHERE Pondname = 'LAKE036' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE036','2024-06-01',2.5,1,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE036' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE036 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE037' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.6, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 37' WHERE Pondname = 'LAKE037' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE037','2024-06-01',2.6,0,'secchi 37');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE037' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE037 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE038' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.7, SECCHIONBOTTOM = 0, SECCHINOTES = 'secchi 38' WHERE Pondname = 'LAKE038' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE038','2024-06-01',2.7,0,'secchi 38');
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE038' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE038 SampleDate: 2024-06-01'
+
+       -- Ensure the Event for these data edits exists.
+       IF EXISTS (SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE039' And SampleDate = '2024-06-01')
+               -- The event exists, update it.
+               UPDATE tblEvents SET SECCHIDEPTH = 2.7, SECCHIONBOTTOM = 0, SECCHINOTES = NULL WHERE Pondname = 'LAKE039' And SampleDate = '2024-06-01'
+
+               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.
+               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('LAKE039','2024-06-01',2.7,0,NULL);
+
+               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.
+               -- SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = 'LAKE039' And SampleDate = '2024-06-01'
+
+       ELSE
+           PRINT 'The event for this record does not exist. PondName:LAKE039 SampleDate: 2024-06-01'
+
+END
+ELSE
+    PRINT 'ERROR: One or more lakes are missing from tblPonds. All lakes in the insert query block must exist in tblPonds before sampling events can be created in the tblEvents table.'
@@ -0,0 +1,147 @@
+/*
+NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring
+This script was generated by the TrimbleGeoDBToDatabase ArcTool available at https://github.com/NPS-ARCN-CAKN/TrimbleGeoDBToDatabase.
+
+Purpose: Transfer water sample data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.
+Source geodatabase: X
+FeatureClass: Water_Sample_Joined
+SQL file name: X
+Script generated by: X
+Date/time: X
+*/
+
+BEGIN TRANSACTION -- COMMIT ROLLBACK
+
+-- Determine if all the necessary parent Event records exist before trying to insert
+IF
+ EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE199' And SampleDate = '2024-05-31') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE001' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE002' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE003' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE004' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE005' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE006' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE007' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE008' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE009' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE010' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE011' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE012' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE013' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE014' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE015' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE016' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE017' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE018' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE019' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE020' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE021' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE022' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE023' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE024' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE025' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE026' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE027' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE028' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE029' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE030' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE031' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE032' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE033' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE034' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE035' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE036' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE037' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE038' And SampleDate = '2024-06-01') And 
+  EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='LAKE039' And SampleDate = '2024-06-01') 
+
+    BEGIN
+    -- Insert the records
+
+-- Insert the water samples first
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE199','2024-05-31','A','08:00:00',0.5,NULL,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE001','2024-06-01','B','08:00:07',0.5,2.0,1,1,1,1,1,'sample 1')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE002','2024-06-01','C','08:00:14',0.5,2.5,0,0,0,0,0,'sample 2')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE003','2024-06-01','A','08:00:21',0.5,3.0,1,1,1,1,1,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE004','2024-06-01','B','08:00:28',0.5,NULL,0,0,0,0,0,'sample 4')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE005','2024-06-01','C','08:00:35',0.5,4.0,1,1,1,1,1,'sample 5')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE006','2024-06-01','A','08:00:42',0.5,1.5,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE007','2024-06-01','B','08:00:49',0.5,2.0,1,1,1,1,1,'sample 7')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE008','2024-06-01','C','08:00:56',0.5,NULL,0,0,0,0,0,'sample 8')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE009','2024-06-01','A','08:01:03',0.5,3.0,1,1,1,1,1,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE010','2024-06-01','B','08:01:10',0.5,3.5,0,0,0,0,0,'sample 10')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE011','2024-06-01','C','08:01:17',0.5,4.0,1,1,1,1,1,'sample 11')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE012','2024-06-01','A','08:01:24',0.5,NULL,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE013','2024-06-01','B','08:01:31',0.5,2.0,1,1,1,1,1,'sample 13')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE014','2024-06-01','C','08:01:38',0.5,2.5,0,0,0,0,0,'sample 14')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE015','2024-06-01','A','08:01:45',0.5,3.0,1,1,1,1,1,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE016','2024-06-01','B','08:01:52',0.5,NULL,0,0,0,0,0,'sample 16')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE017','2024-06-01','C','08:01:59',0.5,4.0,1,1,1,1,1,'sample 17')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE018','2024-06-01','A','08:02:06',0.5,1.5,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE019','2024-06-01','B','08:02:13',0.5,2.0,1,1,1,1,1,'sample 19')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE020','2024-06-01','C','08:02:20',0.5,NULL,0,0,0,0,0,'sample 20')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE021','2024-06-01','A','08:02:27',0.5,3.0,1,1,1,1,1,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE022','2024-06-01','B','08:02:34',0.5,3.5,0,0,0,0,0,'sample 22')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE023','2024-06-01','C','08:02:41',0.5,4.0,1,1,1,1,1,'sample 23')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE024','2024-06-01','A','08:02:48',0.5,NULL,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE025','2024-06-01','B','08:02:55',0.5,2.0,1,1,1,1,1,'sample 25')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE026','2024-06-01','C','08:03:02',0.5,2.5,0,0,0,0,0,'sample 26')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE027','2024-06-01','A','08:03:09',0.5,3.0,1,1,1,1,1,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE028','2024-06-01','B','08:03:16',0.5,NULL,0,0,0,0,0,'sample 28')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE029','2024-06-01','C','08:03:23',0.5,4.0,1,1,1,1,1,'sample 29')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE030','2024-06-01','A','08:03:30',0.5,1.5,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE031','2024-06-01','B','08:03:37',0.5,2.0,1,1,1,1,1,'sample 31')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE032','2024-06-01','C','08:03:44',0.5,NULL,0,0,0,0,0,'sample 32')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE033','2024-06-01','A','08:03:51',0.5,3.0,1,1,1,1,1,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE034','2024-06-01','B','08:03:58',0.5,3.5,0,0,0,0,0,'sample 34')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE035','2024-06-01','C','08:04:05',0.5,4.0,1,1,1,1,1,'sample 35')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE036','2024-06-01','A','08:04:12',0.5,NULL,0,0,0,0,0,NULL)
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE037','2024-06-01','B','08:04:19',0.5,2.0,1,1,1,1,1,'sample 37')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE038','2024-06-01','C','08:04:26',0.5,2.5,0,0,0,0,0,'sample 38')
+INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('LAKE039','2024-06-01','A','08:04:33',0.5,3.0,1,1,1,1,1,NULL)
+   END
+ELSE
+   Print 'One or more parent Event records related to the record you are trying to insert does not exist.'
+
+-- Execute the query below to validate the inserted records.
+-- SELECT * FROM tblWaterSamples WHERE
+   -- (PondName='LAKE199' and  SampleDate = '2024-05-31' and SampleNumber = 'A') Or
+   -- (PondName='LAKE001' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE002' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE003' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE004' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE005' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE006' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE007' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE008' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE009' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE010' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE011' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE012' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE013' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE014' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE015' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE016' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE017' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE018' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE019' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE020' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE021' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE022' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE023' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE024' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE025' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE026' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE027' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE028' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE029' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE030' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE031' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE032' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE033' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE034' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE035' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE036' and  SampleDate = '2024-06-01' and SampleNumber = 'A') Or
+   -- (PondName='LAKE037' and  SampleDate = '2024-06-01' and SampleNumber = 'B') Or
+   -- (PondName='LAKE038' and  SampleDate = '2024-06-01' and SampleNumber = 'C') Or
+   -- (PondName='LAKE039' and  SampleDate = '2024-06-01' and SampleNumber = 'A') 
\ No newline at end of file
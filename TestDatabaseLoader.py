@@ -0,0 +1,352 @@
+# TestDatabaseLoader.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests function 'TrimbleGeoDBToDatabase.LoadJoined' (see
+# 'DatabaseLoader') on an in-memory SQLite database, with the synthetic
+# feature classes and the 'arcpy' stand-in of the benchmarks (see
+# 'Benchmark/SyntheticGeoDB.py') instead of ArcGIS. Every feature class
+# in 'LOAD_TARGETS' is loaded into a table of the columns of its spec.
+# The loader of 'DatabaseLoader' is also tested alone: the
+# parameterized statements, the row counts, the rollback of a load on
+# error and the key counts of the Event checks.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestDatabaseLoader
+
+import os
+import sqlite3
+import sys
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import arcpy
+import DatabaseLoader
+import SyntheticGeoDB
+import TableSpec
+import TrimbleGeoDBToDatabase
+import TrimbleUtility
+
+# The number of rows of each synthetic feature class. Every 97th row
+# repeats the key of the row before it (see 'SyntheticGeoDB').
+ROW_COUNT = 300
+
+def GetCreateTableQuery(Spec, PrimaryKey = False):
+    """
+    The CREATE TABLE statement of a table of the columns of a spec,
+    without types, and with the spec's primary key if 'PrimaryKey' is
+    True.
+    """
+    Columns = [Column.Name for Column in Spec.Columns]
+
+    if PrimaryKey:
+        Columns.append('PRIMARY KEY (' + ', '.join(Spec.KeyColumns) + ')')
+
+    return "CREATE TABLE " + Spec.Table + " (" + ', '.join(Columns) + ")"
+
+# The lakes of the rows that repeat the key of the row before them.
+REPEATED_LAKES = ['LAKE096', 'LAKE193', 'LAKE090']
+
+def GetExpectedRecords(Spec, Columns, WhereClause = None):
+    """
+    The parameters of the records of the spec's feature class, as the
+    SQL scripts format them (see 'TableSpec.CompileFormatter').
+    """
+    FormatParameters = TableSpec.CompileFormatter(Columns, 'Synthetic.gdb', Parameters = True)
+
+    return [FormatParameters(Row, Normal) for Row, Normal in TableSpec.IterExportRows(Spec.FeatureClass, Spec.FieldNames, WhereClause = WhereClause)]
+
+class TestLoadJoined(unittest.TestCase):
+
+    def setUp(self):
+        SyntheticGeoDB.CreateSyntheticGeoDB(ROW_COUNT)
+        arcpy.env.workspace = os.path.join(REPOSITORY_FOLDER, 'Synthetic.gdb')
+        del arcpy.MESSAGES[:]
+
+        # One connection, so that the in-memory database is the same
+        # for the load and the checks.
+        self.Connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self.Pool = DatabaseLoader.ConnectionPool(lambda: self.Connection, MaxConnections = 1)
+
+    def tearDown(self):
+        self.Pool.CloseAll()
+
+    def CreateEvents(self, Specs, Excluded = ()):
+        """
+        Creates tblEvents with the Events of the records of the specs,
+        but those of the 'Excluded' lakes.
+        """
+        self.Connection.execute(GetCreateTableQuery(TrimbleGeoDBToDatabase.SECCHI_JOINED_SPEC))
+
+        Events = {}
+
+        for Spec in Specs:
+            for Record in GetExpectedRecords(Spec, Spec.Columns):
+                if Record[0] not in Excluded:
+                    Events[Record[:2]] = None
+
+        self.Connection.executemany("INSERT INTO tblEvents (PONDNAME, SAMPLEDATE) VALUES (?, ?)", list(Events))
+        self.Connection.commit()
+
+    def GetRows(self, Spec):
+        Cursor = self.Connection.execute("SELECT " + Spec.GetColumnNames() + " FROM " + Spec.Table + " ORDER BY rowid")
+
+        return Cursor.fetchall()
+
+    def test_InsertsEveryTarget(self):
+        Targets = [(FeatureClass, Spec) for FeatureClass, Spec in TrimbleGeoDBToDatabase.LOAD_TARGETS.items()
+                   if FeatureClass not in TrimbleGeoDBToDatabase.LOAD_UPDATES]
+
+        self.CreateEvents([Spec for FeatureClass, Spec in Targets if Spec.EventKeyColumns is not None])
+
+        # The lakes with a repeated key would have two loon records of
+        # one Event, so are not loaded.
+        Lakes = ['LAKE' + str(i).zfill(3) for i in range(SyntheticGeoDB.LAKE_COUNT) if 'LAKE' + str(i).zfill(3) not in REPEATED_LAKES]
+
+        for FeatureClass, Spec in Targets:
+            with self.subTest(FeatureClass = FeatureClass):
+                self.Connection.execute(GetCreateTableQuery(Spec))
+
+                if Spec.OneRecordPerEvent:
+                    Count = TrimbleGeoDBToDatabase.LoadJoined(FeatureClass, self.Pool, BatchSize = 64, Lakes = Lakes)
+                    Expected = GetExpectedRecords(Spec, Spec.Columns, TrimbleUtility.GetRowFilterWhereClause(Lakes = Lakes))
+                else:
+                    Count = TrimbleGeoDBToDatabase.LoadJoined(FeatureClass, self.Pool, BatchSize = 64)
+                    Expected = GetExpectedRecords(Spec, Spec.Columns)
+
+                self.assertEqual(Count, len(Expected))
+                self.assertEqual(self.GetRows(Spec), Expected)
+
+    def test_InsertedValues(self):
+        Spec = TrimbleGeoDBToDatabase.DEPTH_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec))
+        self.CreateEvents([Spec])
+
+        TrimbleGeoDBToDatabase.LoadJoined('Depth_Joined', self.Pool)
+
+        Rows = self.GetRows(Spec)
+
+        # Row 49 has no creation datetime, so is not loaded.
+        self.assertEqual(len(Rows), ROW_COUNT - ROW_COUNT // 50)
+
+        # Row 1: a depth rounded to 1 decimal, the coordinates rounded
+        # to 6 decimals and a comment without its surrounding blanks.
+        self.assertEqual(Rows[1], ('LAKE001', '2024-06-01', '08:00:07', 64.992664, -150.113447, 0.6, 'depth 1', 'R00000.ssf',
+                                   120.1, 0.75, 0.375, 'Synthetic.gdb'))
+
+        # Row 0: a blank comment is null.
+        self.assertIsNone(Rows[0][6])
+
+    def test_RollbackOnError(self):
+        # The repeated key of row 97 breaks the primary key, after
+        # some batches have been sent.
+        Spec = TrimbleGeoDBToDatabase.LOONS_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec, PrimaryKey = True))
+        self.CreateEvents([Spec])
+
+        Count = TrimbleGeoDBToDatabase.LoadJoined('Loons_Joined', self.Pool, BatchSize = 10)
+
+        self.assertIsNone(Count)
+        self.assertEqual(self.GetRows(Spec), [])
+        self.assertIn('NO records have been loaded', arcpy.MESSAGES[-1])
+
+    def test_RaiseErrors(self):
+        Spec = TrimbleGeoDBToDatabase.LOONS_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec, PrimaryKey = True))
+        self.CreateEvents([Spec])
+
+        with self.assertRaises(Exception):
+            TrimbleGeoDBToDatabase.LoadJoined('Loons_Joined', self.Pool, RaiseErrors = True)
+
+        self.assertEqual(self.GetRows(Spec), [])
+
+    def test_RollbackOnMissingEvent(self):
+        Spec = TrimbleGeoDBToDatabase.DEPTH_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec))
+        self.CreateEvents([Spec], Excluded = ['LAKE005'])
+
+        Count = TrimbleGeoDBToDatabase.LoadJoined('Depth_Joined', self.Pool, BatchSize = 64)
+
+        self.assertIsNone(Count)
+        self.assertEqual(self.GetRows(Spec), [])
+
+        Messages = '\n'.join(arcpy.MESSAGES)
+
+        self.assertIn("Events of Depth_Joined are not in tblEvents", Messages)
+        self.assertIn('  LAKE005, ', Messages)
+
+    def test_RollbackOnRepeatedEvent(self):
+        # Without a primary key, the repeated loon keys are only found
+        # by the one record per Event check.
+        Spec = TrimbleGeoDBToDatabase.LOONS_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec))
+        self.CreateEvents([Spec])
+
+        Count = TrimbleGeoDBToDatabase.LoadJoined('Loons_Joined', self.Pool)
+
+        self.assertIsNone(Count)
+        self.assertEqual(self.GetRows(Spec), [])
+
+        Messages = '\n'.join(arcpy.MESSAGES)
+
+        self.assertIn("3 Events of Loons_Joined would have more than one record in tblLoons", Messages)
+
+        for Lake in REPEATED_LAKES:
+            self.assertIn('  ' + Lake + ', ', Messages)
+
+    def test_LakesFilter(self):
+        Spec = TrimbleGeoDBToDatabase.DEPTH_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec))
+        self.CreateEvents([Spec])
+
+        Count = TrimbleGeoDBToDatabase.LoadJoined('Depth_Joined', self.Pool, Lakes = ['LAKE001', 'LAKE002'])
+        Rows = self.GetRows(Spec)
+
+        self.assertEqual(Count, len(Rows))
+        self.assertGreater(Count, 0)
+        self.assertEqual({Row[0] for Row in Rows}, {'LAKE001', 'LAKE002'})
+
+    def test_UpdatesMatchedEvents(self):
+        Spec = TrimbleGeoDBToDatabase.SECCHI_JOINED_SPEC
+        self.Connection.execute(GetCreateTableQuery(Spec))
+
+        # The Events of all the lakes but LAKE005.
+        Columns = Spec.GetValueColumns() + Spec.GetKeyColumns()
+        Expected = GetExpectedRecords(Spec, Columns)
+        Keys = list(dict.fromkeys(Record[-2:] for Record in Expected))
+        Events = [Key for Key in Keys if Key[0] != 'LAKE005']
+        MissingKeys = [Key for Key in Keys if Key[0] == 'LAKE005']
+
+        self.Connection.executemany("INSERT INTO tblEvents (PONDNAME, SAMPLEDATE) VALUES (?, ?)", Events)
+        self.Connection.commit()
+
+        Count = TrimbleGeoDBToDatabase.LoadJoined('Secchi_Joined', self.Pool)
+
+        # A repeated key updates its Event twice.
+        Matched = [Record for Record in Expected if Record[-2] != 'LAKE005']
+
+        self.assertEqual(Count, len(Matched))
+
+        # The last record of each key is its value.
+        Values = {Record[-2:]: Record[:-2] for Record in Matched}
+        Rows = self.Connection.execute("SELECT " + ', '.join(Column.Name for Column in Columns) + " FROM tblEvents").fetchall()
+
+        self.assertEqual({Row[-2:]: Row[:-2] for Row in Rows}, Values)
+
+        Messages = '\n'.join(arcpy.MESSAGES)
+
+        self.assertIn(str(len(Matched)) + " records of tblEvents updated from the " + str(len(Expected)) + " records", Messages)
+        self.assertIn("WARNING: " + str(len(MissingKeys)) + " keys of Secchi_Joined match no record of tblEvents", Messages)
+
+        for Key in MissingKeys:
+            self.assertIn('  ' + ', '.join(Key) + '\n', Messages)
+
+class TestLoadRecords(unittest.TestCase):
+
+    def setUp(self):
+        # One connection, so that the in-memory database is the same
+        # for the load and the checks.
+        self.Connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self.Connection.execute("CREATE TABLE tblEvents (PONDNAME, SAMPLEDATE, SECCHIDEPTH, PRIMARY KEY (PONDNAME, SAMPLEDATE))")
+        self.Pool = DatabaseLoader.ConnectionPool(lambda: self.Connection, MaxConnections = 1)
+
+        self.Insert = DatabaseLoader.GetInsertStatement('tblEvents', ['PONDNAME', 'SAMPLEDATE', 'SECCHIDEPTH'])
+
+    def tearDown(self):
+        self.Pool.CloseAll()
+
+    def GetRows(self):
+        return self.Connection.execute("SELECT PONDNAME, SAMPLEDATE, SECCHIDEPTH FROM tblEvents ORDER BY rowid").fetchall()
+
+    def GetRecords(self, Count):
+        return [('LAKE' + str(i).zfill(3), '2024-06-01', 1.5) for i in range(Count)]
+
+    def test_Inserts(self):
+        # The records may be a generator; they are sent in batches.
+        Records = (Record for Record in self.GetRecords(25))
+
+        self.assertEqual(DatabaseLoader.LoadRecords(self.Pool, self.Insert, Records, BatchSize = 10), (25, 25))
+        self.assertEqual(self.GetRows(), self.GetRecords(25))
+
+    def test_UpdatesAndMissingKeys(self):
+        DatabaseLoader.LoadRecords(self.Pool, self.Insert, self.GetRecords(3))
+
+        # An update whose key matches no row updates none.
+        Statement = DatabaseLoader.GetUpdateStatement('tblEvents', ['SECCHIDEPTH'], ['PONDNAME', 'SAMPLEDATE'])
+        Records = [(2.5, 'LAKE001', '2024-06-01'), (3.5, 'LAKE004', '2024-06-01')]
+
+        self.assertEqual(DatabaseLoader.LoadRecords(self.Pool, Statement, Records), (2, 1))
+        self.assertEqual(self.GetRows()[1], ('LAKE001', '2024-06-01', 2.5))
+
+        Keys = [Record[1:] for Record in Records]
+
+        self.assertEqual(DatabaseLoader.GetMissingKeys(self.Pool, 'tblEvents', ['PONDNAME', 'SAMPLEDATE'], Keys),
+                         [('LAKE004', '2024-06-01')])
+
+    def test_RollbackOnError(self):
+        # The last batch repeats a key of the first, after two batches
+        # have been sent.
+        Records = self.GetRecords(10) + [self.GetRecords(1)[0]]
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            DatabaseLoader.LoadRecords(self.Pool, self.Insert, Records, BatchSize = 5)
+
+        self.assertEqual(self.GetRows(), [])
+
+    def test_RollbackOnCheck(self):
+        def Check(Cursor):
+            # The rows of the open transaction are counted.
+            if DatabaseLoader.CountKeys(Cursor, 'tblEvents', ['PONDNAME'], [('LAKE001',), ('LAKE009',)]) == [(('LAKE001',), 1), (('LAKE009',), 0)]:
+                raise Exception("LAKE009 is missing.")
+
+        with self.assertRaisesRegex(Exception, 'LAKE009 is missing'):
+            DatabaseLoader.LoadRecords(self.Pool, self.Insert, self.GetRecords(3), Check = Check)
+
+        self.assertEqual(self.GetRows(), [])
+
+class TestStatements(unittest.TestCase):
+
+    def test_Placeholders(self):
+        self.assertEqual(DatabaseLoader.GetInsertStatement('tblLoons', ['PONDNAME', 'SAMPLEDATE']),
+                         "INSERT INTO tblLoons(PONDNAME,SAMPLEDATE) VALUES(?,?)")
+        self.assertEqual(DatabaseLoader.GetUpdateStatement('tblEvents', ['SECCHIDEPTH'], ['PONDNAME'], 'format'),
+                         "UPDATE tblEvents SET SECCHIDEPTH = %s WHERE PONDNAME = %s")
+
+    def test_NamedParamStyleIsNotValid(self):
+        # The records are sequences, which the 'named' style cannot
+        # bind.
+        with self.assertRaises(Exception):
+            DatabaseLoader.GetInsertStatement('tblLoons', ['PONDNAME'], 'named')
+
+class TestCountKeys(unittest.TestCase):
+
+    def test_Counts(self):
+        Connection = sqlite3.connect(':memory:')
+        Connection.execute("CREATE TABLE tblEvents (PONDNAME, SAMPLEDATE)")
+
+        # Lake i has i % 3 Events, so a third of the keys are missing.
+        Keys = [('LAKE' + str(i).zfill(4), '2024-06-01') for i in range(1200)]
+        Connection.executemany("INSERT INTO tblEvents VALUES (?, ?)", [Key for i, Key in enumerate(Keys) for j in range(i % 3)])
+
+        Statements = []
+        Connection.set_trace_callback(Statements.append)
+
+        Counts = DatabaseLoader.CountKeys(Connection.cursor(), 'tblEvents', ['PONDNAME', 'SAMPLEDATE'], Keys)
+
+        self.assertEqual(Counts, [(Key, i % 3) for i, Key in enumerate(Keys)])
+
+        # One query per chunk of keys, not one per key.
+        self.assertEqual(len(Statements), 3)
+
+        Connection.close()
+
+if __name__ == '__main__':
+    unittest.main()
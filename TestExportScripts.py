@@ -0,0 +1,390 @@
+# TestExportScripts.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script runs the 'Export*Joined' functions of
+# 'TrimbleGeoDBToDatabase' on a small synthetic geodatabase, with the
+# 'arcpy' stand-in of the benchmarks (see 'Benchmark/arcpy.py')
+# instead of ArcGIS, and compares their SQL scripts with the expected
+# scripts in 'TestData/ExportScripts'. The expected scripts were
+# written by the exporters of version 2.0 (before the table specs), so
+# the default output of every exporter is kept as it was. The lines of
+# the header that change with each run (the file name, user, date/time
+# and geodatabase path) are not compared. The chunked scripts, the
+# files of a bulk insert and the set based updates (continuous and
+# Secchi) are checked as well.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestExportScripts
+
+import csv
+import glob
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import arcpy
+import SyntheticGeoDB
+import TrimbleGeoDBToDatabase
+from TrimbleGeoDBToDatabase import Continuous, Layout, Output, Update
+
+EXPECTED_FOLDER = os.path.join(REPOSITORY_FOLDER, 'TestData', 'ExportScripts')
+
+# The number of rows of each synthetic feature class.
+ROW_COUNT = 40
+
+# The date range of the continuous exports.
+FROM_DATE = '2024-05-01'
+TO_DATE = '2024-07-01'
+
+# The header lines that change with each run.
+VARIABLE_HEADER_LINES = ['SQL file name', 'Script generated by', 'Date/time', 'Source geodatabase']
+
+def NormalizeScript(Text):
+    """
+    The text of a SQL script without the values of its
+    'VARIABLE_HEADER_LINES'.
+    """
+    for Name in VARIABLE_HEADER_LINES:
+        Text = re.sub(r'(?m)^' + re.escape(Name) + r': .*$', Name + ': X', Text)
+
+    return Text
+
+class ExportTestCase(unittest.TestCase):
+    """
+    Runs each test in its own folder, with a synthetic geodatabase of
+    'ROW_COUNT' rows, where the exporters write their scripts.
+    """
+
+    def setUp(self):
+        self.Folder = tempfile.mkdtemp()
+        SyntheticGeoDB.CreateSyntheticGeoDB(ROW_COUNT)
+        arcpy.env.workspace = os.path.join(self.Folder, 'Synthetic.gdb')
+        del arcpy.MESSAGES[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.Folder)
+
+    def Export(self, Function, *Arguments, **Parameters):
+        """
+        Runs an export function, and returns the normalized text of the
+        one SQL script it wrote. The script is then removed, as two
+        exports in the same second have the same file name.
+        """
+        Function(*Arguments, RaiseErrors = True, **Parameters)
+
+        Scripts = glob.glob(os.path.join(self.Folder, '*.sql'))
+
+        self.assertEqual(len(Scripts), 1, arcpy.MESSAGES)
+
+        with open(Scripts[0]) as Script:
+            Text = Script.read()
+
+        os.remove(Scripts[0])
+
+        return NormalizeScript(Text)
+
+class TestExpectedScripts(ExportTestCase):
+
+    def assertExpected(self, Name, Text):
+        with open(os.path.join(EXPECTED_FOLDER, Name + '.sql')) as Expected:
+            self.assertEqual(Text, Expected.read())
+
+    def test_Secchi(self):
+        self.assertExpected('Secchi', self.Export(TrimbleGeoDBToDatabase.ExportSecchiJoined))
+
+    def test_Depth(self):
+        self.assertExpected('Depth', self.Export(TrimbleGeoDBToDatabase.ExportDepthJoined))
+
+    def test_Loons(self):
+        self.assertExpected('Loons', self.Export(TrimbleGeoDBToDatabase.ExportLoonsJoined))
+
+    def test_WaterSample(self):
+        self.assertExpected('WaterSample', self.Export(TrimbleGeoDBToDatabase.ExportWaterSampleJoined))
+
+    def test_Monument(self):
+        self.assertExpected('Monument', self.Export(TrimbleGeoDBToDatabase.ExportMonumentJoined))
+
+    def test_Continuous(self):
+        for Name, ContinuousType in [('DeploymentInsert', Continuous.DEPLOYMENT_INSERT),
+                                     ('DeploymentUpdate', Continuous.DEPLOYMENT_UPDATE),
+                                     ('RetrievalUpdate', Continuous.RETRIEVAL_UPDATE)]:
+            with self.subTest(ContinuousType = ContinuousType):
+                self.assertExpected(Name, self.Export(TrimbleGeoDBToDatabase.ExportContinuousJoined, ContinuousType, FROM_DATE, TO_DATE))
+
+class TestChunkedExport(ExportTestCase):
+
+    def ExportChunks(self, **Parameters):
+        """
+        Runs 'ExportDepthJoined' with the chunk limits 'Parameters', and
+        returns the rows of its chunk manifest and the normalized text
+        of each chunk, in order.
+        """
+        ManifestPath = TrimbleGeoDBToDatabase.ExportDepthJoined(RaiseErrors = True, **Parameters)
+
+        self.assertTrue(ManifestPath.endswith('_Chunks.csv'))
+
+        with open(ManifestPath, newline='') as ManifestFile:
+            Rows = list(csv.DictReader(ManifestFile))
+
+        Chunks = []
+
+        for Row in Rows:
+            with open(os.path.join(self.Folder, Row['SqlFileName'])) as Chunk:
+                Chunks.append(NormalizeScript(Chunk.read()))
+
+        self.assertEqual(len(glob.glob(os.path.join(self.Folder, '*.sql'))), len(Rows))
+
+        return Rows, Chunks
+
+    def GetInserts(self, Text):
+        return [Line for Line in Text.splitlines() if 'INSERT INTO' in Line]
+
+    def test_ChunkRows(self):
+        Unchunked = self.Export(TrimbleGeoDBToDatabase.ExportDepthJoined)
+        Rows, Chunks = self.ExportChunks(ChunkRows = 15)
+
+        self.assertEqual([Row['Chunk'] for Row in Rows], ['1', '2', '3'])
+        self.assertEqual([Row['Records'] for Row in Rows], ['15', '15', '10'])
+        self.assertTrue(Rows[0]['SqlFileName'].endswith('_Chunk001.sql'))
+
+        # Each chunk can be run on its own, and together they insert the
+        # records of the unchunked script, in the same order.
+        for Number, Chunk in enumerate(Chunks, 1):
+            self.assertIn('Chunk: ' + str(Number) + ' ', Chunk)
+            self.assertIn('BEGIN TRANSACTION', Chunk)
+            self.assertIn('tblEvents', Chunk)
+
+        self.assertEqual(sum([self.GetInserts(Chunk) for Chunk in Chunks], []), self.GetInserts(Unchunked))
+
+    def test_ChunkBytes(self):
+        # A chunk ends after the record that reaches the limit.
+        Rows, Chunks = self.ExportChunks(ChunkBytes = 3000)
+
+        self.assertGreater(len(Rows), 1)
+        self.assertEqual(sum(int(Row['Records']) for Row in Rows), ROW_COUNT)
+
+        for Row, Chunk in zip(Rows, Chunks):
+            self.assertEqual(len(self.GetInserts(Chunk)), int(Row['Records']))
+
+    def test_NoRecords(self):
+        # An export without records still writes one chunk.
+        Rows, Chunks = self.ExportChunks(ChunkRows = 15, fromDate = '2030-01-01')
+
+        self.assertEqual([Row['Records'] for Row in Rows], ['0'])
+
+    def test_InvalidLimit(self):
+        with self.assertRaises(Exception):
+            TrimbleGeoDBToDatabase.ExportDepthJoined(ChunkRows = 0, RaiseErrors = True)
+
+class TestBulkInsert(ExportTestCase):
+
+    def ExportBulk(self, Function):
+        """
+        Runs an export function with 'Output.BULK_INSERT', and returns
+        the text of its driver script, data file and format file.
+        """
+        SqlFilePath = Function(OutputType = Output.BULK_INSERT, RaiseErrors = True)
+        TargetFilePath = os.path.splitext(SqlFilePath)[0]
+
+        self.assertIn('_BulkInsert_', TargetFilePath)
+
+        Texts = []
+
+        for Extension in ['.sql', '.csv', '.xml']:
+            with open(TargetFilePath + Extension, newline='', encoding='utf-8') as File:
+                Texts.append(File.read())
+
+        return Texts
+
+    def ReadRows(self, DataText):
+        return list(csv.reader(DataText.splitlines(True)))
+
+    def test_Depth(self):
+        Script, Data, Format = self.ExportBulk(TrimbleGeoDBToDatabase.ExportDepthJoined)
+        Rows = self.ReadRows(Data)
+        Columns = Rows[0]
+
+        # A header row and one row per record, with the values of the
+        # INSERT statements of the SQL script, unquoted.
+        self.assertEqual(Columns[:3], ['PONDNAME', 'SAMPLEDATE', 'GPS_TIME'])
+        self.assertEqual(len(Rows), ROW_COUNT + 1)
+        self.assertEqual(Rows[2], ['LAKE001', '2024-06-01', '08:00:07', '64.992664', '-150.113447', '0.6', 'depth 1', 'R00000.ssf',
+                                   '120.1', '0.75', '0.375', 'Synthetic.gdb'])
+
+        # A null is an empty value.
+        self.assertEqual(Rows[1][Columns.index('COMMENTS_DEPTHS')], '')
+        self.assertTrue(Data.endswith('\r\n'))
+
+        self.assertEqual(Format.count('<FIELD '), len(Columns))
+        self.assertIn('NAME="SOURCE"', Format)
+
+        self.assertIn("BULK INSERT #Staging FROM '", Script)
+        self.assertIn("IF (SELECT COUNT(*) FROM #Staging) <> " + str(ROW_COUNT) + "\n", Script)
+        self.assertIn("FROM #Staging s WHERE NOT EXISTS (SELECT PONDNAME FROM tblEvents e", Script)
+        self.assertIn("INSERT INTO tblPondDepths ([PONDNAME], [SAMPLEDATE], [GPS_TIME],", Script)
+        self.assertNotIn('INSERT INTO tblPondDepths(', Script)
+
+    def test_Quoting(self):
+        # A free text value with a comma, a double quote or a line
+        # break is quoted, and its double quotes are doubled.
+        Comment = 'near "the" shore, east\nside'
+        FeatureClass = arcpy.GetFeatureClass('Depth_Joined')
+        Position = FeatureClass.FieldNames.index('Comment')
+        GetRow = FeatureClass.RowFunction
+
+        def GetQuotedRow(i):
+            Row = GetRow(i)
+            return (Row[:Position] + (Comment,) + Row[Position + 1:] if i == 1 else Row)
+
+        FeatureClass.RowFunction = GetQuotedRow
+
+        Script, Data, Format = self.ExportBulk(TrimbleGeoDBToDatabase.ExportDepthJoined)
+        Rows = self.ReadRows(Data)
+
+        self.assertIn('"near ""the"" shore, east\nside"', Data)
+        self.assertEqual(Rows[2][Rows[0].index('COMMENTS_DEPTHS')], Comment)
+        self.assertEqual(len(Rows), ROW_COUNT + 1)
+
+    def test_Loons(self):
+        # Each Event has one tblLoons record.
+        Script, Data, Format = self.ExportBulk(TrimbleGeoDBToDatabase.ExportLoonsJoined)
+
+        self.assertEqual(len(self.ReadRows(Data)), ROW_COUNT + 1)
+        self.assertIn("More than one record belongs to the same Event.", Script)
+        self.assertIn("have a tblLoons record already.", Script)
+
+    def test_Chunks(self):
+        with self.assertRaises(Exception):
+            TrimbleGeoDBToDatabase.ExportDepthJoined(ChunkRows = 10, OutputType = Output.BULK_INSERT, RaiseErrors = True)
+
+class TestSetBasedUpdates(ExportTestCase):
+
+    def ExportUpdates(self, ContinuousType, **Parameters):
+        return self.Export(TrimbleGeoDBToDatabase.ExportContinuousJoined, ContinuousType, FROM_DATE, TO_DATE,
+                           UpdateType = Update.SET_BASED, **Parameters)
+
+    def test_RetrievalUpdate(self):
+        Script = self.ExportUpdates(Continuous.RETRIEVAL_UPDATE)
+
+        # The records are staged in one multi-row INSERT statement, with
+        # the values of the per row UPDATE statements.
+        self.assertIn("SELECT TOP 0 [SiteName], [DateRetrieved], [RetrieveLatitude], ", Script)
+        self.assertIn(" INTO #Updates FROM dbo.tblContinuousDataDeployments\n", Script)
+        self.assertEqual(Script.count('INSERT INTO #Updates'), 1)
+        self.assertEqual(Script.count("('LAKE"), ROW_COUNT)
+        self.assertIn("('LAKE001', '2024-06-01', 64.992664, -150.113447, 'deployment 1')", Script)
+        self.assertNotIn('\nUPDATE dbo.', Script)
+
+        # The duplicate keys roll back the transaction.
+        self.assertIn("DECLARE @StagedKeys INT = (SELECT COUNT(*) FROM (SELECT DISTINCT [SiteName], [DateRetrieved] FROM #Updates) k)", Script)
+        self.assertIn("IF @StagedKeys < (SELECT COUNT(*) FROM #Updates)", Script)
+        self.assertIn("SELECT [SiteName], [DateRetrieved], COUNT(*) AS [RECORDS] FROM #Updates GROUP BY [SiteName], [DateRetrieved] HAVING COUNT(*) > 1",
+                      Script)
+
+        # One UPDATE ... FROM join on the key, without the notes.
+        self.assertEqual(Script.count('UPDATE t\n'), 1)
+        self.assertIn("    SET t.[RetrieveLatitude] = s.[RetrieveLatitude],\n        t.[RetrieveLongitude] = s.[RetrieveLongitude]\n"
+                      "    --  t.[RetrievalNotes] = s.[RetrievalNotes]\n"
+                      "    FROM dbo.tblContinuousDataDeployments t\n"
+                      "    INNER JOIN #Updates s ON t.[SiteName] = s.[SiteName] AND t.[DateRetrieved] = s.[DateRetrieved]\n", Script)
+        self.assertIn("WHERE NOT EXISTS (SELECT 1 FROM dbo.tblContinuousDataDeployments t WHERE", Script)
+
+    def test_KeepUpdateNotes(self):
+        Script = self.ExportUpdates(Continuous.DEPLOYMENT_UPDATE, KeepUpdateNotes = True)
+
+        self.assertIn("INNER JOIN #Updates s ON t.[SiteName] = s.[SiteName] AND t.[DateDeployed] = s.[DateDeployed]", Script)
+        self.assertIn("t.[DeploymentNotes] = s.[DeploymentNotes]\n    FROM ", Script)
+        self.assertNotIn("--  t.[", Script)
+
+    def test_PerRowIsDefault(self):
+        self.assertEqual(self.Export(TrimbleGeoDBToDatabase.ExportContinuousJoined, Continuous.RETRIEVAL_UPDATE, FROM_DATE, TO_DATE),
+                         self.Export(TrimbleGeoDBToDatabase.ExportContinuousJoined, Continuous.RETRIEVAL_UPDATE, FROM_DATE, TO_DATE,
+                                     UpdateType = Update.PER_ROW))
+
+class TestSetBasedSecchi(ExportTestCase):
+
+    def ExportSecchi(self, **Parameters):
+        return self.Export(TrimbleGeoDBToDatabase.ExportSecchiJoined, UpdateType = Update.SET_BASED, **Parameters)
+
+    def test_Updates(self):
+        Script = self.ExportSecchi()
+
+        # The records are staged from one 'VALUES' set, with the values
+        # of the per row statements, and the last one has no comma.
+        self.assertIn("    SELECT TOP 0 [PONDNAME], [SAMPLEDATE], [SECCHIDEPTH], [SECCHIONBOTTOM], [SECCHINOTES] INTO #SecchiUpdates FROM tblEvents\n",
+                      Script)
+        self.assertEqual(Script.count('INSERT INTO #SecchiUpdates'), 1)
+        self.assertEqual(Script.count("\n        ('LAKE"), ROW_COUNT)
+        self.assertIn("\n        ('LAKE001','2024-06-01',0.8,0,'secchi 1'),\n", Script)
+        self.assertIn(")\n    ) AS v([PONDNAME], [SAMPLEDATE], [SECCHIDEPTH], [SECCHIONBOTTOM], [SECCHINOTES])\n", Script)
+        self.assertIn("    -- " + str(ROW_COUNT) + " records.\n", Script)
+
+        # No Event is updated if one has more than one record.
+        self.assertIn("IF @StagedKeys < (SELECT COUNT(*) FROM #SecchiUpdates)", Script)
+        self.assertIn("GROUP BY [PONDNAME], [SAMPLEDATE] HAVING COUNT(*) > 1", Script)
+
+        # One UPDATE ... FROM join on the key replaces the IF EXISTS
+        # block of each record, and one query lists the missing Events.
+        self.assertNotIn('IF EXISTS (SELECT  PONDNAME', Script)
+        self.assertEqual(Script.count('UPDATE t\n'), 1)
+        self.assertIn("        SET t.[SECCHIDEPTH] = s.[SECCHIDEPTH],\n", Script)
+        self.assertIn("        INNER JOIN #SecchiUpdates s ON t.[PONDNAME] = s.[PONDNAME] AND t.[SAMPLEDATE] = s.[SAMPLEDATE]\n", Script)
+        self.assertIn("            SELECT s.[PONDNAME], s.[SAMPLEDATE] FROM #SecchiUpdates s WHERE NOT EXISTS (SELECT 1 FROM tblEvents t WHERE", Script)
+
+        # The diagnostics and the INSERT of the missing Events are
+        # commented out.
+        self.assertIn("    -- SELECT s.[PONDNAME], ", Script)
+        self.assertIn("    -- INSERT INTO tblEvents([PONDNAME], [SAMPLEDATE], ", Script)
+
+    def test_NoRecords(self):
+        # An empty 'VALUES' set is not valid SQL.
+        Script = self.ExportSecchi(fromDate = '2030-01-01')
+
+        self.assertNotIn('INSERT INTO #SecchiUpdates', Script)
+        self.assertNotIn(' AS v(', Script)
+        self.assertIn("    -- 0 records.\n", Script)
+
+    def test_PerRowIsDefault(self):
+        self.assertEqual(self.Export(TrimbleGeoDBToDatabase.ExportSecchiJoined),
+                         self.Export(TrimbleGeoDBToDatabase.ExportSecchiJoined, UpdateType = Update.PER_ROW))
+
+class TestUniformLayout(ExportTestCase):
+
+    def test_InsertStatements(self):
+        # With Layout.UNIFORM, every table has the INSERT statements and
+        # validation query of the Depth script, with its own indent.
+        Depth = self.Export(TrimbleGeoDBToDatabase.ExportDepthJoined, LayoutType = Layout.UNIFORM)
+
+        self.assertIn("      INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,", Depth)
+
+        Water = self.Export(TrimbleGeoDBToDatabase.ExportWaterSampleJoined, LayoutType = Layout.UNIFORM)
+
+        self.assertIn("\nINSERT INTO tblWaterSamples(PONDNAME,SAMPLEDATE,", Water)
+        self.assertIn("-- (PONDNAME = 'LAKE001' And SAMPLEDATE = '2024-06-01' And SAMPLENUMBER = 'B') Or", Water)
+        self.assertNotIn('[', Water)
+
+        Deployment = self.Export(TrimbleGeoDBToDatabase.ExportContinuousJoined, Continuous.DEPLOYMENT_INSERT, FROM_DATE, TO_DATE,
+                                 LayoutType = Layout.UNIFORM)
+
+        self.assertNotIn('INSERT INTO dbo.', Deployment)
+        self.assertNotIn('] ,[', Deployment)
+
+    def test_TableLayoutIsDefault(self):
+        self.assertEqual(self.Export(TrimbleGeoDBToDatabase.ExportMonumentJoined),
+                         self.Export(TrimbleGeoDBToDatabase.ExportMonumentJoined, LayoutType = Layout.TABLE))
+
+if __name__ == '__main__':
+    unittest.main()
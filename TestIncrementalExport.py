@@ -0,0 +1,99 @@
+# TestIncrementalExport.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the incremental exports of 'TrimbleGeoDBToDatabase'
+# (the 'Incremental' parameter) and their manifests (see
+# 'TrimbleUtility.MarkExportApplied'), with the synthetic feature
+# classes and the 'arcpy' stand-in of the benchmarks (see
+# 'Benchmark/SyntheticGeoDB.py') instead of ArcGIS.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestIncrementalExport
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import arcpy
+import SyntheticGeoDB
+import TrimbleGeoDBToDatabase
+import TrimbleUtility
+
+class TestIncrementalExport(unittest.TestCase):
+
+    def setUp(self):
+        self.Folder = tempfile.mkdtemp()
+        SyntheticGeoDB.CreateSyntheticGeoDB(40)
+        arcpy.env.workspace = os.path.join(self.Folder, 'Synthetic.gdb')
+        del arcpy.MESSAGES[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.Folder)
+
+    def Export(self):
+        """
+        Runs an incremental Depth_Joined export, and returns the path of
+        its script and the number of records it inserts. The script is
+        renamed, as two exports in the same second have the same file
+        name.
+        """
+        SqlFilePath = TrimbleGeoDBToDatabase.ExportDepthJoined(Incremental = True, RaiseErrors = True)
+
+        with open(SqlFilePath) as SqlFile:
+            Count = SqlFile.read().count('INSERT INTO tblPondDepths')
+
+        NewPath = SqlFilePath[:-len('.sql')] + '_' + str(len(os.listdir(self.Folder))) + '.sql'
+
+        os.replace(SqlFilePath, NewPath)
+        os.replace(TrimbleUtility.GetPendingManifestPath(SqlFilePath), TrimbleUtility.GetPendingManifestPath(NewPath))
+
+        return (NewPath, Count)
+
+    def test_MarkExportApplied(self):
+        FirstPath, Count = self.Export()
+
+        self.assertEqual(Count, 40)
+
+        # The rows are not recorded until the export is applied, so the
+        # next export writes them again.
+        SecondPath, Count = self.Export()
+
+        self.assertEqual(Count, 40)
+
+        ManifestPath = TrimbleUtility.MarkExportApplied(FirstPath)
+
+        self.assertTrue(os.path.exists(ManifestPath))
+        self.assertFalse(os.path.exists(TrimbleUtility.GetPendingManifestPath(FirstPath)))
+        self.assertEqual(self.Export()[1], 0)
+
+        # Only the new rows are written; row 49 has no creation
+        # datetime.
+        SyntheticGeoDB.CreateSyntheticGeoDB(60)
+
+        self.assertEqual(self.Export()[1], 19)
+
+        # The older export can still be applied; it adds no rows.
+        TrimbleUtility.MarkExportApplied(SecondPath)
+
+        self.assertEqual(len(TrimbleUtility.ReadExportManifest(os.path.join(self.Folder, 'Synthetic.gdb'), 'Depth_Joined', 'tblPondDepths')), 40)
+
+    def test_NoPendingManifest(self):
+        SqlFilePath = TrimbleGeoDBToDatabase.ExportDepthJoined(RaiseErrors = True)
+
+        with self.assertRaises(Exception):
+            TrimbleUtility.MarkExportApplied(SqlFilePath)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+# TestMonumentIndex.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the monument KD-tree (see 'MonumentIndex') against
+# a brute force search of synthetic point sets, and that a saved index
+# (see 'TableUtility.LoadMonumentIndex') is loaded the same. It needs
+# NumPy (as 'MonumentIndex' does); the tests are skipped without it.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestMonumentIndex
+
+import datetime
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import MonumentIndex
+except ImportError:
+    MonumentIndex = None
+
+def GetBruteForceNearest(Points, X, Y):
+    """
+    The (position, distance) of the closest point, the first one of
+    the points at the same distance.
+    """
+    Best = None
+    BestDistance2 = math.inf
+
+    for i, (PointX, PointY) in enumerate(Points):
+        Distance2 = (PointX - X) ** 2 + (PointY - Y) ** 2
+
+        if Distance2 < BestDistance2:
+            Best = i
+            BestDistance2 = Distance2
+
+    return (Best, math.sqrt(BestDistance2))
+
+@unittest.skipIf(MonumentIndex is None, "NumPy is not installed.")
+class TestMonumentIndex(unittest.TestCase):
+
+    def test_NearestIsTheBruteForceNearest(self):
+        Random = random.Random(7)
+
+        for PointCount in (1, 2, 3, 10, 257):
+            Points = [(Random.uniform(-150.5, -149.5), Random.uniform(64.5, 65.5)) for i in range(PointCount)]
+            Index = MonumentIndex.MonumentIndex(Points)
+
+            for i in range(200):
+                X = Random.uniform(-151.0, -149.0)
+                Y = Random.uniform(64.0, 66.0)
+
+                self.assertEqual(Index.Nearest(X, Y), GetBruteForceNearest(Points, X, Y))
+
+    def test_NearestOnGridIsTheBruteForceNearest(self):
+        # The points of a grid are often at the same distance.
+        Points = [(float(X), float(Y)) for X in range(6) for Y in range(6)]
+        Index = MonumentIndex.MonumentIndex(Points)
+
+        for X in range(-2, 14):
+            for Y in range(-2, 14):
+                self.assertEqual(Index.Nearest(X / 2.0, Y / 2.0), GetBruteForceNearest(Points, X / 2.0, Y / 2.0))
+
+    def test_TiesGoToTheFirstPoint(self):
+        Points = [(1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0)]
+
+        self.assertEqual(MonumentIndex.MonumentIndex(Points).Nearest(0.0, 0.0), (0, 1.0))
+        self.assertEqual(MonumentIndex.MonumentIndex(list(reversed(Points))).Nearest(0.0, 0.0), (0, 1.0))
+
+        # The same point twice.
+        Points = [(5.0, 5.0), (2.0, 2.0), (2.0, 2.0)]
+
+        self.assertEqual(MonumentIndex.MonumentIndex(Points).Nearest(2.0, 2.0), (1, 0.0))
+
+    def test_EmptyIndex(self):
+        Index = MonumentIndex.MonumentIndex([])
+
+        self.assertEqual(len(Index), 0)
+        self.assertEqual(Index.Nearest(1.0, 2.0), (None, None))
+        self.assertEqual(Index.Closest((1.0, 2.0)), (None, None))
+
+    def test_PointWithoutGeometry(self):
+        Index = MonumentIndex.MonumentIndex([(0.0, 0.0), (3.0, 4.0)], [('LAKE1',), ('LAKE2',)], ['LakeNum'])
+
+        self.assertEqual(list(Index.Join([None, (3.0, 3.0), (0.0, 1.0)])),
+                         [(None, None), (('LAKE2',), 1.0), (('LAKE1',), 1.0)])
+
+    def test_AttributesNotTheSameLength(self):
+        with self.assertRaises(Exception):
+            MonumentIndex.MonumentIndex([(0.0, 0.0)], [('LAKE1',), ('LAKE2',)])
+
+class TestMonumentIndexFile(unittest.TestCase):
+
+    def setUp(self):
+        if MonumentIndex is None:
+            self.skipTest("NumPy is not installed.")
+
+        self.Folder = tempfile.mkdtemp(prefix='TestMonumentIndex_')
+
+    def tearDown(self):
+        shutil.rmtree(self.Folder, ignore_errors=True)
+
+    def test_SaveAndLoad(self):
+        Random = random.Random(11)
+        Points = [(Random.uniform(0.0, 100.0), Random.uniform(0.0, 100.0)) for i in range(50)]
+        Attributes = [('LAKE' + str(i).zfill(3),
+                       (None if i % 7 == 0 else i),
+                       (None if i % 5 == 0 else i * 0.25),
+                       (None if i % 3 == 0 else datetime.datetime(2024, 6, 1, 8, 0, 0) + datetime.timedelta(hours=i)),
+                       (None if i % 4 == 0 else 'Rebar'))
+                      for i in range(50)]
+        FieldNames = ['LakeNum', 'Number', 'Height', 'Installed', 'MonType']
+
+        Index = MonumentIndex.MonumentIndex(Points, Attributes, FieldNames, 'Key1')
+        IndexPath = os.path.join(self.Folder, 'Monuments.npz')
+        Index.Save(IndexPath)
+
+        Loaded = MonumentIndex.MonumentIndex.Load(IndexPath)
+
+        self.assertEqual(list(zip(Loaded.Xs, Loaded.Ys)), list(zip(Index.Xs, Index.Ys)))
+        self.assertEqual(Loaded.Order, Index.Order)
+        self.assertEqual(Loaded.FieldNames, FieldNames)
+        self.assertEqual(Loaded.Key, 'Key1')
+        self.assertEqual(Loaded.Attributes, Attributes)
+
+        for i in range(100):
+            X = Random.uniform(-10.0, 110.0)
+            Y = Random.uniform(-10.0, 110.0)
+
+            self.assertEqual(Loaded.Closest((X, Y)), Index.Closest((X, Y)))
+
+        # Only the index file is left; the temporary file it was
+        # written to was renamed.
+        self.assertEqual(os.listdir(self.Folder), ['Monuments.npz'])
+
+    def test_SaveAndLoadWithoutAttributes(self):
+        Index = MonumentIndex.MonumentIndex([(1.0, 1.0), (2.0, 2.0)])
+        IndexPath = os.path.join(self.Folder, 'Monuments.npz')
+        Index.Save(IndexPath)
+
+        Loaded = MonumentIndex.MonumentIndex.Load(IndexPath)
+
+        self.assertEqual(Loaded.Key, '')
+        self.assertEqual(Loaded.Nearest(1.9, 1.9), Index.Nearest(1.9, 1.9))
+
+    def test_SaveAndLoadEmptyIndex(self):
+        IndexPath = os.path.join(self.Folder, 'Monuments.npz')
+        MonumentIndex.MonumentIndex([], [], ['LakeNum']).Save(IndexPath)
+
+        Loaded = MonumentIndex.MonumentIndex.Load(IndexPath)
+
+        self.assertEqual(len(Loaded), 0)
+        self.assertEqual(Loaded.Closest((0.0, 0.0)), (None, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# TestRunMetrics.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the run metrics (see 'RunMetrics'), and the metrics
+# file of an export, with the synthetic feature classes and the 'arcpy'
+# stand-in of the benchmarks (see 'Benchmark/SyntheticGeoDB.py')
+# instead of ArcGIS.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestRunMetrics
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import arcpy
+import RunMetrics
+import SyntheticGeoDB
+import TrimbleGeoDBToDatabase
+
+class TestRunMetrics(unittest.TestCase):
+
+    def test_Stages(self):
+        Metrics = RunMetrics.RunMetrics('Test')
+
+        Metrics.StartStage('Read')
+        self.assertEqual(sum(1 for Row in Metrics.CountRows(range(25))), 25)
+        Metrics.AddRowsEmitted(20)
+
+        Metrics.StartStage('Write')
+        Metrics.SetBytesWritten(1000)
+
+        Report = Metrics.Finish()
+
+        self.assertEqual(Report['Name'], 'Test')
+        self.assertEqual([Stage['Stage'] for Stage in Report['Stages']], ['Read', 'Write'])
+
+        Read, Write = Report['Stages']
+
+        self.assertEqual((Read['RowsRead'], Read['RowsSkipped'], Read['RowsEmitted']), (25, 5, 20))
+        self.assertEqual((Write['RowsRead'], Write['RowsSkipped'], Write['BytesWritten']), (0, 0, 1000))
+
+        # Every stage is stopped, and the run takes at least as long as
+        # its stages.
+        self.assertTrue(all(Stage['Seconds'] is not None for Stage in Report['Stages']))
+        self.assertGreaterEqual(Report['Seconds'], Read['Seconds'] + Write['Seconds'])
+
+    def test_CountRowsStopped(self):
+        # The rows read are counted even if the reader stops early.
+        Metrics = RunMetrics.RunMetrics('Test')
+        Metrics.StartStage('Read')
+
+        for i, Row in enumerate(Metrics.CountRows(range(100))):
+            if i == 9:
+                break
+
+        self.assertEqual(Metrics.Finish()['Stages'][0]['RowsRead'], 10)
+
+    def test_GetMetricsPath(self):
+        self.assertEqual(RunMetrics.GetMetricsPath('C:/Data/fake.gdb_Depth_Joined_Insert_2026.sql'),
+                         'C:/Data/fake.gdb_Depth_Joined_Insert_2026_Metrics.json')
+
+class TestExportMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.Folder = tempfile.mkdtemp()
+        SyntheticGeoDB.CreateSyntheticGeoDB(50)
+        arcpy.env.workspace = os.path.join(self.Folder, 'Synthetic.gdb')
+
+    def tearDown(self):
+        shutil.rmtree(self.Folder)
+
+    def test_WriteMetrics(self):
+        SqlFilePath = TrimbleGeoDBToDatabase.ExportDepthJoined(WriteMetrics = True, RaiseErrors = True)
+
+        with open(RunMetrics.GetMetricsPath(SqlFilePath)) as MetricsFile:
+            Report = json.load(MetricsFile)
+
+        self.assertEqual(Report['Name'], 'Depth_Joined')
+
+        Stages = {Stage['Stage']: Stage for Stage in Report['Stages']}
+
+        # Row 49 has no creation datetime, so is skipped.
+        self.assertEqual((Stages['Export']['RowsRead'], Stages['Export']['RowsSkipped'], Stages['Export']['RowsEmitted']), (50, 1, 49))
+        self.assertEqual(Stages['Assemble']['BytesWritten'], os.path.getsize(SqlFilePath))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+# TestSQLWriter.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the sectioned writer of the SQL scripts (see
+# 'SQLWriter'): the order of the sections, the trimming of the last
+# separator of a section, the sections that are spooled to disk, and
+# the multi-row INSERT statements of 'InsertBatcher'.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestSQLWriter
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import SQLWriter
+
+class TestSQLScriptWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.Folder = tempfile.mkdtemp()
+        self.SqlFilePath = os.path.join(self.Folder, 'Test.sql')
+
+    def tearDown(self):
+        shutil.rmtree(self.Folder)
+
+    def ReadScript(self):
+        with open(self.SqlFilePath) as SqlFile:
+            return SqlFile.read()
+
+    def test_SectionOrder(self):
+        # The sections are assembled in the order they were added, not
+        # the order they were written to.
+        with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+            Header = SqlFile.AddSection()
+            Body = SqlFile.AddSection()
+            Footer = SqlFile.AddSection()
+
+            Footer.write('-- Footer\n')
+            Body.write('-- Body 1\n')
+            Header.write('-- Header\n')
+            Body.write('-- Body 2\n')
+
+        self.assertEqual(self.ReadScript(), '-- Header\n-- Body 1\n-- Body 2\n-- Footer\n')
+
+    def test_TrimEnd(self):
+        with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+            Check = SqlFile.AddSection(TrimEnd = len(' And \n'))
+
+            for Lake in ['LAKE001', 'LAKE002', 'LAKE003']:
+                Check.write("EXISTS (" + Lake + ") And \n")
+
+            SqlFile.AddSection().write('\n')
+
+        self.assertEqual(self.ReadScript(), "EXISTS (LAKE001) And \nEXISTS (LAKE002) And \nEXISTS (LAKE003)\n")
+
+    def test_TrimEndLongerThanWrites(self):
+        # The trimmed characters may span several writes.
+        with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+            Section = SqlFile.AddSection(TrimEnd = 4)
+
+            for Text in ['a', 'b', ' ', 'O', 'r', '\n']:
+                Section.write(Text)
+
+        self.assertEqual(self.ReadScript(), 'ab')
+
+    def test_EmptySectionTrimEnd(self):
+        with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+            SqlFile.AddSection().write('BEGIN\n')
+            SqlFile.AddSection(TrimEnd = 4)
+            SqlFile.AddSection().write('END\n')
+
+        self.assertEqual(self.ReadScript(), 'BEGIN\nEND\n')
+
+    def test_SpooledSection(self):
+        # A section larger than 'SPOOL_MAX_SIZE' is rolled over to disk.
+        Line = "INSERT INTO tblPondDepths VALUES('LAKE001');\n"
+        Count = SQLWriter.SPOOL_MAX_SIZE // len(Line) + 10
+
+        with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+            Section = SqlFile.AddSection(TrimEnd = 1)
+
+            for i in range(Count):
+                Section.write(Line)
+
+            self.assertTrue(Section.File._rolled)
+
+        self.assertEqual(self.ReadScript(), (Line * Count)[:-1])
+
+    def test_ReplacesScript(self):
+        # A script of the same name is replaced, not appended to.
+        for Text in ['-- First\n', '-- Second\n']:
+            with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+                SqlFile.AddSection().write(Text)
+
+        self.assertEqual(self.ReadScript(), '-- Second\n')
+
+    def test_GetSize(self):
+        # The size includes the characters that are trimmed at the end.
+        with SQLWriter.SQLScriptWriter(self.SqlFilePath) as SqlFile:
+            SqlFile.AddSection().write('BEGIN\n')
+            SqlFile.AddSection(TrimEnd = 4).write('a Or\n')
+
+            self.assertEqual(SqlFile.GetSize(), 11)
+
+class TestInsertBatcher(unittest.TestCase):
+
+    def Write(self, Head, Rows, BatchSize):
+        Section = SQLWriter.SQLSection()
+        Batcher = SQLWriter.InsertBatcher(Section, Head, ");\n", BatchSize)
+
+        for Values in Rows:
+            Batcher.Add(Values)
+
+        Batcher.Flush()
+
+        return Section
+
+    def Read(self, Section):
+        Section.File.seek(0)
+        Text = Section.File.read()
+        Section.File.close()
+
+        return Text
+
+    def test_OneRowPerStatement(self):
+        # The default is one statement per row, exactly as Head + Values
+        # + Close.
+        Section = self.Write("      INSERT INTO tblLoons(PONDNAME) VALUES(", ["'LAKE001'", "'LAKE002'"], 1)
+
+        self.assertEqual(self.Read(Section), "      INSERT INTO tblLoons(PONDNAME) VALUES('LAKE001');\n"
+                                             "      INSERT INTO tblLoons(PONDNAME) VALUES('LAKE002');\n")
+
+    def test_Batches(self):
+        Rows = ["'LAKE00" + str(i) + "'" for i in range(5)]
+        Section = self.Write("  INSERT INTO tblLoons(PONDNAME) VALUES(", Rows, 2)
+
+        self.assertEqual(self.Read(Section), "  INSERT INTO tblLoons(PONDNAME) VALUES('LAKE000'),\n"
+                                             "      ('LAKE001');\n"
+                                             "  INSERT INTO tblLoons(PONDNAME) VALUES('LAKE002'),\n"
+                                             "      ('LAKE003');\n"
+                                             "  INSERT INTO tblLoons(PONDNAME) VALUES('LAKE004');\n")
+
+    def test_MultiLineHead(self):
+        # The rows after the first are indented past the start of the
+        # last line of the head.
+        Section = self.Write("INSERT INTO dbo.tblTest\n([PONDNAME])\n  VALUES (", ["'LAKE001'", "'LAKE002'"], 10)
+
+        self.assertEqual(self.Read(Section), "INSERT INTO dbo.tblTest\n([PONDNAME])\n  VALUES ('LAKE001'),\n      ('LAKE002');\n")
+
+    def test_Flush(self):
+        # A full last batch is already closed, and nothing is written
+        # for no rows.
+        self.assertEqual(self.Read(self.Write("VALUES(", ["1", "2"], 2)), "VALUES(1),\n    (2);\n")
+        self.assertEqual(self.Read(self.Write("VALUES(", [], 2)), "")
+
+    def test_BatchSizeCapped(self):
+        Rows = [str(i) for i in range(SQLWriter.MAX_INSERT_ROWS + 1)]
+        Text = self.Read(self.Write("VALUES(", Rows, 5000))
+
+        self.assertEqual(Text.count(';'), 2)
+        self.assertEqual(SQLWriter.InsertBatcher(None, "VALUES(", ");\n", 0).BatchSize, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# TestTableSpec.py
+
+# WRITTEN BY: Nick Bywater
+# CREATED FOR: National Park Service; the CAKN and the ARCN
+# CREATED ON: 2026-October
+# LICENSE: Public Domain
+#
+# PURPOSE:
+# This script tests the row formatters that 'TableSpec.CompileFormatter'
+# compiles from the columns of a table spec, and the 'ScriptLayout' of a
+# spec, on hand-made rows. 'TrimbleUtility' imports 'arcpy', so the
+# 'arcpy' stand-in of the benchmarks (see 'Benchmark/arcpy.py') is used
+# instead of ArcGIS.
+#
+# Usage (from the repository folder):
+#
+# python -m unittest TestTableSpec
+
+import datetime
+import os
+import sys
+import unittest
+
+# The 'arcpy' stand-in must be found before any installed 'arcpy'.
+REPOSITORY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(REPOSITORY_FOLDER, 'Benchmark'), REPOSITORY_FOLDER]
+
+import TableSpec
+from TableSpec import Column, ScriptLayout
+
+COLUMNS = [Column('PONDNAME', 'PondName'),
+           Column('SAMPLEDATE', 'SampleDate'),
+           Column('LATITUDE', 'Latitude', 'Number'),
+           Column('DEPTH', 'Depth', 'Number', Digits = 1),
+           Column('ARRIVED', 'Arrived', 'Time'),
+           Column('COMMENTS', 'Comment', Strip = True, BlankIsNull = True),
+           Column('VEG_TYPE', 'On_Water_', Values = {'Yes': 'WATER'}),
+           Column('SAMPLER', Value = 'Crew A'),
+           Column('SOURCE', Type = 'Source')]
+
+NORMAL = {'PondName': 'LAKE001', 'SampleDate': '2024-06-01', 'SampleTime': '08:00:07', 'Latitude': '64.992664',
+          'Longitude': '-150.113447'}
+
+ROW = {'Depth': 1.25, 'Arrived': datetime.datetime(2024, 6, 1, 8, 30, 5), 'Comment': '  near shore ', 'On_Water_': 'Yes'}
+
+NULL_ROW = {'Depth': None, 'Arrived': None, 'Comment': '   ', 'On_Water_': 'No'}
+
+class TestCompileFormatter(unittest.TestCase):
+
+    def test_Values(self):
+        Format = TableSpec.CompileFormatter(COLUMNS, 'Lakes.gdb')
+
+        self.assertEqual(Format(ROW, NORMAL),
+                         "'LAKE001','2024-06-01',64.992664,1.2,'08:30:05','near shore','WATER','Crew A','Lakes.gdb'")
+
+    def test_Nulls(self):
+        Format = TableSpec.CompileFormatter(COLUMNS, 'Lakes.gdb')
+
+        self.assertEqual(Format(NULL_ROW, NORMAL),
+                         "'LAKE001','2024-06-01',64.992664,NULL,NULL,NULL,NULL,'Crew A','Lakes.gdb'")
+
+    def test_MergedSource(self):
+        # A merged row names its own source geodatabase.
+        Format = TableSpec.CompileFormatter(COLUMNS, 'Batch_Merged.gdb')
+
+        self.assertTrue(Format(ROW, dict(NORMAL, SourceFileName = 'Lakes_2024.gdb')).endswith(",'Lakes_2024.gdb'"))
+
+    def test_Assignments(self):
+        Format = TableSpec.CompileFormatter(COLUMNS[2:4], Separator = ', ', Assignments = True)
+
+        self.assertEqual(Format(ROW, NORMAL), "LATITUDE = 64.992664, DEPTH = 1.2")
+
+    def test_DataValues(self):
+        Format = TableSpec.CompileFormatter(COLUMNS, 'Lakes.gdb', DataValues = True)
+
+        self.assertEqual(Format(ROW, NORMAL),
+                         ['LAKE001', '2024-06-01', '64.992664', '1.2', '08:30:05', 'near shore', 'WATER', 'Crew A', 'Lakes.gdb'])
+        self.assertEqual(Format(NULL_ROW, NORMAL),
+                         ['LAKE001', '2024-06-01', '64.992664', None, None, None, None, 'Crew A', 'Lakes.gdb'])
+
+    def test_Parameters(self):
+        Format = TableSpec.CompileFormatter(COLUMNS, 'Lakes.gdb', Parameters = True)
+
+        self.assertEqual(Format(ROW, NORMAL),
+                         ('LAKE001', '2024-06-01', 64.992664, 1.2, '08:30:05', 'near shore', 'WATER', 'Crew A', 'Lakes.gdb'))
+
+    def test_Source(self):
+        Format = TableSpec.CompileFormatter(COLUMNS[:2], Name = 'FormatKey')
+
+        self.assertTrue(Format.Source.startswith('def FormatKey(Row, Normal):\n'))
+
+class TestScriptLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.Spec = TableSpec.TableSpec('Test_Joined', 'tblTest', COLUMNS[:4], ['PONDNAME', 'SAMPLEDATE', 'LATITUDE'])
+
+    def test_Default(self):
+        Layout = self.Spec.Layout
+
+        self.assertEqual(Layout.GetInsert(self.Spec), "      INSERT INTO tblTest(PONDNAME,SAMPLEDATE,LATITUDE,DEPTH) VALUES(")
+        self.assertEqual(Layout.GetSelect(self.Spec), "SELECT PONDNAME,SAMPLEDATE,LATITUDE,DEPTH FROM tblTest")
+
+        # The numbers are not quoted.
+        self.assertEqual(Layout.GetCondition(self.Spec), "PONDNAME = '{0}' And SAMPLEDATE = '{1}' And LATITUDE = {2}")
+
+    def test_Uniform(self):
+        Layout = ScriptLayout(Insert = 'INSERT INTO dbo.{Table} ([{Columns}]) VALUES (', ColumnSeparator = '], [', Indent = '',
+                              Condition = "PondName='{0}'", Database = 'AK_ShallowLakes')
+
+        self.assertEqual(Layout.GetInsert(self.Spec), "INSERT INTO dbo.tblTest ([PONDNAME], [SAMPLEDATE], [LATITUDE], [DEPTH]) VALUES (")
+        self.assertEqual(Layout.GetCondition(self.Spec), "PondName='{0}'")
+
+        Uniform = Layout.GetUniform()
+
+        self.assertEqual(Uniform.GetInsert(self.Spec), "INSERT INTO tblTest(PONDNAME,SAMPLEDATE,LATITUDE,DEPTH) VALUES(")
+        self.assertEqual(Uniform.GetCondition(self.Spec), self.Spec.Layout.GetCondition(self.Spec))
+        self.assertEqual(Uniform.Database, 'AK_ShallowLakes')
+
+if __name__ == '__main__':
+    unittest.main()
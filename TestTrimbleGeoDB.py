@@ -40,8 +40,11 @@ def FindDuplicatePrimaryKeys(FeatureClassName):
     return FilterDuplicates(d)
 
 def GetPrimaryKeys(FeatureClassName):
+    # Read only the fields that make up the primary key.
+    FieldNames = TrimbleUtility.GetRowKeyFieldNames(FeatureClassName)
+
     d = {}
-    for Row in TrimbleUtility.GetFeatureClassRows(FeatureClassName):
+    for Row in TrimbleUtility.IterFeatureClassRows(FeatureClassName, FieldNames):
         PySampleDateTime = Row['CreationDateTimeLocal']
 
         # A record without a creation datetime is not a valid record.
@@ -49,32 +52,7 @@ def GetPrimaryKeys(FeatureClassName):
         if PySampleDateTime is None:
             continue
 
-        PondName = str(Row['LakeNum'])
-        SampleDate = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-
-
-        if FeatureClassName == 'Water_Sample_Joined':
-            SampleNumber = str(Row['Sample_Number__A__B__C_'])
-
-            if SampleNumber.strip() == '':
-                SampleNumber = 'A'
-
-        if FeatureClassName == 'Depth_Joined':
-            GPS_Time = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
-
-        if FeatureClassName == 'Water_Sample_Joined':
-            RowKey = PondName + SampleDate + SampleNumber
-        elif FeatureClassName == 'Depth_Joined':
-            RowKey = PondName + SampleDate + GPS_Time
-        else:
-            RowKey = PondName + SampleDate
-
-        RowKey = RowKey.upper()
-
-        if RowKey in d:
-            d[RowKey] += 1
-        else:
-            d[RowKey] = 1
+        TrimbleUtility.UpdateKeyCounts(d, FeatureClassName, Row)
 
     return d
 
@@ -17,17 +17,225 @@ import arcpy
 import getpass
 import datetime
 import os
+import time
+import concurrent.futures
 import csv
+import textwrap
 import TrimbleUtility
+import SQLWriter
+import DatabaseLoader
+import RunMetrics
+import TableSpec
 
 from enum import Enum
+from TableSpec import Column
 
 class Continuous(Enum):
     DEPLOYMENT_INSERT = 1
     DEPLOYMENT_UPDATE = 2
     RETRIEVAL_UPDATE = 3
 
-def ExportSecchiJoined():
+class ParentCheck(Enum):
+    PER_ROW = 1
+    SET_BASED = 2
+
+class DuplicateCheck(Enum):
+    NONE = 1
+    REPORT = 2
+    SKIP = 3
+
+class Output(Enum):
+    SQL_SCRIPT = 1
+    BULK_INSERT = 2
+
+class Update(Enum):
+    PER_ROW = 1
+    SET_BASED = 2
+
+class Layout(Enum):
+    TABLE = 1
+    UNIFORM = 2
+
+# The fields that each export function reads from its '_Joined'
+# feature class. Only these fields are requested from the cursor, so
+# the SHAPE and the unused fields are never read.
+SECCHI_JOINED_FIELDS = ['CreationDateTimeLocal', 'LakeNum',
+                        'Secchi_Depth_in_meters', 'OnBottom', 'Comments']
+
+DEPTH_JOINED_FIELDS = ['CreationDateTimeLocal', 'LakeNum',
+                       'YCurrentMapCS', 'XCurrentMapCS', 'Depth_in_meters', 'Comment',
+                       'GNSS_Heigh', 'Vert_Prec', 'Horz_Prec', 'Datafile']
+
+LOONS_JOINED_FIELDS = ['CreationDateTimeLocal', 'LakeNum',
+                       'Loon_Species', 'a___of_Adults', 'a___of_Young', 'On_Water_',
+                       'Identification_Method', 'YCurrentMapCS', 'XCurrentMapCS', 'Loon_Comments']
+
+WATER_SAMPLE_JOINED_FIELDS = ['CreationDateTimeLocal', 'LakeNum',
+                              'Sample_Number__A__B__C_', 'Depth_in_meters', 'Comment',
+                              'Water_Bottles_Collected_']
+
+MONUMENT_JOINED_FIELDS = ['CreationDateTimeLocal', 'LakeNum',
+                          'YCurrentMapCS', 'XCurrentMapCS', 'FeatureHeight',
+                          'MonType', 'Location', 'Comment', 'AccessType',
+                          'DeviceType', 'CorrStatus', 'HorizEstAcc', 'VertEstAcc']
+
+CONTINUOUS_JOINED_FIELDS = ['CreationDateTimeLocal', 'LakeNum',
+                            'Deployment_Type', 'YCurrentMapCS', 'XCurrentMapCS', 'Comments']
+
+# The tables that each export function writes (see 'TableSpec'). The
+# fields read are the '_JOINED_FIELDS' above, so the rows, and their
+# hashes in the incremental export manifests, are the same.
+# The 'Layout' of each spec is the form of the INSERT statements and
+# validation query that its export function has always written (see
+# the 'Layout' enumeration).
+SECCHI_JOINED_SPEC = TableSpec.TableSpec(
+    'Secchi_Joined', 'tblEvents',
+    [Column('PONDNAME', 'PondName'),
+     Column('SAMPLEDATE', 'SampleDate'),
+     Column('SECCHIDEPTH', 'Secchi_Depth_in_meters', 'Number', Digits = 1),
+     Column('SECCHIONBOTTOM', 'OnBottom', 'Number', Values = {'Yes': 1}, Default = 0),
+     Column('SECCHINOTES', 'Comments', Strip = True, BlankIsNull = True)],
+    ['PONDNAME', 'SAMPLEDATE'],
+    FieldNames = SECCHI_JOINED_FIELDS)
+
+DEPTH_JOINED_SPEC = TableSpec.TableSpec(
+    'Depth_Joined', 'tblPondDepths',
+    [Column('PONDNAME', 'PondName'),
+     Column('SAMPLEDATE', 'SampleDate'),
+     Column('GPS_TIME', 'SampleTime'),
+     Column('LATITUDE', 'Latitude', 'Number'),
+     Column('LONGITUDE', 'Longitude', 'Number'),
+     Column('DEPTH', 'Depth_in_meters', 'Number', Digits = 1),
+     Column('COMMENTS_DEPTHS', 'Comment', Strip = True, BlankIsNull = True),
+     Column('DATAFILE', 'Datafile'),
+     Column('GPS_HEIGHT', 'GNSS_Heigh', 'Number'),
+     Column('VERT_PREC', 'Vert_Prec', 'Number'),
+     Column('HORZ_PREC', 'Horz_Prec', 'Number'),
+     Column('SOURCE', Type = 'Source')],
+    ['PONDNAME', 'SAMPLEDATE', 'GPS_TIME'],
+    Purpose = "Transfer lake depth data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.",
+    FieldNames = DEPTH_JOINED_FIELDS,
+    ColumnarRecords = 'ColumnarExport.IterDepthJoinedRecords',
+    EventKeyColumns = ['PONDNAME', 'SAMPLEDATE'],
+    Layout = TableSpec.ScriptLayout(Condition = "PondName='{0}' and  SampleDate = '{1}'"))
+
+LOONS_JOINED_SPEC = TableSpec.TableSpec(
+    'Loons_Joined', 'tblLoons',
+    [Column('PONDNAME', 'PondName'),
+     Column('SAMPLEDATE', 'SampleDate'),
+     Column('SPECIES', 'Loon_Species'),
+     Column('NUM_ADULTS', 'a___of_Adults', 'Number'),
+     Column('NUM_YOUNG', 'a___of_Young', 'Number'),
+     Column('DETECTION_TYPE', 'Identification_Method'),
+     Column('VEG_TYPE', 'On_Water_', Values = {'Yes': 'WATER'}),
+     Column('LATITUDE', 'Latitude', 'Number'),
+     Column('LONGITUDE', 'Longitude', 'Number'),
+     Column('COMMENTS', 'Loon_Comments', Strip = True, BlankIsNull = True),
+     Column('SOURCE', Type = 'Source')],
+    ['PONDNAME', 'SAMPLEDATE'],
+    Purpose = "Transfer loon data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.",
+    FieldNames = LOONS_JOINED_FIELDS,
+    EventKeyColumns = ['PONDNAME', 'SAMPLEDATE'],
+    OneRecordPerEvent = True,
+    Layout = TableSpec.ScriptLayout(Indent = '                ', Select = 'SELECT * FROM {Table}',
+                                    Condition = "PondName='{0}' and SampleDate = '{1}'", Database = 'AK_ShallowLakes'))
+
+# The water bottles are all collected, or none are.
+WATER_BOTTLES_COLLECTED = {'No': 0, 'Yes': 1}
+
+WATER_SAMPLE_JOINED_SPEC = TableSpec.TableSpec(
+    'Water_Sample_Joined', 'tblWaterSamples',
+    [Column('PONDNAME', 'PondName'),
+     Column('SAMPLEDATE', 'SampleDate'),
+     Column('SAMPLENUMBER', 'Sample_Number__A__B__C_', Function = TrimbleUtility.GetSampleNumber),
+     Column('SAMPLETIME', 'SampleTime'),
+     Column('SAMPLEDEPTH', Type = 'Number', Value = 0.5),
+     Column('DEPTH', 'Depth_in_meters', 'Number'),
+     Column('O18_COLL', 'Water_Bottles_Collected_', 'Number', Strip = True, Values = WATER_BOTTLES_COLLECTED),
+     Column('SI_DOC_COLL', 'Water_Bottles_Collected_', 'Number', Strip = True, Values = WATER_BOTTLES_COLLECTED),
+     Column('IONS_COLL', 'Water_Bottles_Collected_', 'Number', Strip = True, Values = WATER_BOTTLES_COLLECTED),
+     Column('TN_TP_COLL', 'Water_Bottles_Collected_', 'Number', Strip = True, Values = WATER_BOTTLES_COLLECTED),
+     Column('CHLA_COLL', 'Water_Bottles_Collected_', 'Number', Strip = True, Values = WATER_BOTTLES_COLLECTED),
+     Column('Notes', 'Comment', Strip = True, BlankIsNull = True)],
+    ['PONDNAME', 'SAMPLEDATE', 'SAMPLENUMBER'],
+    Purpose = "Transfer water sample data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.",
+    FieldNames = WATER_SAMPLE_JOINED_FIELDS,
+    EventKeyColumns = ['PONDNAME', 'SAMPLEDATE'],
+    Layout = TableSpec.ScriptLayout(Insert = 'INSERT INTO {Table}([{Columns}]) VALUES(', ColumnSeparator = '],[', Close = ')\n', Indent = '',
+                                    Comment = "\n-- Insert the water samples first\n", Select = 'SELECT * FROM {Table}',
+                                    Condition = "PondName='{0}' and  SampleDate = '{1}' and SampleNumber = '{2}'"))
+
+MONUMENT_JOINED_SPEC = TableSpec.TableSpec(
+    'Monument_Joined', 'tblMonuments',
+    [Column('PONDNAME', 'LakeNum'),
+     Column('M_DATE', 'SampleDate'),
+     Column('M_LAT_NAD83', 'Latitude', 'Number'),
+     Column('M_LON_NAD83', 'Longitude', 'Number'),
+     Column('M_ELEVATION', 'FeatureHeight', 'Number'),
+     Column('M_LOC_TYPE', 'MonType'),
+     Column('M_LOC_MATERIAL', 'MonType'),
+     Column('M_LOC_NOTES', 'Location', BlankIsNull = True),
+     Column('M_LOC_COMMENTS', 'Comment', BlankIsNull = True),
+     Column('M_ACCESSTYPE', 'AccessType'),
+     Column('M_GPSTYPE', 'DeviceType'),
+     Column('M_GPSTIME', 'SampleTime'),
+     Column('M_CORR_TYPE', 'CorrStatus'),
+     Column('M_EST_H_ERROR', 'HorizEstAcc', 'Number'),
+     Column('M_EST_V_ERROR', 'VertEstAcc', 'Number')],
+    ['PONDNAME', 'M_DATE', 'M_GPSTIME'],
+    Purpose = "Transfer monument data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.\n",
+    FieldNames = MONUMENT_JOINED_FIELDS,
+    Layout = TableSpec.ScriptLayout(Insert = 'INSERT INTO {Table} ([{Columns}]) VALUES (', ColumnSeparator = '], [', Close = ')\n',
+                                    Indent = '        '))
+
+# The deployments are inserted with the coordinates as read; the
+# updates round them (see 'ExportContinuousJoined').
+DEPLOYMENT_INSERT_SPEC = TableSpec.TableSpec(
+    'Deployment_Joined', 'tblContinuousDataDeployments',
+    [Column('SiteName', 'LakeNum'),
+     Column('DateDeployed', 'SampleDate'),
+     Column('TimeDeployed', 'SampleTime'),
+     Column('DeploymentType', 'Deployment_Type'),
+     Column('DeployLatitude', 'YCurrentMapCS', 'Number'),
+     Column('DeployLongitude', 'XCurrentMapCS', 'Number'),
+     Column('DeploymentNotes', 'Comments', BlankIsNull = True)],
+    ['SiteName', 'DateDeployed'],
+    Purpose = "Transfer Deployment_Joined data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.\n",
+    FieldNames = CONTINUOUS_JOINED_FIELDS,
+    Layout = TableSpec.ScriptLayout(Insert = 'INSERT INTO dbo.{Table}\n([{Columns}])\nVALUES (', ColumnSeparator = '] ,[', Close = ')\n\n',
+                                    Separator = ', ', Indent = ''))
+
+DEPLOYMENT_UPDATE_SPEC = TableSpec.TableSpec(
+    'Deployment_Joined', 'tblContinuousDataDeployments',
+    [Column('SiteName', 'LakeNum'),
+     Column('DateDeployed', 'SampleDate'),
+     Column('DeployLatitude', 'Latitude', 'Number'),
+     Column('DeployLongitude', 'Longitude', 'Number'),
+     Column('DeploymentNotes', 'Comments', BlankIsNull = True)],
+    ['SiteName', 'DateDeployed'],
+    FieldNames = CONTINUOUS_JOINED_FIELDS)
+
+RETRIEVAL_UPDATE_SPEC = TableSpec.TableSpec(
+    'Retrieval_Joined', 'tblContinuousDataDeployments',
+    [Column('SiteName', 'LakeNum'),
+     Column('DateRetrieved', 'SampleDate'),
+     Column('RetrieveLatitude', 'Latitude', 'Number'),
+     Column('RetrieveLongitude', 'Longitude', 'Number'),
+     Column('RetrievalNotes', 'Comments', BlankIsNull = True)],
+    ['SiteName', 'DateRetrieved'],
+    FieldNames = CONTINUOUS_JOINED_FIELDS)
+
+CONTINUOUS_SPECS = {Continuous.DEPLOYMENT_INSERT: DEPLOYMENT_INSERT_SPEC,
+                    Continuous.DEPLOYMENT_UPDATE: DEPLOYMENT_UPDATE_SPEC,
+                    Continuous.RETRIEVAL_UPDATE: RETRIEVAL_UPDATE_SPEC}
+
+# The columns of the table variables that hold the distinct parent keys
+# when the parent existence checks are set based (see the 'ParentCheck'
+# enumeration).
+POND_KEY_COLUMNS = [('PondName', 'NVARCHAR(255)')]
+EVENT_KEY_COLUMNS = [('PondName', 'NVARCHAR(255)'), ('SampleDate', 'DATE')]
+
+def ExportSecchiJoined(ParentCheckType = ParentCheck.PER_ROW, Incremental = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, UpdateType = Update.PER_ROW, RaiseErrors = False):
     """
     Translates the data in the Secchi_Joined featureclass into a
     script of SQL insert queries that can be executed on the
@@ -36,6 +244,27 @@ def ExportSecchiJoined():
     NOTE: secchi depth is stored in the tblEvents table so this script
     the event must exist before the Secchi columns are updated. There
     is no Secchi depth table in the database.
+
+    See function 'ExportJoinedTable' for the 'ParentCheckType' (its
+    parent records are the lakes, tblPonds), 'Incremental',
+    'DuplicateCheckType', 'WriteMetrics', 'fromDate', 'toDate', 'Lakes'
+    and 'RaiseErrors' parameters. In an incremental export, a changed
+    row updates its Event again.
+
+    Parameters:
+    - UpdateType = PER_ROW (default) or SET_BASED (see 'Update'
+      enumeration).
+      - PER_ROW writes one 'IF EXISTS ... UPDATE ... ELSE PRINT' block
+        per record, with its commented out INSERT and SELECT queries.
+      - SET_BASED writes the values of all the records as one 'VALUES'
+        set, loaded into the '#SecchiUpdates' staging table, and
+        updates the existing Events with a single 'UPDATE ... FROM'
+        join (see 'GetUpdateFromQuery'). The Events that do not exist
+        are listed by a single query. The per record diagnostics (the
+        current values of each Event, or that it is missing) and the
+        INSERT of the missing Events are single commented out queries.
+
+    Returns the path of the SQL script file.
     """
     try:
         GEO_DB_PATH = arcpy.env.workspace
@@ -51,518 +280,1128 @@ def ExportSecchiJoined():
 
         SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
 
-        SqlFile = open(SqlFilePath,'a')
+        # The cursor reads only the rows in the date range and of the
+        # lakes, if given.
+        RowFilter = TrimbleUtility.GetRowFilterWhereClause(fromDate, toDate, Lakes)
+
+        # In incremental mode, only the rows that are not yet in the
+        # manifest are written.
+        Manifest = (TrimbleUtility.ReadExportManifest(GEO_DB_PATH, FEATURE_CLASS, 'tblEvents') if Incremental else None)
+
+        # The primary key counts, when the duplicate keys are checked.
+        KeyCounts = ({} if DuplicateCheckType is not DuplicateCheck.NONE else None)
+
+        # The time and row counts of each stage of the export.
+        Metrics = RunMetrics.RunMetrics(FEATURE_CLASS)
+        Metrics.StartStage('Export')
+
+        with SQLWriter.SQLScriptWriter(SqlFilePath) as SqlFile:
+            # The script is streamed in sections, which are assembled
+            # in this order when the writer is closed.
+            Header = SqlFile.AddSection()
+            Preview = SqlFile.AddSection(TrimEnd = 4)     # Trim the trailing ' Or \n'
+            LakeExistQueries = SqlFile.AddSection(TrimEnd = 6 if ParentCheckType is ParentCheck.PER_ROW else 0) # Trim the trailing ' And \n'
+            InsertQueries = SqlFile.AddSection()
+            UpdateValues = SqlFile.AddSection(TrimEnd = 2)   # Trim the trailing ',\n'
+            UpdateQueries = SqlFile.AddSection()
+            DuplicateReport = (SqlFile.AddSection() if KeyCounts is not None else None)
+
+            # Write the header info to file
+            PURPOSE = "Transfer secchi depth data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database."
+            Header.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name, RowFilter))
+
+            Header.write("/*\nREAD AND THOROUGHLY UNDERSTAND THIS SCRIPT BEFORE RUNNING.\nRunning this script may change records in the Shallow Lakes monitoring database.\nThe lakes referenced in this script must exist in the tblPonds table prior to running this script. \nSecchi depth data is stored in tblEvents. \nOn error, rollback and correct any problems, then run again. Commit changes when finished.\n*/\n\n")
+            Header.write("USE AK_ShallowLakes\n\n")
+
+            Header.write("-- PREVIEW OF AFFECTED RECORDS: To see the secchi depth values that may be affected uncomment and run the query below:\n")
+            Header.write("-- ")
+
+            # Write a query to allow the user to preview the secchi data
+            # that may be overwritten
+            Preview.write("SELECT PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE \n")
+
+            # We need to ensure all the lakes exist before we can create
+            # sampling events, this section will hold that checking code.
+            LakeExistQueries.write("\n\n")
+            LakeExistQueries.write("BEGIN TRANSACTION -- COMMIT ROLLBACK -- All queries in this transaction must succeed or fail together. COMMIT if all queries succeed. ROLLBACK if any fail. Failure to COMMIT or ROLLBACK will leave the database in a hanging state.\n\n")
+            LakeExistQueries.write("-- All the lakes in the input geodatabase must exist in tblPonds before events can be created or updated\n")
+
+            InsertQueries.write("\nBEGIN\n")
+
+            # The distinct lakes, when the lake check is set based.
+            PondKeys = {}
+
+            # The SQL values of each row, and the SET assignments of its
+            # UPDATE statement (the columns that are not in the key).
+            FormatValues = TableSpec.CompileFormatter(SECCHI_JOINED_SPEC.Columns)
+            FormatAssignments = TableSpec.CompileFormatter(SECCHI_JOINED_SPEC.GetValueColumns(), Separator = ', ', Assignments = True)
+
+            # The set based updates are loaded into a staging table of
+            # the same columns as tblEvents, from one 'VALUES' set.
+            ColumnNames = SECCHI_JOINED_SPEC.GetColumnNames('], [')
+
+            if UpdateType is Update.SET_BASED:
+                InsertQueries.write("    -- Load the values of the records into a staging table\n")
+                InsertQueries.write(GetStagingTableQuery('#SecchiUpdates', 'tblEvents', ColumnNames))
+
+            LakeCount = 0
+            for Row, Normal in TableSpec.IterExportRows(FEATURE_CLASS, SECCHI_JOINED_SPEC.FieldNames, Manifest, KeyCounts,
+                                                        DuplicateCheckType is DuplicateCheck.SKIP, Metrics, RowFilter):
+                PondName = Normal['PondName']
+                SampleDate = Normal['SampleDate']
+
+                # Validate that the lake exists
+                if ParentCheckType is ParentCheck.SET_BASED:
+                    PondKeys[(PondName,)] = None
+                else:
+                    LakeExists = "EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = '" + PondName + "') And \n"
+
+                    if LakeCount > 0:
+                        LakeExistQueries.write("    " + LakeExists)
+                    else:
+                        LakeExistQueries.write("IF " + LakeExists)
+
+                LakeCount = LakeCount + 1
+                Metrics.AddRowsEmitted()
+
+                Preview.write("-- (Pondname = '" + PondName + "' And SampleDate = '" + SampleDate + "') Or \n")
+
+                if UpdateType is Update.SET_BASED:
+                    # An empty 'VALUES' set is not valid SQL, so the
+                    # INSERT is started by the first record.
+                    if LakeCount == 1:
+                        UpdateValues.write("    INSERT INTO #SecchiUpdates ([" + ColumnNames + "])\n")
+                        UpdateValues.write("    SELECT [" + ColumnNames + "] FROM (VALUES\n")
+
+                    UpdateValues.write("        (" + FormatValues(Row, Normal) + "),\n")
+                    continue
+
+                # Write the insert query to file
+                # NOTE: Secchi data is stored in tblEvents so the SQL
+                # ensures the event exists.
+                SelectQuery = "SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = '" + PondName + "' And SampleDate = '" + SampleDate + "'"
+                InsertQueries.write("       -- Ensure the Event for these data edits exists.\n")
+                InsertQueries.write("       IF EXISTS (" + SelectQuery + ")\n")
+                InsertQueries.write("               -- The event exists, update it.\n")
+                InsertQueries.write("               UPDATE tblEvents SET " + FormatAssignments(Row, Normal) +
+                                    " WHERE Pondname = '" + PondName + "' And SampleDate = '" + SampleDate + "'\n\n")
+
+                InsertQueries.write("               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.\n")
+                InsertQueries.write("               -- INSERT INTO tblEvents(" + SECCHI_JOINED_SPEC.GetColumnNames() + ") VALUES(" + FormatValues(Row, Normal) + ");\n\n")
+
+                InsertQueries.write("               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.\n")
+                InsertQueries.write("               -- " + SelectQuery + "\n\n")
+                InsertQueries.write("       ELSE\n")
+                InsertQueries.write("           PRINT 'The event for this record does not exist. PondName:" + PondName + " SampleDate: " + SampleDate + "'\n\n")
+
+            if UpdateType is Update.SET_BASED:
+                WriteSecchiUpdateFromQueries(UpdateQueries, ColumnNames, LakeCount)
+
+            if ParentCheckType is ParentCheck.SET_BASED:
+                LakeExistQueries.write(GetKeySetQuery('@PondKeys', POND_KEY_COLUMNS, PondKeys, LakeCount))
+                LakeExistQueries.write("IF NOT EXISTS (" + GetMissingPondKeysQuery() + ")")
+
+            UpdateQueries.write("END\n")
+            UpdateQueries.write("ELSE\n")
+
+            if ParentCheckType is ParentCheck.SET_BASED:
+                UpdateQueries.write("BEGIN\n")
+                UpdateQueries.write("    PRINT 'ERROR: One or more lakes are missing from tblPonds. All lakes in the insert query block must exist in tblPonds before sampling events can be created in the tblEvents table. The missing lakes are listed in the results.'\n")
+                UpdateQueries.write("    " + GetMissingPondKeysQuery() + "\n")
+                UpdateQueries.write("END\n")
+            else:
+                UpdateQueries.write("    PRINT 'ERROR: One or more lakes are missing from tblPonds. All lakes in the insert query block must exist in tblPonds before sampling events can be created in the tblEvents table.'\n")
 
-        # We need to ensure all the lakes exist before we can create
-        # sampling events, this variable will hold that checking code.
-        LakeExistQueriesComments = "-- All the lakes in the input geodatabase must exist in tblPonds before events can be created or updated\n"
-        LakeExistQueries = []
+            if KeyCounts is not None:
+                WriteDuplicateKeysReport(DuplicateReport, FEATURE_CLASS, KeyCounts, DuplicateCheckType)
 
-        # Write a query to allow the user to preview the secchi data
-        # that may be overwritten
-        PreviewQuery = "SELECT PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE \n"
+            # The sections are assembled into the script when the
+            # writer is closed.
+            Metrics.StartStage('Assemble')
 
-        # Insert queries
-        InsertQueries = []
+        Metrics.SetBytesWritten(os.path.getsize(SqlFile.name))
 
-        for Row in TrimbleUtility.GetFeatureClassRows(FEATURE_CLASS):
-            PySampleDateTime = Row['CreationDateTimeLocal']
+        if Manifest is not None:
+            Metrics.StartStage('Manifest')
+            WritePendingManifest(GEO_DB_PATH, FEATURE_CLASS, 'tblEvents', Manifest, SqlFile.name)
 
-            # A record without a creation datetime is not a valid
-            # record. End this iteration and go to the next row.
-            if PySampleDateTime is None:
-                continue
+        # Let user know we're done
+        FinishedMessage = FEATURE_CLASS + " data written to: " + SqlFile.name + '\n'
+        arcpy.AddMessage(FinishedMessage)
 
-            PondName = str(Row['LakeNum'])
-            SampleDate = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
+        Metrics.Finish(RunMetrics.GetMetricsPath(SqlFile.name) if WriteMetrics else None)
 
-            if Row['Secchi_Depth_in_meters'] is not None:
-                SecchiDepth = str(round(Row['Secchi_Depth_in_meters'], 1))
-            else:
-                SecchiDepth = 'NULL'
+        return SqlFile.name
 
-            if Row['OnBottom'] == "Yes":
-                SecchiOnBottom = '1'
-            else:
-                SecchiOnBottom = '0'
+    except Exception as e:
+        if RaiseErrors:
+            raise
 
-            SecchiNotes = Row['Comments'].strip()
+        Error = 'Error in function ExportSecchiJoined: ' + str(e)
+        arcpy.AddMessage(Error)
 
-            # Validate that the lake exists
-            LakeExists = "EXISTS (SELECT PondName FROM tblPonds WHERE Pondname = '" + PondName + "') And \n"
+def WriteSecchiUpdateFromQueries(Section, ColumnNames, RecordCount):
+    """
+    Writes the end of the set based update of function
+    'ExportSecchiJoined' to 'Section', after the 'VALUES' set of the
+    '#SecchiUpdates' staging table: the commented out diagnostics and
+    INSERT of the missing Events, the single 'UPDATE ... FROM' of the
+    existing Events, and the query that lists the missing Events.
 
-            if len(LakeExistQueries) > 0:
-                LakeExistQueries.append("    " + LakeExists)
-            else:
-                LakeExistQueries.append("IF " + LakeExists)
+    Parameters:
+    - Section = the script section the queries are written to.
+    - ColumnNames = the columns of the staging table, e.g.
+      "PONDNAME], [SAMPLEDATE" (see
+      'TableSpec.TableSpec.GetColumnNames').
+    - RecordCount = the number of records in the 'VALUES' set.
+    """
+    Spec = SECCHI_JOINED_SPEC
+    Table = 'tblEvents'
+    KeyColumns = Spec.KeyColumns
+    ValueColumns = [Column.Name for Column in Spec.GetValueColumns()]
+    StagedColumns = ', '.join("s.[" + Column.Name + "]" for Column in Spec.Columns)
+
+    if RecordCount > 0:
+        Section.write("\n    ) AS v([" + ColumnNames + "])\n\n")
+
+    Section.write("    -- " + str(RecordCount) + " records.\n")
+
+    # The diagnostics of each record: the current values of its Event,
+    # or that the Event does not exist.
+    Section.write("    -- Utility SELECT query in case you want to see the current values of the events before they are updated. Uncomment and execute.\n")
+    Section.write("    -- SELECT " + StagedColumns + ", " +
+                  ', '.join("e.[" + Name + "] AS [CURRENT_" + Name + "]" for Name in ValueColumns) +
+                  ", CASE WHEN e.[" + KeyColumns[0] + "] IS NULL THEN 'The event for this record does not exist.' ELSE 'The event exists.' END AS STATUS" +
+                  " FROM #SecchiUpdates s LEFT JOIN " + Table + " e ON " + GetKeyJoinCondition(KeyColumns, 'e', 's') + "\n\n")
+
+    Section.write("    -- The events that do not exist are not inserted. If you want to insert them then uncomment the INSERT query below and execute.\n")
+    Section.write("    -- INSERT INTO " + Table + "([" + ColumnNames + "]) " +
+                  GetUnmatchedKeysQuery(Table, '#SecchiUpdates', KeyColumns, StagedColumns) + "\n\n")
+
+    # A staged event is updated only once, so the events are not
+    # updated if any of them has more than one record.
+    Section.write("    -- Each event must be updated by one record.\n")
+    Section.write(GetStagedKeysQuery('#SecchiUpdates', KeyColumns))
+    Section.write("    IF @StagedKeys < (SELECT COUNT(*) FROM #SecchiUpdates)\n")
+    Section.write("    BEGIN\n")
+    Section.write("        PRINT 'ERROR: More than one record updates the same event. No events were updated. ROLLBACK, remove the duplicate records (the events are listed in the results) and run again.'\n")
+    Section.write("        " + GetDuplicateStagedKeysQuery('#SecchiUpdates', KeyColumns) + "\n")
+    Section.write("    END\n")
+    Section.write("    ELSE\n")
+    Section.write("    BEGIN\n")
+
+    Section.write("        -- The events exist, update them.\n")
+    Section.write(textwrap.indent(GetUpdateFromQuery(Table, '#SecchiUpdates', KeyColumns, ValueColumns), '    '))
+
+    Section.write("        DECLARE @RowsMatched INT = @@ROWCOUNT\n")
+    Section.write("        PRINT N'Events updated: ' + CAST(@RowsMatched AS NVARCHAR(20)) + N' of the ' + CAST(@StagedKeys AS NVARCHAR(20)) + N' events sent.'\n\n")
+
+    Section.write("        -- The events that do not exist.\n")
+    Section.write("        IF EXISTS (" + GetUnmatchedKeysQuery(Table, '#SecchiUpdates', KeyColumns, '1') + ")\n")
+    Section.write("        BEGIN\n")
+    Section.write("            PRINT 'The events of one or more records do not exist. The missing events are listed in the results.'\n")
+    Section.write("            " + GetUnmatchedKeysQuery(Table, '#SecchiUpdates', KeyColumns, ', '.join("s.[" + Name + "]" for Name in KeyColumns)) + "\n")
+    Section.write("        END\n")
+    Section.write("    END\n")
+
+def ExportDepthJoined(ParentCheckType = ParentCheck.PER_ROW, BatchSize = 1, Incremental = False, Columnar = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, ChunkRows = None, ChunkBytes = None, OutputType = Output.SQL_SCRIPT, RaiseErrors = False, LayoutType = Layout.TABLE):
+    """
+    Translates the data in the Depth_Joined featureclass into a script
+    of SQL insert queries that can be executed on the AK_ShallowLakes
+    database.
 
-            # Write the insert query to file
-            # NOTE: Secchi data is stored in tblEvents so the SQL
-            # ensures the event exists.
-            SelectQuery = "SELECT  PONDNAME, SAMPLEDATE, SECCHIDEPTH, SECCHIONBOTTOM, SECCHINOTES FROM tblEvents WHERE Pondname = '" + PondName + "' And SampleDate = '" + SampleDate + "'"
-            InsertQueries.append("       -- Ensure the Event for these data edits exists.\n")
-            InsertQueries.append("       IF EXISTS (" + SelectQuery + ")\n")
-            InsertQueries.append("               -- The event exists, update it.\n")
-            InsertQueries.append("               UPDATE tblEvents SET SECCHIDEPTH = " + SecchiDepth + ", SECCHIONBOTTOM = " + SecchiOnBottom + ", ")
+    See function 'ExportJoinedTable' for the parameters.
 
-            CommentStr = ("SECCHINOTES = NULL"  if SecchiNotes == '' else "SECCHINOTES = '" + SecchiNotes + "'")
-            InsertQueries.append(CommentStr +
-                                 " WHERE Pondname = '" + PondName + "' And SampleDate = '" + SampleDate + "'\n\n")
+    Returns the path of the SQL script file, or of the chunk manifest
+    if the script is chunked, or of the driver script of a bulk insert.
+    """
+    return ExportJoinedTable(DEPTH_JOINED_SPEC, ParentCheckType, BatchSize, Incremental, Columnar, DuplicateCheckType,
+                             WriteMetrics, fromDate, toDate, Lakes, ChunkRows, ChunkBytes, OutputType, RaiseErrors, LayoutType,
+                             FunctionName = 'ExportDepthJoined')
 
-            InsertQueries.append("               -- The event does not exist. If you want to insert it then uncomment the INSERT query below and execute.\n")
+def ExportJoinedTable(Spec, ParentCheckType = ParentCheck.PER_ROW, BatchSize = 1, Incremental = False, Columnar = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, ChunkRows = None, ChunkBytes = None, OutputType = Output.SQL_SCRIPT, RaiseErrors = False,
+                      LayoutType = Layout.TABLE, ManifestTarget = None, RangeInFileName = False, FunctionName = 'ExportJoinedTable'):
+    """
+    Translates the data in the '_Joined' featureclass of a table spec
+    (see 'TableSpec.TableSpec') into a script of SQL insert queries
+    that can be executed on the AK_ShallowLakes database. If the
+    records of the table belong to an Event (tblEvents), the script
+    inserts them only if all their parent Events exist (see
+    'WriteJoinedTableScript').
+
+    All the insert exports are made by this function: a new protocol
+    table is exported by declaring its spec and calling it; see
+    'DEPTH_JOINED_SPEC' and 'ExportDepthJoined'. The parameters of
+    the 'Export*Joined' functions are described here.
 
-            CommentStr = (",NULL);\n\n" if SecchiNotes == '' else ",'" + SecchiNotes + "');\n\n")
-            InsertQueries.append("               -- INSERT INTO tblEvents(PONDNAME,SAMPLEDATE,SECCHIDEPTH,SECCHIONBOTTOM,SECCHINOTES) VALUES('" +
-                                 PondName + "','" + SampleDate + "'," + SecchiDepth + "," + SecchiOnBottom +
-                                 CommentStr)
+    Parameters:
+    - Spec = the 'TableSpec.TableSpec' of the table.
+    - ParentCheckType = PER_ROW (default) or SET_BASED (see
+      'ParentCheck' enumeration).
+      - PER_ROW writes one EXISTS clause per record.
+      - SET_BASED collects the distinct parent keys as the rows are
+        read, writes them once into a 'VALUES' backed table variable,
+        and checks them with a single anti-join. If any parent records
+        are missing, the script lists the missing keys. For a table
+        with one record per Event (tblLoons), the check that its
+        records do not exist already is made against the same key set.
+    - BatchSize = the number of rows in each INSERT statement. The
+      default (1) writes one INSERT statement per row. Larger values
+      write multi-row 'INSERT ... VALUES (...),(...)' statements, and
+      are capped at SQL Server's limit of 1000 rows
+      ('SQLWriter.MAX_INSERT_ROWS').
+    - Incremental = if True, only the rows that are new or changed
+      since the applied incremental exports of this feature class to
+      this table are written. The rows of the applied exports are
+      recorded in a manifest file next to the geodatabase (see
+      'TrimbleUtility.ReadExportManifest'). The rows of this export
+      are written to a pending manifest next to the script (see
+      'WritePendingManifest'), and are only recorded when the export
+      is marked as applied with 'TrimbleUtility.MarkExportApplied',
+      once its script has been committed; until then, the next
+      incremental exports write them again. The default (False)
+      writes every row and does not read or write the manifests.
+      A changed row whose key has already been exported is left out,
+      as inserting it again would break the table's primary key, and
+      its key is listed once (see 'ReportChangedKeys').
+    - Columnar = if True, the rows are read into NumPy column arrays
+      and formatted a column at a time by the spec's 'ColumnarRecords'
+      function (see module 'ColumnarExport'), instead of one row at a
+      time. The SQL script is the same. This cannot be combined with
+      'Incremental' or 'DuplicateCheckType'.
+    - DuplicateCheckType = NONE (default), REPORT or SKIP (see
+      'DuplicateCheck' enumeration).
+      - REPORT counts the primary keys of the rows as they are read
+        (see 'TrimbleUtility.GetRowKey'), and lists the keys that are
+        read more than once at the end of the script. This is the
+        same report as 'TestTrimbleGeoDB.FindDuplicatePrimaryKeys',
+        without reading the feature class again.
+      - SKIP also writes only the first row of each key. The number of
+        rows skipped is given in the report.
+    - WriteMetrics = if True, the time, row counts, bytes written and
+      peak memory of each stage of the export are written to a JSON
+      file next to the SQL script (see 'RunMetrics'). The stages are
+      shown with the progressor either way.
+    - fromDate, toDate = optional 'YYYY-MM-DD' strings; only the rows
+      with a creation date in this range (inclusive) are written.
+      Either one may be None, for an open ended range.
+    - Lakes = an optional list of the 'LakeNum' values of the lakes
+      whose rows are written.
+      - The date range and lakes are passed to the cursor as a where
+        clause (see 'TrimbleUtility.GetRowFilterWhereClause'), so the
+        other rows are never read from the geodatabase, and are given
+        in the header of the script. The duplicate checks and the
+        incremental manifest only see the rows that are read.
+    - ChunkRows, ChunkBytes = optional limits on the number of records,
+      and on the size (in characters), of each script. If either one
+      is given, the script is split into numbered chunk files (see
+      'GetChunkFilePath') that each have their own header, transaction
+      and parent Event check, and can be run one at a time. The chunks
+      are listed, in order, in a manifest file (see
+      'WriteChunkManifest'), whose path is returned instead. The
+      duplicate key report is at the end of the last chunk. A chunk
+      ends after the record that reaches a limit.
+    - OutputType = SQL_SCRIPT (default) or BULK_INSERT (see 'Output'
+      enumeration).
+      - SQL_SCRIPT writes the script of INSERT statements.
+      - BULK_INSERT writes the records to a delimited data file, with a
+        format file and a small driver script that bulk loads them into
+        a staging table, checks their parent Events and inserts them
+        with a single statement (see function 'ExportBulkInsert').
+        The 'ParentCheckType' and 'BatchSize' do not apply, and it
+        cannot be combined with 'Columnar', 'ChunkRows' or
+        'ChunkBytes'.
+    - RaiseErrors = if False (default), an error is reported with
+      'arcpy.AddMessage' and the function returns None. If True, the
+      error is raised to the caller (see function 'ExportAll').
+    - LayoutType = TABLE (default) or UNIFORM (see 'Layout'
+      enumeration).
+      - TABLE writes the INSERT statements and the validation query in
+        the form the table's export function has always written (see
+        the 'Layout' of each spec, e.g. 'WATER_SAMPLE_JOINED_SPEC'),
+        with its bracketed column names, 'dbo.' schema or validation
+        condition.
+      - UNIFORM writes them in the same form for every table:
+        'INSERT INTO Table(COLUMNS) VALUES(...);', and the condition
+        on the table's key columns in the validation query (see
+        'TableSpec.ScriptLayout.GetUniform'). The rest of the script
+        (the USE statement, checks, messages and transaction) is the
+        same.
+      It does not apply to a bulk insert.
+
+    - ManifestTarget = the target name of the incremental manifest
+      (see 'TrimbleUtility.ReadExportManifest'). The default (None) is
+      the spec's table.
+    - RangeInFileName = if True, the date range ('fromDate' and
+      'toDate') is in the name of the SQL script file (see function
+      'ExportContinuousJoined'). The date range is then not given in
+      the header of the script.
+    - FunctionName = the name of the export function, for the error
+      message.
+
+    Returns the path of the SQL script file, or of the chunk manifest
+    if the script is chunked, or of the driver script of a bulk insert.
+    """
+    try:
+        GEO_DB_PATH = arcpy.env.workspace
 
-            InsertQueries.append("               -- Utility SELECT query in case you want to manually see the event. Uncomment and execute.\n")
-            InsertQueries.append("               -- " + SelectQuery + "\n\n")
-            InsertQueries.append("       ELSE\n")
-            InsertQueries.append("           PRINT 'The event for this record does not exist. PondName:" + PondName + " SampleDate: " + SampleDate + "'\n\n")
+        AssertGeoDB(GEO_DB_PATH)
 
-            PreviewQuery = PreviewQuery + "-- (Pondname = '" + PondName + "' And SampleDate = '" + SampleDate + "') Or \n"
+        if Columnar and Spec.ColumnarRecords is None:
+            raise Exception("The " + Spec.FeatureClass + " feature class has no columnar export.")
 
-        # Write the header info to file
-        PURPOSE = "Transfer secchi depth data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database."
-        SqlFile.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name))
+        if Columnar and Incremental:
+            raise Exception("The 'Columnar' and 'Incremental' parameters cannot both be True.")
+
+        if Columnar and DuplicateCheckType is not DuplicateCheck.NONE:
+            raise Exception("The 'Columnar' parameter cannot be combined with the 'DuplicateCheckType' parameter.")
 
-        SqlFile.write("/*\nREAD AND THOROUGHLY UNDERSTAND THIS SCRIPT BEFORE RUNNING.\nRunning this script may change records in the Shallow Lakes monitoring database.\nThe lakes referenced in this script must exist in the tblPonds table prior to running this script. \nSecchi depth data is stored in tblEvents. \nOn error, rollback and correct any problems, then run again. Commit changes when finished.\n*/\n\n")
-        SqlFile.write("USE AK_ShallowLakes\n\n")
+        TableLayout = (Spec.Layout if LayoutType is Layout.TABLE else Spec.Layout.GetUniform())
 
-        SqlFile.write("-- PREVIEW OF AFFECTED RECORDS: To see the secchi depth values that may be affected uncomment and run the query below:\n")
-        SqlFile.write("-- " + PreviewQuery[:len(PreviewQuery) - 4] + "\n\n")
+        # The columnar records are formatted with the default separator.
+        if Columnar and TableLayout.Separator != ',':
+            raise Exception("The " + Spec.FeatureClass + " feature class has no columnar export in this layout.")
 
-        SqlFile.write("BEGIN TRANSACTION -- COMMIT ROLLBACK -- All queries in this transaction must succeed or fail together. COMMIT if all queries succeed. ROLLBACK if any fail. Failure to COMMIT or ROLLBACK will leave the database in a hanging state.\n\n")
+        if (ChunkRows is not None and ChunkRows < 1) or (ChunkBytes is not None and ChunkBytes < 1):
+            raise Exception("The 'ChunkRows' and 'ChunkBytes' parameters must be at least 1.")
 
+        if OutputType is Output.BULK_INSERT:
+            if Columnar or ChunkRows is not None or ChunkBytes is not None:
+                raise Exception("A bulk insert cannot be combined with the 'Columnar', 'ChunkRows' or 'ChunkBytes' parameters.")
 
-        LakeExistWrite = LakeExistQueriesComments + ''.join(LakeExistQueries)
-        SqlFile.write(LakeExistWrite[:len(LakeExistWrite) - 6] + "\nBEGIN\n") # Trim the trailing ' And'
+            return ExportBulkInsert(Spec, Incremental, DuplicateCheckType, WriteMetrics, fromDate, toDate, Lakes, ManifestTarget)
 
-        SqlFile.write(''.join(InsertQueries))
-        SqlFile.write("END\n")
-        SqlFile.write("ELSE\n")
-        SqlFile.write("    PRINT 'ERROR: One or more lakes are missing from tblPonds. All lakes in the insert query block must exist in tblPonds before sampling events can be created in the tblEvents table.'\n")
+        SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
+
+        FEATURE_CLASS = Spec.FeatureClass
+        TABLE_NAME = Spec.Table
+
+        if ManifestTarget is None:
+            ManifestTarget = TABLE_NAME
+
+        DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
+
+        if RangeInFileName:
+            DatetimeStr = str(fromDate) + '_to_' + str(toDate) + '_' + DatetimeStr
+
+        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_Insert_' + DatetimeStr +'.sql'
+
+        SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
+
+        # The cursor reads only the rows in the date range and of the
+        # lakes, if given.
+        RowFilter = TrimbleUtility.GetRowFilterWhereClause(fromDate, toDate, Lakes)
+
+        # The header gives the rows selected, but not a date range that
+        # is in the file name.
+        HeaderRowFilter = (TrimbleUtility.GetRowFilterWhereClause(Lakes = Lakes) if RangeInFileName else RowFilter)
+
+        # In incremental mode, only the rows that are not yet in the
+        # manifest are written.
+        Manifest = (TrimbleUtility.ReadExportManifest(GEO_DB_PATH, FEATURE_CLASS, ManifestTarget) if Incremental else None)
+
+        # The keys of the changed rows that have already been inserted,
+        # which are left out of the script.
+        ChangedKeys = ([] if Incremental else None)
+
+        # The primary key counts, when the duplicate keys are checked.
+        KeyCounts = ({} if DuplicateCheckType is not DuplicateCheck.NONE else None)
+
+        # The time and row counts of each stage of the export.
+        Metrics = RunMetrics.RunMetrics(FEATURE_CLASS)
+        Metrics.StartStage('Export')
+
+        # The records are written to one script or, if the scripts
+        # are chunked, to one script per chunk. Each chunk is written
+        # and closed before the next one is started.
+        if Columnar:
+            Records = Spec.GetColumnarRecords()(FEATURE_CLASS, SOURCE_FILE_NAME, Metrics, RowFilter)
+        else:
+            Records = IterJoinedTableRecords(Spec, SOURCE_FILE_NAME, Manifest, KeyCounts,
+                                             DuplicateCheckType is DuplicateCheck.SKIP, Metrics, RowFilter, ChangedKeys,
+                                             TableLayout.Separator)
+
+        Records = iter(Records)
+        Record = next(Records, None)
+
+        if ChunkRows is None and ChunkBytes is None:
+            WriteJoinedTableScript(Spec, SqlFilePath, Record, Records, ParentCheckType, BatchSize, GEO_DB_PATH, HeaderRowFilter, Metrics,
+                                   KeyCounts, DuplicateCheckType, TableLayout = TableLayout)
+
+            OutputPath = SqlFilePath
+        else:
+            ChunkFiles = []
+
+            # An export without records still writes one chunk.
+            while Record is not None or len(ChunkFiles) == 0:
+                if len(ChunkFiles) > 0:
+                    Metrics.StartStage('Export')
+
+                ChunkFilePath = GetChunkFilePath(SqlFilePath, len(ChunkFiles) + 1)
+
+                Record, RecordCount = WriteJoinedTableScript(Spec, ChunkFilePath, Record, Records, ParentCheckType, BatchSize,
+                                                             GEO_DB_PATH, HeaderRowFilter, Metrics, KeyCounts, DuplicateCheckType,
+                                                             ChunkRows, ChunkBytes, len(ChunkFiles) + 1, TableLayout)
+
+                ChunkFiles.append((ChunkFilePath, RecordCount))
+
+            OutputPath = WriteChunkManifest(SqlFilePath, ChunkFiles)
+
+        if Manifest is not None:
+            Metrics.StartStage('Manifest')
+            WritePendingManifest(GEO_DB_PATH, FEATURE_CLASS, ManifestTarget, Manifest, OutputPath)
+
+        if ChangedKeys:
+            ReportChangedKeys(FEATURE_CLASS, TABLE_NAME, ChangedKeys)
 
         # Let user know we're done
-        FinishedMessage = FEATURE_CLASS + " data written to: " + SqlFile.name + '\n'
+        FinishedMessage = FEATURE_CLASS + " data written to: " + OutputPath + '\n'
         arcpy.AddMessage(FinishedMessage)
 
+        Metrics.Finish(RunMetrics.GetMetricsPath(OutputPath) if WriteMetrics else None)
+
+        return OutputPath
+
     except Exception as e:
-        Error = 'Error in function ExportSecchiJoined: ' + str(e)
+        if RaiseErrors:
+            raise
+
+        Error = 'Error in function ' + FunctionName + ' (' + Spec.FeatureClass + '): ' + str(e)
         arcpy.AddMessage(Error)
 
-def ExportDepthJoined():
+def WriteJoinedTableScript(Spec, SqlFilePath, Record, Records, ParentCheckType, BatchSize, GeoDBPath, RowFilter, Metrics,
+                           KeyCounts = None, DuplicateCheckType = DuplicateCheck.NONE, ChunkRows = None, ChunkBytes = None, Chunk = None,
+                           TableLayout = None):
     """
-    Translates the data in the Depth_Joined featureclass into a script
-    of SQL insert queries that can be executed on the AK_ShallowLakes
-    database.
+    Writes the SQL insert script of function 'ExportJoinedTable' to
+    'SqlFilePath', for the record 'Record' and the following records
+    of the iterator 'Records' (see 'IterJoinedTableRecords'). 'Record'
+    is None if there are no records.
+
+    If the records of the table belong to an Event (see the
+    'EventKeyColumns' of 'TableSpec.TableSpec'), the inserts are
+    written in a transaction that is left open, and they are run only
+    if all the parent Events exist. If the spec has
+    'OneRecordPerEvent' (tblLoons), a second IF, nested in the first
+    one, also checks that none of the Events has a record yet, and the
+    records that may be altered are selected by the validation query
+    at the top of the script. Otherwise the inserts are written in a
+    'BEGIN TRY' block that commits them, or rolls them back on error
+    (see 'WrapSQLStatementsInTransaction').
+
+    The INSERT statements and the validation query are written in the
+    form of 'TableLayout' (see 'TableSpec.ScriptLayout'). The default
+    (None) is the spec's 'Layout'.
+
+    If 'ChunkRows' or 'ChunkBytes' is given, the script ends after that
+    many records or characters, and 'Chunk' is its number (see
+    'GetFileHeader'). Each script has its own header, transaction and
+    Event check, so it can be run on its own.
+
+    Returns the (NextRecord, RecordCount) tuple: the first record that
+    is not in the script (None if all the records were written), and
+    the number of records in the script.
     """
-    try:
-        GEO_DB_PATH = arcpy.env.workspace
+    NextRecord = None
 
-        AssertGeoDB(GEO_DB_PATH)
+    if TableLayout is None:
+        TableLayout = Spec.Layout
 
-        SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
+    # The records are checked against their parent Events and, for a
+    # table with one record per Event, against the records of the
+    # Events.
+    EventCheck = Spec.EventKeyColumns is not None
+    RecordCheck = Spec.OneRecordPerEvent
+    PerRow = ParentCheckType is ParentCheck.PER_ROW
 
-        FEATURE_CLASS = "Depth_Joined"
+    with SQLWriter.SQLScriptWriter(SqlFilePath) as SqlFile:
+        # The script is streamed in sections, which are assembled
+        # in this order when the writer is closed.
+        Header = SqlFile.AddSection()
 
-        DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
-        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_Insert_' + DatetimeStr +'.sql'
+        if RecordCheck:
+            ValidateQuery = SqlFile.AddSection(TrimEnd = 3)    # Remove the trailing 'Or\n'
 
-        SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
+        EventExistsQuery = SqlFile.AddSection(TrimEnd = 6 if PerRow else 0) # Remove the trailing ' and '
+        RecordExistsQuery = (SqlFile.AddSection(TrimEnd = 6 if PerRow else 0) if RecordCheck else None)
+        InsertQueries = SqlFile.AddSection()
 
-        SqlFile = open(SqlFilePath,'a')
+        if not RecordCheck:
+            ValidateQuery = SqlFile.AddSection(TrimEnd = 3)    # Remove the trailing 'Or\n'
 
-        # Create the first half of the SQL insert query
-        SqlPrefix = 'INSERT INTO tblPondDepths(PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE) VALUES('
+        DuplicateReport = (SqlFile.AddSection() if KeyCounts is not None else None)
 
-        # This will hold the insert queries as they are built
-        InsertQueries = ""
+        # Write the header info to file
+        Header.write(GetFileHeader(Spec.Purpose, GeoDBPath, Spec.FeatureClass, SqlFile.name, RowFilter, Chunk))
 
-        # We need a query to determine if all the Events needed in the
-        # new data to be imported exist in tblEvents or not Build up a
-        # query to determine this.
-        EventExistsQuery = "-- Determine if all the necessary parent Event records exist before trying to insert\nIF\n"
+        if TableLayout.Database is not None:
+            Header.write("USE " + TableLayout.Database + "\n\n")
+
+        if EventCheck:
+            if RecordCheck:
+                Header.write("-- Execute the query below to view/validate records that may be altered.\n-- ")
+                EventExistsQuery.write("\n\n")
+            else:
+                Header.write("BEGIN TRANSACTION -- COMMIT ROLLBACK\n\n")
+
+            # We need a query to determine if all the Events needed in
+            # the new data to be imported exist in tblEvents or not
+            # Build up a query to determine this.
+            EventExistsQuery.write("-- Determine if all the necessary parent Event records exist before trying to insert\n")
+
+            if PerRow:
+                EventExistsQuery.write("IF\n")
+
+            if RecordCheck:
+                # If the parent Events don't exist in tblEvents then
+                # exit the procedure
+                RecordExistsQuery.write("\n    BEGIN\n")
+                RecordExistsQuery.write("        PRINT 'The required parent Event records exist in tblEvents.'\n")
+
+                # Determine if records exist already so we can avoid
+                # duplication
+                RecordExistsQuery.write("            IF ")
+
+                # If we get here then the Events exist and the records
+                # to be inserted do not exist, insert them.
+                InsertQueries.write("\n\n            BEGIN\n")
+                InsertQueries.write("           -- Danger zone below. ROLLBACK on error.\n")
+                InsertQueries.write("           -- Insert the records\n")
+                InsertQueries.write("                PRINT 'inserts'\n")
+                InsertQueries.write("                BEGIN TRANSACTION -- COMMIT ROLLBACK\n")
+            else:
+                InsertQueries.write("\n\n    BEGIN\n    -- Insert the records\n")
 
-        # Build a query to select the just inserted records in order
-        # to validate them
-        ValidateQuery = "SELECT PONDNAME,SAMPLEDATE,GPS_TIME,LATITUDE,LONGITUDE,DEPTH,COMMENTS_DEPTHS,DATAFILE,GPS_HEIGHT,VERT_PREC,HORZ_PREC,SOURCE FROM tblPondDepths WHERE\n"
+            # Build a query to select the just inserted records in order
+            # to validate them
+            ValidateQuery.write(TableLayout.GetSelect(Spec) + " WHERE\n")
+        else:
+            InsertQueries.write(GetTransactionHeader())
 
-        # Write the header info to file
-        PURPOSE = "Transfer lake depth data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database."
-        SqlFile.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name))
+        InsertQueries.write(TableLayout.Comment)
 
-        SqlFile.write("BEGIN TRANSACTION -- COMMIT ROLLBACK\n\n")
+        # The distinct parent Events, when the Event check is set
+        # based.
+        EventKeys = {}
+        RecordCount = 0
 
-        for Row in TrimbleUtility.GetFeatureClassRows(FEATURE_CLASS):
-            PySampleDateTime = Row['CreationDateTimeLocal']
+        InsertBatcher = SQLWriter.InsertBatcher(InsertQueries, TableLayout.GetInsert(Spec), TableLayout.Close, BatchSize)
+        Condition = TableLayout.GetCondition(Spec)
 
-            # A record without a creation datetime is not a valid
-            # record. End this iteration and go to the next row.
-            if PySampleDateTime is None:
-                continue
+        while Record is not None:
+            PondName, SampleDate, KeyValues, Values = Record
 
-            PondName = str(Row['LakeNum'])
-            SampleDate = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-            GPS_Time = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
-            Latitude = str(round(Row['YCurrentMapCS'], 6))
-            Longitude = str(round(Row['XCurrentMapCS'], 6))
-            Depth = str(round(Row['Depth_in_meters'], 1))
+            if EventCheck:
+                # Validation query
+                ValidateQuery.write("   -- (" + Condition.format(*KeyValues) + ") Or\n")
 
-            CommentsDepths = Row['Comment'].strip()
+                # Ensure the parent Event exists, and that the Event has
+                # no record yet
+                if not PerRow:
+                    EventKeys[(PondName, SampleDate)] = None
+                elif RecordCheck:
+                    EventExistsQuery.write("    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE " + GetEventCondition(PondName, SampleDate) + ") And \n")
+                    RecordExistsQuery.write(" NOT EXISTS (SELECT * FROM " + Spec.Table + " WHERE " + GetEventCondition(PondName, SampleDate) + ") And \n")
+                else:
+                    EventExistsQuery.write(" EXISTS  (SELECT PONDNAME FROM tblEvents WHERE " + GetEventCondition(PondName, SampleDate) + ") And \n ")
 
-            GPSHeight = str(Row["GNSS_Heigh"])
-            VertPrec = str(Row["Vert_Prec"])
-            HorizPrec = str(Row["Horz_Prec"])
+            RecordCount = RecordCount + 1
+            Metrics.AddRowsEmitted()
 
-            DataFile = str(Row['Datafile'])
-            Source = SOURCE_FILE_NAME
+            # Write the insert query to file
+            InsertBatcher.Add(Values)
 
-            # Validation query
-            ValidateQuery = ValidateQuery + "   -- (PondName='" + PondName + "' and  SampleDate = '" + SampleDate + "') Or\n"
+            # A chunk ends when it is full.
+            if ((ChunkRows is not None and RecordCount >= ChunkRows) or
+                (ChunkBytes is not None and SqlFile.GetSize() >= ChunkBytes)):
+                NextRecord = next(Records, None)
+                break
 
-            # Ensure the parent Event exists
-            EventExistsQuery = EventExistsQuery + " EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='" + PondName + "' And SampleDate = '" + SampleDate + "') And \n "
+            Record = next(Records, None)
 
-            # Write the insert query to file
-            CommentStr = (",NULL,'" if CommentsDepths == '' else ",'" + CommentsDepths + "','")
-            InsertQueries = (InsertQueries + "      " + SqlPrefix  + "'" + PondName + "','" + SampleDate + "','" + GPS_Time + "'," + Latitude + "," + Longitude + "," + Depth +
-                             CommentStr +
-                             DataFile + "'," + GPSHeight + "," + VertPrec + "," + HorizPrec + ",'" + Source  + "');\n")
+        InsertBatcher.Flush()
 
-        # Write out the query that will determine if the required
-        # Events all exist
-        EventExistsQuery = EventExistsQuery[:len(EventExistsQuery) - 6] + '\n' # Remove the trailing ' and '
+        if not EventCheck:
+            InsertQueries.write(GetTransactionFooter())
+        else:
+            if not PerRow:
+                EventExistsQuery.write(GetKeySetQuery('@EventKeys', EVENT_KEY_COLUMNS, EventKeys, RecordCount))
+                EventExistsQuery.write("IF NOT EXISTS (" + GetMissingEventKeysQuery() + ")")
+
+                if RecordCheck:
+                    RecordExistsQuery.write("NOT EXISTS (" + GetExistingEventRecordsQuery(Spec) + ")")
+
+            if RecordCheck:
+                InsertQueries.write("               PRINT '" + str(RecordCount) + " records inserted from " + Spec.FeatureClass + " into database table " + Spec.Table + ".'\n")
+                InsertQueries.write("               PRINT 'DO NOT FORGET TO COMMIT OR ROLLBACK OR THE DATABASE WILL BE LEFT IN A HANGING STATE!!!!'\n")
+                InsertQueries.write("            END\n")
+                InsertQueries.write("        ELSE\n")
+
+                if PerRow:
+                    InsertQueries.write("            PRINT 'One or more records exist already. Uncomment and use the validation query above to help determine which " +
+                                        Spec.FeatureClass + "\\" + Spec.Table + " records exist already.'\n")
+                else:
+                    InsertQueries.write("            BEGIN\n")
+                    InsertQueries.write("            PRINT 'One or more records exist already. The existing " + Spec.FeatureClass + "\\" + Spec.Table +
+                                        " records are listed in the results.'\n")
+                    InsertQueries.write("            " + GetExistingEventRecordsQuery(Spec) + "\n")
+                    InsertQueries.write("            END\n")
+
+                InsertQueries.write("    END\n")
+
+                Indent = "    "
+                Print = Indent + "PRINT '"
+                MissingMessage = "One or more parent Event records (tblEvents) related to the record you are trying to insert does not exist."
+            else:
+                InsertQueries.write("   END\n")
 
-        SqlFile.write(EventExistsQuery + "\n    BEGIN\n    -- Insert the records\n")
-        SqlFile.write(InsertQueries)
-        SqlFile.write("   END\n")
-        SqlFile.write("ELSE\n   Print 'One or more parent Event records related to the record you are trying to insert does not exist.'\n\n")
+                Indent = "   "
+                Print = Indent + "Print '"
+                MissingMessage = "One or more parent Event records related to the record you are trying to insert does not exist."
 
-        SqlFile.write("-- Execute the query below to validate the inserted records.\n-- " + ValidateQuery[:len(ValidateQuery) - 3])
+            if PerRow:
+                InsertQueries.write("ELSE\n" + Print + MissingMessage + "'\n\n")
+            else:
+                InsertQueries.write("ELSE\n" + Indent + "BEGIN\n")
+                InsertQueries.write(Print + MissingMessage + " The missing Events are listed in the results.'\n")
+                InsertQueries.write(Indent + GetMissingEventKeysQuery() + "\n")
+                InsertQueries.write(Indent + "END\n\n")
 
-        # Let user know we're done
-        FinishedMessage = FEATURE_CLASS + " data written to: " + SqlFile.name + '\n'
-        arcpy.AddMessage(FinishedMessage)
+            if not RecordCheck:
+                InsertQueries.write("-- Execute the query below to validate the inserted records.\n-- ")
 
-    except Exception as e:
-        Error = 'Error in function ExportDepthJoined: ' + str(e)
-        arcpy.AddMessage(Error)
+        # The duplicate keys of all the rows are known when the last
+        # record has been read.
+        if KeyCounts is not None and NextRecord is None:
+            WriteDuplicateKeysReport(DuplicateReport, Spec.FeatureClass, KeyCounts, DuplicateCheckType)
+
+        # The sections are assembled into the script when the
+        # writer is closed.
+        Metrics.StartStage('Assemble')
+
+    Metrics.SetBytesWritten(os.path.getsize(SqlFile.name))
+
+    return (NextRecord, RecordCount)
 
-def ExportLoonsJoined():
+def GetEventCondition(PondName, SampleDate):
     """
-    Translates the data in the Loons_Joined featureclass into a script
-    of SQL insert queries that can be executed on the AK_ShallowLakes
-    database.
+    The condition that selects the records of one Event, e.g.
+    "Pondname='LAKE001' And SampleDate = '2024-06-01'", in tblEvents or
+    in a table whose records belong to an Event. The Event columns of
+    these tables are all named PondName and SampleDate.
     """
-    try:
-        GEO_DB_PATH = arcpy.env.workspace
+    return "Pondname='" + PondName + "' And SampleDate = '" + SampleDate + "'"
 
-        AssertGeoDB(GEO_DB_PATH)
+def GetExistingEventRecordsQuery(Spec):
+    """
+    Lists the records of the table of a spec that belong to the Events
+    in '@EventKeys' (see 'GetKeySetQuery'), for a table with one record
+    per Event (see 'TableSpec.TableSpec').
+    """
+    PondNameColumn, SampleDateColumn = Spec.EventKeyColumns
 
-        SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
+    return ("SELECT t.* FROM " + Spec.Table + " t INNER JOIN @EventKeys k ON t." + PondNameColumn + " = k.PondName And t." +
+            SampleDateColumn + " = k.SampleDate")
 
-        FEATURE_CLASS = "Loons_Joined"
-        TABLE_NAME = "tblLoons"
+def IterJoinedTableRecords(Spec, SourceFileName, Manifest = None, KeyCounts = None, SkipDuplicates = False, Metrics = None, WhereClause = None,
+                           ChangedKeys = None, Separator = ','):
+    """
+    Reads the '_Joined' feature class of a table spec one row at a
+    time (see 'TableSpec.IterExportRows'), and yields the (PondName,
+    SampleDate, KeyValues, Values) of each valid record, where
+    'KeyValues' is the list of the text values of the spec's
+    'KeyColumns', e.g. ['LAKE001', '2024-06-01', 'A'], for the
+    validation query, and 'Values' is the list of the SQL values of its
+    INSERT statement, joined by 'Separator', both formatted by the
+    spec's compiled formatters (see 'TableSpec.CompileFormatter'). See
+    function 'ExportJoinedTable'.
+
+    See 'TableSpec.IterExportRows' for the 'Manifest', 'KeyCounts',
+    'SkipDuplicates', 'Metrics', 'WhereClause' and 'ChangedKeys'
+    parameters.
+    """
+    FormatValues = TableSpec.CompileFormatter(Spec.Columns, SourceFileName, Separator)
+    FormatKeyValues = TableSpec.CompileFormatter(Spec.GetKeyColumns(), SourceFileName, DataValues = True, Name = 'FormatKeyValues')
 
-        DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
-        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_Insert_' + DatetimeStr +'.sql'
+    for Row, Normal in TableSpec.IterExportRows(Spec.FeatureClass, Spec.FieldNames, Manifest, KeyCounts, SkipDuplicates, Metrics, WhereClause,
+                                                ChangedKeys):
+        yield (Normal['PondName'], Normal['SampleDate'], FormatKeyValues(Row, Normal), FormatValues(Row, Normal))
 
-        SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
+def IterDepthJoinedRecords(FeatureClass, SourceFileName, Manifest = None, KeyCounts = None, SkipDuplicates = False, Metrics = None, WhereClause = None):
+    """
+    Reads the Depth_Joined feature class one row at a time, and yields
+    the (PondName, SampleDate, KeyValues, Values) of each valid
+    record, where 'Values' is the comma separated list of the SQL
+    values of its tblPondDepths INSERT statement (see
+    'DEPTH_JOINED_SPEC' and 'IterJoinedTableRecords'). See 'ColumnarExport.IterDepthJoinedRecords'
+    for the columnar equivalent.
+    """
+    if FeatureClass != DEPTH_JOINED_SPEC.FeatureClass:
+        raise Exception("The feature class '" + FeatureClass + "' is not " + DEPTH_JOINED_SPEC.FeatureClass + ".")
 
-        SqlFile = open(SqlFilePath,'a')
+    return IterJoinedTableRecords(DEPTH_JOINED_SPEC, SourceFileName, Manifest, KeyCounts, SkipDuplicates, Metrics, WhereClause)
 
-        # This will hold the insert queries as they are built
-        InsertQueries = ""
+def ExportBulkInsert(Spec, Incremental = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, ManifestTarget = None):
+    """
+    Translates the data in the '_Joined' featureclass of a table spec
+    (see 'TableSpec.TableSpec') into the files of a bulk insert, next
+    to the geodatabase:
+    - a delimited data file ('..._BulkInsert_<datetime>.csv') of the
+      records: UTF-8, comma separated, with a header row of the column
+      names (see 'WriteBulkDataFile'),
+    - the format file ('....xml') of the data file (see
+      'GetBulkFormatFile'), and
+    - the driver script ('....sql'), which bulk loads the data file
+      into a staging table, checks that the staging table holds all the
+      records and, if the table's records belong to an Event, that all
+      their parent Events exist, and then inserts the records into the
+      table with a single statement (see 'GetBulkInsertQuery'). On
+      any error the transaction is rolled back.
+
+    The records are read and formatted by the same row pipeline as the
+    SQL scripts (see 'TableSpec.IterExportRows'), so the incremental
+    manifest and the duplicate checks are the same. The values are
+    written unquoted (see 'TableSpec.CompileFormatter'); the free text
+    values with a comma, a double quote or a line break are quoted by
+    the CSV writer, so they are loaded as written.
+
+    NOTE: BULK INSERT reads the data and format files on the database
+    server, so they must be on a path the SQL Server service can read;
+    edit the paths in the driver script if the files are moved. The
+    'FORMAT = 'CSV'' option needs SQL Server 2017 or later. An empty
+    text value is loaded as NULL.
 
-        # We need a query to determine if all the Events needed in the
-        # new data to be imported exist in tblEvents or not
-        EventExistsQuery = "-- Determine if all the necessary parent Event records exist before trying to insert\n"
-        EventExistsQuery = EventExistsQuery + "IF\n"
+    Parameters:
+    - Spec = the 'TableSpec.TableSpec' of the table.
+    - ManifestTarget = the name the incremental export manifest is
+      kept under (see 'TrimbleUtility.ReadExportManifest'). The
+      default (None) is the name of the table.
+    - See function 'ExportJoinedTable' for the other parameters.
 
-        # We need a query to determine if all the Events needed in the
-        # new data to be imported exist in tblEvents or not
-        RecordExistsQuery = "    -- Determine if records exist already so we can avoid duplication\n"
-        RecordExistsQuery = "        IF "
+    Returns the path of the driver script.
 
+    Errors are raised to the calling export function.
+    """
+    GEO_DB_PATH = arcpy.env.workspace
 
-        # Build a query to select the just inserted records in order
-        # to validate them
-        ValidateQuery = "SELECT * FROM " + TABLE_NAME + " WHERE\n"
+    AssertGeoDB(GEO_DB_PATH)
 
-        # Write the header info to file
-        PURPOSE = "Transfer loon data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database."
-        SqlFile.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name))
+    SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
 
-        i = 0
-        for Row in TrimbleUtility.GetFeatureClassRows(FEATURE_CLASS):
-            PySampleDateTime = Row['CreationDateTimeLocal']
+    FEATURE_CLASS = Spec.FeatureClass
 
-            # A record without a creation datetime is not a valid
-            # record. End this iteration and go to the next row.
-            if PySampleDateTime is None:
-                continue
+    if ManifestTarget is None:
+        ManifestTarget = Spec.Table
 
-            PondName = str(Row['LakeNum'])
-            SampleDate = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-            Species = str(Row['Loon_Species'])
-            NumAdults = str(Row['a___of_Adults'])
-            NumYoung = str(Row['a___of_Young'])
-            OnWater = str(Row['On_Water_'])
+    DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
+    TargetFilePath = os.path.dirname(arcpy.env.workspace) + '/' + SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_BulkInsert_' + DatetimeStr
 
-            if OnWater == "Yes":
-                VegType = "WATER"
-            elif OnWater is None:
-                VegType = ""
+    DataFilePath = TargetFilePath + '.csv'
+    FormatFilePath = TargetFilePath + '.xml'
+    SqlFilePath = TargetFilePath + '.sql'
 
-            DetectionType = str(Row['Identification_Method'])
-            Latitude = str(round(Row['YCurrentMapCS'], 6))
-            Longitude = str(round(Row['XCurrentMapCS'], 6))
-            Comments = Row['Loon_Comments'].strip()
-            Source = SOURCE_FILE_NAME
+    # The cursor reads only the rows in the date range and of the
+    # lakes, if given.
+    RowFilter = TrimbleUtility.GetRowFilterWhereClause(fromDate, toDate, Lakes)
 
-            # Validation query
-            ValidateQuery = ValidateQuery + "   -- (PondName='" + PondName + "' and SampleDate = '" + SampleDate + "') Or\n"
+    # In incremental mode, only the rows that are not yet in the
+    # manifest are written.
+    Manifest = (TrimbleUtility.ReadExportManifest(GEO_DB_PATH, FEATURE_CLASS, ManifestTarget) if Incremental else None)
 
-            # Ensure the parent Event exists
-            EventExistsQuery = EventExistsQuery + "    EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='" + PondName + "' And SampleDate = '" + SampleDate + "') And \n"
+    # The keys of the changed rows that have already been inserted,
+    # which are left out of the data file.
+    ChangedKeys = ([] if Incremental else None)
 
-            # Ensure the record does not exist already
-            RecordExistsQuery = RecordExistsQuery + " NOT EXISTS (SELECT * FROM tblLoons WHERE Pondname='" + PondName + "' And SampleDate = '" + SampleDate  + "') And \n"
+    # The primary key counts, when the duplicate keys are checked.
+    KeyCounts = ({} if DuplicateCheckType is not DuplicateCheck.NONE else None)
 
-            # Write the insert query to file
-            CommentStr = (",NULL,'" if Comments == '' else ",'" + Comments + "','")
-            VegTypeStr = (",NULL," if VegType == '' else ",'" + VegType + "',")
-            InsertQueries = (InsertQueries + "                INSERT INTO " + TABLE_NAME + "(PONDNAME,SAMPLEDATE,SPECIES,NUM_ADULTS,NUM_YOUNG,DETECTION_TYPE,VEG_TYPE,LATITUDE,LONGITUDE,COMMENTS,SOURCE) VALUES("  +
-                             "'"  + PondName + "','" + SampleDate + "','" + Species + "'," + NumAdults + "," + NumYoung + ",'" + DetectionType + "'" + VegTypeStr + Latitude + "," + Longitude +
-                             CommentStr + Source + "');\n")
-
-            i = i + 1
-
-        SqlFile.write("USE AK_ShallowLakes\n\n")
-        SqlFile.write("-- Execute the query below to view/validate records that may be altered.\n-- " + ValidateQuery[:len(ValidateQuery) - 3] + "\n\n")
-
-        # Write out the query that will determine if the required
-        # Events all exist
-        EventExistsQuery = EventExistsQuery[:len(EventExistsQuery) - 6] + '\n' # Remove the trailing ' and '
-
-        # If the parent Events don't exist in tblEvents then exit the
-        # procedure
-        SqlFile.write(EventExistsQuery + "    BEGIN\n")
-        SqlFile.write("        PRINT 'The required parent Event records exist in tblEvents.'\n")
-        SqlFile.write("    " + RecordExistsQuery[:len(RecordExistsQuery) - 6] + "\n\n")
-        SqlFile.write("            BEGIN\n")
-
-        # If we get here then the Events exist and the records to be
-        # inserted do not exist, insert them.
-        SqlFile.write("           -- Danger zone below. ROLLBACK on error.\n")
-        SqlFile.write("           -- Insert the records\n")
-        SqlFile.write("                PRINT 'inserts'\n")
-        SqlFile.write("                BEGIN TRANSACTION -- COMMIT ROLLBACK\n")
-        SqlFile.write(InsertQueries)
-        SqlFile.write("               PRINT '" + str(i) + " records inserted from " + FEATURE_CLASS + " into database table " + TABLE_NAME + ".'\n")
-        SqlFile.write("               PRINT 'DO NOT FORGET TO COMMIT OR ROLLBACK OR THE DATABASE WILL BE LEFT IN A HANGING STATE!!!!'\n")
-        SqlFile.write("            END\n")
-        SqlFile.write("        ELSE\n")
-        SqlFile.write("            PRINT 'One or more records exist already. Uncomment and use the validation query above to help determine which " + FEATURE_CLASS + "\\" + TABLE_NAME + " records exist already.'\n")
-        SqlFile.write("    END\n")
-        SqlFile.write("ELSE\n    PRINT 'One or more parent Event records (tblEvents) related to the record you are trying to insert does not exist.'\n\n")
+    # The time and row counts of each stage of the export.
+    Metrics = RunMetrics.RunMetrics(FEATURE_CLASS)
+    Metrics.StartStage('Export')
 
-        # Let user know we're done
-        FinishedMessage = FEATURE_CLASS + " data written to: " + SqlFile.name + '\n'
-        arcpy.AddMessage(FinishedMessage)
+    RecordCount = WriteBulkDataFile(Spec, DataFilePath, SOURCE_FILE_NAME, Manifest, KeyCounts,
+                                    DuplicateCheckType is DuplicateCheck.SKIP, Metrics, RowFilter, ChangedKeys)
 
-    except Exception as e:
-        Error = 'Error in function ExportLoonsJoined:' + str(e)
-        arcpy.AddMessage(Error)
+    Metrics.StartStage('Assemble')
+
+    with open(FormatFilePath, 'w') as FormatFile:
+        FormatFile.write(GetBulkFormatFile(Spec))
+
+    with SQLWriter.SQLScriptWriter(SqlFilePath) as SqlFile:
+        SQLStatements = SqlFile.AddSection()
+        DuplicateReport = (SqlFile.AddSection() if KeyCounts is not None else None)
+
+        SQLStatements.write(GetFileHeader(Spec.Purpose, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name, RowFilter))
+        SQLStatements.write(GetBulkInsertQuery(Spec, DataFilePath, FormatFilePath, RecordCount))
+
+        if KeyCounts is not None:
+            WriteDuplicateKeysReport(DuplicateReport, FEATURE_CLASS, KeyCounts, DuplicateCheckType)
+
+    Metrics.SetBytesWritten(os.path.getsize(DataFilePath) + os.path.getsize(FormatFilePath) + os.path.getsize(SqlFilePath))
+
+    if Manifest is not None:
+        Metrics.StartStage('Manifest')
+        WritePendingManifest(GEO_DB_PATH, FEATURE_CLASS, ManifestTarget, Manifest, SqlFilePath)
 
-def ExportWaterSampleJoined():
+    if ChangedKeys:
+        ReportChangedKeys(FEATURE_CLASS, Spec.Table, ChangedKeys)
+
+    # Let user know we're done
+    FinishedMessage = FEATURE_CLASS + " data written to: " + DataFilePath + " (bulk insert script: " + SqlFilePath + ")\n"
+    arcpy.AddMessage(FinishedMessage)
+
+    Metrics.Finish(RunMetrics.GetMetricsPath(SqlFilePath) if WriteMetrics else None)
+
+    return SqlFilePath
+
+def WriteBulkDataFile(Spec, DataFilePath, SourceFileName, Manifest = None, KeyCounts = None, SkipDuplicates = False, Metrics = None, WhereClause = None,
+                      ChangedKeys = None):
     """
-    Translates the data in the Water_Sample_Joined featureclass into a
-    script of SQL insert queries that can be executed on the
-    AK_ShallowLakes database.
+    Writes the records of the '_Joined' feature class of a table spec
+    to the delimited data file of a bulk insert (see function
+    'ExportBulkInsert'), one row at a time, and returns the number of
+    records written.
+
+    The file is UTF-8 and comma separated, with Windows line endings
+    and a header row of the column names. A value is quoted if it has
+    a comma, a double quote or a line break, and its double quotes are
+    doubled. A null is written as an empty value.
+
+    See 'TableSpec.IterExportRows' for the 'Manifest', 'KeyCounts',
+    'SkipDuplicates', 'Metrics', 'WhereClause' and 'ChangedKeys'
+    parameters.
     """
-    try:
-        GEO_DB_PATH = arcpy.env.workspace
+    FormatValues = TableSpec.CompileFormatter(Spec.Columns, SourceFileName, DataValues = True)
+    RecordCount = 0
 
-        AssertGeoDB(GEO_DB_PATH)
+    with open(DataFilePath, 'w', newline='', encoding='utf-8') as DataFile:
+        Writer = csv.writer(DataFile, lineterminator='\r\n')
+        Writer.writerow([Column.Name for Column in Spec.Columns])
 
-        SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
+        for Row, Normal in TableSpec.IterExportRows(Spec.FeatureClass, Spec.FieldNames, Manifest, KeyCounts, SkipDuplicates, Metrics, WhereClause,
+                                                    ChangedKeys):
+            Writer.writerow(FormatValues(Row, Normal))
 
-        FEATURE_CLASS = "Water_Sample_Joined"
-        TABLE_NAME = "tblWaterSamples"
+            RecordCount = RecordCount + 1
 
-        DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
-        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_Insert_' + DatetimeStr +'.sql'
+            if Metrics is not None:
+                Metrics.AddRowsEmitted()
 
-        SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
+    return RecordCount
 
-        SqlFile = open(SqlFilePath,'a')
+def WritePendingManifest(GeoDBPath, FeatureClass, Target, Manifest, OutputPath):
+    """
+    Writes the manifest of an incremental export next to its output
+    (see 'TrimbleUtility.GetPendingManifestPath'), and lets the user
+    know that the export must be marked as applied (see
+    'TrimbleUtility.MarkExportApplied') once its script has been
+    committed, so that the next incremental exports leave its rows out.
 
-        # Create the first half of the SQL insert query
-        SqlPrefix = 'INSERT INTO ' + TABLE_NAME + '([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[018_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[NOTES]) VALUES('
+    Parameters:
+    - GeoDBPath = the path of the geodatabase.
+    - FeatureClass = the name of the '_Joined' feature class.
+    - Target = the target of the manifest (see
+      'TrimbleUtility.ReadExportManifest'), e.g. the table name.
+    - Manifest = the rows of the manifest, with those of this export.
+    - OutputPath = the path returned by the export function.
+    """
+    ManifestPath = TrimbleUtility.GetPendingManifestPath(OutputPath)
 
-        # This will hold the insert queries as they are built
-        InsertWaterSamplesQueries = ""
+    TrimbleUtility.WriteExportManifest(GeoDBPath, FeatureClass, Target, Manifest, ManifestPath)
 
-        # We need a query to determine if all the Events needed in the
-        # new data to be imported exist in tblEvents or not build up a
-        # query to determine this.
-        EventExistsQuery = "-- Determine if all the necessary parent Event records exist before trying to insert\nIF\n"
+    arcpy.AddMessage("The rows of this incremental export are recorded in: " + ManifestPath + "\n" +
+                     "Once the script has been committed, run TrimbleUtility.MarkExportApplied(r'" + OutputPath + "') " +
+                     "so that the next incremental exports leave them out.\n")
 
-        # Build a query to select the just inserted records in order
-        # to validate them
-        ValidateQuery = "SELECT * FROM " + TABLE_NAME + " WHERE\n"
+def ReportChangedKeys(FeatureClass, TableName, ChangedKeys):
+    """
+    Lets the user know of the rows of an incremental insert export
+    that have changed since they were exported, and so were left out
+    (see 'TrimbleUtility.UpdateExportManifest'). Their records are
+    already in the table, and must be corrected there by hand. The
+    changed rows are recorded in the manifest, so they are not
+    reported again once the export is marked as applied (see
+    'TrimbleUtility.MarkExportApplied'); a row that changes again is
+    reported again.
 
-        # Write the header info to file
-        PURPOSE = "Transfer water sample data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database."
-        SqlFile.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name))
+    Parameters:
+    - FeatureClass = the name of the '_Joined' feature class.
+    - TableName = the name of the database table.
+    - ChangedKeys = the list of the keys of the changed rows (see
+      'TrimbleUtility.GetRowKey').
+    """
+    arcpy.AddMessage("WARNING: " + str(len(ChangedKeys)) + " rows of " + FeatureClass + " have changed since they were exported to " +
+                     TableName + "; they were left out, as inserting them again would break its primary key. Correct their records " +
+                     "in the table; they will not be reported again once this export is marked as applied:\n" +
+                     ''.join('  ' + Key + '\n' for Key in ChangedKeys))
 
-        SqlFile.write("BEGIN TRANSACTION -- COMMIT ROLLBACK\n\n")
+def GetBulkFormatFile(Spec):
+    """
+    The XML format file of the data file of a table spec (see function
+    'WriteBulkDataFile'): one comma terminated character field per
+    column (the last one is terminated by the line break), loaded as
+    text into the column of the same name of the staging table (see
+    'GetBulkInsertQuery').
+    """
+    Fields = []
+    Columns = []
 
-        for Row in TrimbleUtility.GetFeatureClassRows(FEATURE_CLASS):
-            PySampleDateTime = Row['CreationDateTimeLocal']
+    for i, SpecColumn in enumerate(Spec.Columns, 1):
+        Terminator = (',' if i < len(Spec.Columns) else '\\r\\n')
 
-            # A record without a creation datetime is not a valid
-            # record. End this iteration and go to the next row.
-            if PySampleDateTime is None:
-                continue
+        Fields.append('  <FIELD ID="' + str(i) + '" xsi:type="CharTerm" TERMINATOR="' + Terminator + '"/>\n')
+        Columns.append('  <COLUMN SOURCE="' + str(i) + '" NAME="' + SpecColumn.Name + '" xsi:type="SQLNVARCHAR"/>\n')
 
-            PondName = str(Row['LakeNum'])
-            SampleDate = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-            SampleNumber = str(Row['Sample_Number__A__B__C_']).upper()
-            if SampleNumber.strip() == '':
-                SampleNumber = 'A'
+    xml = '<?xml version="1.0"?>\n'
+    xml += '<BCPFORMAT xmlns="http://schemas.microsoft.com/sqlserver/2004/bulkload/format" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+    xml += ' <RECORD>\n' + ''.join(Fields) + ' </RECORD>\n'
+    xml += ' <ROW>\n' + ''.join(Columns) + ' </ROW>\n'
+    xml += '</BCPFORMAT>\n'
 
-            SampleTime = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
+    return xml
 
-            if Row['Depth_in_meters'] is not None:
-                Depth = str(Row['Depth_in_meters'])
-            else:
-                Depth = 'NULL'
+def GetBulkInsertQuery(Spec, DataFilePath, FormatFilePath, RecordCount):
+    """
+    The body of the driver script of a bulk insert (see function
+    'ExportBulkInsert'): it creates the '#Staging' table, bulk loads
+    the data file into it, checks the number of rows loaded and the
+    parent Events of the records (and, if the spec has
+    'OneRecordPerEvent', that each Event has one staged record and no
+    record in the table yet, as 'WriteJoinedTableScript' does), and
+    inserts the records into the spec's table, in a transaction that
+    is rolled back on any error.
 
-            SampleDepth = str(0.5)
+    Parameters:
+    - Spec = the 'TableSpec.TableSpec' of the table.
+    - DataFilePath, FormatFilePath = the paths of the data file and its
+      format file.
+    - RecordCount = the number of records in the data file.
+    """
+    ColumnNames = '[' + Spec.GetColumnNames('], [') + ']'
 
-            Notes = Row['Comment'].strip()
+    sql = "-- Load the data file into a staging table, then insert the records into " + Spec.Table + ".\n"
+    sql += "-- The data file and the format file must be readable by the SQL Server service.\n"
+    sql += "DROP TABLE IF EXISTS #Staging\n"
+    sql += "CREATE TABLE #Staging (" + ', '.join('[' + Column.Name + '] NVARCHAR(MAX) NULL' for Column in Spec.Columns) + ")\n\n"
 
-            WaterBottlesCollected = Row['Water_Bottles_Collected_'].strip()
-            if WaterBottlesCollected == 'No':
-                O18_Coll = '0'
-                SI_DOC_Coll = '0'
-                IONS_Coll = '0'
-                TN_TP_Coll = '0'
-                CHLA_Coll = '0'
-            elif WaterBottlesCollected == 'Yes':
-                O18_Coll = '1'
-                SI_DOC_Coll = '1'
-                IONS_Coll = '1'
-                TN_TP_Coll = '1'
-                CHLA_Coll = '1'
+    sql += GetTransactionHeader()
 
-            # Validation query
-            ValidateQuery = ValidateQuery + "   -- (PondName='" + PondName + "' and  SampleDate = '" + SampleDate + "' and SampleNumber = '" + SampleNumber + "') Or\n"
+    sql += "    BULK INSERT #Staging FROM '" + os.path.abspath(DataFilePath).replace("'", "''") + "'\n"
+    sql += "    WITH (FORMAT = 'CSV', FIRSTROW = 2, FIELDQUOTE = '\"', CODEPAGE = '65001', KEEPNULLS, TABLOCK,\n"
+    sql += "          FORMATFILE = '" + os.path.abspath(FormatFilePath).replace("'", "''") + "')\n\n"
 
-            # Ensure the parent Event exists
-            EventExistsQuery = EventExistsQuery + " EXISTS  (SELECT PONDNAME FROM tblEvents WHERE Pondname='" + PondName + "' And SampleDate = '" + SampleDate + "') And \n "
+    sql += "    -- The data file holds " + str(RecordCount) + " records.\n"
+    sql += "    IF (SELECT COUNT(*) FROM #Staging) <> " + str(RecordCount) + "\n"
+    sql += "        RAISERROR(N'The staging table does not hold the " + str(RecordCount) + " records of the data file.', 16, 1)\n\n"
 
-            # Write the insert query to file
-            CommentStr = (",NULL" if Notes == '' else ",'" + Notes + "'")
-            InsertWaterSamplesQueries = (InsertWaterSamplesQueries + "INSERT INTO tblWaterSamples([PONDNAME],[SAMPLEDATE],[SAMPLENUMBER],[SAMPLETIME],[SAMPLEDEPTH],[DEPTH],[O18_COLL],[SI_DOC_COLL],[IONS_COLL],[TN_TP_COLL],[CHLA_COLL],[Notes]) VALUES('"  +
-                                         PondName + "','" + SampleDate + "','" + SampleNumber + "','" + SampleTime + "'," + SampleDepth + "," + Depth + "," +
-                                         O18_Coll + "," + SI_DOC_Coll + "," + IONS_Coll + "," + TN_TP_Coll + "," + CHLA_Coll + CommentStr + ")\n")
+    if Spec.EventKeyColumns is not None:
+        PondName, SampleDate = Spec.EventKeyColumns
+        MissingEvents = ("FROM #Staging s WHERE NOT EXISTS (SELECT PONDNAME FROM tblEvents e WHERE e.PondName = s.[" + PondName +
+                         "] And e.SampleDate = s.[" + SampleDate + "])")
 
-        # Write out the query that will determine if the required
-        # Events all exist
-        EventExistsQuery = EventExistsQuery[:len(EventExistsQuery) - 6] + '\n' # Remove the trailing ' and '
+        sql += "    -- Determine if all the necessary parent Event records exist before trying to insert\n"
+        sql += "    IF EXISTS (SELECT 1 " + MissingEvents + ")\n"
+        sql += "    BEGIN\n"
+        sql += "        SELECT DISTINCT s.[" + PondName + "] AS PondName, s.[" + SampleDate + "] AS SampleDate " + MissingEvents + "\n"
+        sql += "        RAISERROR(N'One or more parent Event records related to the records you are trying to insert do not exist. The missing Events are listed in the results.', 16, 1)\n"
+        sql += "    END\n\n"
 
-        SqlFile.write(EventExistsQuery + "\n    BEGIN\n    -- Insert the records\n\n")
-        SqlFile.write("-- Insert the water samples first\n")
-        SqlFile.write(InsertWaterSamplesQueries)
-        SqlFile.write("   END\n")
-        SqlFile.write("ELSE\n   Print 'One or more parent Event records related to the record you are trying to insert does not exist.'\n\n")
+        if Spec.OneRecordPerEvent:
+            EventKeys = "s.[" + PondName + "], s.[" + SampleDate + "]"
+            ExistingRecords = ("FROM " + Spec.Table + " t INNER JOIN (SELECT DISTINCT " + EventKeys + " FROM #Staging s) k ON t." + PondName +
+                               " = k.[" + PondName + "] And t." + SampleDate + " = k.[" + SampleDate + "]")
 
-        SqlFile.write("-- Execute the query below to validate the inserted records.\n-- " + ValidateQuery[:len(ValidateQuery) - 3])
+            sql += "    -- Each Event has one " + Spec.Table + " record, so it must have one staged record and none in " + Spec.Table + "\n"
+            sql += "    IF EXISTS (" + GetDuplicateStagedKeysQuery('#Staging', Spec.EventKeyColumns) + ")\n"
+            sql += "    BEGIN\n"
+            sql += "        " + GetDuplicateStagedKeysQuery('#Staging', Spec.EventKeyColumns) + "\n"
+            sql += "        RAISERROR(N'More than one record belongs to the same Event. The Events are listed in the results.', 16, 1)\n"
+            sql += "    END\n\n"
 
-        # Let user know we're done
-        FinishedMessage = FEATURE_CLASS + " data written to: " + SqlFile.name + '\n'
-        arcpy.AddMessage(FinishedMessage)
+            sql += "    IF EXISTS (SELECT 1 " + ExistingRecords + ")\n"
+            sql += "    BEGIN\n"
+            sql += "        SELECT t.* " + ExistingRecords + "\n"
+            sql += "        RAISERROR(N'One or more of the Events have a " + Spec.Table + " record already. The existing records are listed in the results.', 16, 1)\n"
+            sql += "    END\n\n"
 
-    except Exception as e:
-        Error = 'Error in function ExportWaterSampleJoined: ' + str(e)
-        arcpy.AddMessage(Error)
+    sql += "    -- Insert the records\n"
+    sql += "    INSERT INTO " + Spec.Table + " (" + ColumnNames + ")\n"
+    sql += "    SELECT " + ColumnNames + " FROM #Staging\n"
+
+    sql += GetTransactionFooter()
+
+    sql += "DROP TABLE IF EXISTS #Staging\n"
+
+    return sql
 
-def ExportMonumentJoined():
+def ExportLoonsJoined(ParentCheckType = ParentCheck.PER_ROW, BatchSize = 1, Incremental = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, OutputType = Output.SQL_SCRIPT, RaiseErrors = False, LayoutType = Layout.TABLE):
     """
-    Translates the data in the Monument featureclass into a
-    script of SQL insert statements that can be executed on the
-    AK_ShallowLakes database.
+    Translates the data in the Loons_Joined featureclass into a script
+    of SQL insert queries that can be executed on the AK_ShallowLakes
+    database. Each Event has at most one tblLoons record, so the script
+    also checks that none of its Events has a record yet.
+
+    See function 'ExportJoinedTable' for the parameters. The records
+    are not formatted a column at a time, and the script is not
+    chunked.
+
+    Returns the path of the SQL script file, or of the driver script
+    of a bulk insert.
     """
-    try:
-        GEO_DB_PATH = arcpy.env.workspace
+    return ExportJoinedTable(LOONS_JOINED_SPEC, ParentCheckType, BatchSize, Incremental, DuplicateCheckType = DuplicateCheckType,
+                             WriteMetrics = WriteMetrics, fromDate = fromDate, toDate = toDate, Lakes = Lakes, OutputType = OutputType,
+                             RaiseErrors = RaiseErrors, LayoutType = LayoutType, FunctionName = 'ExportLoonsJoined')
 
-        AssertGeoDB(GEO_DB_PATH)
 
-        SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
+def ExportWaterSampleJoined(ParentCheckType = ParentCheck.PER_ROW, BatchSize = 1, Incremental = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, OutputType = Output.SQL_SCRIPT, RaiseErrors = False, LayoutType = Layout.TABLE):
+    """
+    Translates the data in the Water_Sample_Joined featureclass into a
+    script of SQL insert queries that can be executed on the
+    AK_ShallowLakes database.
 
-        FEATURE_CLASS = "Monument_Joined"
-        TABLE_NAME = "tblMonuments"
+    See function 'ExportJoinedTable' for the parameters. The records
+    are not formatted a column at a time, and the script is not
+    chunked.
 
-        DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
-        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_Insert_' + DatetimeStr +'.sql'
+    Returns the path of the SQL script file, or of the driver script
+    of a bulk insert.
+    """
+    return ExportJoinedTable(WATER_SAMPLE_JOINED_SPEC, ParentCheckType, BatchSize, Incremental, DuplicateCheckType = DuplicateCheckType,
+                             WriteMetrics = WriteMetrics, fromDate = fromDate, toDate = toDate, Lakes = Lakes, OutputType = OutputType,
+                             RaiseErrors = RaiseErrors, LayoutType = LayoutType, FunctionName = 'ExportWaterSampleJoined')
 
-        SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
 
-        SqlFile = open(SqlFilePath,'a')
+def ExportMonumentJoined(BatchSize = 1, Incremental = False, DuplicateCheckType = DuplicateCheck.NONE, WriteMetrics = False, fromDate = None, toDate = None, Lakes = None, OutputType = Output.SQL_SCRIPT, RaiseErrors = False, LayoutType = Layout.TABLE):
+    """
+    Translates the data in the Monument featureclass into a
+    script of SQL insert statements that can be executed on the
+    AK_ShallowLakes database.
 
-        # Write the header info to file
-        PURPOSE = "Transfer monument data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.\n"
-        SqlFile.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name))
-
-        InsertStatements = ''
-
-        for Row in TrimbleUtility.GetFeatureClassRows(FEATURE_CLASS):
-            PySampleDateTime = Row['CreationDateTimeLocal']
-
-            PondName = Row['LakeNum']
-            MonumentDate = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-            LatitudeNAD83 = str(round(Row['YCurrentMapCS'], 6))
-            LongitudeNAD83 = str(round(Row['XCurrentMapCS'], 6))
-            Elevation = str(Row['FeatureHeight'])
-            LocType = Row['MonType']
-            LocMaterial = Row['MonType']
-
-            LocNotes = Row['Location']
-            LocNotesStr = (',NULL' if LocNotes.strip() == '' else ",'" + LocNotes + "'")
-
-            LocComments = Row['Comment']
-            LocCommentsStr = (',NULL' if LocComments.strip() == '' else ",'" + LocComments + "'")
-
-            AccessType = Row['AccessType']
-            GPSType = Row['DeviceType']
-            GPSTime = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
-            CorrType = Row['CorrStatus']
-            EstHError = str(Row['HorizEstAcc'])
-            EstVError = str(Row['VertEstAcc'])
-
-            InsertStatements += ('        INSERT INTO ' + TABLE_NAME + ' ' +
-                                 '([PONDNAME], [M_DATE], [M_LAT_NAD83], [M_LON_NAD83], [M_ELEVATION], [M_LOC_TYPE], ' +
-                                 '[M_LOC_MATERIAL], [M_LOC_NOTES], [M_LOC_COMMENTS], [M_ACCESSTYPE], [M_GPSTYPE], [M_GPSTIME], ' +
-                                 '[M_CORR_TYPE], [M_EST_H_ERROR], [M_EST_V_ERROR]) ' +
-                                 'VALUES (' +
-                                 "'" + PondName + "','" + MonumentDate + "'," + LatitudeNAD83 + "," + LongitudeNAD83 + "," + Elevation + ",'" + LocType +
-                                 "','" + LocMaterial + "'" + LocNotesStr + LocCommentsStr + ",'" + AccessType + "','" + GPSType + "','" + GPSTime +
-                                 "','" + CorrType + "'," + EstHError + "," + EstVError + ")\n")
-
-        SqlFile.write(WrapSQLStatementsInTransaction(InsertStatements))
+    See function 'ExportJoinedTable' for the parameters. The monuments
+    have no parent Event, so there is no 'ParentCheckType'; the
+    records are not formatted a column at a time, and the script is
+    not chunked.
+
+    Returns the path of the SQL script file, or of the driver script
+    of a bulk insert.
+    """
+    return ExportJoinedTable(MONUMENT_JOINED_SPEC, BatchSize = BatchSize, Incremental = Incremental, DuplicateCheckType = DuplicateCheckType,
+                             WriteMetrics = WriteMetrics, fromDate = fromDate, toDate = toDate, Lakes = Lakes, OutputType = OutputType,
+                             RaiseErrors = RaiseErrors, LayoutType = LayoutType, FunctionName = 'ExportMonumentJoined')
 
-    except Exception as e:
-        Error = 'Error in function ExportMonumentJoined: ' + str(e)
-        arcpy.AddMessage(Error)
 
 def ExportContinuousJoined(ContinuousType : Continuous,
                            fromDate : str, toDate : str,
-                           KeepUpdateNotes = False):
+                           KeepUpdateNotes = False,
+                           BatchSize = 1,
+                           Incremental = False,
+                           DuplicateCheckType = DuplicateCheck.NONE,
+                           WriteMetrics = False,
+                           Lakes = None,
+                           OutputType = Output.SQL_SCRIPT,
+                           UpdateType = Update.PER_ROW,
+                           RaiseErrors = False,
+                           LayoutType = Layout.TABLE):
     """
     Translates the data in the Deployment/Retrieval featureclass into a
     script of SQL update statements that can be executed on the
@@ -573,6 +1412,10 @@ def ExportContinuousJoined(ContinuousType : Continuous,
     against the database in the site name and date deployed and
     retrieved columns.
 
+    See function 'ExportJoinedTable' for the 'DuplicateCheckType',
+    'WriteMetrics', 'Lakes', 'RaiseErrors' and 'LayoutType' parameters;
+    the 'LayoutType' only applies to DEPLOYMENT_INSERT.
+
     Parameters:
     - ContinuousType = Type of continuous data. DEPLOYMENT_INSERT or
       DEPLOYMENT_UPDATE or RETRIEVAL_UPDATE (see 'Continuous'
@@ -588,10 +1431,14 @@ def ExportContinuousJoined(ContinuousType : Continuous,
         - The RETRIEVAL's have SQL UPDATE statements that include the
           retrieval date, retrieval time, lat/long, and possibly the
           notes column.
+      - The DEPLOYMENT_INSERT script is written by function
+        'ExportJoinedTable', as the inserts of the other tables are.
     - fromDate = this is the start date, from the feature class table
       for the creation of the SQL INSERT/UPDATE statements.
     - toDate = this is the end date, from the feature class table for
       the creation of the SQL INSERT/UPDATE statements.
+      - Only the rows with a creation date in this range (inclusive)
+        are read from the geodatabase.
     - KeepUpdateNotes = Keep update notes? If false (default), comment
       out the 'RetrievalNotes' or 'DeploymentNotes' in the SQL UPDATE
       statement's 'SET' clause. Otherwise, keep the comment column.
@@ -600,131 +1447,510 @@ def ExportContinuousJoined(ContinuousType : Continuous,
         UPDATE statement, but is commented out, so this statement's
         execution does not overwrite previously entered retrieval or
         deployment notes for this record.
+    - BatchSize = the number of rows in each INSERT statement, for
+      DEPLOYMENT_INSERT. The default (1) writes one INSERT statement
+      per row. Larger values write multi-row
+      'INSERT ... VALUES (...),(...)' statements, and are capped at
+      SQL Server's limit of 1000 rows ('SQLWriter.MAX_INSERT_ROWS').
+    - Incremental = as in function 'ExportJoinedTable'. A changed row
+      whose key has already been inserted is left out of a
+      DEPLOYMENT_INSERT script, and its key is listed once (see
+      'ReportChangedKeys'); the UPDATE scripts update it again.
+    - OutputType = SQL_SCRIPT (default) or BULK_INSERT (see 'Output'
+      enumeration and function 'ExportBulkInsert'). BULK_INSERT is
+      only valid for DEPLOYMENT_INSERT, and the 'BatchSize' does not
+      apply.
+    - UpdateType = PER_ROW (default) or SET_BASED (see 'Update'
+      enumeration), for DEPLOYMENT_UPDATE and RETRIEVAL_UPDATE.
+      - PER_ROW writes one UPDATE statement per record.
+      - SET_BASED loads the values of all the records into the
+        '#Updates' staging table, with multi-row INSERT statements of
+        up to 'SQLWriter.MAX_INSERT_ROWS' rows, and applies them with a
+        single 'UPDATE ... FROM' join on the key (see
+        'GetUpdateFromQuery'). The 'KeepUpdateNotes' parameter applies
+        the same way. If a key is read more than once, the script
+        lists the keys and raises an error, so the transaction is
+        rolled back and no deployment is updated; use
+        'DuplicateCheckType' to find them before (its keys are the
+        same SiteName and DateDeployed or DateRetrieved, see
+        'TrimbleUtility.GetRowKey'). Otherwise the script
+        prints the number of records matched and the number of
+        deployments sent, and lists the records that match no
+        deployment.
+
+    Returns the path of the SQL script file, or of the driver script
+    of a bulk insert.
     """
     try:
 
-        if ContinuousType is Continuous.DEPLOYMENT_INSERT:
-            FEATURE_CLASS = "Deployment_Joined"
-        elif ContinuousType is Continuous.DEPLOYMENT_UPDATE:
-            FEATURE_CLASS = "Deployment_Joined"
-        elif ContinuousType is Continuous.RETRIEVAL_UPDATE:
-            FEATURE_CLASS = "Retrieval_Joined"
-        else:
+        if ContinuousType not in CONTINUOUS_SPECS:
             raise Exception("Value of 'ContinuousType' parameter is not valid.")
 
+        # The columns of the inserted or updated records.
+        Spec = CONTINUOUS_SPECS[ContinuousType]
+
+        # The deployments are inserted as the other tables are.
+        if ContinuousType is Continuous.DEPLOYMENT_INSERT:
+            return ExportJoinedTable(Spec, BatchSize = BatchSize, Incremental = Incremental, DuplicateCheckType = DuplicateCheckType,
+                                     WriteMetrics = WriteMetrics, fromDate = fromDate, toDate = toDate, Lakes = Lakes,
+                                     OutputType = OutputType, RaiseErrors = True, LayoutType = LayoutType,
+                                     ManifestTarget = Spec.Table + '_' + ContinuousType.name, RangeInFileName = True)
+
+        FEATURE_CLASS = Spec.FeatureClass
+
         GEO_DB_PATH = arcpy.env.workspace
 
         AssertGeoDB(GEO_DB_PATH)
 
+        if OutputType is Output.BULK_INSERT:
+            raise Exception("A bulk insert is only valid for the DEPLOYMENT_INSERT continuous type.")
+
         SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
 
-        TABLE_NAME = "tblContinuousDataDeployments"
+        TABLE_NAME = Spec.Table
 
         DatetimeStr = TrimbleUtility.GetCurrentDatetimeStr()
 
-        if ContinuousType is Continuous.DEPLOYMENT_INSERT:
-            SQLOperationStr = "_Insert_"
-        elif ContinuousType is Continuous.DEPLOYMENT_UPDATE:
-            SQLOperationStr = "_Update_"
-        elif ContinuousType is Continuous.RETRIEVAL_UPDATE:
-            SQLOperationStr = "_Update_"
-
-        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + SQLOperationStr + fromDate + '_to_' + toDate + '_' + DatetimeStr + '.sql'
+        TARGET_FILE_NAME = SOURCE_FILE_NAME + '_' + FEATURE_CLASS + '_Update_' + fromDate + '_to_' + toDate + '_' + DatetimeStr + '.sql'
 
         SqlFilePath = os.path.dirname(arcpy.env.workspace) + '/' + TARGET_FILE_NAME
 
-        SqlFile = open(SqlFilePath,'a')
+        # The cursor reads only the rows in the date range and of the
+        # lakes, if given.
+        RowFilter = TrimbleUtility.GetRowFilterWhereClause(fromDate, toDate, Lakes)
 
-        # Write the header info to file
-        PURPOSE = "Transfer " + FEATURE_CLASS + " data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.\n"
-        SqlFile.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name))
+        # In incremental mode, only the rows that are not yet in the
+        # manifest are written.
+        Manifest = (TrimbleUtility.ReadExportManifest(GEO_DB_PATH, FEATURE_CLASS, TABLE_NAME + '_' + ContinuousType.name) if Incremental else None)
 
-        SQLStatements = ''
+        # The primary key counts, when the duplicate keys are checked.
+        KeyCounts = ({} if DuplicateCheckType is not DuplicateCheck.NONE else None)
 
-        fDate = datetime.datetime.strptime(fromDate, '%Y-%m-%d')
-        tDate = datetime.datetime.strptime(toDate, '%Y-%m-%d')
+        # The time and row counts of each stage of the export.
+        Metrics = RunMetrics.RunMetrics(FEATURE_CLASS)
+        Metrics.StartStage('Export')
 
-        for Row in TrimbleUtility.GetFeatureClassRows(FEATURE_CLASS):
-            PySampleDateTime = Row['CreationDateTimeLocal']
+        with SQLWriter.SQLScriptWriter(SqlFilePath) as SqlFile:
+            SQLStatements = SqlFile.AddSection()
+            DuplicateReport = (SqlFile.AddSection() if KeyCounts is not None else None)
 
-            # The site name and date deployed columns comprise the
-            # primary key of the table tblContinuousDataDeployments.
-            SiteName = Row['LakeNum']
+            # Write the header info to file
+            PURPOSE = "Transfer " + FEATURE_CLASS + " data from the field Trimble data collection application to the AK_ShallowLakes monitoring SQL Server database.\n"
+            # The date range is in the file name.
+            SQLStatements.write(GetFileHeader(PURPOSE, GEO_DB_PATH, FEATURE_CLASS, SqlFile.name,
+                                              TrimbleUtility.GetRowFilterWhereClause(Lakes = Lakes)))
 
-            if ContinuousType is Continuous.DEPLOYMENT_INSERT:
-                DateDeployed = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-                DDeployed = datetime.datetime.strptime(DateDeployed, '%Y-%m-%d')
+            SQLStatements.write(GetTransactionHeader())
 
-                if DDeployed >= fDate and DDeployed <= tDate:
-                    TimeDeployed = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
-                    DeploymentType = Row['Deployment_Type']
-                    DeployLatitude = str(Row['YCurrentMapCS'])
-                    DeployLongitude = str(Row['XCurrentMapCS'])
-                    DeploymentNotes = Row['Comments']
+            # The values of each record are formatted by the compiled
+            # spec (see 'TableSpec.CompileFormatter'). The updates set
+            # the coordinates and notes of the record of the key.
+            SetBased = (UpdateType is Update.SET_BASED)
 
-                    DeploymentNotesStr = (', NULL' if DeploymentNotes.strip() == '' else ", '" + DeploymentNotes + "'")
-                    DeploymentTypeStr = (', NULL' if DeploymentType is None else ", '" + DeploymentType + "'")
+            if SetBased:
+                FormatValues = TableSpec.CompileFormatter(Spec.Columns, Separator = ', ')
+            else:
+                LatitudeColumn, LongitudeColumn, NotesColumn = Spec.GetValueColumns()
+                FormatNotes = TableSpec.CompileFormatter([NotesColumn])
+                FormatKey = TableSpec.CompileFormatter(Spec.GetKeyColumns(), Separator = ' AND ', Assignments = True)
+
+            # The set based updates are loaded into a staging table of
+            # the same columns as the table, and applied after the last
+            # record.
+            if SetBased:
+                SQLStatements.write("    -- Load the values of the records into a staging table\n")
+                SQLStatements.write(GetStagingTableQuery('#Updates', 'dbo.' + TABLE_NAME, Spec.GetColumnNames('], [')))
+
+                InsertBatcher = SQLWriter.InsertBatcher(SQLStatements,
+                                                        "    INSERT INTO #Updates ([" + Spec.GetColumnNames('], [') + "])\n" +
+                                                        "    VALUES (",
+                                                        ");\n\n",
+                                                        SQLWriter.MAX_INSERT_ROWS)
+
+            RecordCount = 0
+
+            for Row, Normal in TableSpec.IterExportRows(FEATURE_CLASS, Spec.FieldNames, Manifest, KeyCounts,
+                                                        DuplicateCheckType is DuplicateCheck.SKIP, Metrics, RowFilter):
+                RecordCount = RecordCount + 1
+
+                if SetBased:
+                    InsertBatcher.Add(FormatValues(Row, Normal))
+                else:
+                    Latitude = Normal['Latitude']
+                    Longitude = Normal['Longitude']
+                    NotesStr = FormatNotes(Row, Normal)
+
+                    SQLStatements.write('UPDATE dbo.' + TABLE_NAME + "\n" +
+                                        'SET [' + LatitudeColumn.Name + '] = ' + Latitude + ",\n")
+                    SQLStatements.write('    [' + LongitudeColumn.Name + '] = ' + Longitude + ",\n" +
+                                        '    [' + NotesColumn.Name + '] = ' + NotesStr + "\n"
+                                        if KeepUpdateNotes
+                                        else
+                                        '    [' + LongitudeColumn.Name + '] = ' + Longitude + "\n" +
+                                        '--  [' + NotesColumn.Name + '] = ' + NotesStr + "\n")
+
+                    SQLStatements.write("WHERE " + FormatKey(Row, Normal) + "\n\n")
+
+                Metrics.AddRowsEmitted()
+
+            if SetBased:
+                InsertBatcher.Flush()
+
+                # The notes are set only if they are kept (see the
+                # 'KeepUpdateNotes' parameter).
+                LatitudeColumn, LongitudeColumn, NotesColumn = Spec.GetValueColumns()
+                SetColumns = [LatitudeColumn.Name, LongitudeColumn.Name]
+                CommentedColumns = []
+
+                if KeepUpdateNotes:
+                    SetColumns.append(NotesColumn.Name)
+                else:
+                    CommentedColumns.append(NotesColumn.Name)
+
+                # A key with more than one staged record raises an
+                # error, so the transaction is rolled back.
+                SQLStatements.write("    -- Each deployment must be updated by one record\n")
+                SQLStatements.write(GetStagedKeysQuery('#Updates', Spec.KeyColumns))
+                SQLStatements.write("    IF @StagedKeys < (SELECT COUNT(*) FROM #Updates)\n")
+                SQLStatements.write("    BEGIN\n")
+                SQLStatements.write("        " + GetDuplicateStagedKeysQuery('#Updates', Spec.KeyColumns) + "\n")
+                SQLStatements.write("        RAISERROR(N'More than one record updates the same deployment. The deployments are listed in the results.', 16, 1)\n")
+                SQLStatements.write("    END\n\n")
+
+                SQLStatements.write("    -- Update the records of the keys in the staging table\n")
+                SQLStatements.write(GetUpdateFromQuery('dbo.' + TABLE_NAME, '#Updates', Spec.KeyColumns, SetColumns, CommentedColumns))
+
+                SQLStatements.write("    DECLARE @RowsMatched INT = @@ROWCOUNT\n")
+                SQLStatements.write("    PRINT N'Records matched: ' + CAST(@RowsMatched AS NVARCHAR(20)) + N' of the ' + CAST(@StagedKeys AS NVARCHAR(20)) + N' deployments sent.'\n\n")
+
+                SQLStatements.write("    -- The records that match no deployment\n")
+                SQLStatements.write("    IF EXISTS (" + GetUnmatchedKeysQuery('dbo.' + TABLE_NAME, '#Updates', Spec.KeyColumns, '1') + ")\n")
+                SQLStatements.write("        " + GetUnmatchedKeysQuery('dbo.' + TABLE_NAME, '#Updates', Spec.KeyColumns, '*') + "\n")
+
+            SQLStatements.write(GetTransactionFooter())
+
+            if KeyCounts is not None:
+                WriteDuplicateKeysReport(DuplicateReport, FEATURE_CLASS, KeyCounts, DuplicateCheckType)
+
+            # The sections are assembled into the script when the
+            # writer is closed.
+            Metrics.StartStage('Assemble')
+
+        Metrics.SetBytesWritten(os.path.getsize(SqlFile.name))
+
+        if Manifest is not None:
+            Metrics.StartStage('Manifest')
+            WritePendingManifest(GEO_DB_PATH, FEATURE_CLASS, TABLE_NAME + '_' + ContinuousType.name, Manifest, SqlFile.name)
+
+        Metrics.Finish(RunMetrics.GetMetricsPath(SqlFile.name) if WriteMetrics else None)
+
+        return SqlFile.name
 
-                    SQLStatements += ('INSERT INTO dbo.' + TABLE_NAME + "\n" +
-                                      "([SiteName] ,[DateDeployed] ,[TimeDeployed] ,[DeploymentType] ,[DeployLatitude] ,[DeployLongitude] ,[DeploymentNotes])\n" +
-                                      "VALUES (" +
-                                      "'" + SiteName + "', '" + DateDeployed + "', '" + TimeDeployed + "'" + DeploymentTypeStr + ", " + DeployLatitude + ", " + DeployLongitude + DeploymentNotesStr + ")\n\n")
+    except Exception as e:
+        if RaiseErrors:
+            raise
+
+        Error = 'Error in function ExportContinuousJoined: ' + str(e)
+        arcpy.AddMessage(Error)
 
-            elif ContinuousType is Continuous.DEPLOYMENT_UPDATE:
-                DateDeployed = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-                DDeployed = datetime.datetime.strptime(DateDeployed, '%Y-%m-%d')
+# The exports run by function 'ExportAll' when no list is given: each
+# entry is an export function and a dictionary of its keyword
+# arguments. The continuous exports are not included because they
+# need a date range, e.g. add:
+#   (ExportContinuousJoined, {'ContinuousType': Continuous.DEPLOYMENT_INSERT,
+#                             'fromDate': '2023-09-08', 'toDate': '2023-09-25'})
+EXPORT_ALL_DEFAULTS = [(ExportSecchiJoined, {}),
+                       (ExportDepthJoined, {}),
+                       (ExportLoonsJoined, {}),
+                       (ExportWaterSampleJoined, {}),
+                       (ExportMonumentJoined, {})]
+
+def ExportAll(Exports = None, Workers = None, UseProcesses = True):
+    """
+    Runs several export functions at once, each in its own worker of a
+    process or thread pool. The exports are independent: each one
+    reads its own feature class and writes its own SQL script file.
 
-                if DDeployed >= fDate and DDeployed <= tDate:
-                    TimeDeployed = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
-                    DeployLatitude = str(round(Row['YCurrentMapCS'], 6))
-                    DeployLongitude = str(round(Row['XCurrentMapCS'], 6))
-                    DeploymentNotes = Row['Comments']
+    The geodatabase is the current 'arcpy.env.workspace'.
 
-                    DeploymentNotesStr = ('NULL' if DeploymentNotes.strip() == '' else "'" + DeploymentNotes + "'")
+    Parameters:
+    - Exports = a list of (export function, keyword arguments
+      dictionary) pairs. The default is 'EXPORT_ALL_DEFAULTS'. The
+      functions must be module level functions (not lambdas) so that
+      they can be sent to a worker process.
+    - Workers = the number of workers. The default (None) is one
+      worker per export, up to the number of processors.
+    - UseProcesses = if True (default), the exports run in a process
+      pool; each process sets its own 'arcpy.env.workspace'. If False,
+      they run in a thread pool, which starts faster but shares one
+      arcpy session.
+      - NOTE: when using processes, the calling script must guard its
+        entry point with "if __name__ == '__main__':" (see the example
+        scripts).
+
+    Returns a list with one dictionary per export, in the order of
+    'Exports', with the keys:
+    - 'Function' = the name of the export function.
+    - 'Arguments' = the keyword arguments of the export.
+    - 'Succeeded' = True or False.
+    - 'SqlFilePath' = the path of the SQL script file, or None.
+    - 'Error' = the error message, or None.
+    - 'Seconds' = the time the export took.
+
+    A failed export does not stop the others. A one line summary of
+    each export is written with 'arcpy.AddMessage'.
+    """
+    GEO_DB_PATH = arcpy.env.workspace
 
-                    SQLStatements += ('UPDATE dbo.' + TABLE_NAME + "\n" +
-                                      'SET [DeployLatitude] = ' + DeployLatitude + ",\n")
-                    SQLStatements += ('    [DeployLongitude] = ' + DeployLongitude + ",\n" +
-                                      '    [DeploymentNotes] = ' + DeploymentNotesStr + "\n"
-                                      if KeepUpdateNotes
-                                      else
-                                      '    [DeployLongitude] = ' + DeployLongitude + "\n" +
-                                      '--  [DeploymentNotes] = ' + DeploymentNotesStr + "\n")
+    AssertGeoDB(GEO_DB_PATH)
 
-                    SQLStatements +=  "WHERE SiteName = '" + SiteName + "' AND DateDeployed = '" + DateDeployed + "'\n\n"
+    if Exports is None:
+        Exports = EXPORT_ALL_DEFAULTS
 
-            elif ContinuousType is Continuous.RETRIEVAL_UPDATE:
-                DateRetrieved = TrimbleUtility.GetDateTime(PySampleDateTime, 'd')
-                DRetrieved = datetime.datetime.strptime(DateRetrieved, '%Y-%m-%d')
+    if len(Exports) == 0:
+        return []
 
-                if DRetrieved >= fDate and DRetrieved <= tDate:
-                    TimeRetrieved = TrimbleUtility.GetDateTime(PySampleDateTime, 't')
-                    RetrieveLatitude = str(round(Row['YCurrentMapCS'], 6))
-                    RetrieveLongitude = str(round(Row['XCurrentMapCS'], 6))
-                    RetrievalNotes = Row['Comments']
+    if Workers is None:
+        Workers = min(len(Exports), os.cpu_count() or 1)
 
-                    RetrievalNotesStr = ('NULL' if RetrievalNotes.strip() == '' else "'" + RetrievalNotes + "'")
+    if UseProcesses:
+        Executor = concurrent.futures.ProcessPoolExecutor(max_workers=Workers)
+    else:
+        Executor = concurrent.futures.ThreadPoolExecutor(max_workers=Workers)
 
-                    SQLStatements += ('UPDATE dbo.' + TABLE_NAME + "\n" +
-                                      'SET [RetrieveLatitude] = ' + RetrieveLatitude + ",\n")
-                    SQLStatements += ('    [RetrieveLongitude] = ' + RetrieveLongitude + ",\n" +
-                                      '    [RetrievalNotes] = ' + RetrievalNotesStr + "\n"
-                                      if KeepUpdateNotes
-                                      else
-                                      '    [RetrieveLongitude] = ' + RetrieveLongitude + "\n" +
-                                      '--  [RetrievalNotes] = ' + RetrievalNotesStr + "\n")
+    with Executor:
+        Futures = [Executor.submit(RunExport, GEO_DB_PATH, ExportFunction, Arguments)
+                   for ExportFunction, Arguments in Exports]
 
-                    SQLStatements +=  "WHERE SiteName = '" + SiteName + "' AND DateRetrieved = '" + DateRetrieved + "'\n\n"
+        Results = [Future.result() for Future in Futures]
 
-        SqlFile.write(WrapSQLStatementsInTransaction(SQLStatements))
+    for Result in Results:
+        if Result['Succeeded']:
+            arcpy.AddMessage(Result['Function'] + " succeeded in " + format(Result['Seconds'], '.2f') + " seconds: " + Result['SqlFilePath'])
+        else:
+            arcpy.AddMessage(Result['Function'] + " FAILED in " + format(Result['Seconds'], '.2f') + " seconds: " + Result['Error'])
 
+    return Results
+
+def RunExport(GeoDBPath, ExportFunction, Arguments):
+    """
+    Runs one export of function 'ExportAll' in a worker, and returns
+    its result dictionary. Errors are returned, not raised.
+    """
+    StartTime = time.perf_counter()
+
+    Result = {'Function': ExportFunction.__name__,
+              'Arguments': Arguments,
+              'Succeeded': False,
+              'SqlFilePath': None,
+              'Error': None}
+
+    try:
+        arcpy.env.workspace = GeoDBPath
+
+        Result['SqlFilePath'] = ExportFunction(RaiseErrors=True, **Arguments)
+        Result['Succeeded'] = True
     except Exception as e:
-        Error = 'Error in function ExportContinuousJoined: ' + str(e)
+        Result['Error'] = str(e)
+
+    Result['Seconds'] = time.perf_counter() - StartTime
+
+    return Result
+
+# The table spec of each feature class that can be loaded by function
+# 'LoadJoined'. The rows of the 'LOAD_UPDATES' feature classes UPDATE
+# the records of their keys; the others are INSERTed.
+LOAD_TARGETS = {Spec.FeatureClass: Spec for Spec in [SECCHI_JOINED_SPEC,
+                                                     DEPTH_JOINED_SPEC,
+                                                     LOONS_JOINED_SPEC,
+                                                     WATER_SAMPLE_JOINED_SPEC,
+                                                     MONUMENT_JOINED_SPEC,
+                                                     DEPLOYMENT_INSERT_SPEC]}
+
+LOAD_UPDATES = ['Secchi_Joined']
+
+def LoadJoined(FeatureClass, Pool, BatchSize = 1000, fromDate = None, toDate = None, Lakes = None, RaiseErrors = False):
+    """
+    Loads the data in a '_Joined' featureclass directly into the
+    AK_ShallowLakes database, instead of writing an SQL script.
+
+    The rows are sent through a DB-API connection borrowed from 'Pool'
+    (a 'DatabaseLoader.ConnectionPool') with parameterized
+    'executemany' batches, all in one transaction: if any batch fails,
+    the transaction is rolled back and NO records are loaded. Several
+    'LoadJoined' calls may share one pool from different threads.
+
+    The records of a table with parent Events (see 'EventKeyColumns'
+    of 'TableSpec.TableSpec') are checked as the SQL scripts check
+    them, before the transaction is committed: every Event of the
+    loaded records must be in tblEvents, and for a table with
+    'OneRecordPerEvent' each of these Events must now have one record.
+    Otherwise the Events are listed and the transaction is rolled back.
+
+    Parameters:
+    - FeatureClass = one of the feature class names in 'LOAD_TARGETS'.
+      Secchi_Joined rows UPDATE tblEvents; the other feature classes
+      are INSERTed into their tables.
+    - Pool = a 'DatabaseLoader.ConnectionPool'.
+    - BatchSize = the number of records sent in each 'executemany'
+      call.
+    - fromDate, toDate = optional 'YYYY-MM-DD' strings; only the rows
+      with a creation date in this range (inclusive) are loaded.
+    - Lakes = an optional list of the 'LakeNum' values of the lakes to
+      load; the rows of the other lakes are not read.
+    - RaiseErrors = if False (default), an error is reported with
+      'arcpy.AddMessage' and the function returns None. If True, the
+      error is raised to the caller.
+
+    The number of rows inserted or updated is reported (see
+    'DatabaseLoader.LoadRecords'). If fewer rows were updated than
+    records were sent, the keys that match no record are listed (see
+    'DatabaseLoader.GetMissingKeys'); their records were not loaded.
+
+    Returns the number of rows inserted or updated, or the number of
+    records sent if the driver does not report it (0 if there are no
+    records to load). Returns None on error, when nothing is loaded.
+    """
+    try:
+        GEO_DB_PATH = arcpy.env.workspace
+
+        AssertGeoDB(GEO_DB_PATH)
+
+        SOURCE_FILE_NAME = os.path.basename(GEO_DB_PATH) # Extract just the filename from the path.
+
+        if FeatureClass not in LOAD_TARGETS:
+            raise Exception("Value of 'FeatureClass' parameter is not valid.")
+
+        Spec = LOAD_TARGETS[FeatureClass]
+
+        # The parameters of an UPDATE are the SET values followed by
+        # the key values.
+        if FeatureClass in LOAD_UPDATES:
+            Columns = Spec.GetValueColumns() + Spec.GetKeyColumns()
+            Statement = DatabaseLoader.GetUpdateStatement(Spec.Table, [Column.Name for Column in Spec.GetValueColumns()], Spec.KeyColumns,
+                                                          Pool.ParamStyle)
+        else:
+            Columns = Spec.Columns
+            Statement = DatabaseLoader.GetInsertStatement(Spec.Table, [Column.Name for Column in Columns], Pool.ParamStyle)
+
+        # The cursor reads only the rows in the date range and of the
+        # lakes, if given.
+        RowFilter = TrimbleUtility.GetRowFilterWhereClause(fromDate, toDate, Lakes)
+
+        # The parameters of each record are formatted by the compiled
+        # spec, from the same values as the SQL scripts (see
+        # 'TableSpec.CompileFormatter').
+        FormatParameters = TableSpec.CompileFormatter(Columns, SOURCE_FILE_NAME, Parameters = True)
+
+        # The distinct keys of the updates, to find those that match
+        # no record, and the distinct Events of the inserts, to check
+        # them before the commit.
+        Keys = {}
+        EventKeys = {}
+
+        if Spec.EventKeyColumns is not None:
+            ColumnNames = [Column.Name for Column in Columns]
+            EventPositions = [ColumnNames.index(Name) for Name in Spec.EventKeyColumns]
+
+        def Records():
+            for Row, Normal in TableSpec.IterExportRows(FeatureClass, Spec.FieldNames, WhereClause = RowFilter):
+                Parameters = FormatParameters(Row, Normal)
+
+                if FeatureClass in LOAD_UPDATES:
+                    Keys[Parameters[-len(Spec.KeyColumns):]] = None
+                elif Spec.EventKeyColumns is not None:
+                    EventKeys[tuple(Parameters[i] for i in EventPositions)] = None
+
+                yield Parameters
+
+        def CheckEvents(Cursor):
+            Counts = DatabaseLoader.CountKeys(Cursor, 'tblEvents', ['PONDNAME', 'SAMPLEDATE'], list(EventKeys), Pool.ParamStyle)
+            MissingEvents = [Key for Key, Count in Counts if Count == 0]
+
+            if len(MissingEvents) > 0:
+                raise Exception(str(len(MissingEvents)) + " Events of " + FeatureClass + " are not in tblEvents:\n" +
+                                ''.join('  ' + ', '.join(str(Value) for Value in Key) + '\n' for Key in MissingEvents))
+
+            if Spec.OneRecordPerEvent:
+                Counts = DatabaseLoader.CountKeys(Cursor, Spec.Table, Spec.EventKeyColumns, list(EventKeys), Pool.ParamStyle)
+                RepeatedEvents = [Key for Key, Count in Counts if Count > 1]
+
+                if len(RepeatedEvents) > 0:
+                    raise Exception(str(len(RepeatedEvents)) + " Events of " + FeatureClass + " would have more than one record in " +
+                                    Spec.Table + ":\n" +
+                                    ''.join('  ' + ', '.join(str(Value) for Value in Key) + '\n' for Key in RepeatedEvents))
+
+        Check = (CheckEvents if Spec.EventKeyColumns is not None and FeatureClass not in LOAD_UPDATES else None)
+
+        RecordCount, RowCount = DatabaseLoader.LoadRecords(Pool, Statement, Records(), BatchSize, Check)
+
+        # Let user know we're done
+        if RowCount is None:
+            arcpy.AddMessage(str(RecordCount) + " records from " + FeatureClass + " sent to " + Spec.Table + " and committed. " +
+                             "The database driver does not report the number of rows loaded.\n")
+
+            return RecordCount
+
+        if FeatureClass in LOAD_UPDATES:
+            arcpy.AddMessage(str(RowCount) + " records of " + Spec.Table + " updated from the " + str(RecordCount) + " records of " +
+                             FeatureClass + " sent, and committed.\n")
+
+            if RowCount < RecordCount:
+                MissingKeys = DatabaseLoader.GetMissingKeys(Pool, Spec.Table, Spec.KeyColumns, list(Keys))
+
+                if len(MissingKeys) > 0:
+                    arcpy.AddMessage("WARNING: " + str(len(MissingKeys)) + " keys of " + FeatureClass + " match no record of " +
+                                     Spec.Table + "; their records were not loaded:\n" +
+                                     ''.join('  ' + ', '.join(str(Value) for Value in Key) + '\n' for Key in MissingKeys))
+        else:
+            arcpy.AddMessage(str(RowCount) + " records from " + FeatureClass + " loaded into " + Spec.Table + " and committed.\n")
+
+        return RowCount
+
+    except Exception as e:
+        if RaiseErrors:
+            raise
+
+        Error = 'Error in function LoadJoined: ' + str(e) + '\nRolling back transaction; NO records have been loaded.'
         arcpy.AddMessage(Error)
 
-def GetFileHeader(Purpose, GeoDBPath, FeatureClass, SQLFileName):
+def WriteDuplicateKeysReport(Section, FeatureClass, KeyCounts, DuplicateCheckType):
     """
-    Standard header information to put in each sql script.
+    Writes the duplicate key report of an export to the end of its SQL
+    script, as comments, and reports the number of duplicate keys with
+    'arcpy.AddMessage'.
+
+    Parameters:
+    - Section = the script section the report is written to.
+    - FeatureClass = the name of the exported feature class.
+    - KeyCounts = the primary key counts of the rows that were read
+      (see 'TrimbleUtility.UpdateKeyCounts').
+    - DuplicateCheckType = REPORT or SKIP (see 'DuplicateCheck'
+      enumeration).
+    """
+    Duplicates = TrimbleUtility.GetDuplicateKeys(KeyCounts)
+
+    Lines = ["\n\n-- DUPLICATE PRIMARY KEYS: " + str(len(Duplicates)) + " of the " + str(len(KeyCounts)) +
+             " primary keys in " + FeatureClass + " were read more than once.\n"]
+
+    for RowKey, Count in Duplicates.items():
+        Lines.append("--     " + RowKey + ": " + str(Count) + " rows\n")
+
+    if DuplicateCheckType is DuplicateCheck.SKIP:
+        Skipped = sum(Count - 1 for Count in Duplicates.values())
+        Lines.append("-- " + str(Skipped) + " duplicate rows were skipped. Only the first row of each primary key is in this script.\n")
+
+    Section.write(''.join(Lines))
+
+    arcpy.AddMessage(FeatureClass + ": " + str(len(Duplicates)) + " duplicate primary keys.")
+
+def GetFileHeader(Purpose, GeoDBPath, FeatureClass, SQLFileName, RowFilter = None, Chunk = None):
+    """
+    Standard header information to put in each sql script. If the rows
+    of the feature class were filtered, 'RowFilter' is the where clause
+    that selected them (see 'TrimbleUtility.GetRowFilterWhereClause').
+    If the script is one of several chunks, 'Chunk' is its number (see
+    'WriteChunkManifest').
     """
     header = "/*\n"
     header += "NPS Arctic and Central Alaska Inventory and Monitoring Program, Shallow Lakes Monitoring\n"
@@ -732,6 +1958,13 @@ def GetFileHeader(Purpose, GeoDBPath, FeatureClass, SQLFileName):
     header += "Purpose: " + Purpose + "\n"
     header += "Source geodatabase: " + GeoDBPath + "\n"
     header += "FeatureClass: " + FeatureClass  + "\n"
+
+    if RowFilter is not None:
+        header += "Rows selected: " + RowFilter + "\n"
+
+    if Chunk is not None:
+        header += "Chunk: " + str(Chunk) + " (run the chunks in the order of the chunk manifest)\n"
+
     header += "SQL file name: " + SQLFileName + "\n"
     header += "Script generated by: " + getpass.getuser() + ".\n"
     header += "Date/time: " + str(datetime.datetime.now())  + ".\n"
@@ -739,11 +1972,172 @@ def GetFileHeader(Purpose, GeoDBPath, FeatureClass, SQLFileName):
 
     return header
 
+def GetChunkFilePath(SqlFilePath, Chunk):
+    """
+    The path of chunk number 'Chunk' of the script 'SqlFilePath', e.g.
+    'fake.gdb_Depth_Joined_Insert_..._Chunk003.sql'.
+    """
+    return os.path.splitext(SqlFilePath)[0] + '_Chunk' + format(Chunk, '03d') + '.sql'
+
+def WriteChunkManifest(SqlFilePath, ChunkFiles):
+    """
+    Writes the manifest of a chunked script: a CSV file that lists the
+    chunks of 'SqlFilePath' in the order they must be run, and the
+    number of records in each. A load that stopped can be resumed from
+    the first chunk that was not committed.
+
+    Parameters:
+    - SqlFilePath = the path of the script as if it were not chunked.
+    - ChunkFiles = the list of the (chunk file path, record count) of
+      each chunk, in order.
+
+    Returns the path of the manifest, e.g.
+    'fake.gdb_Depth_Joined_Insert_..._Chunks.csv'.
+    """
+    ManifestPath = os.path.splitext(SqlFilePath)[0] + '_Chunks.csv'
+
+    with open(ManifestPath, 'w', newline='') as ManifestFile:
+        Writer = csv.writer(ManifestFile)
+        Writer.writerow(['Chunk', 'SqlFileName', 'Records'])
+
+        for Chunk, (ChunkFilePath, RecordCount) in enumerate(ChunkFiles, 1):
+            Writer.writerow([Chunk, os.path.basename(ChunkFilePath), RecordCount])
+
+    return ManifestPath
+
+def GetKeySetQuery(TableVariable, KeyColumns, Keys, RecordCount):
+    """
+    Declares the table variable 'TableVariable' and fills it, with a
+    single 'VALUES' list, with the distinct keys referenced by the
+    records of a script.
+
+    Parameters:
+    - TableVariable = the name of the table variable (e.g.
+      '@EventKeys').
+    - KeyColumns = a list of (column name, SQL type) tuples (e.g.
+      'EVENT_KEY_COLUMNS').
+    - Keys = the distinct keys; each key is a tuple of strings in the
+      order of 'KeyColumns'. A dictionary is used by the callers to
+      keep the keys in the order they were first read.
+    - RecordCount = the number of records the keys were collected
+      from. Used in the comment only.
+    """
+    ColumnNames = ', '.join(Column[0] for Column in KeyColumns)
+
+    sql = "-- " + str(len(Keys)) + " distinct keys referenced by " + str(RecordCount) + " records.\n"
+    sql += "DECLARE " + TableVariable + " TABLE (" + ', '.join(Column[0] + ' ' + Column[1] for Column in KeyColumns) + ", PRIMARY KEY (" + ColumnNames + "))\n"
+
+    # An empty 'VALUES' list is not valid SQL.
+    if len(Keys) > 0:
+        sql += "INSERT INTO " + TableVariable + " (" + ColumnNames + ")\n"
+        sql += "SELECT " + ColumnNames + " FROM (VALUES\n"
+        sql += ",\n".join("    (" + ', '.join("'" + Value + "'" for Value in Key) + ")" for Key in Keys)
+        sql += "\n) AS k(" + ColumnNames + ")\n"
+
+    return sql
+
+def GetMissingPondKeysQuery():
+    """
+    Lists the lakes in '@PondKeys' (see 'GetKeySetQuery') that are
+    missing from tblPonds.
+    """
+    return "SELECT k.PondName FROM @PondKeys k WHERE NOT EXISTS (SELECT PondName FROM tblPonds p WHERE p.PondName = k.PondName)"
+
+def GetMissingEventKeysQuery():
+    """
+    Lists the Events in '@EventKeys' (see 'GetKeySetQuery') that are
+    missing from tblEvents.
+    """
+    return "SELECT k.PondName, k.SampleDate FROM @EventKeys k WHERE NOT EXISTS (SELECT PONDNAME FROM tblEvents e WHERE e.PondName = k.PondName And e.SampleDate = k.SampleDate)"
+
+def GetStagingTableQuery(StagingTable, Table, ColumnNames):
+    """
+    Creates the empty temporary table 'StagingTable' (e.g. '#Updates')
+    with the columns 'ColumnNames' (e.g. "SiteName], [DateDeployed",
+    see 'TableSpec.TableSpec.GetColumnNames') of 'Table', so the staged
+    values have the same types as the table's columns.
+    """
+    sql = "    DROP TABLE IF EXISTS " + StagingTable + "\n"
+    sql += "    SELECT TOP 0 [" + ColumnNames + "] INTO " + StagingTable + " FROM " + Table + "\n\n"
+
+    return sql
+
+def GetKeyJoinCondition(KeyColumns, TableAlias, StagingAlias):
+    """
+    The join condition of the records of a table and of its staging
+    table on the 'KeyColumns', e.g. "t.[SiteName] = s.[SiteName] AND
+    t.[DateDeployed] = s.[DateDeployed]".
+    """
+    return ' AND '.join(TableAlias + ".[" + Name + "] = " + StagingAlias + ".[" + Name + "]" for Name in KeyColumns)
+
+def GetUpdateFromQuery(Table, StagingTable, KeyColumns, SetColumns, CommentedColumns = ()):
+    """
+    A single 'UPDATE ... FROM' statement that sets the 'SetColumns' of
+    the records of 'Table' to the values of the records of
+    'StagingTable' (see 'GetStagingTableQuery') with the same
+    'KeyColumns'. The 'CommentedColumns' are in the SET clause, but
+    commented out.
+    """
+    Assignments = ["t.[" + Name + "] = s.[" + Name + "]" for Name in SetColumns]
+
+    sql = "    UPDATE t\n"
+    sql += "    SET " + ",\n        ".join(Assignments) + "\n"
+
+    for Name in CommentedColumns:
+        sql += "    --  t.[" + Name + "] = s.[" + Name + "]\n"
+
+    sql += "    FROM " + Table + " t\n"
+    sql += "    INNER JOIN " + StagingTable + " s ON " + GetKeyJoinCondition(KeyColumns, 't', 's') + "\n\n"
+
+    return sql
+
+def GetStagedKeysQuery(StagingTable, KeyColumns):
+    """
+    Declares '@StagedKeys', the number of distinct 'KeyColumns' keys in
+    'StagingTable'. It is less than the number of staged records when
+    a key has more than one record, which an 'UPDATE ... FROM' (see
+    'GetUpdateFromQuery') would apply in no particular order; those
+    keys are listed by 'GetDuplicateStagedKeysQuery'.
+    """
+    return ("    DECLARE @StagedKeys INT = (SELECT COUNT(*) FROM (SELECT DISTINCT " +
+            ', '.join("[" + Name + "]" for Name in KeyColumns) + " FROM " + StagingTable + ") k)\n")
+
+def GetDuplicateStagedKeysQuery(StagingTable, KeyColumns):
+    """
+    Lists the 'KeyColumns' keys that have more than one record in
+    'StagingTable', and their number of records.
+    """
+    Keys = ', '.join("[" + Name + "]" for Name in KeyColumns)
+
+    return "SELECT " + Keys + ", COUNT(*) AS [RECORDS] FROM " + StagingTable + " GROUP BY " + Keys + " HAVING COUNT(*) > 1"
+
+def GetUnmatchedKeysQuery(Table, StagingTable, KeyColumns, SelectColumns):
+    """
+    Lists the 'SelectColumns' (e.g. '*') of the records of
+    'StagingTable' whose 'KeyColumns' match no record of 'Table'.
+    """
+    return ("SELECT " + SelectColumns + " FROM " + StagingTable + " s WHERE NOT EXISTS (SELECT 1 FROM " + Table + " t WHERE " +
+            GetKeyJoinCondition(KeyColumns, 't', 's') + ")")
+
 def WrapSQLStatementsInTransaction(SQLStatements):
+    return GetTransactionHeader() + SQLStatements + GetTransactionFooter()
+
+def GetTransactionHeader():
+    """
+    The opening of the 'BEGIN TRY' block that
+    'WrapSQLStatementsInTransaction' puts before the SQL statements.
+    """
     sql = "BEGIN TRY\n"
     sql += "    BEGIN TRANSACTION\n\n"
-    sql += SQLStatements
-    sql += "\n     COMMIT TRANSACTION\n"
+
+    return sql
+
+def GetTransactionFooter():
+    """
+    The 'COMMIT' and the 'BEGIN CATCH' (rollback) block that
+    'WrapSQLStatementsInTransaction' puts after the SQL statements.
+    """
+    sql = "\n     COMMIT TRANSACTION\n"
     sql += "     PRINT N'Successfully inserted ALL records and committed them.'\n"
     sql += "END TRY\n"
     sql += "BEGIN CATCH -- ROLLBACK\n"
@@ -9,44 +9,423 @@
 
 import arcpy
 import datetime
+import hashlib
+import json
+import os
+
+# The formatted dates, by date, and the formatted times, by time of
+# day. Many rows share a date (and, over many days, a time of day), so
+# each is formatted only once. A cache is emptied when it reaches
+# 'MAX_CACHED_STRINGS' entries.
+DATE_STRINGS = {}
+TIME_STRINGS = {}
+MAX_CACHED_STRINGS = 100000
+
+# The text field of a merged feature class that holds the path of the
+# geodatabase each row was merged from (the field added by
+# 'arcpy.management.Merge' with 'ADD_SOURCE_INFO'; see module
+# 'BatchExport').
+SOURCE_FIELD = 'MERGE_SRC'
+
+def GetDateStr(PyDateTime):
+    """
+    The date of 'PyDateTime' as 'YYYY-MM-DD'.
+    """
+    Date = PyDateTime.date()
+    DateStr = DATE_STRINGS.get(Date)
+
+    if DateStr is None:
+        if len(DATE_STRINGS) >= MAX_CACHED_STRINGS:
+            DATE_STRINGS.clear()
+
+        DateStr = DATE_STRINGS[Date] = PyDateTime.strftime('%Y-%m-%d')
+
+    return DateStr
+
+def GetTimeStr(PyDateTime):
+    """
+    The time of 'PyDateTime' as 'HH:MM:SS'.
+    """
+    Time = PyDateTime.time()
+    TimeStr = TIME_STRINGS.get(Time)
+
+    if TimeStr is None:
+        if len(TIME_STRINGS) >= MAX_CACHED_STRINGS:
+            TIME_STRINGS.clear()
+
+        TimeStr = TIME_STRINGS[Time] = PyDateTime.strftime('%H:%M:%S')
+
+    return TimeStr
 
 def GetDateTime(PyDateTime, DateTimeType):
     if DateTimeType == 'd':
-        DateTime = PyDateTime.strftime('%Y-%m-%d')
+        DateTime = GetDateStr(PyDateTime)
     elif DateTimeType == 't':
-        DateTime = PyDateTime.strftime('%H:%M:%S')
+        DateTime = GetTimeStr(PyDateTime)
     elif DateTimeType == 'dt':
-        DateTime = PyDateTime.strftime('%Y-%m-%d %H:%M:%S')
+        DateTime = GetDateStr(PyDateTime) + ' ' + GetTimeStr(PyDateTime)
 
     return DateTime
 
+def NormalizeRow(Row, TextFieldNames = ()):
+    """
+    Returns a dictionary of the canonical values of a '_Joined' row (a
+    dictionary record), derived once per row for the export functions
+    and the duplicate checks:
+    - 'PondName' = the 'LakeNum' as text.
+    - 'SampleDate' = the date of the 'CreationDateTimeLocal', as
+      'YYYY-MM-DD' (see 'GetDateTime').
+    - 'SampleTime' = its time, as 'HH:MM:SS'.
+    - 'SampleDay' = its date, as a 'datetime.date', for comparing with
+      a date range without formatting and parsing the date.
+    - 'Latitude', 'Longitude' = the 'YCurrentMapCS' and 'XCurrentMapCS'
+      rounded to 6 decimals, as text (if the row has them).
+    - each of the 'TextFieldNames' (e.g. the comments), with the
+      leading and trailing blanks removed.
+    - 'SourceFileName' = the file name of the geodatabase the row was
+      merged from, if the row has the 'SOURCE_FIELD'.
+    The dates and times are None if the row has no creation datetime.
+    The row itself is not changed, so its hash (see 'GetRowHash') is
+    the same.
+    """
+    PySampleDateTime = Row['CreationDateTimeLocal']
+
+    Normal = {'PondName': str(Row['LakeNum'])}
+
+    if PySampleDateTime is None:
+        Normal['SampleDate'] = Normal['SampleTime'] = Normal['SampleDay'] = None
+    else:
+        Normal['SampleDate'] = GetDateStr(PySampleDateTime)
+        Normal['SampleTime'] = GetTimeStr(PySampleDateTime)
+        Normal['SampleDay'] = PySampleDateTime.date()
+
+    if 'YCurrentMapCS' in Row:
+        Normal['Latitude'] = str(round(Row['YCurrentMapCS'], 6))
+        Normal['Longitude'] = str(round(Row['XCurrentMapCS'], 6))
+
+    for FieldName in TextFieldNames:
+        Normal[FieldName] = Row[FieldName].strip()
+
+    if SOURCE_FIELD in Row:
+        Normal['SourceFileName'] = GetSourceFileName(Row[SOURCE_FIELD])
+
+    return Normal
+
 def GetCurrentDatetimeStr():
     now = datetime.datetime.now()
     return now.strftime('%Y-%m-%dT%H.%M.%S')
 
-def GetFeatureClassRows(FeatureClassName):
+def IterFeatureClassRows(FeatureClassName, FieldNames = None, WhereClause = None, Metrics = None):
+    """
+    The parameter 'FeatureClassName' takes as its argument the name
+    of the feature class.
+    The parameter 'FieldNames' is the list of field names to read. If
+    'None' (default), then all the fields of the feature class are
+    read.
+    The parameter 'WhereClause' is an optional SQL expression that is
+    passed to the cursor, so that only the matching rows are read.
+    The parameter 'Metrics' is an optional 'RunMetrics.RunMetrics'; the
+    rows are counted as read by its current stage.
+    This function is a generator that yields one dictionary record at
+    a time, where each dictionary contains a set of field names and
+    values of the given feature class. Rows are read from the cursor
+    only as they are requested, so the feature class is never held in
+    memory as a whole.
+    """
+    if FieldNames is None:
+        # Get the feature class field names
+        Fields = arcpy.ListFields(FeatureClassName)
+        FieldNames = [Field.name for Field in Fields]
+
+    with arcpy.da.SearchCursor(FeatureClassName, FieldNames, where_clause=WhereClause) as Cursor:
+        Rows = (Cursor if Metrics is None else Metrics.CountRows(Cursor))
+
+        for Row in Rows:
+            yield dict(zip(FieldNames, Row))
+
+def GetFeatureClassRows(FeatureClassName, FieldNames = None, WhereClause = None, Metrics = None):
     """
     The paramenter 'FeatureClassName' takes as its argument the name
     of the feature class.
     This function returns a list of dictionary records where each
     dictionary contains a set of field names and values of the given
     feature class.
+    See function 'IterFeatureClassRows' for the 'FieldNames',
+    'WhereClause' and 'Metrics' parameters.
+    """
+    return list(IterFeatureClassRows(FeatureClassName, FieldNames, WhereClause, Metrics))
+
+def GetRowFilterWhereClause(fromDate = None, toDate = None, Lakes = None, WhereClause = None):
+    """
+    Returns the cursor 'WhereClause' (see 'IterFeatureClassRows') that
+    selects the '_Joined' rows in a date window and of a list of lakes,
+    so that the other rows are never read from the geodatabase. Returns
+    None if there is no filter.
+
+    Parameters:
+    - fromDate, toDate = optional 'YYYY-MM-DD' strings; only the rows
+      with a 'CreationDateTimeLocal' date in this range (inclusive) are
+      selected. Either one may be None, for an open ended window.
+    - Lakes = an optional list of the 'LakeNum' values of the lakes to
+      select.
+    - WhereClause = an optional SQL expression that the rows must also
+      match, e.g. 'CreationDateTimeLocal IS NOT NULL'.
+    """
+    Terms = ([] if WhereClause is None else ['(' + WhereClause + ')'])
+
+    # The dates are parsed so that a badly formed date is an error, not
+    # a part of the SQL expression.
+    if fromDate is not None:
+        FromDay = datetime.datetime.strptime(fromDate, '%Y-%m-%d').date()
+        Terms.append("CreationDateTimeLocal >= date '" + FromDay.isoformat() + "'")
+
+    # The rows of the last day are before midnight of the next day.
+    if toDate is not None:
+        AfterDay = datetime.datetime.strptime(toDate, '%Y-%m-%d').date() + datetime.timedelta(days=1)
+        Terms.append("CreationDateTimeLocal < date '" + AfterDay.isoformat() + "'")
+
+    if Lakes is not None:
+        if len(Lakes) == 0:
+            raise Exception("The 'Lakes' list is empty.")
+
+        Terms.append('LakeNum IN (' + ', '.join("'" + str(Lake).replace("'", "''") + "'" for Lake in Lakes) + ')')
+
+    if len(Terms) == 0:
+        return None
+
+    return ' AND '.join(Terms)
+
+def GetRowKey(FeatureClassName, Row, Normal = None):
     """
-    FIELD_NAME = 0
-    FIELD_VALUE = 1
+    Returns the primary key of a '_Joined' feature class row (a
+    dictionary record) as an upper case string:
+    - Water_Sample_Joined: PondName + SampleDate + SampleNumber (a blank
+      sample number is 'A').
+    - Depth_Joined, Monument_Joined: PondName + SampleDate + GPS time
+      (the M_GPSTIME of tblMonuments).
+    - Otherwise: PondName + SampleDate (e.g. the SiteName and
+      DateDeployed or DateRetrieved of Deployment_Joined and
+      Retrieval_Joined).
+    The row must have the 'CreationDateTimeLocal' and 'LakeNum' fields
+    (and 'Sample_Number__A__B__C_' for Water_Sample_Joined).
 
-    # Get the feature class field names
-    Fields = arcpy.ListFields(FeatureClassName)
-    FieldNames = [Field.name for Field in Fields]
+    The key is made from the normalized values of the row (see
+    'NormalizeRow'), which are derived from the row if 'Normal' is not
+    given.
+    """
+    if Normal is None:
+        Normal = NormalizeRow(Row)
 
-    DList = []
-    for Row in arcpy.da.SearchCursor(FeatureClassName, FieldNames):
-        z = zip(FieldNames, Row)
-        d = {}
+    PondName = Normal['PondName']
+    SampleDate = Normal['SampleDate']
 
-        for t in z:
-            d[t[FIELD_NAME]] = t[FIELD_VALUE]
+    if FeatureClassName == 'Water_Sample_Joined':
+        RowKey = PondName + SampleDate + GetSampleNumber(Row['Sample_Number__A__B__C_'])
+    elif FeatureClassName in ('Depth_Joined', 'Monument_Joined'):
+        RowKey = PondName + SampleDate + Normal['SampleTime']
+    else:
+        RowKey = PondName + SampleDate
+
+    return RowKey.upper()
+
+def GetRowKeyFieldNames(FeatureClassName):
+    """
+    Returns the list of the fields that make up the primary key of a
+    '_Joined' feature class (see 'GetRowKey').
+    """
+    FieldNames = ['CreationDateTimeLocal', 'LakeNum']
+
+    if FeatureClassName == 'Water_Sample_Joined':
+        FieldNames.append('Sample_Number__A__B__C_')
+
+    return FieldNames
+
+def GetSourceField(FeatureClassName):
+    """
+    Returns the 'SOURCE_FIELD' if the feature class has it (i.e. it
+    was merged from several geodatabases), otherwise None.
+    """
+    if any(Field.name == SOURCE_FIELD for Field in arcpy.ListFields(FeatureClassName)):
+        return SOURCE_FIELD
+
+    return None
+
+def GetSourceFileName(SourcePath):
+    """
+    Returns the file name of the geodatabase in the 'SOURCE_FIELD'
+    value of a merged row, which is the path of the feature class it
+    was merged from (e.g. 'C:/Data/Crew1.gdb/Depth_Joined' is
+    'Crew1.gdb').
+    """
+    Parts = SourcePath.replace('\\', '/').split('/')
 
-        DList.append(d)
+    for Part in reversed(Parts):
+        if Part.lower().endswith('.gdb'):
+            return Part
 
-    return DList
+    return Parts[-1]
+
+def GetSampleNumber(Value):
+    """
+    The water sample number (A, B or C) of a 'Sample_Number__A__B__C_'
+    value, in upper case. A blank sample number is 'A'.
+    """
+    SampleNumber = str(Value).upper()
+
+    if SampleNumber.strip() == '':
+        SampleNumber = 'A'
+
+    return SampleNumber
+
+def GetRowHash(Row):
+    """
+    Returns a hash of the field values of a dictionary record. The
+    hash changes when any value read from the row changes, except the
+    'SOURCE_FIELD' of a merged row, so the same row merged from a
+    geodatabase of another path is not a changed row.
+    """
+    Items = tuple(Item for Item in Row.items() if Item[0] != SOURCE_FIELD)
+
+    return hashlib.sha1(repr(Items).encode('utf-8')).hexdigest()
+
+def GetExportManifestPath(GeoDBPath, FeatureClassName, Target):
+    """
+    The path of the export manifest of a feature class and its target
+    table. The manifest is written next to the geodatabase, e.g.
+    'fake.gdb_Depth_Joined_tblPondDepths_Manifest.json'.
+    """
+    return (os.path.dirname(GeoDBPath) + '/' + os.path.basename(GeoDBPath) + '_' +
+            FeatureClassName + '_' + Target + '_Manifest.json')
+
+def ReadExportManifest(GeoDBPath, FeatureClassName, Target):
+    """
+    Returns the rows recorded in the export manifest of a feature
+    class and target table, as a dictionary of the row keys (see
+    'GetRowKey') and the list of the row hashes exported with that key
+    (see 'GetRowHash'). If there is no manifest yet, returns an empty
+    dictionary.
+
+    The manifest only holds the rows of the exports that have been
+    marked as applied (see 'MarkExportApplied').
+    """
+    ManifestPath = GetExportManifestPath(GeoDBPath, FeatureClassName, Target)
+
+    if not os.path.exists(ManifestPath):
+        return {}
+
+    with open(ManifestPath, 'r') as ManifestFile:
+        return json.load(ManifestFile)['Rows']
+
+def WriteExportManifest(GeoDBPath, FeatureClassName, Target, Manifest, ManifestPath = None):
+    """
+    Writes the export manifest of a feature class and target table, or,
+    if 'ManifestPath' is given, the pending manifest of an export (see
+    'GetPendingManifestPath'). The file is replaced in one step, so an
+    interrupted write leaves the previous manifest in place.
+    """
+    if ManifestPath is None:
+        ManifestPath = GetExportManifestPath(GeoDBPath, FeatureClassName, Target)
+
+    with open(ManifestPath + '.tmp', 'w') as ManifestFile:
+        json.dump({'GeoDB': GeoDBPath,
+                   'FeatureClass': FeatureClassName,
+                   'Target': Target,
+                   'Updated': GetCurrentDatetimeStr(),
+                   'Rows': Manifest}, ManifestFile)
+
+    os.replace(ManifestPath + '.tmp', ManifestPath)
+
+def GetPendingManifestPath(OutputPath):
+    """
+    The path of the pending manifest of an incremental export, next to
+    its output (the path returned by the export function), e.g.
+    'fake.gdb_Depth_Joined_20261017_101500_Manifest.json' for the
+    script 'fake.gdb_Depth_Joined_20261017_101500.sql'.
+    """
+    return os.path.splitext(OutputPath)[0] + '_Manifest.json'
+
+def MarkExportApplied(OutputPath):
+    """
+    Records the rows of an incremental export as exported, once its
+    script has been run and committed: the pending manifest written
+    next to 'OutputPath' (the path returned by the export function) is
+    merged into the export manifest of its feature class and target
+    table, and removed. Until then, the next incremental exports write
+    the same rows again, so a script that was never run, or was rolled
+    back, loses no rows. Returns the path of the export manifest.
+
+    The manifests are merged, so the exports of the same feature class
+    and table may be marked in any order.
+    """
+    PendingPath = GetPendingManifestPath(OutputPath)
+
+    if not os.path.exists(PendingPath):
+        raise Exception("There is no pending manifest of the export '" + OutputPath + "' (" + PendingPath + ").")
+
+    with open(PendingPath, 'r') as ManifestFile:
+        Pending = json.load(ManifestFile)
+
+    Manifest = ReadExportManifest(Pending['GeoDB'], Pending['FeatureClass'], Pending['Target'])
+
+    for RowKey, Hashes in Pending['Rows'].items():
+        AppliedHashes = Manifest.setdefault(RowKey, [])
+        AppliedHashes.extend(RowHash for RowHash in Hashes if RowHash not in AppliedHashes)
+
+    WriteExportManifest(Pending['GeoDB'], Pending['FeatureClass'], Pending['Target'], Manifest)
+    os.remove(PendingPath)
+
+    return GetExportManifestPath(Pending['GeoDB'], Pending['FeatureClass'], Pending['Target'])
+
+def UpdateExportManifest(Manifest, FeatureClassName, Row, Normal = None, ChangedKeys = None):
+    """
+    Returns True if the row is new or changed since it was recorded in
+    'Manifest' (see 'ReadExportManifest'), and records it. Returns False
+    if the same row has already been exported. 'Normal' is the
+    normalized values of the row, if they are known (see 'GetRowKey').
+
+    If 'ChangedKeys' (a list) is given, a changed row whose key has
+    already been exported is not new, as an INSERT of the row would
+    break the table's primary key: its key is appended to
+    'ChangedKeys' and False is returned. The changed row is recorded,
+    so it is not reported again once the export is marked as applied
+    (see 'MarkExportApplied').
+    """
+    RowKey = GetRowKey(FeatureClassName, Row, Normal)
+    RowHash = GetRowHash(Row)
+
+    Hashes = Manifest.setdefault(RowKey, [])
+
+    if RowHash in Hashes:
+        return False
+
+    Changed = (ChangedKeys is not None and len(Hashes) > 0)
+
+    Hashes.append(RowHash)
+
+    if Changed:
+        ChangedKeys.append(RowKey)
+        return False
+
+    return True
+
+def UpdateKeyCounts(KeyCounts, FeatureClassName, Row, Normal = None):
+    """
+    Counts the primary key of the row (see 'GetRowKey') in
+    'KeyCounts', a dictionary of the row keys and the number of rows
+    read with that key. Returns the row's count so far: 1 for the
+    first row with its key, and more than 1 for a duplicate. 'Normal'
+    is the normalized values of the row, if they are known.
+    """
+    RowKey = GetRowKey(FeatureClassName, Row, Normal)
+
+    Count = KeyCounts.get(RowKey, 0) + 1
+    KeyCounts[RowKey] = Count
+
+    return Count
+
+def GetDuplicateKeys(KeyCounts):
+    """
+    Returns a dictionary of the keys in 'KeyCounts' (see
+    'UpdateKeyCounts') that were read more than once, and their counts.
+    """
+    return {RowKey: Count for RowKey, Count in KeyCounts.items() if Count > 1}